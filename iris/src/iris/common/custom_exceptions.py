@@ -43,3 +43,26 @@ class PipelineNotFoundException(HTTPException):
                 "errorMessage": "Pipeline not found",
             },
         )
+
+
+class JobQueueFullException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "type": "too_many_requests",
+                "errorMessage": "Iris is at capacity, retry later",
+            },
+            headers={"Retry-After": "5"},
+        )
+
+
+class ServiceShuttingDownException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "type": "shutting_down",
+                "errorMessage": "Iris is shutting down, retry later",
+            },
+        )
@@ -0,0 +1,339 @@
+"""Bounded, prioritised execution of pipeline and webhook jobs.
+
+Every job runs in one of two pools so that long ingestion jobs cannot starve
+student-facing requests:
+
+- ``interactive``: chat, search, rewriting and other requests a user waits for
+- ``background``: lecture/FAQ ingestion and deletion
+
+Each pool has a fixed number of worker threads and a bounded priority queue.
+Submissions are rejected with HTTP 429 while a pool is saturated and with
+HTTP 503 while Iris is draining for shutdown. Every ``stats_log_interval``
+completed jobs a pool logs its state:
+
+    Job executor | pool=interactive workers=32 running=32 queued=12 submitted=980
+    completed=936 rejected=4 wait_p50_ms=0 wait_p95_ms=850 wait_max_ms=2310
+"""
+
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Any, Callable, Optional
+
+from iris.common.custom_exceptions import (
+    JobQueueFullException,
+    ServiceShuttingDownException,
+)
+from iris.common.logging_config import get_logger
+from iris.common.profiling import profiled
+from iris.config import settings
+
+logger = get_logger(__name__)
+
+# Number of recent queue wait times the percentiles are computed from.
+_WAIT_SAMPLE_SIZE = 1024
+
+
+class Workload(str, Enum):
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+class JobPriority(IntEnum):
+    """Order of queued jobs within a pool; lower values run first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+@dataclass(frozen=True)
+class JobPoolStats:
+    """Snapshot of a pool's occupancy, throughput and queue wait times."""
+
+    workload: str
+    workers: int
+    running: int
+    queued: int
+    capacity: int
+    submitted: int
+    completed: int
+    rejected: int
+    wait_p50_ms: float
+    wait_p95_ms: float
+    wait_max_ms: float
+
+    @property
+    def saturated(self) -> bool:
+        return self.running + self.queued >= self.capacity
+
+
+@dataclass
+class _Job:
+    context: contextvars.Context
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[
+        min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    ]
+
+
+def _call(job: _Job) -> Any:
+    with profiled(getattr(job.fn, "__name__", "job")):
+        return job.fn(*job.args, **job.kwargs)
+
+
+class JobPool:
+    """Fixed-size thread pool with a bounded priority queue and admission control.
+
+    Worker threads are started on demand up to ``max_workers``. At most
+    ``max_workers + max_queue_size`` jobs are accepted at a time; further
+    submissions raise ``JobQueueFullException``.
+    """
+
+    def __init__(
+        self,
+        workload: Workload,
+        max_workers: int,
+        max_queue_size: int,
+        stats_log_interval: int = 0,
+    ):
+        self.workload = workload
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self.stats_log_interval = stats_log_interval
+        self._condition = threading.Condition()
+        self._queue: list[tuple[int, int, _Job]] = []
+        self._sequence = itertools.count()
+        self._workers: list[threading.Thread] = []
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._waits_ms: deque[float] = deque(maxlen=_WAIT_SAMPLE_SIZE)
+        self._shutting_down = False
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue_size
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: JobPriority = JobPriority.NORMAL,
+        **kwargs: Any,
+    ) -> Future:
+        """Queue ``fn(*args, **kwargs)`` and return its future.
+
+        The caller's contextvars (request id, Langfuse observation stack) are
+        propagated to the worker thread.
+
+        Raises:
+            JobQueueFullException: The pool is saturated.
+            ServiceShuttingDownException: The pool is draining for shutdown.
+        """
+        job = _Job(contextvars.copy_context(), fn, args, kwargs, Future())
+        with self._condition:
+            if self._shutting_down:
+                raise ServiceShuttingDownException()
+            if self._running + len(self._queue) >= self.capacity:
+                self._rejected += 1
+                logger.warning(
+                    "Job executor | pool=%s rejected job | running=%d queued=%d",
+                    self.workload.value,
+                    self._running,
+                    len(self._queue),
+                )
+                raise JobQueueFullException()
+            heapq.heappush(self._queue, (int(priority), next(self._sequence), job))
+            self._submitted += 1
+            pending = self._running + len(self._queue)
+            if len(self._workers) < self.max_workers and pending > len(self._workers):
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"iris-{self.workload.value}-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+            else:
+                self._condition.notify()
+        return job.future
+
+    def stats(self) -> JobPoolStats:
+        with self._condition:
+            waits = sorted(self._waits_ms)
+            return JobPoolStats(
+                workload=self.workload.value,
+                workers=len(self._workers),
+                running=self._running,
+                queued=len(self._queue),
+                capacity=self.capacity,
+                submitted=self._submitted,
+                completed=self._completed,
+                rejected=self._rejected,
+                wait_p50_ms=_percentile(waits, 0.5),
+                wait_p95_ms=_percentile(waits, 0.95),
+                wait_max_ms=waits[-1] if waits else 0.0,
+            )
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(
+            "Job executor | pool=%s workers=%d running=%d queued=%d submitted=%d "
+            "completed=%d rejected=%d wait_p50_ms=%.0f wait_p95_ms=%.0f wait_max_ms=%.0f",
+            stats.workload,
+            stats.workers,
+            stats.running,
+            stats.queued,
+            stats.submitted,
+            stats.completed,
+            stats.rejected,
+            stats.wait_p50_ms,
+            stats.wait_p95_ms,
+            stats.wait_max_ms,
+        )
+
+    def close(self) -> None:
+        """Stop accepting jobs; queued and running jobs still complete."""
+        with self._condition:
+            self._shutting_down = True
+            self._condition.notify_all()
+
+    def shutdown(self, timeout: float) -> bool:
+        """Stop accepting jobs and wait until queued and running jobs finish.
+
+        Returns:
+            True if the pool drained within ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        self.close()
+        with self._condition:
+            while self._queue or self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "Job executor | pool=%s drain timed out | running=%d queued=%d",
+                        self.workload.value,
+                        self._running,
+                        len(self._queue),
+                    )
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutting_down:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+                self._running += 1
+                self._waits_ms.append((time.monotonic() - job.enqueued_at) * 1000)
+
+            try:
+                self._run(job)
+            finally:
+                with self._condition:
+                    self._running -= 1
+                    self._completed += 1
+                    completed = self._completed
+                    self._condition.notify_all()
+                if self.stats_log_interval > 0 and (
+                    completed % self.stats_log_interval == 0
+                ):
+                    self.log_stats()
+
+    def _run(self, job: _Job) -> None:
+        if not job.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = job.context.run(_call, job)
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            logger.error(
+                "Job executor | pool=%s job %s failed",
+                self.workload.value,
+                getattr(job.fn, "__name__", job.fn),
+                exc_info=e,
+            )
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+
+
+class JobExecutor:
+    """Routes jobs to the pool of their workload class."""
+
+    def __init__(self, pools: dict[Workload, JobPool]):
+        self.pools = pools
+
+    def submit(
+        self,
+        workload: Workload,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: JobPriority = JobPriority.NORMAL,
+        **kwargs: Any,
+    ) -> Future:
+        return self.pools[workload].submit(fn, *args, priority=priority, **kwargs)
+
+    def stats(self) -> list[JobPoolStats]:
+        return [pool.stats() for pool in self.pools.values()]
+
+    def shutdown(self, timeout: float) -> bool:
+        """Drain all pools, sharing ``timeout`` seconds between them."""
+        deadline = time.monotonic() + timeout
+        for pool in self.pools.values():
+            pool.close()
+        drained = True
+        for pool in self.pools.values():
+            drained &= pool.shutdown(max(0.0, deadline - time.monotonic()))
+        for pool in self.pools.values():
+            pool.log_stats()
+        return drained
+
+
+_job_executor: Optional[JobExecutor] = None
+_job_executor_lock = threading.Lock()
+
+
+def get_job_executor() -> JobExecutor:
+    """Process-wide executor built from ``settings.job_executor``."""
+    global _job_executor  # pylint: disable=global-statement
+    with _job_executor_lock:
+        if _job_executor is None:
+            config = settings.job_executor
+            _job_executor = JobExecutor(
+                {
+                    Workload.INTERACTIVE: JobPool(
+                        Workload.INTERACTIVE,
+                        max_workers=config.interactive_workers,
+                        max_queue_size=config.interactive_queue_size,
+                        stats_log_interval=config.stats_log_interval,
+                    ),
+                    Workload.BACKGROUND: JobPool(
+                        Workload.BACKGROUND,
+                        max_workers=config.background_workers,
+                        max_queue_size=config.background_queue_size,
+                        stats_log_interval=config.stats_log_interval,
+                    ),
+                }
+            )
+        return _job_executor
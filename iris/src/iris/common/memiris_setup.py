@@ -2,12 +2,15 @@ import contextvars
 import logging
 import time
 from threading import Thread
-from typing import Callable, Sequence
+from typing import Callable, Optional, Sequence
 from uuid import UUID
 
 from memiris import (
+    AbstractLanguageModel,
+    BudgetedLanguageModel,
     LearningDTO,
     LearningService,
+    LlmBudget,
     Memory,
     MemoryConnectionDTO,
     MemoryConnectionService,
@@ -15,14 +18,21 @@ from memiris import (
     MemoryCreationPipelineBuilder,
     MemoryDTO,
     MemoryService,
+    MemorySleepScheduler,
     MemoryWithRelationsDTO,
     OllamaLanguageModel,
+    SleepSchedulerStats,
 )
 from memiris.api.memory_sleep_pipeline import (
     MemorySleepPipeline,
     MemorySleepPipelineBuilder,
 )
 from memiris.llm.openai_language_model import OpenAiLanguageModel
+from memiris.service.sleep_checkpoint import (
+    FileSleepCheckpointStore,
+    InMemorySleepCheckpointStore,
+    SleepCheckpointStore,
+)
 from memiris.service.vectorizer import Vectorizer
 from memiris.util.uuid_util import is_valid_uuid, to_uuid
 from weaviate import WeaviateClient
@@ -83,6 +93,21 @@ Keep the learnings short and concise. Better have multiple short learnings than
 
 type Tenant = str
 
+# Sleep checkpoints outlive the per-tenant MemirisWrapper instances
+_in_memory_sleep_checkpoints = InMemorySleepCheckpointStore()
+
+# One budget for the LLM calls of all tenants, shared by memory creation and sleep
+_llm_budget = LlmBudget(
+    max_concurrent_calls=settings.memiris.llm_max_concurrent_calls,
+    tokens_per_minute=settings.memiris.llm_tokens_per_minute,
+)
+
+
+def _sleep_checkpoint_store() -> SleepCheckpointStore:
+    if settings.memiris.sleep_checkpoint_dir:
+        return FileSleepCheckpointStore(settings.memiris.sleep_checkpoint_dir)
+    return _in_memory_sleep_checkpoints
+
 
 def _get_model_id(config_value: str | dict[str, str], use_local: bool) -> str:
     """
@@ -101,13 +126,14 @@ def _get_model_id(config_value: str | dict[str, str], use_local: bool) -> str:
 
 
 def _convert_iris_model_to_memiris_llm(
-    model_id: str,
-) -> OpenAiLanguageModel | OllamaLanguageModel:
+    model_id: str, with_budget: bool = True
+) -> AbstractLanguageModel:
     """
     Convert an Iris LLM model ID to a Memiris-compatible language model.
 
     Args:
         model_id: The ID of the model from the LLM configuration.
+        with_budget: Whether the calls of the model count against the shared Memiris LLM budget.
 
     Returns:
         A Memiris-compatible language model (OpenAiLanguageModel or OllamaLanguageModel).
@@ -121,8 +147,9 @@ def _convert_iris_model_to_memiris_llm(
     if model is None:
         raise ValueError(f"Model with ID '{model_id}' not found in LlmManager")
 
+    memiris_llm: AbstractLanguageModel
     if isinstance(model, OllamaModel):
-        return OllamaLanguageModel(model.model, model.host, model.api_key)
+        memiris_llm = OllamaLanguageModel(model.model, model.host, model.api_key)
     elif isinstance(
         model,
         (
@@ -133,7 +160,7 @@ def _convert_iris_model_to_memiris_llm(
         ),
     ):
         is_azure = isinstance(model, (AzureOpenAIChatModel, AzureOpenAIEmbeddingModel))
-        return OpenAiLanguageModel(
+        memiris_llm = OpenAiLanguageModel(
             model=model.model,
             api_key=model.api_key,
             base_url=getattr(model, "base_url", None),
@@ -145,6 +172,25 @@ def _convert_iris_model_to_memiris_llm(
         raise ValueError(
             f"Model type '{type(model).__name__}' is not supported for Memiris"
         )
+    return (
+        BudgetedLanguageModel(memiris_llm, _llm_budget) if with_budget else memiris_llm
+    )
+
+
+def _create_vectorizer() -> Vectorizer:
+    """
+    Creates the vectorizer from the configured embedding models.
+    Embeddings are not budgeted, as memory searches during chats must not wait for the sleep.
+    """
+    if not settings.memiris.llm_configuration:
+        raise ValueError("Memiris LLM configuration is not set")
+
+    return Vectorizer(
+        [
+            _convert_iris_model_to_memiris_llm(model_id, with_budget=False)
+            for model_id in settings.memiris.llm_configuration.embeddings
+        ]
+    )
 
 
 def _create_memory_creation_pipeline(
@@ -233,6 +279,8 @@ def _create_memory_sleep_pipeline(
         .set_vectorizer(vectorizer)
         .set_group_size(25)
         .set_max_threads(20)
+        .set_window_size(settings.memiris.sleep_window_size)
+        .set_checkpoint_store(_sleep_checkpoint_store())
         .set_tool_llm(tool_llm)
         .set_response_llm(json_llm)
         .build()
@@ -263,7 +311,7 @@ def has_memories_for_tenant(tenant: Tenant, memory_service: MemoryService) -> bo
         bool: True if there are memories for the tenant, False otherwise.
     """
     try:
-        return len(memory_service.get_all_memories(tenant)) > 0
+        return memory_service.has_memories(tenant)
     except Exception as e:
         logging.error(
             "Error checking memories for tenant %s: %s", tenant, e, exc_info=True
@@ -291,13 +339,7 @@ class MemirisWrapper:
 
         self.enabled = True
 
-        # Create embedding models from configuration
-        config = settings.memiris.llm_configuration
-        self._memiris_embedding_models = [
-            _convert_iris_model_to_memiris_llm(model_id)
-            for model_id in config.embeddings
-        ]
-        self.vectorizer = Vectorizer(self._memiris_embedding_models)
+        self.vectorizer = _create_vectorizer()
 
         # Create local pipelines
         self.memory_creation_pipeline_local = _create_memory_creation_pipeline(
@@ -403,11 +445,17 @@ class MemirisWrapper:
             if use_local
             else self.memory_sleep_pipeline_cloud
         )
-        pipeline.sleep(self.tenant)
+        stats = pipeline.sleep(self.tenant)
 
         elapsed = time.perf_counter() - start_time
         logging.info(
-            "Memory sleep finished for tenant %s; duration=%.3fs", self.tenant, elapsed
+            "Memory sleep finished for tenant %s; duration=%.3fs memories=%d "
+            "memories_per_s=%.2f peak_rss_mb=%.0f",
+            self.tenant,
+            elapsed,
+            stats.memories,
+            stats.memories_per_s,
+            stats.peak_rss_mb,
         )
 
     def has_memories(self) -> bool:
@@ -685,48 +733,41 @@ class MemirisWrapper:
             raise
 
 
-def memory_sleep_task():
+def memory_sleep_task(
+    tenants: Optional[Sequence[Tenant]] = None,
+) -> Optional[SleepSchedulerStats]:
     """
     A periodic task to sleep memories for all users.
+    The tenants with unslept memories sleep in parallel and take turns, while their LLM calls share the Memiris
+    LLM budget with memory creation.
+
+    Args:
+        tenants: The tenants to sleep. Defaults to all users with unslept memories.
+
+    Returns:
+        The progress of the sleep, or None if it was skipped.
     """
     if not settings.memiris.enabled or not settings.memiris.sleep_enabled:
         logging.info("Memiris memory sleep task is disabled. Skipping execution.")
-        return
+        return None
+    if not settings.memiris.llm_configuration:
+        logging.error("Memiris is enabled but LLM configuration is missing.")
+        return None
     logging.info("Running memory sleep task for all users.")
     vector_db = VectorDatabase().static_client_instance
     if not vector_db:
         logging.warning("Vector database client not initialized. Skipping sleep task.")
-        return
-    memory_service = MemoryService(vector_db)
-    tenants = memory_service.find_all_tenants()
-    if not tenants:
-        logging.info("No tenants found in memory service. Exiting sleep task.")
-        return
-    tenants = [tenant for tenant in tenants if tenant.startswith("artemis-user-")]
-    logging.info("Found %d tenants for memory sleep task.", len(tenants))
-    tenants = [
-        tenant for tenant in tenants if memory_service.has_unslept_memories(tenant)
-    ]
-    logging.info("Found %d tenants with unslept memories.", len(tenants))
-    total = len(tenants)
-    if total == 0:
-        logging.info("No tenants with unslept memories found. Exiting sleep task.")
-        return
-    for idx, tenant in enumerate(tenants, start=1):
-        try:
-            logging.info("Sleeping memories for tenant %s (%d/%d)", tenant, idx, total)
-            memiris_wrapper = MemirisWrapper(vector_db, tenant)
-            start = time.perf_counter()
-            memiris_wrapper.sleep_memories()
-            elapsed = time.perf_counter() - start
-            logging.info(
-                "Finished sleeping memories for tenant %s (%d/%d) in %.3fs",
-                tenant,
-                idx,
-                total,
-                elapsed,
-            )
-        except Exception as e:
-            logging.error(
-                "Error sleeping memories for tenant %s: %s", tenant, e, exc_info=True
-            )
+        return None
+
+    vectorizer = _create_vectorizer()
+    scheduler = MemorySleepScheduler(
+        create_pipeline=lambda: _create_memory_sleep_pipeline(
+            vector_db, vectorizer, use_local=True
+        ),
+        memory_service=MemoryService(vector_db),
+        max_parallel_tenants=settings.memiris.sleep_max_parallel_tenants,
+        windows_per_turn=settings.memiris.sleep_windows_per_turn,
+        tenant_filter=lambda tenant: tenant.startswith("artemis-user-"),
+        llm_budget=_llm_budget,
+    )
+    return scheduler.run(tenants)
@@ -0,0 +1,112 @@
+"""Prometheus metrics for pipeline phases and LLM usage.
+
+Every ``timed_span`` feeds the ``iris_pipeline_span_seconds`` histogram
+labelled with the pipeline, span and variant, so p50/p95 latencies of query
+rewriting, embedding, search or reranking can be queried instead of grepped.
+LLM completions count calls and input/output tokens per model and pipeline.
+All metrics are served on ``/metrics`` in the Prometheus text format.
+
+The pipeline and variant of the current run are kept in a context variable,
+so spans and LLM calls of nested retrievers and sub-pipelines (and of jobs
+submitted to the job executor) are attributed to the run that caused them.
+
+With ``metrics.enabled: false``, recording is a no-op.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Iterator, Optional
+
+import prometheus_client
+
+from iris.config import settings
+
+# Pipeline phases range from millisecond lookups to minute-long agent loops.
+_SPAN_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 80, 160)
+
+_UNSET = "-"
+
+# (pipeline, variant) of the run the current context belongs to.
+_run_labels: ContextVar[tuple[str, str]] = ContextVar(
+    "iris_metrics_run_labels", default=(_UNSET, _UNSET)
+)
+
+_metrics: Optional[SimpleNamespace] = None
+_metrics_disabled = False
+_metrics_lock = threading.Lock()
+
+
+def _get_metrics() -> Optional[SimpleNamespace]:
+    """Create the Prometheus collectors on first use; None if disabled."""
+    global _metrics, _metrics_disabled  # pylint: disable=global-statement
+    if _metrics is not None or _metrics_disabled:
+        return _metrics
+    with _metrics_lock:
+        if _metrics is not None or _metrics_disabled:
+            return _metrics
+        if not settings.metrics.enabled:
+            _metrics_disabled = True
+            return None
+        _metrics = SimpleNamespace(
+            client=prometheus_client,
+            span_seconds=prometheus_client.Histogram(
+                "iris_pipeline_span_seconds",
+                "Wall-clock duration of pipeline phases",
+                ["pipeline", "span", "variant"],
+                buckets=_SPAN_BUCKETS,
+            ),
+            llm_calls=prometheus_client.Counter(
+                "iris_llm_calls_total",
+                "LLM completions",
+                ["model", "pipeline"],
+            ),
+            llm_tokens=prometheus_client.Counter(
+                "iris_llm_tokens_total",
+                "LLM tokens by direction",
+                ["model", "pipeline", "direction"],
+            ),
+        )
+        return _metrics
+
+
+@contextmanager
+def run_labels(pipeline: str, variant: Optional[str]) -> Iterator[None]:
+    """Attribute spans and LLM calls of the wrapped block to this pipeline run."""
+    token = _run_labels.set((pipeline, variant or _UNSET))
+    try:
+        yield
+    finally:
+        _run_labels.reset(token)
+
+
+def observe_span(
+    pipeline: str, span: str, seconds: float, variant: Optional[str] = None
+) -> None:
+    """Record the duration of a pipeline phase."""
+    metrics = _get_metrics()
+    if metrics is None:
+        return
+    variant = variant or _run_labels.get()[1]
+    metrics.span_seconds.labels(pipeline, span, variant).observe(seconds)
+
+
+def record_llm_call(model: str, input_tokens: int, output_tokens: int) -> None:
+    """Count one LLM completion and its tokens for the current pipeline run."""
+    metrics = _get_metrics()
+    if metrics is None:
+        return
+    pipeline = _run_labels.get()[0]
+    model = model or _UNSET
+    metrics.llm_calls.labels(model, pipeline).inc()
+    metrics.llm_tokens.labels(model, pipeline, "input").inc(input_tokens or 0)
+    metrics.llm_tokens.labels(model, pipeline, "output").inc(output_tokens or 0)
+
+
+def render_metrics() -> Optional[tuple[bytes, str]]:
+    """Body and content type of the Prometheus exposition; None if disabled."""
+    metrics = _get_metrics()
+    if metrics is None:
+        return None
+    return metrics.client.generate_latest(), metrics.client.CONTENT_TYPE_LATEST
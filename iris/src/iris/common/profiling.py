@@ -0,0 +1,65 @@
+"""Opt-in sampling profiles of single requests.
+
+With ``metrics.profiling_enabled`` set, a request that sends the
+``X-Iris-Profile`` header marks its context for profiling. Pipelines run in
+job executor threads, so the jobs submitted by that request are sampled with
+``pyinstrument`` and written as HTML to ``metrics.profile_dir``:
+
+    Profile | job=run_chat_pipeline_worker duration_ms=8421 path=tmp/profiles/...html
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator
+
+from pyinstrument import Profiler
+
+from iris.common.logging_config import get_logger, get_request_id
+from iris.config import settings
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = "X-Iris-Profile"
+
+_profile_requested: ContextVar[bool] = ContextVar(
+    "iris_profile_requested", default=False
+)
+
+
+def request_profile(header_value: str | None) -> None:
+    """Mark the current request for profiling if enabled and asked for."""
+    if (
+        settings.metrics.profiling_enabled
+        and header_value
+        and header_value.lower() not in ("0", "false")
+    ):
+        _profile_requested.set(True)
+
+
+@contextmanager
+def profiled(name: str) -> Iterator[None]:
+    """Sample the wrapped block if the current request asked for a profile."""
+    if not _profile_requested.get():
+        yield
+        return
+
+    profiler = Profiler(interval=settings.metrics.profiler_interval_ms / 1000)
+    started = time.perf_counter()
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        duration_ms = (time.perf_counter() - started) * 1000
+        try:
+            path = Path(settings.metrics.profile_dir)
+            path.mkdir(parents=True, exist_ok=True)
+            path /= f"{int(time.time())}-{get_request_id()}-{name}.html"
+            path.write_text(profiler.output_html(), encoding="utf-8")
+            logger.info(
+                "Profile | job=%s duration_ms=%.0f path=%s", name, duration_ms, path
+            )
+        except OSError as e:
+            logger.error("Could not write the profile of %s", name, exc_info=e)
@@ -6,7 +6,8 @@ end-to-end chat latency to individual phases:
     Pipeline timing | pipeline=ChatPipeline span=agent_loop duration_ms=12345 elapsed_ms=13000
 
 ``elapsed_ms`` is the time since the pipeline run started, so the log lines
-double as a timeline of the run.
+double as a timeline of the run. Each span is also observed by the
+``iris_pipeline_span_seconds`` Prometheus histogram.
 """
 
 import time
@@ -14,6 +15,7 @@ from contextlib import contextmanager
 from typing import Iterator, Optional
 
 from iris.common.logging_config import get_logger
+from iris.common.metrics import observe_span
 
 logger = get_logger(__name__)
 
@@ -36,6 +38,7 @@ def timed_span(
     finally:
         now = time.perf_counter()
         duration_ms = (now - span_start) * 1000
+        observe_span(pipeline, span, now - span_start)
         if run_start is not None:
             logger.info(
                 "Pipeline timing | pipeline=%s span=%s duration_ms=%.0f elapsed_ms=%.0f",
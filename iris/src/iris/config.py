@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field, model_validator
@@ -48,11 +48,25 @@ class MemirisSettings(BaseModel):
     Settings for Memiris configuration.
      - enabled: Whether Memiris is enabled or not.
      - sleep_enabled: Whether the sleep functionality of Memiris is enabled or not.
+     - sleep_window_size: Number of unslept memories a sleep loads and processes together.
+     - sleep_checkpoint_dir: Directory where interrupted sleeps record how far they got, so they resume
+        there even after a restart. Without it, sleeps only resume within the same process.
+     - sleep_max_parallel_tenants: Number of tenants the nightly sleep processes at the same time.
+     - sleep_windows_per_turn: Windows a tenant processes before the next tenant takes its turn.
+     - llm_max_concurrent_calls: Maximum number of Memiris LLM calls running at the same time, shared by memory
+        creation and sleep. Unlimited if not set.
+     - llm_tokens_per_minute: Maximum number of tokens the Memiris LLM calls use per minute. Unlimited if not set.
      - llm_configuration: The configuration for the LLMs used by Memiris. Required if Memiris is enabled.
     """
 
     enabled: bool = Field(default=True)
     sleep_enabled: bool = Field(default=True)
+    sleep_window_size: int = Field(default=200, ge=1)
+    sleep_checkpoint_dir: Optional[str] = Field(default=None)
+    sleep_max_parallel_tenants: int = Field(default=4, ge=1)
+    sleep_windows_per_turn: int = Field(default=1, ge=1)
+    llm_max_concurrent_calls: Optional[int] = Field(default=None, ge=1)
+    llm_tokens_per_minute: Optional[int] = Field(default=None, ge=1)
     llm_configuration: Optional[MemirisLlmConfiguration] = Field(default=None)
 
     @model_validator(mode="after")
@@ -149,6 +163,193 @@ class TranscriptionSettings(BaseModel):
             "1.0 to disable."
         ),
     )
+    slide_scan_sample_seconds: float = Field(
+        default=2.0,
+        description=(
+            "Frame sampling interval for the CPU-only visual change scan that "
+            "decides where slide numbers are read with GPT Vision (0 disables "
+            "the scan and probes fixed anchors instead)."
+        ),
+    )
+    slide_scan_hash_threshold: int = Field(
+        default=16,
+        description=(
+            "Differing bits (out of 256) between perceptual hashes of "
+            "consecutive samples that count as a slide change."
+        ),
+    )
+
+
+class LectureIngestionSettings(BaseModel):
+    """Settings for the slide vision step of lecture ingestion."""
+
+    vision_max_workers: int = Field(
+        default=4,
+        description="Max parallel vision requests per lecture unit",
+    )
+    render_processes: int = Field(
+        default=2,
+        description="Processes rendering slides for the vision model (0 renders in-thread)",
+    )
+    render_long_edge_px: int = Field(
+        default=2048,
+        description="Target size of the longer slide edge in rendered images",
+    )
+
+
+class LectureQueryRewriteSettings(BaseModel):
+    """Settings for rewriting chat messages into lecture retrieval queries.
+
+    ``fan_out`` asks the LLM separately for each query and hypothetical
+    answer; ``combined`` asks for all of them in one JSON response and falls
+    back to ``fan_out`` if the response cannot be parsed.
+    """
+
+    mode: Literal["fan_out", "combined"] = Field(
+        default="fan_out",
+        description="Rewrite mode of chat variants without an entry in variant_modes",
+    )
+    variant_modes: dict[str, Literal["fan_out", "combined"]] = Field(
+        default_factory=dict,
+        description="Rewrite mode per chat variant id",
+    )
+    compare_fraction: float = Field(
+        default=0.0,
+        description="Fraction of retrievals that also run the other mode and log its recall and latency",
+    )
+    stats_log_interval: int = Field(
+        default=100,
+        description="Log rewrite latency and recall statistics every N retrievals (0 disables)",
+    )
+
+
+class EmbeddingCacheSettings(BaseModel):
+    """Settings for the content-addressed embedding cache.
+
+    Embeddings are cached per (embedding model id, normalized text) in an
+    in-memory LRU and, if ``sqlite_path`` is set, in an SQLite file that
+    survives restarts.
+    """
+
+    enabled: bool = Field(default=True, description="Enable the embedding cache")
+    max_memory_mb: int = Field(
+        default=128,
+        description="Size bound of the in-memory LRU in megabytes",
+    )
+    sqlite_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file for the on-disk cache; in-memory only if unset",
+    )
+    max_disk_mb: int = Field(
+        default=2048,
+        description="Size bound of the on-disk cache in megabytes",
+    )
+    stats_log_interval: int = Field(
+        default=1000,
+        description="Log hit-rate statistics every N cache lookups (0 disables)",
+    )
+
+
+class JobExecutorSettings(BaseModel):
+    """Settings for the pools that run pipeline and webhook jobs.
+
+    A pool accepts ``workers + queue_size`` jobs at a time; further requests
+    are rejected with HTTP 429.
+    """
+
+    interactive_workers: int = Field(
+        default=32,
+        description="Threads running chat, search and other interactive jobs",
+    )
+    interactive_queue_size: int = Field(
+        default=256,
+        description="Interactive jobs that may wait for a free thread",
+    )
+    background_workers: int = Field(
+        default=16,
+        description="Threads running ingestion and deletion jobs",
+    )
+    background_queue_size: int = Field(
+        default=64,
+        description="Background jobs that may wait for a free thread",
+    )
+    drain_timeout_seconds: int = Field(
+        default=60,
+        description="Time to let queued and running jobs finish on shutdown",
+    )
+    stats_log_interval: int = Field(
+        default=100,
+        description="Log pool statistics every N completed jobs (0 disables)",
+    )
+
+
+class GlobalSearchCacheSettings(BaseModel):
+    """Settings for the semantic cache of global search answers.
+
+    Questions whose embedding is at least ``similarity_threshold`` similar to a
+    cached question of the same Artemis instance reuse its HyDE answer, search
+    hits and, if ``reuse_answers`` is set, the generated answer.
+    """
+
+    enabled: bool = Field(default=True, description="Enable the global search cache")
+    similarity_threshold: float = Field(
+        default=0.95,
+        description="Minimum cosine similarity for two questions to share an entry",
+    )
+    ttl_seconds: int = Field(
+        default=600,
+        description="Time after which a cached entry expires",
+    )
+    max_entries: int = Field(
+        default=1024,
+        description="Entries kept before the least recently used one is evicted",
+    )
+    reuse_answers: bool = Field(
+        default=True,
+        description="Reuse the cached answer; otherwise only HyDE and search hits",
+    )
+    stats_log_interval: int = Field(
+        default=100,
+        description="Log hit-rate and latency statistics every N lookups (0 disables)",
+    )
+
+
+class PipelineRegistrySettings(BaseModel):
+    """Settings for reusing constructed pipeline and retriever instances."""
+
+    max_idle_per_key: int = Field(
+        default=8,
+        description="Idle instances kept per pipeline, variant and local flag (0 disables reuse)",
+    )
+    prewarm: bool = Field(
+        default=True,
+        description="Build the chat pipelines and retrievers at startup",
+    )
+    stats_log_interval: int = Field(
+        default=100,
+        description="Log reuse and constructor-cost statistics every N leases (0 disables)",
+    )
+
+
+class MetricsSettings(BaseModel):
+    """Settings for the Prometheus metrics endpoint and the sampling profiler."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Record span, LLM call and token metrics and serve them on /metrics",
+    )
+    profiling_enabled: bool = Field(
+        default=False,
+        description="Profile jobs of requests that send the X-Iris-Profile header",
+    )
+    profiler_interval_ms: float = Field(
+        default=1.0,
+        description="Sampling interval of the profiler",
+    )
+    profile_dir: str = Field(
+        default="tmp/profiles",
+        description="Directory the HTML profiles are written to",
+    )
 
 
 class Settings(BaseModel):
@@ -162,6 +363,23 @@ class Settings(BaseModel):
     local_llm_enabled: bool = Field(default=True)
     llm_configuration: dict[str, LlmVariantConfiguration] = Field(default_factory=dict)
     transcription: TranscriptionSettings = Field(default_factory=TranscriptionSettings)
+    lecture_ingestion: LectureIngestionSettings = Field(
+        default_factory=LectureIngestionSettings
+    )
+    lecture_query_rewrite: LectureQueryRewriteSettings = Field(
+        default_factory=LectureQueryRewriteSettings
+    )
+    embedding_cache: EmbeddingCacheSettings = Field(
+        default_factory=EmbeddingCacheSettings
+    )
+    job_executor: JobExecutorSettings = Field(default_factory=JobExecutorSettings)
+    global_search_cache: GlobalSearchCacheSettings = Field(
+        default_factory=GlobalSearchCacheSettings
+    )
+    pipeline_registry: PipelineRegistrySettings = Field(
+        default_factory=PipelineRegistrySettings
+    )
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
 
     @classmethod
     def get_settings(cls):
@@ -1,4 +1,6 @@
-from threading import Semaphore, Thread
+from concurrent.futures import Future
+from threading import Semaphore
+from typing import Callable
 
 from iris.common.logging_config import get_logger
 
@@ -8,7 +10,8 @@ logger = get_logger(__name__)
 class IngestionJobHandler:
     """
     A handler to track the current ingestion jobs for lecture units.
-    Skips duplicate jobs if a thread is already running for the same lecture unit.
+    Skips duplicate jobs if a job is already queued or running for the same
+    lecture unit.
     """
 
     def __init__(self):
@@ -16,18 +19,23 @@ class IngestionJobHandler:
         self.semaphore = Semaphore(1)
 
     def add_job(
-        self, process: Thread, course_id: int, lecture_id: int, lecture_unit_id: int
+        self,
+        submit: Callable[[], Future],
+        course_id: int,
+        lecture_id: int,
+        lecture_unit_id: int,
     ):
+        """Call ``submit`` to start the job unless one is pending for the unit."""
         self.semaphore.acquire()
         try:
-            old_thread = None
+            old_job = None
             course_dict = self.job_list.get(course_id)
             if course_dict:
                 lecture_dict = course_dict.get(lecture_id)
                 if lecture_dict:
-                    old_thread = lecture_dict.get(lecture_unit_id)
+                    old_job = lecture_dict.get(lecture_unit_id)
 
-            if old_thread is not None and old_thread.is_alive():
+            if old_job is not None and not old_job.done():
                 logger.info(
                     "Skipping duplicate ingestion job (already running) | "
                     "course=%d lecture=%d unit=%d",
@@ -39,7 +47,6 @@ class IngestionJobHandler:
 
             self.job_list.setdefault(course_id, {}).setdefault(lecture_id, {})[
                 lecture_unit_id
-            ] = process
-            process.start()
+            ] = submit()
         finally:
             self.semaphore.release()
@@ -0,0 +1,107 @@
+"""Slide rendering for vision-based lecture ingestion.
+
+PyMuPDF holds the GIL while rasterising, so rendering pages on threads does
+not overlap with anything else. Pages are rendered in a small process pool
+instead, while the calling threads wait on the vision model.
+
+This module is imported by the pool workers and therefore only depends on
+PyMuPDF and the standard library.
+"""
+
+import base64
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import fitz
+
+# Resolution bounds for the slide images sent to the vision model. The
+# previous fixed 5x matrix is the upper bound; below 1x text gets unreadable.
+MIN_RENDER_SCALE = 1.0
+MAX_RENDER_SCALE = 5.0
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Per worker process: the document opened by the last render call.
+_open_document: Optional[tuple[tuple, fitz.Document]] = None
+
+
+def render_scale(width: float, height: float, long_edge_px: int) -> float:
+    """Zoom factor that renders the longer page edge at about ``long_edge_px``."""
+    longest = max(width, height)
+    if longest <= 0:
+        return MAX_RENDER_SCALE
+    return min(MAX_RENDER_SCALE, max(MIN_RENDER_SCALE, long_edge_px / longest))
+
+
+def render_page_base64(page, long_edge_px: int) -> str:
+    """Render a page as a base64-encoded JPEG sized for the vision model."""
+    scale = render_scale(page.rect.width, page.rect.height, long_edge_px)
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))
+    return base64.b64encode(pix.tobytes("jpg")).decode("utf-8")
+
+
+def _render_in_worker(pdf_path: str, page_num: int, long_edge_px: int) -> str:
+    global _open_document  # pylint: disable=global-statement
+    stat = os.stat(pdf_path)
+    # Temporary file names can be reused, so the key includes size and mtime.
+    key = (pdf_path, stat.st_size, stat.st_mtime_ns)
+    if _open_document is None or _open_document[0] != key:
+        if _open_document is not None:
+            _open_document[1].close()
+        _open_document = (key, fitz.open(pdf_path))
+    return render_page_base64(_open_document[1].load_page(page_num), long_edge_px)
+
+
+def _get_executor(processes: int) -> ProcessPoolExecutor:
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            # spawn: forking the multi-threaded server process is not safe.
+            _executor = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _reset_executor(broken: ProcessPoolExecutor) -> None:
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False)
+
+
+def submit_render(
+    pdf_path: str, page_num: int, long_edge_px: int, processes: int
+) -> "Future[str]":
+    """Render a page of ``pdf_path`` in the shared process pool.
+
+    With ``processes <= 0`` the page is rendered in the calling thread and an
+    already completed future is returned.
+    """
+    if processes <= 0:
+        future: Future[str] = Future()
+        try:
+            with fitz.open(pdf_path) as doc:
+                future.set_result(
+                    render_page_base64(doc.load_page(page_num), long_edge_px)
+                )
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    executor = _get_executor(processes)
+    try:
+        return executor.submit(_render_in_worker, pdf_path, page_num, long_edge_px)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM on a huge page); start a fresh pool once.
+        _reset_executor(executor)
+        return _get_executor(processes).submit(
+            _render_in_worker, pdf_path, page_num, long_edge_px
+        )
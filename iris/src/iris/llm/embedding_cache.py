@@ -0,0 +1,308 @@
+"""Content-addressed cache for text embeddings.
+
+Ingestion and retrieval embed the same strings over and over: re-ingested
+slides that did not change, repeated HyDE answers, popular FAQ questions.
+An embedding only depends on the embedding model and the text, so it is
+cached under ``sha256(model id, normalized text)``.
+
+The cache has two tiers:
+
+* an in-memory LRU bounded by the size of the stored vectors, and
+* optionally an SQLite file, bounded the same way, that survives restarts
+  and is shared by all worker threads.
+
+A memory miss that hits the disk tier promotes the vector into memory. Every
+``stats_log_interval`` lookups one greppable line with the hit rate is logged:
+
+    Embedding cache | lookups=1000 hits=812 hit_rate=0.81 memory_entries=640 ...
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import batched
+from typing import Callable, Optional
+
+from iris.common.logging_config import get_logger
+from iris.config import settings
+
+logger = get_logger(__name__)
+
+# Stays below SQLite's default limit of 999 bound parameters per statement.
+_SQLITE_MAX_PARAMETERS = 900
+
+
+def normalize_text(text: str) -> str:
+    """Normalization applied before hashing: NFC, trimmed, single spaces."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model_id: str, text: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(model_id.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_text(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("d", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array("d")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Hit and miss counts and sizes of both cache tiers."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_entries: int = 0
+    memory_bytes: int = 0
+    disk_entries: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class _SqliteStore:
+    """Size-bounded on-disk tier; least recently used rows are evicted first."""
+
+    def __init__(self, path: str, max_bytes: int):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings(last_used)"
+        )
+        self._connection.commit()
+        self.entries, self.size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        for chunk in batched(keys, _SQLITE_MAX_PARAMETERS):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # nosec B608
+                chunk,
+            ).fetchall()
+            found.update(rows)
+        if found:
+            now = time.time()
+            self._connection.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+            self._connection.commit()
+        return found
+
+    def put_many(self, items: list[tuple[str, bytes]]) -> None:
+        now = time.time()
+        existing = self._sizes([key for key, _ in items])
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+            [(key, blob, now) for key, blob in items],
+        )
+        for key, blob in items:
+            if key in existing:
+                self.size -= existing.pop(key)
+            else:
+                self.entries += 1
+            self.size += len(blob)
+        self._evict()
+        self._connection.commit()
+
+    def _sizes(self, keys: list[str]) -> dict[str, int]:
+        sizes: dict[str, int] = {}
+        for chunk in batched(keys, _SQLITE_MAX_PARAMETERS):
+            placeholders = ",".join("?" * len(chunk))
+            sizes.update(
+                self._connection.execute(
+                    f"SELECT key, LENGTH(vector) FROM embeddings WHERE key IN ({placeholders})",  # nosec B608
+                    chunk,
+                ).fetchall()
+            )
+        return sizes
+
+    def _evict(self) -> None:
+        while self.size > self._max_bytes and self.entries > 0:
+            rows = self._connection.execute(
+                "SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_used LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self.size <= self._max_bytes:
+                    break
+                self._connection.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+                self.entries -= 1
+                self.size -= size
+
+
+class EmbeddingCache:
+    """Two-tier (memory LRU, optional SQLite) cache of embedding vectors."""
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        sqlite_path: Optional[str] = None,
+        max_disk_bytes: int = 0,
+        stats_log_interval: int = 0,
+    ):
+        self._max_memory_bytes = max_memory_bytes
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk = _SqliteStore(sqlite_path, max_disk_bytes) if sqlite_path else None
+        self._stats_log_interval = stats_log_interval
+        self._stats = EmbeddingCacheStats()
+        self._lock = threading.Lock()
+
+    def get_or_embed(
+        self,
+        model_id: str,
+        texts: list[str],
+        embed_many: Callable[[list[str]], list[list[float]]],
+    ) -> list[list[float]]:
+        """Return one vector per text, embedding only texts not cached yet.
+
+        Duplicates within ``texts`` are embedded once. ``embed_many`` is called
+        outside the cache lock, at most once, with the missing texts in order.
+        """
+        keys = [cache_key(model_id, text) for text in texts]
+        with self._lock:
+            found = self._lookup(keys)
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            vectors = embed_many(list(missing.values()))
+            blobs = [_pack(vector) for vector in vectors]
+            with self._lock:
+                self._store(list(zip(missing, blobs)))
+            found.update(zip(missing, blobs))
+        return [_unpack(found[key]) for key in keys]
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return self._snapshot()
+
+    def _lookup(self, keys: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        for key in keys:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                found[key] = blob
+        disk_keys = [key for key in dict.fromkeys(keys) if key not in found]
+        if self._disk is not None and disk_keys:
+            try:
+                from_disk = self._disk.get_many(disk_keys)
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache disk lookup failed: %s", e)
+                from_disk = {}
+            for key, blob in from_disk.items():
+                self._remember(key, blob)
+            found.update(from_disk)
+            self._stats.disk_hits += sum(1 for key in keys if key in from_disk)
+
+        hits = sum(1 for key in keys if key in found)
+        self._record(hits, len(keys) - hits)
+        return found
+
+    def _store(self, items: list[tuple[str, bytes]]) -> None:
+        for key, blob in items:
+            self._remember(key, blob)
+        if self._disk is not None:
+            try:
+                self._disk.put_many(items)
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache disk write failed: %s", e)
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        if len(blob) > self._max_memory_bytes:
+            return
+        self._memory[key] = blob
+        self._memory_bytes += len(blob)
+        while self._memory_bytes > self._max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _record(self, hits: int, misses: int) -> None:
+        before = self._stats.lookups
+        self._stats.hits += hits
+        self._stats.misses += misses
+        interval = self._stats_log_interval
+        if interval > 0 and before // interval != self._stats.lookups // interval:
+            stats = self._snapshot()
+            logger.info(
+                "Embedding cache | lookups=%d hits=%d disk_hits=%d hit_rate=%.2f "
+                "memory_entries=%d memory_mb=%.1f disk_entries=%d",
+                stats.lookups,
+                stats.hits,
+                stats.disk_hits,
+                stats.hit_rate,
+                stats.memory_entries,
+                stats.memory_bytes / (1024 * 1024),
+                stats.disk_entries,
+            )
+
+    def _snapshot(self) -> EmbeddingCacheStats:
+        return EmbeddingCacheStats(
+            hits=self._stats.hits,
+            disk_hits=self._stats.disk_hits,
+            misses=self._stats.misses,
+            memory_entries=len(self._memory),
+            memory_bytes=self._memory_bytes,
+            disk_entries=self._disk.entries if self._disk is not None else 0,
+        )
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Process-wide cache built from ``settings.embedding_cache``; None if disabled."""
+    global _embedding_cache  # pylint: disable=global-statement
+    config = settings.embedding_cache
+    if not config.enabled:
+        return None
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache(
+                max_memory_bytes=config.max_memory_mb * 1024 * 1024,
+                sqlite_path=config.sqlite_path,
+                max_disk_bytes=config.max_disk_mb * 1024 * 1024,
+                stats_log_interval=config.stats_log_interval,
+            )
+        return _embedding_cache
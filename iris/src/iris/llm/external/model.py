@@ -80,6 +80,13 @@ class EmbeddingModel(LanguageModel, metaclass=ABCMeta):
         """Create an embedding from the text"""
         raise NotImplementedError(f"The LLM {str(self)} does not support embeddings")
 
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Create one embedding per text, in input order.
+
+        Models whose API accepts several inputs per request should override this.
+        """
+        return [self.embed(text) for text in texts]
+
 
 class ImageGenerationModel(LanguageModel, metaclass=ABCMeta):
     """Abstract class for the llm image generation wrappers"""
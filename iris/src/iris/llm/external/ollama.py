@@ -24,6 +24,7 @@ from iris.tracing import observe
 
 from ...common.logging_config import get_logger
 from ...common.message_converters import map_role_to_str, map_str_to_role
+from ...common.metrics import record_llm_call
 from ...common.pyris_message import PyrisAIMessage, PyrisMessage, PyrisToolMessage
 from ...common.token_usage_dto import TokenUsageDTO
 from ...domain.data.image_message_content_dto import ImageMessageContentDTO
@@ -131,6 +132,7 @@ def convert_to_iris_message(
         numOutputTokens=num_output_tokens,
         model=model,
     )
+    record_llm_call(model, num_input_tokens, num_output_tokens)
 
     thinking = message.get("thinking")
     if thinking:
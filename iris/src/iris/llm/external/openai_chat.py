@@ -40,6 +40,7 @@ from iris.tracing import observe
 
 from ...common.logging_config import get_logger
 from ...common.message_converters import map_role_to_str, map_str_to_role
+from ...common.metrics import record_llm_call
 from ...common.pyris_message import PyrisAIMessage, PyrisMessage
 from ...common.token_logprob_dto import TokenLogprobEntry, TopLogprobCandidate
 from ...common.token_usage_dto import TokenUsageDTO
@@ -335,11 +336,13 @@ def create_token_usage(usage: Optional[CompletionUsage], model: str) -> TokenUsa
     Returns:
         TokenUsageDTO with the token usage information
     """
-    return TokenUsageDTO(
+    token_usage = TokenUsageDTO(
         model=model,
         numInputTokens=getattr(usage, "prompt_tokens", 0),
         numOutputTokens=getattr(usage, "completion_tokens", 0),
     )
+    record_llm_call(model, token_usage.num_input_tokens, token_usage.num_output_tokens)
+    return token_usage
 
 
 def create_completion_usage_from_responses_usage(usage) -> Optional[CompletionUsage]:
@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional, TypeVar
 
 from langchain_experimental.text_splitter import SemanticChunker
 from langchain_openai import AzureOpenAIEmbeddings, OpenAIEmbeddings
@@ -11,10 +11,12 @@ from openai import (
     RateLimitError,
 )
 
-from iris.tracing import observe
+from iris.tracing import TracedThreadPoolExecutor, observe
 
 from ...llm.external.model import EmbeddingModel
 
+T = TypeVar("T")
+
 
 class OpenAIEmbeddingModel(EmbeddingModel):
     """OpenAIEmbeddingModel provides methods to generate text embeddings using the OpenAI API.
@@ -23,10 +25,63 @@ class OpenAIEmbeddingModel(EmbeddingModel):
     """
 
     api_key: str
+    # Upper bounds for one ``embed_documents`` request in ``embed_many``.
+    embed_batch_size: int = 64
+    embed_batch_max_tokens: int = 100_000
+    # Number of batches sent concurrently by ``embed_many``.
+    embed_max_concurrency: int = 4
     _client: OpenAIEmbeddings
 
     @observe(name="OpenAI Embedding", as_type="embedding")
     def embed(self, text: str) -> list[float]:
+        return self._with_retries(lambda: self._client.embed_query(text))
+
+    @observe(name="OpenAI Batch Embedding", as_type="embedding")
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embed many texts with as few HTTP requests as possible.
+
+        Texts are grouped into batches bounded by ``embed_batch_size`` and by an
+        estimated token budget, and up to ``embed_max_concurrency`` batches are
+        in flight at once. Each batch is retried on its own, so a transient
+        error does not resend the whole input. The result keeps input order.
+        """
+        batches = self._split_into_batches(texts)
+        if len(batches) <= 1 or self.embed_max_concurrency <= 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with TracedThreadPoolExecutor(
+                max_workers=min(self.embed_max_concurrency, len(batches))
+            ) as executor:
+                results = list(executor.map(self._embed_batch, batches))
+        return [vector for batch_result in results for vector in batch_result]
+
+    def _split_into_batches(self, texts: list[str]) -> list[list[str]]:
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = _estimate_tokens(text)
+            if current and (
+                len(current) >= self.embed_batch_size
+                or current_tokens + tokens > self.embed_batch_max_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        vectors = self._with_retries(lambda: self._client.embed_documents(batch))
+        if len(vectors) != len(batch):
+            raise RuntimeError(
+                f"OpenAI returned {len(vectors)} embeddings for {len(batch)} texts."
+            )
+        return vectors
+
+    def _with_retries(self, request: Callable[[], T]) -> T:
         retries = 5
         backoff_factor = 2
         initial_delay = 1
@@ -34,7 +89,7 @@ class OpenAIEmbeddingModel(EmbeddingModel):
 
         for attempt in range(retries):
             try:
-                return self._client.embed_query(text)
+                return request()
             except (
                 APIError,
                 APITimeoutError,
@@ -68,6 +123,15 @@ class OpenAIEmbeddingModel(EmbeddingModel):
         return chunker.split_text(text)
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough token count used to keep a batch under the request token limit.
+
+    OpenAI-compatible backends tokenize differently, so this deliberately
+    over-estimates (about three characters per token) instead of using tiktoken.
+    """
+    return len(text) // 3 + 1
+
+
 class DirectOpenAIEmbeddingModel(OpenAIEmbeddingModel):
     """Direct OpenAI embedding model.
 
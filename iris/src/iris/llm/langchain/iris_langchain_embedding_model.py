@@ -14,7 +14,7 @@ class IrisLangchainEmbeddingModel(Embeddings):
         super().__init__(request_handler=request_handler, **kwargs)
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        return [self.embed_query(text) for text in texts]
+        return self.request_handler.embed_many(texts)
 
     def embed_query(self, text: str) -> List[float]:
         return self.request_handler.embed(text)
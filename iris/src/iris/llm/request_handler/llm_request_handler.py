@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict
 from iris.common.logging_config import get_logger
 from iris.common.pyris_message import PyrisMessage
 from iris.llm.completion_arguments import CompletionArguments
+from iris.llm.embedding_cache import get_embedding_cache
 from iris.llm.external.model import (
     ChatModel,
     CompletionModel,
@@ -61,7 +62,20 @@ class LlmRequestHandler(RequestHandler):
 
     def embed(self, text: str) -> list[float]:
         llm = self._select_model(EmbeddingModel)
-        return llm.embed(text)
+        cache = get_embedding_cache()
+        if cache is None:
+            return llm.embed(text)
+        [vector] = cache.get_or_embed(
+            llm.id, [text], lambda missing: [llm.embed(missing[0])]
+        )
+        return vector
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        llm = self._select_model(EmbeddingModel)
+        cache = get_embedding_cache()
+        if cache is None:
+            return llm.embed_many(texts)
+        return cache.get_or_embed(llm.id, texts, llm.embed_many)
 
     def split_text_semantically(
         self,
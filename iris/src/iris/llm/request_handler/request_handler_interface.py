@@ -51,6 +51,10 @@ class RequestHandler(BaseModel, metaclass=ABCMeta):
         """Create an embedding from the text"""
         raise NotImplementedError
 
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Create one embedding per text, in input order"""
+        return [self.embed(text) for text in texts]
+
     @abstractmethod
     def bind_tools(
         self,
@@ -5,15 +5,18 @@ from contextlib import asynccontextmanager
 from apscheduler.schedulers.background import BackgroundScheduler
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 
 import iris.sentry as sentry
+from iris.common.job_executor import get_job_executor
 from iris.common.logging_config import (
     generate_request_id,
     get_logger,
     set_request_id,
     setup_logging,
 )
+from iris.common.metrics import render_metrics
+from iris.common.profiling import PROFILE_HEADER, request_profile
 from iris.config import settings
 from iris.pipeline.shared.global_search_intent_classifier import (
     warm_up as warm_up_intent_classifier,
@@ -23,6 +26,7 @@ from iris.web.routers.health.health_endpoint import router as health_router
 from iris.web.routers.ingestion_status import router as ingestion_status_router
 from iris.web.routers.memiris import router as memiris_router
 from iris.web.routers.pipelines import router as pipelines_router
+from iris.web.routers.pipelines import warm_up_pipelines
 from iris.web.routers.search import router as search_router
 from iris.web.routers.webhooks import router as webhooks_router
 
@@ -47,12 +51,16 @@ async def lifespan(_: FastAPI):
     )
 
     threading.Thread(target=warm_up_intent_classifier, daemon=True).start()
+    if settings.pipeline_registry.prewarm:
+        threading.Thread(target=warm_up_pipelines, daemon=True).start()
 
     scheduler.add_job(memory_sleep_task, trigger="cron", hour=1, minute=0)
     scheduler.start()
     logger.info("Scheduler started")
     yield
 
+    logger.info("Draining job executor")
+    get_job_executor().shutdown(settings.job_executor.drain_timeout_seconds)
     shutdown_langfuse()
     scheduler.shutdown()
     logger.info("Scheduler stopped")
@@ -93,8 +101,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-# Paths to exclude from request logging (health checks are too noisy)
-EXCLUDED_LOG_PATHS = {"/api/v1/health", "/api/v1/health/"}
+# Paths to exclude from request logging (health checks and scrapes are too noisy)
+EXCLUDED_LOG_PATHS = {"/api/v1/health", "/api/v1/health/", "/metrics"}
 
 
 @app.middleware("http")
@@ -106,10 +114,12 @@ async def request_logging_middleware(request: Request, call_next):
     - Logs request start (DEBUG) and completion (INFO)
     - Skips logging for health check endpoints
     - Tracks request duration
+    - Marks requests sending the X-Iris-Profile header for profiling
     """
     # Generate and set request ID
     request_id = generate_request_id()
     set_request_id(request_id)
+    request_profile(request.headers.get(PROFILE_HEADER))
 
     # Check if we should log this request
     path = request.url.path
@@ -148,6 +158,16 @@ async def request_logging_middleware(request: Request, call_next):
     return response
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus exposition of the span, LLM call and token metrics."""
+    rendered = render_metrics()
+    if rendered is None:
+        return PlainTextResponse("Metrics are disabled", status_code=404)
+    body, content_type = rendered
+    return Response(content=body, media_type=content_type)
+
+
 app.include_router(health_router)
 app.include_router(pipelines_router)
 app.include_router(webhooks_router)
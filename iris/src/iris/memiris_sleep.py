@@ -0,0 +1,64 @@
+"""Run the Memiris memory sleep outside of the nightly job, e.g. to catch up
+after an outage:
+
+    APPLICATION_YML_PATH=application.yml LLM_CONFIG_PATH=llm_config.yml \\
+        python -m iris.memiris_sleep [--tenant artemis-user-42 ...]
+
+Without ``--tenant``, all users with unslept memories are slept. Exits with a
+non-zero status if the sleep was skipped or a tenant failed.
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from iris.common.logging_config import get_logger, setup_logging
+from iris.config import settings
+
+logger = get_logger(__name__)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m iris.memiris_sleep",
+        description="Sleep the Memiris memories of all users with unslept memories.",
+    )
+    parser.add_argument(
+        "--tenant",
+        action="append",
+        dest="tenants",
+        help="Only sleep this tenant. Can be repeated.",
+    )
+    parser.add_argument(
+        "--max-parallel-tenants",
+        type=int,
+        help="Overrides memiris.sleep_max_parallel_tenants.",
+    )
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    settings.set_env_vars()
+    if args.max_parallel_tenants:
+        settings.memiris.sleep_max_parallel_tenants = args.max_parallel_tenants
+
+    # Import after the environment is set up, as in the application lifespan
+    from iris.common.memiris_setup import (  # noqa: E402 pylint: disable=import-outside-toplevel
+        memory_sleep_task,
+    )
+
+    stats = memory_sleep_task(args.tenants)
+    if stats is None:
+        return 1
+    logger.info(
+        "Memory sleep finished | tenants=%d completed=%d failed=%d memories=%d elapsed_s=%.1f",
+        stats.tenants,
+        stats.completed,
+        stats.failed,
+        stats.memories,
+        stats.elapsed_s,
+    )
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import time
 from abc import ABC, abstractmethod
+from contextlib import ExitStack
 from threading import Thread
 from typing import Any, Callable, Generic, List, Optional, TypeVar
 
@@ -10,6 +11,7 @@ from memiris.domain.memory import Memory
 from iris.common.logging_config import get_logger
 from iris.common.memiris_setup import MemirisWrapper
 from iris.common.message_converters import convert_iris_message_to_langchain_message
+from iris.common.metrics import run_labels
 from iris.common.pyris_message import IrisMessageRole, PyrisMessage
 from iris.common.timing import timed_span
 from iris.common.token_usage_dto import TokenUsageDTO
@@ -74,6 +76,11 @@ class AgentPipelineExecutionState(Generic[DTO, VARIANT]):
     deferred_session_title_delivered: bool
     partial_result_sender: Optional[PartialResultSender]
     activity_tracker: ActivityTracker
+    # Optional event identifier that triggered the run (e.g. "jol")
+    event: Optional[str]
+    # Pooled instances (e.g. retrievers) leased for this run and its metric
+    # labels; released when the run ends.
+    leases: ExitStack
 
 
 def _filter_empty_messages(messages: list[PyrisMessage]) -> list[PyrisMessage]:
@@ -618,7 +625,12 @@ class AbstractAgentPipeline(ABC, Pipeline, Generic[DTO, VARIANT]):
 
     @observe(name="Abstract Agent Pipeline")
     def __call__(
-        self, dto: DTO, variant: VARIANT, callback: StatusCallback, local: bool = False
+        self,
+        dto: DTO,
+        variant: VARIANT,
+        callback: StatusCallback,
+        local: bool = False,
+        event: Optional[str] = None,
     ):
         """
         Call the agent pipeline with the provided arguments.
@@ -628,14 +640,14 @@ class AbstractAgentPipeline(ABC, Pipeline, Generic[DTO, VARIANT]):
             variant: The variant configuration to use
             callback: Status callback for updates
             local: If True, use local models; if False, use cloud models
+            event: Optional event identifier that triggered the run
         """
         start_time = time.perf_counter()
         pipeline_name = self.__class__.__name__
+        variant_id = variant.id if hasattr(variant, "id") else "default"
 
         logger.info(
-            "Pipeline started | pipeline=%s variant=%s",
-            pipeline_name,
-            variant.id if hasattr(variant, "id") else "default",
+            "Pipeline started | pipeline=%s variant=%s", pipeline_name, variant_id
         )
 
         # 0. Initialize the execution state
@@ -667,6 +679,9 @@ class AbstractAgentPipeline(ABC, Pipeline, Generic[DTO, VARIANT]):
         state.activity_tracker = ActivityTracker(
             getattr(state.callback, "activity_snapshot", lambda _items, _seq: None)
         )
+        state.event = event
+        state.leases = ExitStack()
+        state.leases.enter_context(run_labels(pipeline_name, variant_id))
         state.tracing_context = self.create_tracing_context(dto, variant)
         state.memiris_wrapper = MemirisWrapper(
             state.db.client, self.get_memiris_tenant(state.dto)
@@ -776,5 +791,6 @@ class AbstractAgentPipeline(ABC, Pipeline, Generic[DTO, VARIANT]):
                 len(state.tools),
             )
         finally:
+            state.leases.close()
             # Clean up tracing context to prevent memory leaks
             clear_current_context()
@@ -17,7 +17,7 @@ from iris.pipeline.chat.iris_chat_mode import IrisChatMode
 from iris.pipeline.session_title_generation_pipeline import (
     SessionTitleGenerationPipeline,
 )
-from iris.tools.chat_tool_providers import CHAT_TOOL_PROVIDERS
+from iris.tools.chat_tool_providers import CHAT_TOOL_PROVIDERS, get_lecture_retriever
 from iris.tracing import TracedThreadPoolExecutor, observe
 from iris.web.status.status_update import StatusCallback
 
@@ -179,7 +179,6 @@ class ChatPipeline(AbstractAgentPipeline[ChatPipelineExecutionDTO, Variant]):
     ]
 
     chat_mode: IrisChatMode
-    event: Optional[str]
     session_title_pipeline: SessionTitleGenerationPipeline
     citation_pipeline: CitationPipeline
     suggestion_pipeline: Optional[InteractionSuggestionPipeline]
@@ -198,8 +197,6 @@ class ChatPipeline(AbstractAgentPipeline[ChatPipelineExecutionDTO, Variant]):
 
         self.chat_mode = chat_mode
 
-        self.event = None
-
         # Initialize pipelines & retrievers
         self.session_title_pipeline = SessionTitleGenerationPipeline(local=local)
         self.citation_pipeline = CitationPipeline(local=local)
@@ -228,6 +225,20 @@ class ChatPipeline(AbstractAgentPipeline[ChatPipelineExecutionDTO, Variant]):
         )
         self._guide_model_cache = {}
 
+    def reset_request_state(self) -> None:
+        """Forget the tokens the previous request left on the sub-pipelines.
+
+        Called by the pipeline registry before a warm instance is reused.
+        """
+        self.tokens = []
+        self.session_title_pipeline.tokens = None
+        self.citation_pipeline.tokens = []
+        if self.suggestion_pipeline is not None:
+            self.suggestion_pipeline.tokens = None
+        if self.code_feedback_pipeline is not None:
+            self.code_feedback_pipeline.tokens = None
+        self.mcq_pipeline.tokens = []
+
     def __repr__(self):
         return f"{self.__class__.__name__}(context={self.chat_mode.value})"
 
@@ -538,7 +549,7 @@ class ChatPipeline(AbstractAgentPipeline[ChatPipelineExecutionDTO, Variant]):
             ),
             "text_exercise_submission": dto.text_exercise_submission,
             "mcq_parallel": getattr(state, "mcq_parallel", False),
-            "event": self.event,
+            "event": state.event,
         }
 
         return self.system_prompt_template.render(template_context)
@@ -615,16 +626,8 @@ class ChatPipeline(AbstractAgentPipeline[ChatPipelineExecutionDTO, Variant]):
         self,
         state: AgentPipelineExecutionState[ChatPipelineExecutionDTO, Variant],
     ) -> LectureRetrieval:
-        """Return a per-request LectureRetrieval instance, cached on the state.
-
-        Both the prompt content injection and the lecture retrieval tool need a
-        retriever; caching avoids instantiating it (and its models) twice.
-        """
-        retriever = getattr(state, "lecture_retriever", None)
-        if retriever is None:
-            retriever = LectureRetrieval(state.db.client)
-            state.lecture_retriever = retriever
-        return retriever
+        """Return the LectureRetrieval leased for this run."""
+        return get_lecture_retriever(state)
 
     def _build_current_view(
         self,
@@ -1016,11 +1019,9 @@ class ChatPipeline(AbstractAgentPipeline[ChatPipelineExecutionDTO, Variant]):
         try:
             logger.info("Running chat pipeline...")
 
-            self.event = event
-
             # Delegate to parent class for standardized execution
             local = dto.settings is not None and dto.settings.is_local()
-            super().__call__(dto, variant, callback, local=local)
+            super().__call__(dto, variant, callback, local=local, event=event)
 
         except Exception as e:
             logger.error(
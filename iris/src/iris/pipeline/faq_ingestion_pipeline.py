@@ -93,15 +93,20 @@ class FaqIngestionPipeline(AbstractIngestion, Pipeline):
     def batch_update(self, faq: FaqDTO):
         """
         Batch update the faq into the database
-        This method is thread-safe and can only be executed by one thread at a time.
-        Weaviate limitation.
+        The faq is embedded before the write. Only the write is thread-safe and
+        executed by one thread at a time (Weaviate limitation).
         """
+        try:
+            embed_chunk = self.llm_embedding.embed(
+                f"{faq.question_title} : {faq.question_answer}"
+            )
+        except Exception as e:
+            logger.error("Error embedding faq: %s", e)
+            raise
+
         with batch_update_lock:
             with self.collection.batch.rate_limit(requests_per_minute=600) as batch:
                 try:
-                    embed_chunk = self.llm_embedding.embed(
-                        f"{faq.question_title} : {faq.question_answer}"
-                    )
                     faq_dict = faq.model_dump()
 
                     batch.add_object(properties=faq_dict, vector=embed_chunk)
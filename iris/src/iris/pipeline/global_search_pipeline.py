@@ -1,5 +1,6 @@
 import json
 import re
+import time
 
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
@@ -8,6 +9,7 @@ from weaviate import WeaviateClient
 
 from iris.common.logging_config import get_logger
 from iris.common.pipeline_enum import PipelineEnum
+from iris.config import settings
 from iris.domain.search.lecture_search_dto import (
     GlobalSearchResponseDTO,
     LectureSearchResultDTO,
@@ -20,6 +22,11 @@ from iris.pipeline.prompts.global_search_prompts import (
     answer_system_prompt,
     hyde_system_prompt,
 )
+from iris.pipeline.shared.global_search_cache import (
+    CachedGlobalSearch,
+    GlobalSearchCacheScope,
+    get_global_search_cache,
+)
 from iris.pipeline.shared.global_search_intent_classifier import (
     classify as classify_intent,
 )
@@ -65,6 +72,7 @@ class GlobalSearchPipeline(SubPipeline):
             answer_model,
             embedding_model,
         )
+        self.cache_model_ids = (hyde_model, answer_model, embedding_model)
 
         hyde_completion_args = CompletionArguments(max_tokens=150)
         answer_completion_args = CompletionArguments(
@@ -93,7 +101,12 @@ class GlobalSearchPipeline(SubPipeline):
 
     @observe(name="Global Search Pipeline")
     def __call__(
-        self, query: str, limit: int = 5, intent: SearchIntent | None = None, **_kwargs
+        self,
+        query: str,
+        limit: int = 5,
+        intent: SearchIntent | None = None,
+        base_url: str | None = None,
+        **_kwargs,
     ) -> GlobalSearchResponseDTO:
         """
         Answer a student's question using course content retrieved via HyDE.
@@ -102,6 +115,8 @@ class GlobalSearchPipeline(SubPipeline):
         :param limit: Maximum number of source segments to retrieve.
         :param intent: Pre-computed intent (SearchIntent). If None,
                        the classifier is called here.
+        :param base_url: Artemis instance of the request. Near-identical questions
+                         of the same instance are answered from the semantic cache.
         :return: An answer with source references.
         """
         # Guard: skip the full LLM pipeline for navigation queries
@@ -112,6 +127,46 @@ class GlobalSearchPipeline(SubPipeline):
             sources = self.retriever.search(query=query, limit=limit)
             return GlobalSearchResponseDTO(answer=None, sources=sources)
 
+        started = time.perf_counter()
+        cache = get_global_search_cache() if base_url else None
+        cached = None
+        if cache is not None:
+            scope = GlobalSearchCacheScope(base_url, self.cache_model_ids, limit)
+            query_vector = self.retriever.llm_embedding.embed(query)
+            cached = cache.lookup(scope, query_vector)
+
+        if cached is not None and settings.global_search_cache.reuse_answers:
+            logger.info("[global-search] answer served from the semantic cache")
+            cache.record_request(True, time.perf_counter() - started)
+            return GlobalSearchResponseDTO(
+                answer=cached.answer, sources=cached.used_sources
+            )
+
+        if cached is not None:
+            hypothetical_answer, sources = cached.hypothetical_answer, cached.sources
+        else:
+            hypothetical_answer, sources = self._retrieve(query, limit)
+        answer, used_sources = self._answer(query, sources)
+
+        if cache is not None:
+            if cached is None:
+                cache.store(
+                    scope,
+                    query_vector,
+                    CachedGlobalSearch(
+                        hypothetical_answer=hypothetical_answer,
+                        sources=sources,
+                        answer=answer,
+                        used_sources=used_sources,
+                    ),
+                )
+            cache.record_request(cached is not None, time.perf_counter() - started)
+        return GlobalSearchResponseDTO(answer=answer, sources=used_sources)
+
+    def _retrieve(
+        self, query: str, limit: int
+    ) -> tuple[str, list[LectureSearchResultDTO]]:
+        """Search with the embedding of a hypothetical answer (HyDE)."""
         # Step 1: Generate a short hypothetical answer to use as the search vector
         hypothetical_answer = (self.hyde_prompt | self.hyde_pipeline).invoke(
             {"query": query}
@@ -143,15 +198,20 @@ class GlobalSearchPipeline(SubPipeline):
                 alpha=0.1,
                 limit=limit,
             )
+        return hypothetical_answer, sources
 
+    def _answer(
+        self, query: str, sources: list[LectureSearchResultDTO]
+    ) -> tuple[str | None, list[LectureSearchResultDTO]]:
+        """Generate the answer and select the sources it is grounded in."""
         if not sources:
-            return GlobalSearchResponseDTO(answer=None, sources=[])
+            return None, []
 
         # Step 3: Generate the real answer using numbered context (with metadata so the
         # model knows the course/lecture name and can reference them explicitly)
         grounded_sources = [s for s in sources if s.snippet]
         if not grounded_sources:
-            return GlobalSearchResponseDTO(answer=None, sources=[])
+            return None, []
 
         def _location_label(s: LectureSearchResultDTO) -> str:
             page = s.lecture_unit.page_number
@@ -221,4 +281,4 @@ class GlobalSearchPipeline(SubPipeline):
             self.answer_llm.tokens, PipelineEnum.IRIS_GLOBAL_SEARCH_PIPELINE
         )
 
-        return GlobalSearchResponseDTO(answer=answer, sources=used_sources)
+        return answer, used_sources
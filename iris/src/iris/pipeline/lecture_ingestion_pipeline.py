@@ -1,9 +1,11 @@
 import base64
+import hashlib
 import json
 import os
 import re
 import tempfile
 import threading
+from concurrent.futures import as_completed
 from datetime import datetime
 from typing import Optional
 
@@ -16,6 +18,7 @@ from weaviate.classes.query import Filter
 
 from iris.common.logging_config import get_logger
 from iris.common.pipeline_enum import PipelineEnum
+from iris.config import settings
 from iris.domain.ingestion.ingestion_pipeline_execution_dto import (
     IngestionPipelineExecutionDto,
 )
@@ -27,12 +30,13 @@ from ..domain.data.lecture_unit_page_dto import LectureUnitPageDTO
 from ..domain.data.slide_vision_dto import SlideVisionDTO
 from ..domain.data.text_message_content_dto import TextMessageContentDTO
 from ..ingestion.abstract_ingestion import AbstractIngestion
+from ..ingestion.pdf_rendering import submit_render
 from ..llm import (
     CompletionArguments,
     LlmRequestHandler,
 )
 from ..llm.langchain import IrisLangchainChatModel
-from ..tracing import observe
+from ..tracing import TracedThreadPoolExecutor, observe
 from ..vector_database.lecture_unit_page_chunk_schema import (
     LectureUnitPageChunkSchema,
     init_lecture_unit_page_chunk_schema,
@@ -124,6 +128,16 @@ def save_pdf(pdf_file_base64):
     return temp_pdf_file_path
 
 
+def compute_page_hash(page, page_text: str) -> str:
+    """
+    Fingerprint a PDF page by its text and a low-resolution rendering.
+    The thumbnail catches changes that do not touch the text layer (images, diagrams).
+    """
+    digest = hashlib.sha256(page_text.encode("utf-8"))
+    digest.update(page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5)).samples)
+    return digest.hexdigest()
+
+
 def create_page_data(
     page_num,
     page_splits,
@@ -132,6 +146,7 @@ def create_page_data(
     base_url,
     display_page_number,
     hidden_until=None,
+    page_hash=None,
 ):
     """
     Create and return a list of dictionnaries to be ingested in the Vector Database.
@@ -148,6 +163,7 @@ def create_page_data(
             LectureUnitPageChunkSchema.BASE_URL.value: base_url,
             LectureUnitPageChunkSchema.PAGE_VERSION.value: lecture_unit_dto.attachment_version,
             LectureUnitPageChunkSchema.HIDDEN_UNTIL.value: hidden_until,
+            LectureUnitPageChunkSchema.PAGE_HASH.value: page_hash,
         }
         for page_split in page_splits
     ]
@@ -195,10 +211,11 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
         self.llm = IrisLangchainChatModel(
             request_handler=request_handler, completion_args=completion_args
         )
-        self.pipeline = self.llm | StrOutputParser()
         self.tokens = []
         self.course_language = None
         self._hidden_until_by_page: dict[int, object] = {}
+        self._existing_chunks: list = []
+        self._reused_chunks: list[tuple[object, dict]] = []
 
     @observe(name="Lecture Unit Page Ingestion Pipeline")
     def __call__(self) -> (str, []):
@@ -222,12 +239,7 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
                 return self.course_language, self.tokens
             self.callback.update()
             self._load_existing_slide_visibility()
-            self.delete_lecture_unit(
-                self.dto.lecture_unit.course_id,
-                self.dto.lecture_unit.lecture_id,
-                self.dto.lecture_unit.lecture_unit_id,
-                self.dto.settings.artemis_base_url,
-            )
+            self._load_existing_chunks()
             self.callback.update()
             self.callback.update()
             chunks = []
@@ -243,11 +255,14 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
             self.callback.update()
             self.callback.update()
             logger.info(
-                "[%s] Embedding and indexing %d chunks into Weaviate",
+                "[%s] Embedding and indexing %d chunks into Weaviate (%d unchanged chunks kept)",
                 self.dto.lecture_unit.lecture_unit_name,
                 len(chunks),
+                len(self._reused_chunks),
             )
             self.batch_update(chunks)
+            self._update_reused_chunks()
+            self._delete_stale_chunks()
 
             self.callback.update(tokens=self.tokens)
 
@@ -343,6 +358,64 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
                 chunk.properties.get(LectureUnitPageChunkSchema.HIDDEN_UNTIL.value),
             )
 
+    def _load_existing_chunks(self) -> None:
+        """Remember the stored chunks so unchanged pages can be reused."""
+        self._existing_chunks = self.collection.query.fetch_objects(
+            filters=self._get_page_chunk_filter(), include_vector=True, limit=10_000
+        ).objects
+        self._reused_chunks = []
+
+    def _existing_pages_by_hash(self) -> dict[str, list[list]]:
+        """Stored chunks grouped per page, keyed by page hash, in page order."""
+        pages: dict[tuple[str, int], list] = {}
+        for chunk in self._existing_chunks:
+            page_hash = chunk.properties.get(LectureUnitPageChunkSchema.PAGE_HASH.value)
+            if not page_hash:
+                continue
+            page_number = int(
+                chunk.properties[LectureUnitPageChunkSchema.PAGE_NUMBER.value]
+            )
+            pages.setdefault((page_hash, page_number), []).append(chunk)
+        by_hash: dict[str, list[list]] = {}
+        for (page_hash, _), page_chunks in sorted(
+            pages.items(), key=lambda item: item[0][1]
+        ):
+            by_hash.setdefault(page_hash, []).append(page_chunks)
+        return by_hash
+
+    def _update_reused_chunks(self) -> None:
+        """
+        Point kept chunks at their new page and attachment version; vectors stay.
+        Chunks that already carry these values are skipped, the others are
+        replaced with their stored vector in one batch instead of one request each.
+        """
+        changed = [
+            (chunk, properties)
+            for chunk, properties in self._reused_chunks
+            if any(
+                chunk.properties.get(key) != value for key, value in properties.items()
+            )
+        ]
+        if not changed:
+            return
+        with batch_update_lock:
+            with self.collection.batch.rate_limit(requests_per_minute=600) as batch:
+                for chunk, properties in changed:
+                    batch.add_object(
+                        uuid=chunk.uuid,
+                        properties={**chunk.properties, **properties},
+                        vector=chunk.vector.get("default"),
+                    )
+
+    def _delete_stale_chunks(self) -> None:
+        """Delete stored chunks of pages that changed or no longer exist."""
+        reused = {chunk.uuid for chunk, _ in self._reused_chunks}
+        stale = [
+            chunk.uuid for chunk in self._existing_chunks if chunk.uuid not in reused
+        ]
+        if stale:
+            self.collection.data.delete_many(where=Filter.by_id().contains_any(stale))
+
     def restore_display_page_numbers_from_existing_chunks(self) -> None:
         chunks = self.collection.query.fetch_objects(
             filters=self._get_page_chunk_filter(), limit=10000
@@ -366,18 +439,25 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
     def batch_update(self, chunks):
         """
         Batch update the chunks into the database
-        This method is thread-safe and can only be executed by one thread at a time.
-        Weaviate limitation.
+        The chunks are embedded before the write. Only the write is thread-safe
+        and executed by one thread at a time (Weaviate limitation).
         """
+        self.callback.update()
+        try:
+            vectors = self.llm_embedding.embed_many(
+                [
+                    chunk[LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value]
+                    for chunk in chunks
+                ]
+            )
+        except Exception as e:
+            logger.error("Error embedding lecture unit", exc_info=e)
+            raise
+
         with batch_update_lock:
             with self.collection.batch.rate_limit(requests_per_minute=600) as batch:
                 try:
-                    for i, chunk in enumerate(chunks):
-                        if i % 10 == 0:
-                            self.callback.update()
-                        embed_chunk = self.llm_embedding.embed(
-                            chunk[LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value]
-                        )
+                    for chunk, embed_chunk in zip(chunks, vectors):
                         batch.add_object(properties=chunk, vector=embed_chunk)
                 except Exception as e:
                     logger.error("Error updating lecture unit", exc_info=e)
@@ -390,7 +470,9 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
         base_url: str = None,
     ):  # pylint: disable=arguments-renamed
         """
-        Chunk the data from the lecture into smaller pieces
+        Chunk the data from the lecture into smaller pieces.
+        Pages whose hash matches a stored page keep their stored chunks
+        (see ``_reused_chunks``) and skip vision, chunking and embedding.
         """
         doc = fitz.open(lecture_pdf)
         self.course_language = self.get_course_language(
@@ -402,30 +484,50 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
         )
         prefix = f"[{lecture_unit_slide_dto.lecture_name} / {lecture_unit_slide_dto.lecture_unit_name}]"
         logger.info("%s Starting PDF chunking: %d pages", prefix, doc.page_count)
-        old_page_text = ""
-        display_page_numbers: list[int] = []
+        page_texts: list[str] = []
+        page_hashes: list[str] = []
+        display_page_numbers: list[int] = [-1] * doc.page_count
+        changed_pages: list[int] = []
+        existing_pages = self._existing_pages_by_hash()
         for page_num in range(doc.page_count):
-            self.callback.update()
             page = doc.load_page(page_num)
-            page_text = page.get_text()
+            page_texts.append(page.get_text())
+            page_hashes.append(compute_page_hash(page, page_texts[page_num]))
 
-            matrix = fitz.Matrix(5, 5)
-            pix = page.get_pixmap(matrix=matrix)
-            img_base64 = base64.b64encode(pix.tobytes("jpg")).decode("utf-8")
-
-            vision_result = self.interpret_image(
-                img_base64,
-                old_page_text,
-                lecture_unit_slide_dto.lecture_name,
-                self.course_language,
+            if not existing_pages.get(page_hashes[page_num]):
+                changed_pages.append(page_num)
+                continue
+            self.callback.update()
+            stored_chunks = existing_pages[page_hashes[page_num]].pop(0)
+            display_page_numbers[page_num] = stored_chunks[0].properties.get(
+                LectureUnitPageChunkSchema.DISPLAY_PAGE_NUMBER.value, -1
             )
-            display_page_numbers.append(vision_result.display_page_number)
-
-            if vision_result.academic_description:
-                page_text = self.merge_page_content_and_image_interpretation(
-                    page_text, vision_result.academic_description
+            self._reused_chunks.extend(
+                (
+                    chunk,
+                    {
+                        LectureUnitPageChunkSchema.COURSE_LANGUAGE.value: self.course_language,
+                        LectureUnitPageChunkSchema.PAGE_NUMBER.value: page_num + 1,
+                        LectureUnitPageChunkSchema.PAGE_VERSION.value: (
+                            lecture_unit_slide_dto.attachment_version
+                        ),
+                        LectureUnitPageChunkSchema.HIDDEN_UNTIL.value: (
+                            self._hidden_until_by_page.get(page_num + 1)
+                        ),
+                    },
                 )
+                for chunk in stored_chunks
+            )
 
+        interpreted = self._interpret_pages(
+            lecture_pdf,
+            changed_pages,
+            page_texts,
+            lecture_unit_slide_dto.lecture_name,
+        )
+        for page_num in changed_pages:
+            vision_result, page_text = interpreted[page_num]
+            display_page_numbers[page_num] = vision_result.display_page_number
             page_splits = text_splitter.create_documents([page_text])
             data.extend(
                 create_page_data(
@@ -436,9 +538,9 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
                     base_url,
                     vision_result.display_page_number,
                     self._hidden_until_by_page.get(page_num + 1),
+                    page_hashes[page_num],
                 )
             )
-            old_page_text = page_text
         if lecture_unit_slide_dto is not None:
             lecture_unit_slide_dto.display_page_numbers = display_page_numbers
             logger.info(
@@ -447,13 +549,67 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
                 display_page_numbers,
             )
         logger.info(
-            "%s PDF chunking complete: %d chunks from %d pages",
+            "%s PDF chunking complete: %d chunks from %d pages (%d unchanged chunks kept)",
             prefix,
             len(data),
             doc.page_count,
+            len(self._reused_chunks),
         )
         return data
 
+    def _interpret_pages(
+        self,
+        lecture_pdf: str,
+        page_numbers: list[int],
+        page_texts: list[str],
+        lecture_name: str,
+    ) -> dict[int, tuple[SlideVisionDTO, str]]:
+        """
+        Run vision on the given pages and merge the result into the page text.
+        Pages are rendered in a process pool and interpreted concurrently; the
+        context for each page is the raw PDF text of the previous page, so pages
+        do not wait for each other. Returns (vision result, page text) per page.
+        """
+        config = settings.lecture_ingestion
+        renders = {
+            page_num: submit_render(
+                lecture_pdf,
+                page_num,
+                config.render_long_edge_px,
+                config.render_processes,
+            )
+            for page_num in page_numbers
+        }
+
+        def interpret(page_num: int) -> tuple[SlideVisionDTO, str]:
+            vision_result = self.interpret_image(
+                renders[page_num].result(),
+                page_texts[page_num - 1] if page_num > 0 else "",
+                lecture_name,
+                self.course_language,
+            )
+            page_text = page_texts[page_num]
+            if vision_result.academic_description:
+                page_text = self.merge_page_content_and_image_interpretation(
+                    page_text, vision_result.academic_description
+                )
+            return vision_result, page_text
+
+        interpreted: dict[int, tuple[SlideVisionDTO, str]] = {}
+        if not page_numbers:
+            return interpreted
+        with TracedThreadPoolExecutor(
+            max_workers=max(1, min(config.vision_max_workers, len(page_numbers)))
+        ) as executor:
+            futures = {
+                executor.submit(interpret, page_num): page_num
+                for page_num in page_numbers
+            }
+            for future in as_completed(futures):
+                interpreted[futures[future]] = future.result()
+                self.callback.update()
+        return interpreted
+
     def interpret_image(
         self,
         img_base64: str,
@@ -536,12 +692,17 @@ class LectureUnitPageIngestionPipeline(AbstractIngestion, Pipeline):
             image_interpretation=image_interpretation,
         )
         prompt = ChatPromptTemplate.from_messages(prompt_val)
+        # Pages are merged concurrently; a model per call keeps token usage apart.
+        llm = IrisLangchainChatModel(
+            request_handler=self.llm.request_handler,
+            completion_args=self.llm.completion_args,
+        )
         clean_output = clean_text(
-            (prompt | self.pipeline).invoke({}),
+            (prompt | llm | StrOutputParser()).invoke({}),
             bullets=True,
             extra_whitespace=True,
         )
-        self._append_tokens(self.llm.tokens, PipelineEnum.IRIS_LECTURE_INGESTION)
+        self._append_tokens(llm.tokens, PipelineEnum.IRIS_LECTURE_INGESTION)
         return clean_output
 
     def get_course_language(self, page_content: str) -> str:
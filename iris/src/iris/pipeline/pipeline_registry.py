@@ -0,0 +1,206 @@
+"""Warm, reusable pipeline and retriever instances.
+
+Building a ``ChatPipeline`` constructs its sub-pipelines, LLM wrappers and
+retrievers and resolves all of their models from the LLM configuration; every
+request used to pay for that again. The registry keeps idle instances per
+(pipeline id, variant, local) key and leases each instance to one request at a
+time. Per-request state lives in the execution state or is cleared by the
+instance's ``reset_request_state()`` before it is leased again.
+
+When the file at ``LLM_CONFIG_PATH`` changes, the LLMs are reloaded and idle
+instances are dropped, so the next requests build against the new
+configuration. Every ``stats_log_interval`` leases one greppable line with
+the constructor cost that reuse saves is logged:
+
+    Pipeline registry | leases=100 reused=96 built=4 build_avg_ms=412 idle=6
+    reloads=0
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from iris.common.logging_config import get_logger
+from iris.config import settings
+from iris.llm.llm_manager import LlmManager
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# (pipeline id, variant, local)
+PipelineKey = tuple[str, str, bool]
+
+
+@dataclass
+class PipelineRegistryStats:
+    """Leases, instance builds and reloads of the registry."""
+
+    leases: int = 0
+    built: int = 0
+    build_ms: float = 0.0
+    idle: int = 0
+    reloads: int = 0
+
+    @property
+    def reused(self) -> int:
+        return self.leases - self.built
+
+    @property
+    def build_avg_ms(self) -> float:
+        return self.build_ms / self.built if self.built else 0.0
+
+
+def _config_mtime(path: Optional[str]) -> Optional[float]:
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class PipelineRegistry:
+    """Pool of idle pipeline instances, leased exclusively per request."""
+
+    def __init__(
+        self,
+        max_idle_per_key: int,
+        stats_log_interval: int = 0,
+        llm_config_path: Optional[str] = None,
+    ):
+        self._max_idle_per_key = max(0, max_idle_per_key)
+        self._stats_log_interval = stats_log_interval
+        self._llm_config_path = llm_config_path
+        self._llm_config_mtime = _config_mtime(llm_config_path)
+        self._idle: dict[PipelineKey, list[Any]] = {}
+        self._generation = 0
+        self._stats = PipelineRegistryStats()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self, key: PipelineKey, factory: Callable[[], T]) -> Iterator[T]:
+        """Lend an idle instance of ``key``, or one built by ``factory``.
+
+        The instance is returned to the pool when the ``with`` block exits.
+        """
+        instance, generation = self._acquire(key, factory)
+        try:
+            yield instance
+        finally:
+            self._release(key, instance, generation)
+
+    def warm(self, key: PipelineKey, factory: Callable[[], Any]) -> None:
+        """Build an instance of ``key`` ahead of time unless one is idle."""
+        with self._lock:
+            if self._idle.get(key) or self._max_idle_per_key == 0:
+                return
+        with self.lease(key, factory):
+            pass
+
+    def clear(self) -> None:
+        """Drop all idle instances; leased ones are discarded when returned."""
+        with self._lock:
+            self._generation += 1
+            self._idle.clear()
+
+    def stats(self) -> PipelineRegistryStats:
+        with self._lock:
+            return self._snapshot()
+
+    def _acquire(self, key: PipelineKey, factory: Callable[[], T]) -> tuple[T, int]:
+        self._reload_if_llm_config_changed()
+        with self._lock:
+            idle = self._idle.get(key)
+            instance = idle.pop() if idle else None
+            generation = self._generation
+            self._stats.leases += 1
+            self._maybe_log()
+
+        if instance is not None:
+            reset = getattr(instance, "reset_request_state", None)
+            if reset is not None:
+                reset()
+            return instance, generation
+
+        started = time.perf_counter()
+        instance = factory()
+        build_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats.built += 1
+            self._stats.build_ms += build_ms
+        logger.info(
+            "Pipeline registry | built pipeline=%s variant=%s local=%s in %.0fms",
+            *key,
+            build_ms,
+        )
+        return instance, generation
+
+    def _release(self, key: PipelineKey, instance: Any, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle_per_key:
+                idle.append(instance)
+
+    def _reload_if_llm_config_changed(self) -> None:
+        mtime = _config_mtime(self._llm_config_path)
+        with self._lock:
+            if mtime == self._llm_config_mtime:
+                return
+            self._llm_config_mtime = mtime
+            self._generation += 1
+            self._idle.clear()
+            self._stats.reloads += 1
+        logger.info("Pipeline registry | LLM configuration changed, reloading")
+        try:
+            LlmManager().load_llms()
+        except Exception as e:
+            logger.error("Failed to reload the LLM configuration", exc_info=e)
+
+    def _maybe_log(self) -> None:
+        interval = self._stats_log_interval
+        if interval <= 0 or self._stats.leases % interval != 0:
+            return
+        stats = self._snapshot()
+        logger.info(
+            "Pipeline registry | leases=%d reused=%d built=%d build_avg_ms=%.0f "
+            "idle=%d reloads=%d",
+            stats.leases,
+            stats.reused,
+            stats.built,
+            stats.build_avg_ms,
+            stats.idle,
+            stats.reloads,
+        )
+
+    def _snapshot(self) -> PipelineRegistryStats:
+        return PipelineRegistryStats(
+            leases=self._stats.leases,
+            built=self._stats.built,
+            build_ms=self._stats.build_ms,
+            idle=sum(len(idle) for idle in self._idle.values()),
+            reloads=self._stats.reloads,
+        )
+
+
+_pipeline_registry: Optional[PipelineRegistry] = None
+_pipeline_registry_lock = threading.Lock()
+
+
+def get_pipeline_registry() -> PipelineRegistry:
+    """Process-wide registry built from ``settings.pipeline_registry``."""
+    global _pipeline_registry  # pylint: disable=global-statement
+    with _pipeline_registry_lock:
+        if _pipeline_registry is None:
+            config = settings.pipeline_registry
+            _pipeline_registry = PipelineRegistry(
+                max_idle_per_key=config.max_idle_per_key,
+                stats_log_interval=config.stats_log_interval,
+                llm_config_path=os.environ.get("LLM_CONFIG_PATH"),
+            )
+        return _pipeline_registry
@@ -129,3 +129,46 @@ You should create a response that look like spoken content from a lecture video
 Answer just with the spoken text.
 Do not exceed 350 words. Add keywords and phrases that are relevant to student intent.
 """
+
+combined_rewrite_initial_prompt = """
+You write good and performant vector database queries, in particular for Weaviate,
+from chat histories between an AI tutor and a student in the lecture {course_name}.
+The queries are used to retrieve context information from indexed lecture slides and lecture transcriptions so the
+AI tutor can use the context information to give a better answer.
+A good vector database query is formulated in natural language, just like a student would ask a question.
+It is not an instruction to the database, but a question to the database.
+The chat history between the AI tutor and the student is provided to you in the next messages.
+"""
+
+combined_rewrite_initial_prompt_with_exercise_context = """
+You write good and performant vector database queries, in particular for Weaviate,
+from chat histories between an AI tutor and a student.
+The student has sent a query in the context of the lecture {course_name} and the exercise {exercise_name}.
+For more exercise context here is the problem statement:
+---
+{problem_statement}
+---
+The queries are used to retrieve context information from indexed lecture slides and lecture transcriptions so the
+AI tutor can use the context information to give a better answer.
+A good vector database query is formulated in natural language, just like a student would ask a question.
+It is not an instruction to the database, but a question to the database.
+The chat history between the AI tutor and the student is provided to you in the next messages.
+"""
+
+combined_rewrite_student_query_prompt = """This is the latest student message: '{student_query}'.
+Write all of the following texts in {course_language} and return them as one JSON object with exactly these keys:
+{output_fields}
+For the queries, replace any reference to previous messages or to the exercise context with the details needed and
+preserve the context and semantic meaning of the student message.
+For the hypothetical answers, add keywords and phrases that are relevant to the student intent and do not exceed
+{answer_word_limit} words each.
+ANSWER ONLY WITH THE JSON OBJECT.
+"""
+
+combined_rewrite_output_fields = {
+    "lecture_pages_query": "the student message rewritten as a query for lecture slides",
+    "lecture_pages_answer": "a hypothetical answer that looks like a university lecture slide",
+    "lecture_transcriptions_query": "the student message rewritten as a query for lecture transcriptions",
+    "lecture_transcriptions_answer": "a hypothetical answer that looks like spoken content from a lecture video, "
+    "only the spoken text",
+}
@@ -0,0 +1,284 @@
+"""Semantic cache for global search answers.
+
+During a lecture many students ask nearly the same question at once. Instead
+of generating a HyDE answer, searching and generating an answer for each of
+them, a question whose embedding is at least ``similarity_threshold`` similar
+to a cached question reuses that entry.
+
+Entries are scoped to the Artemis instance, the pipeline models and the
+result limit. They expire after ``ttl_seconds`` and are dropped when lecture
+content, metadata or visibility of a course they reference changes. Every
+``stats_log_interval`` lookups one greppable line is logged:
+
+    Global search cache | lookups=200 hits=74 hit_rate=0.37 entries=118
+    invalidated=9 lookup_avg_ms=0.6 hit_avg_ms=41 miss_avg_ms=5210
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import count
+from typing import Iterable, Optional
+
+import numpy as np
+
+from iris.common.logging_config import get_logger
+from iris.config import settings
+from iris.domain.search.lecture_search_dto import LectureSearchResultDTO
+
+logger = get_logger(__name__)
+
+
+def _normalize_base_url(base_url: str) -> str:
+    return base_url.rstrip("/")
+
+
+@dataclass(frozen=True)
+class GlobalSearchCacheScope:
+    """Requests only share entries if all of these are equal."""
+
+    base_url: str
+    model_ids: tuple[str, ...]
+    limit: int
+
+    def __post_init__(self):
+        object.__setattr__(self, "base_url", _normalize_base_url(self.base_url))
+
+
+@dataclass(frozen=True)
+class CachedGlobalSearch:
+    hypothetical_answer: str
+    sources: list[LectureSearchResultDTO]
+    answer: Optional[str]
+    used_sources: list[LectureSearchResultDTO]
+
+
+@dataclass
+class GlobalSearchCacheStats:
+    """Hit rate of the cache and latency of hit and miss requests."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidated: int = 0
+    entries: int = 0
+    lookup_ms: float = 0.0
+    hit_requests: int = 0
+    hit_ms: float = 0.0
+    miss_requests: int = 0
+    miss_ms: float = 0.0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def lookup_avg_ms(self) -> float:
+        return self.lookup_ms / self.lookups if self.lookups else 0.0
+
+    @property
+    def hit_avg_ms(self) -> float:
+        return self.hit_ms / self.hit_requests if self.hit_requests else 0.0
+
+    @property
+    def miss_avg_ms(self) -> float:
+        return self.miss_ms / self.miss_requests if self.miss_requests else 0.0
+
+
+@dataclass
+class _Entry:
+    scope: GlobalSearchCacheScope
+    vector: np.ndarray
+    result: CachedGlobalSearch
+    course_ids: frozenset[int]
+    expires_at: float
+
+
+def _unit_vector(vector: list[float]) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    return array / norm if norm > 0 else array
+
+
+class GlobalSearchCache:
+    """LRU of global search results, matched by question embedding similarity."""
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        ttl_seconds: float,
+        max_entries: int,
+        stats_log_interval: int = 0,
+    ):
+        self._similarity_threshold = similarity_threshold
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._stats_log_interval = stats_log_interval
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._ids_by_scope: dict[GlobalSearchCacheScope, set[int]] = {}
+        self._next_id = count()
+        self._stats = GlobalSearchCacheStats()
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, scope: GlobalSearchCacheScope, query_vector: list[float]
+    ) -> Optional[CachedGlobalSearch]:
+        """Most similar live entry of ``scope`` above the threshold, if any."""
+        started = time.perf_counter()
+        vector = _unit_vector(query_vector)
+        with self._lock:
+            self._drop_expired(scope)
+            ids = list(self._ids_by_scope.get(scope, ()))
+            best_id = None
+            if ids:
+                similarities = np.stack([self._entries[i].vector for i in ids]) @ vector
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self._similarity_threshold:
+                    best_id = ids[best]
+            if best_id is not None:
+                self._entries.move_to_end(best_id)
+                self._stats.hits += 1
+                result = self._entries[best_id].result
+            else:
+                self._stats.misses += 1
+                result = None
+            self._stats.lookup_ms += (time.perf_counter() - started) * 1000
+            self._maybe_log()
+        return result
+
+    def store(
+        self,
+        scope: GlobalSearchCacheScope,
+        query_vector: list[float],
+        result: CachedGlobalSearch,
+    ) -> None:
+        entry = _Entry(
+            scope=scope,
+            vector=_unit_vector(query_vector),
+            result=result,
+            course_ids=frozenset(source.course.id for source in result.sources),
+            expires_at=time.monotonic() + self._ttl_seconds,
+        )
+        with self._lock:
+            entry_id = next(self._next_id)
+            self._entries[entry_id] = entry
+            self._ids_by_scope.setdefault(scope, set()).add(entry_id)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, base_url: str, course_ids: Iterable[int]) -> int:
+        """Drop the entries of ``base_url`` that may show stale course content.
+
+        Entries referencing one of ``course_ids`` are dropped, as are entries
+        without sources, since the changed content may now match them. Other
+        entries can only miss newly added content, which ``ttl_seconds`` bounds.
+        """
+        base_url = _normalize_base_url(base_url)
+        course_ids = set(course_ids)
+        with self._lock:
+            stale = [
+                entry_id
+                for entry_id, entry in self._entries.items()
+                if entry.scope.base_url == base_url
+                and (not entry.course_ids or entry.course_ids & course_ids)
+            ]
+            for entry_id in stale:
+                self._remove(entry_id)
+            self._stats.invalidated += len(stale)
+        if stale:
+            logger.debug(
+                "Global search cache | invalidated %d entries of courses %s",
+                len(stale),
+                sorted(course_ids),
+            )
+        return len(stale)
+
+    def record_request(self, hit: bool, elapsed_seconds: float) -> None:
+        """Record the end-to-end latency of a request served (or not) from the cache."""
+        with self._lock:
+            if hit:
+                self._stats.hit_requests += 1
+                self._stats.hit_ms += elapsed_seconds * 1000
+            else:
+                self._stats.miss_requests += 1
+                self._stats.miss_ms += elapsed_seconds * 1000
+
+    def stats(self) -> GlobalSearchCacheStats:
+        with self._lock:
+            return self._snapshot()
+
+    def _drop_expired(self, scope: GlobalSearchCacheScope) -> None:
+        now = time.monotonic()
+        for entry_id in list(self._ids_by_scope.get(scope, ())):
+            if self._entries[entry_id].expires_at <= now:
+                self._remove(entry_id)
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        ids = self._ids_by_scope[entry.scope]
+        ids.discard(entry_id)
+        if not ids:
+            del self._ids_by_scope[entry.scope]
+
+    def _maybe_log(self) -> None:
+        interval = self._stats_log_interval
+        if interval <= 0 or self._stats.lookups % interval != 0:
+            return
+        stats = self._snapshot()
+        logger.info(
+            "Global search cache | lookups=%d hits=%d hit_rate=%.2f entries=%d "
+            "invalidated=%d lookup_avg_ms=%.1f hit_avg_ms=%.0f miss_avg_ms=%.0f",
+            stats.lookups,
+            stats.hits,
+            stats.hit_rate,
+            stats.entries,
+            stats.invalidated,
+            stats.lookup_avg_ms,
+            stats.hit_avg_ms,
+            stats.miss_avg_ms,
+        )
+
+    def _snapshot(self) -> GlobalSearchCacheStats:
+        return GlobalSearchCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            invalidated=self._stats.invalidated,
+            entries=len(self._entries),
+            lookup_ms=self._stats.lookup_ms,
+            hit_requests=self._stats.hit_requests,
+            hit_ms=self._stats.hit_ms,
+            miss_requests=self._stats.miss_requests,
+            miss_ms=self._stats.miss_ms,
+        )
+
+
+_global_search_cache: Optional[GlobalSearchCache] = None
+_global_search_cache_lock = threading.Lock()
+
+
+def get_global_search_cache() -> Optional[GlobalSearchCache]:
+    """Process-wide cache built from ``settings.global_search_cache``; None if disabled."""
+    global _global_search_cache  # pylint: disable=global-statement
+    config = settings.global_search_cache
+    if not config.enabled:
+        return None
+    with _global_search_cache_lock:
+        if _global_search_cache is None:
+            _global_search_cache = GlobalSearchCache(
+                similarity_threshold=config.similarity_threshold,
+                ttl_seconds=config.ttl_seconds,
+                max_entries=config.max_entries,
+                stats_log_interval=config.stats_log_interval,
+            )
+        return _global_search_cache
+
+
+def invalidate_global_search_cache(base_url: str, course_ids: Iterable[int]) -> None:
+    """Drop cached global search results of changed courses; no-op if disabled."""
+    cache = get_global_search_cache()
+    if cache is not None and base_url:
+        cache.invalidate(base_url, course_ids)
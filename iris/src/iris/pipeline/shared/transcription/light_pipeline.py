@@ -8,6 +8,7 @@ with a slide number by analysing video frames.
 from typing import Any, Dict, List, Optional
 
 from iris.common.logging_config import get_logger
+from iris.config import settings
 from iris.llm.llm_configuration import resolve_model
 from iris.llm.request_handler.llm_request_handler import LlmRequestHandler
 from iris.pipeline.shared.transcription.alignment import align_slides_with_segments
@@ -24,7 +25,8 @@ class LightTranscriptionPipeline:
     """Detect slide changes and align them with transcript segments.
 
     Steps:
-    1. Probe video frames with GPT Vision to find slide change points.
+    1. Scan video frames for visual changes and probe them with GPT Vision to
+       find slide change points.
     2. Align each transcript segment with the most recent slide change.
 
     Requires the video file to still be on disk (from the heavy phase
@@ -100,6 +102,8 @@ class LightTranscriptionPipeline:
             min_stride=1,
             job_id=str(lecture_unit_id),
             on_progress=on_slide_detection_progress,
+            visual_scan_sample_seconds=settings.transcription.slide_scan_sample_seconds,
+            visual_scan_hash_threshold=settings.transcription.slide_scan_hash_threshold,
         )
         self.callback.update()
         logger.info(
@@ -2,9 +2,15 @@
 Detect slide-number change points from a video with minimal GPT Vision calls.
 
 Strategy:
-- Probe sparse "anchors" (every ``anchor_stride`` segments) with GPT Vision.
-- When adjacent anchors disagree (or either is unknown), recursively probe the
-  midpoint until the interval either stabilises or shrinks to ``min_stride``.
+- Decode the video sequentially at a low sample rate and compare perceptual
+  hashes of the slide region to find visual change points (CPU only).
+- Probe the first segment after every visual change, plus sparse anchors
+  inside long unchanged runs, with GPT Vision.
+- When adjacent probes within a run disagree (or either is unknown),
+  recursively probe the midpoint until the interval either stabilises or
+  shrinks to ``min_stride``.
+- Without a usable visual scan, fall back to sparse "anchors" (every
+  ``anchor_stride`` segments) refined the same way.
 - Compress the per-segment labels into ``(timestamp, slide_num)`` change points
   for the alignment step.
 """
@@ -12,6 +18,7 @@ Strategy:
 from __future__ import annotations
 
 import base64
+import bisect
 import re
 from collections import OrderedDict
 from typing import Callable, Dict, List, Optional, Tuple
@@ -35,6 +42,60 @@ _SYSTEM_PROMPT = (
 )
 
 
+def _crop_slide_region(frame):
+    """Crop bottom half — slides are typically in the lower portion of the frame."""
+    height = frame.shape[0]
+    return frame[int(height * 0.5) :, :]  # noqa: E203
+
+
+def _difference_hash(frame, hash_size: int = 16):
+    """Perceptual difference hash of the slide region as a boolean array."""
+    gray = cv2.cvtColor(_crop_slide_region(frame), cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    return small[:, 1:] > small[:, :-1]
+
+
+def scan_visual_changes(
+    video_path: str, sample_seconds: float, hash_threshold: int
+) -> Optional[List[float]]:
+    """Find timestamps where the slide region visibly changes.
+
+    The video is decoded front to back (no seeking) and every
+    ``sample_seconds`` a frame is hashed. A change is reported at the first
+    sample whose hash differs from the previous sample in more than
+    ``hash_threshold`` bits.
+
+    Returns:
+        Change timestamps in seconds, or None if the video could not be decoded.
+    """
+    cap = cv2.VideoCapture(video_path)
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        if fps <= 0:
+            return None
+
+        step = max(1, round(fps * sample_seconds))
+        changes: List[float] = []
+        previous = None
+        frame_idx = 0
+        while cap.grab():
+            if frame_idx % step == 0:
+                ret, frame = cap.retrieve()
+                if ret:
+                    current = _difference_hash(frame)
+                    if (
+                        previous is not None
+                        and int((current != previous).sum()) > hash_threshold
+                    ):
+                        changes.append(frame_idx / fps)
+                    previous = current
+            frame_idx += 1
+
+        return changes if previous is not None else None
+    finally:
+        cap.release()
+
+
 class _FrameCache:
     """LRU cache for base64-encoded cropped frames keyed by segment index."""
 
@@ -69,7 +130,7 @@ class _FrameCache:
             self._cache[idx] = None
             return None
 
-        ts = self._capture_timestamp(idx)
+        ts = self.capture_timestamp(idx)
         self.cap.set(cv2.CAP_PROP_POS_FRAMES, int(ts * self.fps))
         ret, frame = self.cap.read()
 
@@ -77,10 +138,7 @@ class _FrameCache:
             self._cache[idx] = None
             return None
 
-        # Crop bottom half — slides are typically in the lower portion of the frame.
-        height = frame.shape[0]
-        cropped = frame[int(height * 0.5) :, :]  # noqa: E203
-        success, buffer = cv2.imencode(".jpg", cropped)
+        success, buffer = cv2.imencode(".jpg", _crop_slide_region(frame))
 
         if not success:
             self._cache[idx] = None
@@ -94,7 +152,7 @@ class _FrameCache:
 
         return img_b64
 
-    def _capture_timestamp(self, idx: int) -> float:
+    def capture_timestamp(self, idx: int) -> float:
         """Choose a timestamp 20% into the segment span to avoid transition frames."""
         try:
             start = float(self.segments[idx]["start"])
@@ -120,8 +178,9 @@ class SlideTurnDetector:
     """
     Detect slide-number change points using recursive midpoint refinement.
 
-    Minimises GPT Vision calls by only probing anchors and refining intervals
-    where adjacent anchors disagree.
+    Minimises GPT Vision calls by only probing segments right after a visual
+    change (or sparse anchors if the video cannot be scanned) and refining
+    intervals where adjacent probes disagree.
     """
 
     def __init__(
@@ -135,6 +194,8 @@ class SlideTurnDetector:
         job_id: Optional[str] = None,
         capture_offset_ratio: float = 0.2,
         on_progress: Optional[Callable[[int, int], None]] = None,
+        visual_scan_sample_seconds: float = 2.0,
+        visual_scan_hash_threshold: int = 16,
     ):
         """
         Args:
@@ -146,6 +207,10 @@ class SlideTurnDetector:
             cache_size: Max frames to keep in the LRU cache.
             job_id: Optional job ID for log correlation.
             capture_offset_ratio: Fraction into the segment span to capture the frame.
+            visual_scan_sample_seconds: Frame sampling interval of the visual
+                change scan (0 disables the scan).
+            visual_scan_hash_threshold: Differing hash bits (out of 256) that
+                count as a visual change.
         """
         self.video_path = video_path
         self.segments = segments
@@ -154,6 +219,8 @@ class SlideTurnDetector:
         self.min_stride = max(1, min_stride)
         self.job_id = job_id
         self.on_progress = on_progress
+        self.visual_scan_sample_seconds = visual_scan_sample_seconds
+        self.visual_scan_hash_threshold = visual_scan_hash_threshold
         self.labels: List[Optional[int]] = [None] * len(segments)
         self.frame_cache = _FrameCache(
             video_path,
@@ -182,15 +249,19 @@ class SlideTurnDetector:
                 self.min_stride,
             )
 
-            anchor_indices = self._build_anchor_indices()
-            logger.debug("[Lecture %s] Anchors: %s", self.job_id, anchor_indices)
+            run_starts = self._visual_run_starts()
+            if run_starts is not None:
+                self._resolve_visual_runs(run_starts)
+            else:
+                anchor_indices = self._build_anchor_indices()
+                logger.debug("[Lecture %s] Anchors: %s", self.job_id, anchor_indices)
 
-            for idx in anchor_indices:
-                if self.labels[idx] is None:
-                    self.labels[idx] = self._query_label(idx)
+                for idx in anchor_indices:
+                    if self.labels[idx] is None:
+                        self.labels[idx] = self._query_label(idx)
 
-            for left, right in zip(anchor_indices, anchor_indices[1:]):
-                self._resolve_interval(left, right)
+                for left, right in zip(anchor_indices, anchor_indices[1:]):
+                    self._resolve_interval(left, right)
 
             self._backfill_unknowns()
             change_points = self._to_change_points()
@@ -212,6 +283,80 @@ class SlideTurnDetector:
             anchors.append(len(self.segments) - 1)
         return anchors
 
+    def _visual_run_starts(self) -> Optional[Dict[int, int]]:
+        """Segment indices at which a visually unchanged run of segments begins.
+
+        A change is reported at the first sample showing it, so it happened up
+        to ``visual_scan_sample_seconds`` earlier. Each run start is mapped to
+        the first segment whose frame may already show the run; the segments in
+        between are resolved by probing.
+
+        Returns None if the scan is disabled or the video cannot be decoded.
+        """
+        if self.visual_scan_sample_seconds <= 0:
+            return None
+
+        changes = scan_visual_changes(
+            self.video_path,
+            self.visual_scan_sample_seconds,
+            self.visual_scan_hash_threshold,
+        )
+        if changes is None:
+            logger.warning(
+                "[Lecture %s] Visual change scan failed; falling back to anchors",
+                self.job_id,
+            )
+            return None
+
+        # A segment belongs to the run that is visible at its captured frame.
+        capture_timestamps = [
+            self.frame_cache.capture_timestamp(idx) for idx in range(len(self.segments))
+        ]
+        run_starts = {0: 0}
+        for change in changes:
+            idx = bisect.bisect_left(capture_timestamps, change)
+            if idx < len(self.segments):
+                earliest = bisect.bisect_right(
+                    capture_timestamps, change - self.visual_scan_sample_seconds
+                )
+                run_starts[idx] = min(earliest, run_starts.get(idx, idx))
+
+        logger.info(
+            "[Lecture %s] Visual change scan: changes=%d, runs=%d",
+            self.job_id,
+            len(changes),
+            len(run_starts),
+        )
+        return dict(sorted(run_starts.items()))
+
+    def _resolve_visual_runs(self, run_starts: Dict[int, int]) -> None:
+        """Label each visually unchanged run from its first segment.
+
+        Long runs additionally get anchors every ``anchor_stride`` segments so
+        that slide changes the scan missed are still found by refinement.
+        """
+        starts = list(run_starts)
+        run_ends = starts[1:] + [len(self.segments)]
+        probes = {len(self.segments) - 1}
+        for start, end in zip(starts, run_ends):
+            probes.update(range(start, end, self.anchor_stride))
+        probe_indices = sorted(probes)
+        logger.debug("[Lecture %s] Probes: %s", self.job_id, probe_indices)
+
+        for idx in probe_indices:
+            if self.labels[idx] is None:
+                self.labels[idx] = self._query_label(idx)
+
+        for left, right in zip(probe_indices, probe_indices[1:]):
+            if right in run_starts:
+                # Nothing changed visually between the left probe and the
+                # segments that may already show the next run.
+                boundary = max(left, run_starts[right] - 1)
+                self._fill_span(left, boundary + 1, self.labels[left])
+                self._resolve_interval(boundary, right)
+            else:
+                self._resolve_interval(left, right)
+
     def _query_label(self, idx: int) -> Optional[int]:
         frame_b64 = self.frame_cache.get(idx)
         if frame_b64 is None:
@@ -279,10 +424,7 @@ class SlideTurnDetector:
             # Stable span — fill interior without more GPT calls.
             # Note: -1 means "unknown slide number", not a stable label.
             # Two unknown endpoints must still be probed at the midpoint.
-            for i in range(idx_left + 1, idx_right):
-                if self.labels[i] is None:
-                    self.labels[i] = left_label
-            self._log_progress(f"filled stable span [{idx_left}, {idx_right}]")
+            self._fill_span(idx_left, idx_right, left_label)
             return
 
         mid = (idx_left + idx_right) // 2
@@ -295,6 +437,15 @@ class SlideTurnDetector:
         self._resolve_interval(idx_left, mid)
         self._resolve_interval(mid, idx_right)
 
+    def _fill_span(self, idx_left: int, idx_right: int, label: Optional[int]) -> None:
+        """Assign ``label`` to the unlabeled segments strictly between two probes."""
+        if label is None:
+            return
+        for i in range(idx_left + 1, idx_right):
+            if self.labels[i] is None:
+                self.labels[i] = label
+        self._log_progress(f"filled stable span [{idx_left}, {idx_right}]")
+
     def _backfill_unknowns(self) -> None:
         """Replace remaining None labels with last known label, or -1 if none seen."""
         last_label: int = -1
@@ -342,6 +493,8 @@ def detect_slide_timestamps(
     min_stride: int = 1,
     job_id: Optional[str] = None,
     on_progress: Optional[Callable[[int, int], None]] = None,
+    visual_scan_sample_seconds: float = 2.0,
+    visual_scan_hash_threshold: int = 16,
 ) -> List[Tuple[float, int]]:
     """Detect slide change timestamps using minimal GPT Vision calls.
 
@@ -352,6 +505,9 @@ def detect_slide_timestamps(
         anchor_stride: Probe every Nth segment initially.
         min_stride: Smallest interval to refine (1 = per-segment correctness).
         job_id: Optional job ID for log correlation.
+        visual_scan_sample_seconds: Frame sampling interval of the visual
+            change scan (0 disables the scan).
+        visual_scan_hash_threshold: Differing hash bits that count as a change.
 
     Returns:
         List of (timestamp, slide_number) change points.
@@ -364,5 +520,7 @@ def detect_slide_timestamps(
         min_stride=min_stride,
         job_id=job_id,
         on_progress=on_progress,
+        visual_scan_sample_seconds=visual_scan_sample_seconds,
+        visual_scan_hash_threshold=visual_scan_hash_threshold,
     )
     return detector.detect()
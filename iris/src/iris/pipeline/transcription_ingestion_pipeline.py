@@ -128,15 +128,14 @@ class TranscriptionIngestionPipeline(SubPipeline):
         )
 
     def batch_insert(self, chunks):
-        prepared_chunks = []
+        self.callback.update()
         try:
-            for i, chunk in enumerate(chunks):
-                if i % 5 == 0:
-                    self.callback.update()
-                embed_chunk = self.llm_embedding.embed(
+            vectors = self.llm_embedding.embed_many(
+                [
                     chunk[LectureTranscriptionSchema.SEGMENT_TEXT.value]
-                )
-                prepared_chunks.append((chunk, embed_chunk))
+                    for chunk in chunks
+                ]
+            )
         except Exception as e:
             logger.error("Error embedding lecture transcription chunk: %s", e)
             raise
@@ -144,7 +143,7 @@ class TranscriptionIngestionPipeline(SubPipeline):
         with batch_update_lock:
             with self.collection.batch.dynamic() as batch:
                 try:
-                    for chunk, embed_chunk in prepared_chunks:
+                    for chunk, embed_chunk in zip(chunks, vectors):
                         batch.add_object(properties=chunk, vector=embed_chunk)
                 except Exception as e:
                     logger.error("Error indexing lecture transcription chunk: %s", e)
@@ -100,6 +100,10 @@ class BaseRetrieval(SubPipeline, ABC):
         self.collection = schema_init_func(client)
         self.tokens = []
 
+    def reset_request_state(self) -> None:
+        """Forget the tokens of the previous request."""
+        self.tokens = []
+
     @observe(name="Retrieval: Question Assessment")
     def assess_question(
         self,
@@ -97,6 +97,11 @@ class LecturePageChunkRetrieval(SubPipeline):
         # same unit would otherwise trigger one identical Weaviate lookup each.
         self._lecture_unit_cache: dict = {}
 
+    def reset_request_state(self) -> None:
+        """Forget the tokens and caches of the previous request."""
+        self.tokens = []
+        self._lecture_unit_cache = {}
+
     @observe(name="Full Lecture Retrieval")
     def __call__(
         self,
@@ -1,3 +1,5 @@
+import random
+import time
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -16,6 +18,7 @@ from iris.common.message_converters import (
 from iris.common.pipeline_enum import PipelineEnum
 from iris.common.pyris_message import PyrisMessage
 from iris.common.timing import timed_span
+from iris.config import settings
 from iris.domain.retrieval.lecture.lecture_retrieval_dto import (
     LectureRetrievalDTO,
     LectureTranscriptionRetrievalDTO,
@@ -35,6 +38,10 @@ from iris.llm.request_handler.rerank_request_handler import (
     RerankRequestHandler,
 )
 from iris.pipeline.prompts.lecture_retrieval_prompts import (
+    combined_rewrite_initial_prompt,
+    combined_rewrite_initial_prompt_with_exercise_context,
+    combined_rewrite_output_fields,
+    combined_rewrite_student_query_prompt,
     lecture_retrieval_initial_prompt_lecture_pages_with_exercise_context,
     lecture_retrieval_initial_prompt_lecture_transcriptions_with_exercise_context,
     lecture_retriever_initial_prompt_lecture_pages,
@@ -48,6 +55,14 @@ from iris.pipeline.sub_pipeline import SubPipeline
 from iris.retrieval.lecture.lecture_page_chunk_retrieval import (
     LecturePageChunkRetrieval,
 )
+from iris.retrieval.lecture.lecture_query_rewrite import (
+    LectureQueryRewrites,
+    QueryRewriteStrategy,
+    parse_combined_rewrites,
+    query_rewrite_stats,
+    retrieval_recall,
+    rewrite_strategy_for_variant,
+)
 from iris.retrieval.lecture.lecture_transcription_retrieval import (
     LectureTranscriptionRetrieval,
 )
@@ -101,6 +116,13 @@ class LectureRetrieval(SubPipeline):
         )
         self.llm_embedding = LlmRequestHandler(embedding_model)
         self.pipeline = self.llm | StrOutputParser()
+        self.combined_rewrite_llm = IrisLangchainChatModel(
+            request_handler=request_handler,
+            completion_args=CompletionArguments(
+                temperature=0, max_tokens=1200, response_format="JSON"
+            ),
+        )
+        self.combined_rewrite_pipeline = self.combined_rewrite_llm | StrOutputParser()
 
         self.lecture_unit_collection = init_lecture_unit_schema(client)
         self.lecture_transcription_collection = init_lecture_transcription_schema(
@@ -131,6 +153,15 @@ class LectureRetrieval(SubPipeline):
         # that receives the pre-embedded vectors uses the same embedding model.
         self._assert_shared_embedding_model()
 
+    def reset_request_state(self) -> None:
+        """Forget the tokens and release/visibility caches of the previous request."""
+        self.tokens = []
+        self._transcription_presence_cache = {}
+        self._release_cache = {}
+        self.lecture_unit_segment_pipeline.reset_request_state()
+        self.lecture_transcription_pipeline.reset_request_state()
+        self.lecture_unit_page_chunk_pipeline.reset_request_state()
+
     def _assert_shared_embedding_model(self) -> None:
         """Guard the shared-embedding optimization against misconfiguration.
 
@@ -188,6 +219,7 @@ class LectureRetrieval(SubPipeline):
         lecture_id: int = None,
         lecture_unit_id: int = None,
         base_url: str = None,
+        variant_id: Optional[str] = None,
     ) -> LectureRetrievalDTO:
         with timed_span("LectureRetrieval", "get_lecture_unit"):
             with TracedThreadPoolExecutor(max_workers=2) as executor:
@@ -217,77 +249,77 @@ class LectureRetrieval(SubPipeline):
                 "Lecture retrieval: no transcriptions for unit — skipping transcription domain"
             )
 
+        # Sampled retrievals also run the other rewrite mode, so its recall
+        # and latency can be compared on the same requests.
+        strategy = rewrite_strategy_for_variant(variant_id)
+        compare = random.random() < settings.lecture_query_rewrite.compare_fraction
+        rewrite_args = (
+            chat_history,
+            query,
+            lecture_unit.course_language,
+            lecture_unit.course_name,
+            problem_statement,
+            exercise_title,
+            transcriptions_exist,
+        )
+        other_rewrites = None
         with timed_span("LectureRetrieval", "query_rewrites"):
-            (
-                rewritten_lecture_pages_query,
-                rewritten_lecture_transcriptions_query,
-                hypothetical_lecture_pages_answer_query,
-                hypothetical_lecture_transcriptions_answer_query,
-            ) = self.run_parallel_rewrite_tasks(
-                chat_history,
-                query,
-                lecture_unit.course_language,
-                lecture_unit.course_name,
-                problem_statement,
-                exercise_title,
-                include_transcriptions=transcriptions_exist,
-            )
+            if compare:
+                with TracedThreadPoolExecutor(max_workers=1) as executor:
+                    other_future = executor.submit(
+                        self.rewrite_queries, strategy.other, *rewrite_args
+                    )
+                    rewrites = self.rewrite_queries(strategy, *rewrite_args)
+                    other_rewrites = other_future.result()
+            else:
+                rewrites = self.rewrite_queries(strategy, *rewrite_args)
 
         with timed_span("LectureRetrieval", "query_embeddings"):
-            queries_to_embed = [
-                rewritten_lecture_pages_query,
-                hypothetical_lecture_pages_answer_query,
-            ]
-            if transcriptions_exist:
-                queries_to_embed.extend(
-                    [
-                        rewritten_lecture_transcriptions_query,
-                        hypothetical_lecture_transcriptions_answer_query,
-                    ]
+            queries_to_embed = self._queries_to_embed(rewrites, transcriptions_exist)
+            if other_rewrites is not None:
+                queries_to_embed += self._queries_to_embed(
+                    other_rewrites, transcriptions_exist
                 )
             query_vectors = self.embed_distinct_queries(queries_to_embed)
 
         with timed_span("LectureRetrieval", "search_pipelines"):
+            search_args = (lecture_unit, query, transcriptions_exist, query_vectors)
+            if other_rewrites is None:
+                results = self.search_with_rewrites(rewrites, *search_args)
+            else:
+                with TracedThreadPoolExecutor(max_workers=1) as executor:
+                    other_future = executor.submit(
+                        self.search_with_rewrites, other_rewrites, *search_args
+                    )
+                    results = self.search_with_rewrites(rewrites, *search_args)
+                    other_results = other_future.result()
+                self._record_rewrite_comparison(strategy, results, other_results)
             (
                 lecture_unit_segments,
                 lecture_transcriptions,
                 lecture_unit_page_chunks,
-            ) = self.call_lecture_pipelines(
-                lecture_unit,
-                query,
-                rewritten_lecture_pages_query,
-                rewritten_lecture_transcriptions_query,
-                hypothetical_lecture_pages_answer_query,
-                hypothetical_lecture_transcriptions_answer_query,
-                transcriptions_exist,
-                query_vectors,
-            )
+            ) = results
+        query_rewrite_stats.record_retrieval()
 
-        # Fetch the segments' surrounding transcriptions/page chunks
-        # concurrently: these are independent Weaviate lookups (two per
-        # segment) that used to run sequentially.
+        # Fetch the transcriptions and page chunks on the pages of all found
+        # segments with one filtered query per collection instead of two
+        # queries per segment.
         if lecture_unit_segments:
             with timed_span("LectureRetrieval", "segment_content_fetch"):
-                with TracedThreadPoolExecutor(max_workers=8) as executor:
-                    transcription_futures = []
+                with TracedThreadPoolExecutor(max_workers=2) as executor:
+                    transcriptions_future = None
                     if transcriptions_exist:
-                        transcription_futures = [
-                            executor.submit(
-                                self.get_lecture_transcription_of_lecture_unit,
-                                segment,
-                            )
-                            for segment in lecture_unit_segments
-                        ]
-                    page_chunk_futures = [
-                        executor.submit(
-                            self.get_lecture_page_chunks_of_lecture_unit, segment
+                        transcriptions_future = executor.submit(
+                            self.get_lecture_transcriptions_of_segments,
+                            lecture_unit_segments,
                         )
-                        for segment in lecture_unit_segments
-                    ]
-                    for future in transcription_futures:
-                        lecture_transcriptions += future.result()
-                    for future in page_chunk_futures:
-                        lecture_unit_page_chunks += future.result()
+                    page_chunks_future = executor.submit(
+                        self.get_lecture_page_chunks_of_segments,
+                        lecture_unit_segments,
+                    )
+                    if transcriptions_future is not None:
+                        lecture_transcriptions += transcriptions_future.result()
+                    lecture_unit_page_chunks += page_chunks_future.result()
 
         # Remove duplicate lecture transcriptions
         unique_transcriptions = {}
@@ -685,6 +717,154 @@ class LectureRetrieval(SubPipeline):
                 ],
             )
 
+    @staticmethod
+    def _queries_to_embed(
+        rewrites: LectureQueryRewrites, transcriptions_exist: bool
+    ) -> List[str]:
+        queries = [rewrites.lecture_pages_query, rewrites.lecture_pages_answer]
+        if transcriptions_exist:
+            queries += [
+                rewrites.lecture_transcriptions_query,
+                rewrites.lecture_transcriptions_answer,
+            ]
+        return queries
+
+    def search_with_rewrites(
+        self,
+        rewrites: LectureQueryRewrites,
+        lecture_unit: LectureUnitRetrievalDTO,
+        query: str,
+        transcriptions_exist: bool,
+        query_vectors: Dict[str, List[float]],
+    ):
+        """Run the segment, transcription and page chunk searches for ``rewrites``."""
+        return self.call_lecture_pipelines(
+            lecture_unit,
+            query,
+            rewrites.lecture_pages_query,
+            rewrites.lecture_transcriptions_query,
+            rewrites.lecture_pages_answer,
+            rewrites.lecture_transcriptions_answer,
+            transcriptions_exist,
+            query_vectors,
+        )
+
+    @staticmethod
+    def _record_rewrite_comparison(
+        strategy: QueryRewriteStrategy, results, other_results
+    ) -> None:
+        """Record the recall of the combined mode against the fan-out search hits."""
+        hits, other_hits = (
+            {item.uuid for items in result for item in items}
+            for result in (results, other_results)
+        )
+        if strategy is QueryRewriteStrategy.FAN_OUT:
+            recall = retrieval_recall(hits, other_hits)
+        else:
+            recall = retrieval_recall(other_hits, hits)
+        query_rewrite_stats.record_comparison(recall)
+        logger.info(
+            "Lecture query rewrite | compared modes | combined_recall=%.2f", recall
+        )
+
+    def rewrite_queries(
+        self,
+        strategy: QueryRewriteStrategy,
+        chat_history: list[PyrisMessage],
+        student_query: str,
+        course_language: str,
+        course_name: str = None,
+        problem_statement: str = None,
+        exercise_title: str = None,
+        include_transcriptions: bool = True,
+    ) -> LectureQueryRewrites:
+        """Write the retrieval queries and hypothetical answers in ``strategy`` mode.
+
+        A combined rewrite that fails or cannot be parsed falls back to the
+        fan-out rewrite.
+        """
+        rewrite_args = (
+            chat_history,
+            student_query,
+            course_language,
+            course_name,
+            problem_statement,
+            exercise_title,
+            include_transcriptions,
+        )
+        started = time.perf_counter()
+        fallback = False
+        if strategy is QueryRewriteStrategy.COMBINED:
+            try:
+                rewrites = self.run_combined_rewrite_task(*rewrite_args)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "Combined query rewrite failed, falling back to fan-out | error=%s",
+                    e,
+                )
+                fallback = True
+                rewrites = LectureQueryRewrites(
+                    *self.run_parallel_rewrite_tasks(*rewrite_args)
+                )
+        else:
+            rewrites = LectureQueryRewrites(
+                *self.run_parallel_rewrite_tasks(*rewrite_args)
+            )
+        query_rewrite_stats.record_rewrite(
+            strategy, (time.perf_counter() - started) * 1000, fallback=fallback
+        )
+        return rewrites
+
+    @observe(name="Retrieval: Run Combined Rewrite Task")
+    def run_combined_rewrite_task(
+        self,
+        chat_history: list[PyrisMessage],
+        student_query: str,
+        course_language: str,
+        course_name: str = None,
+        problem_statement: str = None,
+        exercise_title: str = None,
+        include_transcriptions: bool = True,
+    ) -> LectureQueryRewrites:
+        """
+        Write all retrieval queries and hypothetical answers with one LLM call.
+        """
+        if problem_statement:
+            initial_prompt = combined_rewrite_initial_prompt_with_exercise_context
+        else:
+            initial_prompt = combined_rewrite_initial_prompt
+        fields = ["lecture_pages_query", "lecture_pages_answer"]
+        if include_transcriptions:
+            fields += ["lecture_transcriptions_query", "lecture_transcriptions_answer"]
+        output_fields = "\n".join(
+            f'- "{field}": {combined_rewrite_output_fields[field]}' for field in fields
+        )
+
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", initial_prompt),
+            ]
+        )
+        prompt = self._add_last_four_messages_to_prompt(prompt, chat_history)
+        prompt += SystemMessagePromptTemplate.from_template(
+            combined_rewrite_student_query_prompt
+        )
+        prompt_val = prompt.format_messages(
+            course_language=course_language,
+            course_name=course_name,
+            exercise_name=exercise_title,
+            problem_statement=problem_statement,
+            student_query=student_query,
+            output_fields=output_fields,
+            answer_word_limit=120,
+        )
+        prompt = ChatPromptTemplate.from_messages(prompt_val)
+        response = (prompt | self.combined_rewrite_pipeline).invoke({})
+        token_usage = self.combined_rewrite_llm.tokens
+        token_usage.pipeline = PipelineEnum.IRIS_LECTURE_RETRIEVAL_PIPELINE
+        self.tokens.append(token_usage)
+        return parse_combined_rewrites(response, include_transcriptions)
+
     @observe(name="Retrieval: Run Parallel Rewrite Tasks")
     def run_parallel_rewrite_tasks(
         self,
@@ -1122,120 +1302,177 @@ class LectureRetrieval(SubPipeline):
     def get_lecture_transcription_of_lecture_unit(
         self, lecture_unit_segment: LectureUnitSegmentRetrievalDTO
     ):
-        target_page_number = lecture_unit_segment.display_page_number
+        return self.get_lecture_transcriptions_of_segments([lecture_unit_segment])
 
-        # Slides with unknown display page (-1) do not match any transcription
-        if target_page_number == -1 and lecture_unit_segment.page_number != -1:
-            return []
+    def get_lecture_page_chunks_of_lecture_unit(
+        self, lecture_unit_segment: LectureUnitSegmentRetrievalDTO
+    ):
+        return self.get_lecture_page_chunks_of_segments([lecture_unit_segment])
 
-        # A None in any filter value crashes the Weaviate gRPC query ("unknown
-        # value type <nil>"); such segments cannot match a transcription anyway.
-        filter_values = (
-            lecture_unit_segment.course_id,
-            lecture_unit_segment.lecture_id,
-            lecture_unit_segment.lecture_unit_id,
-            target_page_number,
-            lecture_unit_segment.base_url,
-        )
-        if any(value is None for value in filter_values):
-            logger.debug(
-                "Skipping transcription lookup for segment %s: missing filter values",
-                lecture_unit_segment.uuid,
-            )
-            return []
+    def get_lecture_transcriptions_of_segments(
+        self, lecture_unit_segments: List[LectureUnitSegmentRetrievalDTO]
+    ) -> List[LectureTranscriptionRetrievalDTO]:
+        """Fetch the transcriptions spoken on the slides of all segments.
 
-        transcription_filter = Filter.by_property(
-            LectureTranscriptionSchema.COURSE_ID.value
-        ).equal(lecture_unit_segment.course_id)
-        transcription_filter &= Filter.by_property(
-            LectureTranscriptionSchema.LECTURE_ID.value
-        ).equal(lecture_unit_segment.lecture_id)
-        transcription_filter &= Filter.by_property(
-            LectureTranscriptionSchema.LECTURE_UNIT_ID.value
-        ).equal(lecture_unit_segment.lecture_unit_id)
-        transcription_filter &= Filter.by_property(
-            LectureTranscriptionSchema.PAGE_NUMBER.value
-        ).equal(target_page_number)
-        transcription_filter &= Filter.by_property(
-            LectureTranscriptionSchema.BASE_URL.value
-        ).equal(lecture_unit_segment.base_url)
+        A segment's transcriptions are matched by its display page number, so
+        all segments are looked up with a single query whose filter ORs one
+        page-number set per lecture unit. Results are de-duplicated by UUID.
+        """
+        pages_by_unit: Dict[tuple, set] = {}
+        for segment in lecture_unit_segments:
+            target_page_number = segment.display_page_number
+            # Slides with unknown display page (-1) do not match any transcription
+            if target_page_number == -1 and segment.page_number != -1:
+                continue
+            unit_key = self._segment_unit_key(segment, target_page_number)
+            if unit_key is None:
+                logger.debug(
+                    "Skipping transcription lookup for segment %s: missing filter values",
+                    segment.uuid,
+                )
+                continue
+            pages_by_unit.setdefault(unit_key, set()).add(target_page_number)
+
+        if not pages_by_unit:
+            return []
 
         lecture_transcriptions = (
             self.lecture_transcription_collection.query.fetch_objects(
-                filters=transcription_filter
+                filters=self._segment_pages_filter(
+                    pages_by_unit, LectureTranscriptionSchema
+                ),
+                limit=10_000,
             ).objects
         )
 
-        return [
-            dto
-            for transcription in lecture_transcriptions
-            if (
-                dto := self.lecture_transcription_pipeline.generate_retrieval_dtos(
-                    transcription.properties, str(transcription.uuid)
-                )
+        transcriptions: Dict[str, LectureTranscriptionRetrievalDTO] = {}
+        for transcription in lecture_transcriptions:
+            uuid = str(transcription.uuid)
+            if uuid in transcriptions:
+                continue
+            dto = self.lecture_transcription_pipeline.generate_retrieval_dtos(
+                transcription.properties, uuid
             )
-            is not None
-        ]
+            if dto is not None:
+                transcriptions[uuid] = dto
+        return list(transcriptions.values())
 
-    def get_lecture_page_chunks_of_lecture_unit(
-        self, lecture_unit_segment: LectureUnitSegmentRetrievalDTO
-    ):
-        filter_values = (
-            lecture_unit_segment.course_id,
-            lecture_unit_segment.lecture_id,
-            lecture_unit_segment.lecture_unit_id,
-            lecture_unit_segment.page_number,
-            lecture_unit_segment.base_url,
-        )
-        if any(value is None for value in filter_values):
-            logger.debug(
-                "Skipping page-chunk lookup for segment %s: missing filter values",
-                lecture_unit_segment.uuid,
-            )
-            return []
+    def get_lecture_page_chunks_of_segments(
+        self, lecture_unit_segments: List[LectureUnitSegmentRetrievalDTO]
+    ) -> List[LectureUnitPageChunkRetrievalDTO]:
+        """Fetch the visible page chunks of the slides of all segments.
 
-        page_chunk_filter = Filter.by_property(
-            LectureUnitPageChunkSchema.COURSE_ID.value
-        ).equal(lecture_unit_segment.course_id)
-        page_chunk_filter &= Filter.by_property(
-            LectureUnitPageChunkSchema.LECTURE_ID.value
-        ).equal(lecture_unit_segment.lecture_id)
-        page_chunk_filter &= Filter.by_property(
-            LectureUnitPageChunkSchema.LECTURE_UNIT_ID.value
-        ).equal(lecture_unit_segment.lecture_unit_id)
-        page_chunk_filter &= Filter.by_property(
-            LectureUnitPageChunkSchema.PAGE_NUMBER.value
-        ).equal(lecture_unit_segment.page_number)
-        page_chunk_filter &= Filter.by_property(
-            LectureUnitPageChunkSchema.BASE_URL.value
-        ).equal(lecture_unit_segment.base_url)
+        All segments are looked up with a single query. Each chunk is mapped
+        back to a segment on its page to fill in the course, lecture and unit
+        metadata, and de-duplicated by UUID.
+        """
+        pages_by_unit: Dict[tuple, set] = {}
+        segment_by_page: Dict[tuple, LectureUnitSegmentRetrievalDTO] = {}
+        for segment in lecture_unit_segments:
+            unit_key = self._segment_unit_key(segment, segment.page_number)
+            if unit_key is None:
+                logger.debug(
+                    "Skipping page-chunk lookup for segment %s: missing filter values",
+                    segment.uuid,
+                )
+                continue
+            pages_by_unit.setdefault(unit_key, set()).add(segment.page_number)
+            segment_by_page.setdefault((*unit_key, segment.page_number), segment)
+
+        if not pages_by_unit:
+            return []
 
         lecture_page_chunks = (
             self.lecture_unit_page_chunk_collection.query.fetch_objects(
-                filters=page_chunk_filter
+                filters=self._segment_pages_filter(
+                    pages_by_unit, LectureUnitPageChunkSchema
+                ),
+                limit=10_000,
             ).objects
         )
 
-        return [
-            LectureUnitPageChunkRetrievalDTO(
-                str(chunk.uuid),
-                lecture_unit_segment.course_id,
-                lecture_unit_segment.course_name,
-                lecture_unit_segment.course_description,
-                lecture_unit_segment.lecture_id,
-                lecture_unit_segment.lecture_name,
-                lecture_unit_segment.lecture_unit_id,
-                lecture_unit_segment.lecture_unit_name,
-                lecture_unit_segment.lecture_unit_link,
-                chunk.properties[LectureUnitPageChunkSchema.COURSE_LANGUAGE.value],
-                chunk.properties[LectureUnitPageChunkSchema.PAGE_NUMBER.value],
-                chunk.properties.get(
+        page_chunks: Dict[str, LectureUnitPageChunkRetrievalDTO] = {}
+        for chunk in lecture_page_chunks:
+            uuid = str(chunk.uuid)
+            if uuid in page_chunks or not is_slide_visible(chunk.properties):
+                continue
+            properties = chunk.properties
+            segment = segment_by_page.get(
+                (
+                    properties.get(LectureUnitPageChunkSchema.COURSE_ID.value),
+                    properties.get(LectureUnitPageChunkSchema.LECTURE_ID.value),
+                    properties.get(LectureUnitPageChunkSchema.LECTURE_UNIT_ID.value),
+                    properties.get(LectureUnitPageChunkSchema.BASE_URL.value),
+                    properties[LectureUnitPageChunkSchema.PAGE_NUMBER.value],
+                )
+            )
+            if segment is None:
+                continue
+            page_chunks[uuid] = LectureUnitPageChunkRetrievalDTO(
+                uuid,
+                segment.course_id,
+                segment.course_name,
+                segment.course_description,
+                segment.lecture_id,
+                segment.lecture_name,
+                segment.lecture_unit_id,
+                segment.lecture_unit_name,
+                segment.lecture_unit_link,
+                properties[LectureUnitPageChunkSchema.COURSE_LANGUAGE.value],
+                properties[LectureUnitPageChunkSchema.PAGE_NUMBER.value],
+                properties.get(
                     LectureUnitPageChunkSchema.DISPLAY_PAGE_NUMBER.value,
-                    chunk.properties[LectureUnitPageChunkSchema.PAGE_NUMBER.value],
+                    properties[LectureUnitPageChunkSchema.PAGE_NUMBER.value],
                 ),
-                chunk.properties[LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value],
-                lecture_unit_segment.base_url,
+                properties[LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value],
+                segment.base_url,
             )
-            for chunk in lecture_page_chunks
-            if is_slide_visible(chunk.properties)
-        ]
+        return list(page_chunks.values())
+
+    @staticmethod
+    def _segment_unit_key(
+        segment: LectureUnitSegmentRetrievalDTO, page_number: Optional[int]
+    ) -> Optional[tuple]:
+        """(course, lecture, unit, base URL) of a segment, or None if incomplete.
+
+        A None in any filter value crashes the Weaviate gRPC query ("unknown
+        value type <nil>"); such segments cannot match anything anyway.
+        """
+        unit_key = (
+            segment.course_id,
+            segment.lecture_id,
+            segment.lecture_unit_id,
+            segment.base_url,
+        )
+        if page_number is None or any(value is None for value in unit_key):
+            return None
+        return unit_key
+
+    @staticmethod
+    def _segment_pages_filter(pages_by_unit: Dict[tuple, set], schema):
+        """OR of one (lecture unit, page numbers) filter per lecture unit."""
+        unit_filters = []
+        for (
+            course_id,
+            lecture_id,
+            lecture_unit_id,
+            base_url,
+        ), pages in pages_by_unit.items():
+            unit_filters.append(
+                Filter.all_of(
+                    [
+                        Filter.by_property(schema.COURSE_ID.value).equal(course_id),
+                        Filter.by_property(schema.LECTURE_ID.value).equal(lecture_id),
+                        Filter.by_property(schema.LECTURE_UNIT_ID.value).equal(
+                            lecture_unit_id
+                        ),
+                        Filter.by_property(schema.BASE_URL.value).equal(base_url),
+                        Filter.by_property(schema.PAGE_NUMBER.value).contains_any(
+                            sorted(pages)
+                        ),
+                    ]
+                )
+            )
+        if len(unit_filters) == 1:
+            return unit_filters[0]
+        return Filter.any_of(unit_filters)
@@ -69,6 +69,12 @@ class LectureTranscriptionRetrieval(SubPipeline):
         self._lecture_unit_cache: dict = {}
         self._slide_visibility_cache: dict = {}
 
+    def reset_request_state(self) -> None:
+        """Forget the tokens and caches of the previous request."""
+        self.tokens = []
+        self._lecture_unit_cache = {}
+        self._slide_visibility_cache = {}
+
     @observe(name="Lecture Transcription Retrieval")
     def __call__(
         self,
@@ -73,6 +73,11 @@ class LectureUnitSegmentRetrieval(SubPipeline):
         # would otherwise trigger one identical Weaviate lookup each.
         self._lecture_unit_cache: dict = {}
 
+    def reset_request_state(self) -> None:
+        """Forget the tokens and caches of the previous request."""
+        self.tokens = []
+        self._lecture_unit_cache = {}
+
     @observe(name="Lecture Unit Segment Retrieval")
     def __call__(
         self,
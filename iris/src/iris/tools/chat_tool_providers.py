@@ -14,6 +14,7 @@ from iris.domain.chat.chat_pipeline_execution_dto import ChatPipelineExecutionDT
 from iris.domain.variant.variant import Variant
 from iris.pipeline.abstract_agent_pipeline import AgentPipelineExecutionState
 from iris.pipeline.chat.mcq_chat_mixin import retrieve_lecture_content_for_mcq
+from iris.pipeline.pipeline_registry import get_pipeline_registry
 from iris.retrieval.faq_retrieval import FaqRetrieval
 from iris.retrieval.lecture.lecture_retrieval import LectureRetrieval
 from iris.tools import (
@@ -105,16 +106,29 @@ def provide_file_lookup(state: State) -> Callable[[str], str] | None:
 # ---------------------------------------------------------------------------
 
 
+def get_lecture_retriever(state: State) -> LectureRetrieval:
+    """Lease a warm LectureRetrieval for the rest of the run, once per run.
+
+    Both the prompt content injection and the lecture retrieval tool need a
+    retriever; the leased instance is cached on the state and shared by both.
+    """
+    lecture_retriever = getattr(state, "lecture_retriever", None)
+    if lecture_retriever is None:
+        lecture_retriever = state.leases.enter_context(
+            get_pipeline_registry().lease(
+                ("lecture_retrieval_pipeline", "default", state.local),
+                lambda: LectureRetrieval(state.db.client, local=state.local),
+            )
+        )
+        state.lecture_retriever = lecture_retriever
+    return lecture_retriever
+
+
 def provide_lecture_retrieval(state: State) -> Optional[Callable]:
     if not state.allow_lecture_tool:
         return None
     course_id = state.dto.course.id
-    # Reuse a retriever already created for prompt content injection, if present,
-    # to avoid instantiating it (and its models) twice in the same request.
-    lecture_retriever = getattr(state, "lecture_retriever", None)
-    if lecture_retriever is None:
-        lecture_retriever = LectureRetrieval(state.db.client, local=state.local)
-        state.lecture_retriever = lecture_retriever
+    lecture_retriever = get_lecture_retriever(state)
     base_url = state.dto.settings.artemis_base_url if state.dto.settings else ""
     lecture_id = state.dto.lecture.id if state.dto.lecture else None
     lecture_unit_id = state.dto.lecture_unit_id if state.dto.lecture else None
@@ -129,6 +143,7 @@ def provide_lecture_retrieval(state: State) -> Optional[Callable]:
         state.lecture_content_storage,
         lecture_id=lecture_id,
         lecture_unit_id=lecture_unit_id,
+        variant_id=state.variant.id,
     )
 
 
@@ -138,7 +153,12 @@ def provide_faq_retrieval(state: State) -> Optional[Callable]:
     if not state.allow_faq_tool:
         return None
     course_id = state.dto.course.id
-    faq_retriever = FaqRetrieval(state.db.client)
+    faq_retriever = state.leases.enter_context(
+        get_pipeline_registry().lease(
+            ("faq_retrieval_pipeline", "default", state.local),
+            lambda: FaqRetrieval(state.db.client, local=state.local),
+        )
+    )
 
     return create_tool_faq_content_retrieval(
         faq_retriever,
@@ -16,6 +16,7 @@ def create_tool_lecture_content_retrieval(
     lecture_content_storage: Dict[str, Any],
     lecture_id: Optional[int] = None,
     lecture_unit_id: Optional[int] = None,
+    variant_id: Optional[str] = None,
 ) -> Callable[[], str]:
     """
     Create a tool that retrieves lecture content using RAG.
@@ -28,6 +29,7 @@ def create_tool_lecture_content_retrieval(
         query_text: The student's query text.
         history: Chat history messages.
         lecture_content_storage: Storage for retrieved content.
+        variant_id: Chat variant, which selects the query rewrite mode.
 
     Returns:
         Callable[[], str]: Function that returns lecture content string.
@@ -55,6 +57,7 @@ def create_tool_lecture_content_retrieval(
             lecture_id=lecture_id,
             lecture_unit_id=lecture_unit_id,
             base_url=base_url,
+            variant_id=variant_id,
         )
 
         # Store the lecture content for later use (e.g., citation pipeline)
@@ -28,6 +28,7 @@ class LectureUnitPageChunkSchema(Enum):
     BASE_URL = "base_url"
     PAGE_VERSION = "attachment_version"
     HIDDEN_UNTIL = "hidden_until"
+    PAGE_HASH = "page_hash"
 
 
 def init_lecture_unit_page_chunk_schema(client: WeaviateClient) -> Collection:
@@ -77,6 +78,15 @@ def init_lecture_unit_page_chunk_schema(client: WeaviateClient) -> Collection:
                 index_searchable=False,
             ),
         )
+        _add_property_if_missing(
+            collection,
+            Property(
+                name=LectureUnitPageChunkSchema.PAGE_HASH.value,
+                description="Hash of the page text and thumbnail, used to skip unchanged pages on re-ingestion",
+                data_type=DataType.TEXT,
+                index_searchable=False,
+            ),
+        )
 
         return collection
 
@@ -148,5 +158,11 @@ def init_lecture_unit_page_chunk_schema(client: WeaviateClient) -> Collection:
                 data_type=DataType.DATE,
                 index_searchable=False,
             ),
+            Property(
+                name=LectureUnitPageChunkSchema.PAGE_HASH.value,
+                description="Hash of the page text and thumbnail, used to skip unchanged pages on re-ingestion",
+                data_type=DataType.TEXT,
+                index_searchable=False,
+            ),
         ],
     )
@@ -13,6 +13,7 @@ from iris.web.routers.health.health_model import (
     ModuleStatus,
     ServiceStatus,
 )
+from iris.web.routers.health.job_executor_health import check_job_executor_status
 from iris.web.routers.health.Pipelines.pipeline_health import check_pipelines_health
 from iris.web.routers.health.weaviate_health import check_weaviate_status
 
@@ -20,7 +21,11 @@ router = APIRouter(prefix="/api/v1/health", tags=["health"])
 logger = get_logger(__name__)
 HealthCheckCallable = Callable[[], tuple[str, ModuleStatus]]
 
-MODULES: list[HealthCheckCallable] = [check_weaviate_status, check_pipelines_health]
+MODULES: list[HealthCheckCallable] = [
+    check_weaviate_status,
+    check_pipelines_health,
+    check_job_executor_status,
+]
 
 
 @router.get(
@@ -0,0 +1,25 @@
+"""Health check reporting the load of the pipeline job pools."""
+
+from __future__ import annotations
+
+from iris.common.job_executor import get_job_executor
+from iris.web.routers.health.health_model import ModuleStatus, ServiceStatus
+
+
+def check_job_executor_status() -> tuple[str, ModuleStatus]:
+    """Report queue depth and wait times; DEGRADED while a pool rejects jobs."""
+    module_name = "Job Executor"
+    pool_stats = get_job_executor().stats()
+    saturated = [stats.workload for stats in pool_stats if stats.saturated]
+    status_obj = ModuleStatus(
+        status=ServiceStatus.DEGRADED if saturated else ServiceStatus.UP,
+        metaData="; ".join(
+            f"{stats.workload}: running={stats.running}/{stats.workers} "
+            f"queued={stats.queued} rejected={stats.rejected} "
+            f"wait_p95_ms={stats.wait_p95_ms:.0f}"
+            for stats in pool_stats
+        ),
+    )
+    if saturated:
+        status_obj.error = "Saturated pools: " + ", ".join(saturated)
+    return module_name, status_obj
@@ -1,9 +1,9 @@
-from threading import Thread
 from typing import List
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from sentry_sdk import capture_exception
 
+from iris.common.job_executor import JobPriority, Workload, get_job_executor
 from iris.common.logging_config import get_logger, get_request_id, set_request_id
 from iris.dependencies import TokenValidator
 from iris.domain import (
@@ -30,6 +30,7 @@ from iris.llm.llm_manager import LlmManager
 from iris.llm.llm_requirements import missing_llm_requirements
 from iris.pipeline.autonomous_tutor_pipeline import AutonomousTutorPipeline
 from iris.pipeline.chat.chat_pipeline import ChatPipeline
+from iris.pipeline.chat.iris_chat_mode import IrisChatMode
 from iris.pipeline.competency_extraction_pipeline import (
     CompetencyExtractionPipeline,
 )
@@ -41,15 +42,17 @@ from iris.pipeline.inconsistency_check_pipeline import (
 from iris.pipeline.lecture_ingestion_update_pipeline import (
     LectureIngestionUpdatePipeline,
 )
+from iris.pipeline.pipeline_registry import get_pipeline_registry
 from iris.pipeline.rewriting_pipeline import RewritingPipeline
 from iris.pipeline.shared.global_search_intent_classifier import (
     classify as classify_intent,
 )
 from iris.pipeline.tutor_suggestion_pipeline import TutorSuggestionPipeline
+from iris.retrieval.faq_retrieval import FaqRetrieval
 from iris.retrieval.lecture.lecture_global_search_retrieval import (
     LectureGlobalSearchRetrieval,
 )
-from iris.tracing import TracedThreadPoolExecutor
+from iris.retrieval.lecture.lecture_retrieval import LectureRetrieval
 from iris.vector_database.database import VectorDatabase
 from iris.web.status.status_update import (
     AutonomousTutorCallback,
@@ -65,7 +68,32 @@ from iris.web.utils import validate_pipeline_variant
 router = APIRouter(prefix="/api/v1/pipelines", tags=["pipelines"])
 logger = get_logger(__name__)
 
-_global_search_executor = TracedThreadPoolExecutor(max_workers=100)
+
+def warm_up_pipelines() -> None:
+    """Build the chat pipelines and retrievers so the first requests reuse them."""
+    registry = get_pipeline_registry()
+    for chat_mode in IrisChatMode:
+        try:
+            registry.warm(
+                ("chat_pipeline", chat_mode.value, False),
+                lambda mode=chat_mode: ChatPipeline(chat_mode=mode, local=False),
+            )
+        except Exception as e:
+            logger.warning(
+                "Could not pre-warm the %s chat pipeline", chat_mode, exc_info=e
+            )
+    try:
+        client = VectorDatabase().client
+        registry.warm(
+            ("lecture_retrieval_pipeline", "default", False),
+            lambda: LectureRetrieval(client, local=False),
+        )
+        registry.warm(
+            ("faq_retrieval_pipeline", "default", False),
+            lambda: FaqRetrieval(client, local=False),
+        )
+    except Exception as e:
+        logger.warning("Could not pre-warm the retrievers", exc_info=e)
 
 
 def run_chat_pipeline_worker(
@@ -87,10 +115,12 @@ def run_chat_pipeline_worker(
 
     try:
         is_local = bool(getattr(dto, "settings", None) and dto.settings.is_local())
-        pipeline = ChatPipeline(chat_mode=dto.chat_mode, local=is_local)
         variant = find_variant(ChatPipeline.get_variants(), variant_id)
-
-        pipeline(dto=dto, variant=variant, callback=callback, event=event)
+        with get_pipeline_registry().lease(
+            ("chat_pipeline", dto.chat_mode.value, is_local),
+            lambda: ChatPipeline(chat_mode=dto.chat_mode, local=is_local),
+        ) as pipeline:
+            pipeline(dto=dto, variant=variant, callback=callback, event=event)
     except Exception as e:
         logger.error("Error running chat pipeline", exc_info=e)
         callback.fail("Fatal error.", exception=e)
@@ -107,11 +137,15 @@ def run_chat_pipeline(
 ):
     variant = validate_pipeline_variant(dto.settings, ChatPipeline)
     request_id = get_request_id()
-    thread = Thread(
-        target=run_chat_pipeline_worker,
-        args=(dto, variant, event, request_id),
+    get_job_executor().submit(
+        Workload.INTERACTIVE,
+        run_chat_pipeline_worker,
+        dto,
+        variant,
+        event,
+        request_id,
+        priority=JobPriority.HIGH,
     )
-    thread.start()
 
 
 def run_competency_extraction_pipeline_worker(
@@ -153,11 +187,13 @@ def run_competency_extraction_pipeline(dto: CompetencyExtractionPipelineExecutio
         dto.execution.settings, CompetencyExtractionPipeline
     )
     request_id = get_request_id()
-    thread = Thread(
-        target=run_competency_extraction_pipeline_worker,
-        args=(dto, variant, request_id),
+    get_job_executor().submit(
+        Workload.INTERACTIVE,
+        run_competency_extraction_pipeline_worker,
+        dto,
+        variant,
+        request_id,
     )
-    thread.start()
 
 
 def run_rewriting_pipeline_worker(
@@ -198,11 +234,13 @@ def run_rewriting_pipeline(dto: RewritingPipelineExecutionDTO):
     ).lower()
     logger.info("Rewriting pipeline started | variant=%s", variant)
     request_id = get_request_id()
-    thread = Thread(
-        target=run_rewriting_pipeline_worker,
-        args=(dto, variant, request_id),
+    get_job_executor().submit(
+        Workload.INTERACTIVE,
+        run_rewriting_pipeline_worker,
+        dto,
+        variant,
+        request_id,
     )
-    thread.start()
 
 
 def run_inconsistency_check_pipeline_worker(
@@ -244,11 +282,13 @@ def run_inconsistency_check_pipeline(dto: InconsistencyCheckPipelineExecutionDTO
         dto.execution.settings, InconsistencyCheckPipeline
     )
     request_id = get_request_id()
-    thread = Thread(
-        target=run_inconsistency_check_pipeline_worker,
-        args=(dto, variant, request_id),
+    get_job_executor().submit(
+        Workload.INTERACTIVE,
+        run_inconsistency_check_pipeline_worker,
+        dto,
+        variant,
+        request_id,
     )
-    thread.start()
 
 
 def run_communication_tutor_suggestions_pipeline_worker(
@@ -289,11 +329,14 @@ def run_communication_tutor_suggestions_pipeline(
 ):
     variant = validate_pipeline_variant(dto.settings, TutorSuggestionPipeline)
     request_id = get_request_id()
-    thread = Thread(
-        target=run_communication_tutor_suggestions_pipeline_worker,
-        args=(dto, variant, request_id),
+    get_job_executor().submit(
+        Workload.INTERACTIVE,
+        run_communication_tutor_suggestions_pipeline_worker,
+        dto,
+        variant,
+        request_id,
+        priority=JobPriority.LOW,
     )
-    thread.start()
 
 
 def run_autonomous_tutor_pipeline_worker(
@@ -332,11 +375,14 @@ def run_autonomous_tutor_pipeline_worker(
 def run_autonomous_tutor_pipeline(dto: AutonomousTutorPipelineExecutionDTO):
     variant = validate_pipeline_variant(dto.settings, AutonomousTutorPipeline)
     request_id = get_request_id()
-    thread = Thread(
-        target=run_autonomous_tutor_pipeline_worker,
-        args=(dto, variant, request_id),
+    get_job_executor().submit(
+        Workload.INTERACTIVE,
+        run_autonomous_tutor_pipeline_worker,
+        dto,
+        variant,
+        request_id,
+        priority=JobPriority.LOW,
     )
-    thread.start()
 
 
 def run_global_search_pipeline_worker(dto: GlobalSearchRequestDTO, request_id: str):
@@ -382,6 +428,7 @@ def run_global_search_pipeline_worker(dto: GlobalSearchRequestDTO, request_id: s
             query=dto.query,
             limit=dto.limit,
             intent=intent,
+            base_url=dto.settings.artemis_base_url,
         )
         if result.answer:
             logger.info(
@@ -415,8 +462,12 @@ def run_global_search_pipeline(dto: GlobalSearchRequestDTO):
       - TRIGGER_AI (LLM path, ~5-8s): thinking callback first, then result
       - SKIP_AI (sources only, ~200ms): result callback only (no loading state needed)
     """
-    _global_search_executor.submit(
-        run_global_search_pipeline_worker, dto, get_request_id()
+    get_job_executor().submit(
+        Workload.INTERACTIVE,
+        run_global_search_pipeline_worker,
+        dto,
+        get_request_id(),
+        priority=JobPriority.HIGH,
     )
 
 
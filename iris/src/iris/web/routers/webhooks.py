@@ -1,8 +1,7 @@
-from threading import Thread
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from sentry_sdk import capture_exception
 
+from iris.common.job_executor import JobPriority, Workload, get_job_executor
 from iris.common.logging_config import get_logger
 from iris.dependencies import TokenValidator
 from iris.domain.ingestion.ingestion_pipeline_execution_dto import (
@@ -23,6 +22,7 @@ from iris.pipeline.lecture_update_lock import lecture_update_lock
 from iris.pipeline.lecture_visibility_update_pipeline import (
     LectureVisibilityUpdatePipeline,
 )
+from iris.pipeline.shared.global_search_cache import invalidate_global_search_cache
 from iris.tracing import observe
 from iris.vector_database.lecture_unit_page_chunk_schema import (
     init_lecture_unit_page_chunk_schema,
@@ -59,11 +59,11 @@ ingestion_job_handler = IngestionJobHandler()
 def run_lecture_update_pipeline_worker(
     dto: IngestionPipelineExecutionDto, variant_id: str
 ):
-    """Run the lecture unit ingestion pipeline in a separate thread.
+    """Run the lecture unit ingestion pipeline in the background pool.
 
-    No concurrency throttling here — Artemis controls how many jobs are
-    dispatched via MAX_CONCURRENT_PROCESSING. Every job Iris receives
-    starts immediately so Artemis has an accurate view of what's running.
+    Artemis controls how many jobs are dispatched via MAX_CONCURRENT_PROCESSING,
+    so the background pool should have enough workers for every job Iris
+    receives to start immediately; its queue only absorbs bursts.
     """
     lecture_unit_id = (
         dto.lecture_unit.lecture_unit_id
@@ -87,10 +87,15 @@ def run_lecture_update_pipeline_worker(
         )
         callback.fail(str(e), exception=e)
         capture_exception(e)
+    finally:
+        if dto.lecture_unit is not None:
+            invalidate_global_search_cache(
+                dto.settings.artemis_base_url, [dto.lecture_unit.course_id]
+            )
 
 
 def run_lecture_deletion_pipeline_worker(dto: LecturesDeletionExecutionDto):
-    """Run the lecture deletion pipeline in a separate thread."""
+    """Run the lecture deletion pipeline in the background pool."""
     callback = None
     try:
         callback = LecturesDeletionStatusCallback(
@@ -111,12 +116,17 @@ def run_lecture_deletion_pipeline_worker(dto: LecturesDeletionExecutionDto):
         if callback is not None:
             callback.fail(str(e), exception=e)
         capture_exception(e)
+    finally:
+        invalidate_global_search_cache(
+            dto.settings.artemis_base_url,
+            {lecture_unit.course_id for lecture_unit in dto.lecture_units},
+        )
 
 
 def run_faq_update_pipeline_worker(
     dto: FaqIngestionPipelineExecutionDto, variant_id: str
 ):
-    """Run the FAQ ingestion pipeline in a separate thread."""
+    """Run the FAQ ingestion pipeline in the background pool."""
     callback = None
     try:
         callback = FaqIngestionStatus(
@@ -146,7 +156,7 @@ def run_faq_update_pipeline_worker(
 
 
 def run_faq_delete_pipeline_worker(dto: FaqDeletionExecutionDto, variant_id: str):
-    """Run the FAQ deletion in a separate thread."""
+    """Run the FAQ deletion in the background pool."""
     callback = None
     try:
         callback = FaqIngestionStatus(
@@ -188,9 +198,10 @@ def lecture_ingestion_webhook(dto: IngestionPipelineExecutionDto):
     """Webhook endpoint to trigger the lecture ingestion pipeline."""
     variant = validate_pipeline_variant(dto.settings, LectureIngestionUpdatePipeline)
 
-    thread = Thread(target=run_lecture_update_pipeline_worker, args=(dto, variant))
     ingestion_job_handler.add_job(
-        process=thread,
+        submit=lambda: get_job_executor().submit(
+            Workload.BACKGROUND, run_lecture_update_pipeline_worker, dto, variant
+        ),
         course_id=dto.lecture_unit.course_id,
         lecture_id=dto.lecture_unit.lecture_id,
         lecture_unit_id=dto.lecture_unit.lecture_unit_id,
@@ -216,6 +227,7 @@ def lecture_metadata_webhook(dto: LectureUnitMetadataUpdateDTO):
         db = VectorDatabase()
         collection = init_lecture_unit_schema(db.get_client())
         updated = LectureMetadataUpdatePipeline(collection)(dto)
+    invalidate_global_search_cache(dto.base_url, [dto.course_id])
     if updated == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -263,6 +275,9 @@ def lecture_visibility_webhook(dto: LectureUnitVisibilityUpdateDTO):
                 "errorMessage": "Weaviate is temporarily rate-limited; retry later"
             },
         ) from error
+    finally:
+        # Slides may have been hidden even if the update did not complete.
+        invalidate_global_search_cache(dto.base_url, [dto.course_id])
     if result.lecture_units_updated == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -280,8 +295,12 @@ def lecture_deletion_webhook(dto: LecturesDeletionExecutionDto):
     """Webhook endpoint to trigger the lecture deletion."""
     validate_pipeline_variant(dto.settings, LectureUnitDeletionPipeline)
 
-    thread = Thread(target=run_lecture_deletion_pipeline_worker, args=(dto,))
-    thread.start()
+    get_job_executor().submit(
+        Workload.BACKGROUND,
+        run_lecture_deletion_pipeline_worker,
+        dto,
+        priority=JobPriority.HIGH,
+    )
 
 
 @router.post(
@@ -294,8 +313,9 @@ def faq_ingestion_webhook(dto: FaqIngestionPipelineExecutionDto):
     """Webhook endpoint to trigger the FAQ ingestion pipeline."""
     variant = validate_pipeline_variant(dto.settings, FaqIngestionPipeline)
 
-    thread = Thread(target=run_faq_update_pipeline_worker, args=(dto, variant))
-    thread.start()
+    get_job_executor().submit(
+        Workload.BACKGROUND, run_faq_update_pipeline_worker, dto, variant
+    )
 
 
 @router.post(
@@ -308,5 +328,10 @@ def faq_deletion_webhook(dto: FaqDeletionExecutionDto):
     """Webhook endpoint to trigger the FAQ deletion pipeline."""
     variant = validate_pipeline_variant(dto.settings, FaqIngestionPipeline)
 
-    thread = Thread(target=run_faq_delete_pipeline_worker, args=(dto, variant))
-    thread.start()
+    get_job_executor().submit(
+        Workload.BACKGROUND,
+        run_faq_delete_pipeline_worker,
+        dto,
+        variant,
+        priority=JobPriority.HIGH,
+    )
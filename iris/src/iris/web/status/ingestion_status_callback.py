@@ -9,6 +9,7 @@ from iris.domain.ingestion.ingestion_status_update_dto import (
     IngestionStatusUpdateDTO,
 )
 from iris.domain.status.run_state_dto import RunStateEnum
+from iris.web.status.status_sender import status_update_stats
 from iris.web.status.status_update import StatusCallback
 
 logger = get_logger(__name__)
@@ -40,20 +41,6 @@ class IngestionStatusCallback(StatusCallback):
         )
         super().__init__(url, run_id, status)
 
-    def _post_status_payload(
-        self, payload: dict, timeout: int = 200
-    ) -> http_requests.Response:
-        """Send a pre-serialized status payload to Artemis."""
-        return http_requests.post(
-            self.url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.run_id}",
-            },
-            json=payload,
-            timeout=timeout,
-        )
-
     def on_status_update(self) -> bool:
         """Send a status update to Artemis with bounded retry and no raise."""
         last_error = None
@@ -67,8 +54,10 @@ class IngestionStatusCallback(StatusCallback):
                     resp.status_code,
                 )
                 resp.raise_for_status()
+                status_update_stats.record_sent(True)
                 return True
             except http_requests.exceptions.RequestException as exc:
+                status_update_stats.record_sent(False)
                 last_error = exc
                 if attempt < _CALLBACK_MAX_RETRIES - 1:
                     wait_seconds = _CALLBACK_RETRY_BASE_SECONDS * (attempt + 1)
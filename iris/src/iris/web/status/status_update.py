@@ -1,6 +1,6 @@
 import time
 from concurrent.futures import Future
-from threading import Lock
+from threading import Event, RLock
 from typing import Any, Optional
 
 import requests
@@ -33,6 +33,7 @@ from iris.domain.status.rewriting_status_update_dto import (
 from iris.domain.status.run_state_dto import RunStateEnum, StatusErrorDTO
 from iris.domain.status.status_update_dto import StatusUpdateDTO
 from iris.tracing import TracedThreadPoolExecutor
+from iris.web.status.status_sender import post_status, status_update_stats
 
 logger = get_logger(__name__)
 
@@ -50,6 +51,10 @@ class StatusCallback:
     # intentionally excluded so they keep accumulating across updates.
     _TRANSIENT_RESULT_FIELDS: tuple[str, ...] = ("result", "display_page_numbers")
 
+    # Minimum spacing in seconds between asynchronous running updates of one
+    # run. A snapshot queued while an older one is still waiting replaces it.
+    running_update_min_interval: float = 0.25
+
     def __init__(self, url: str, run_id: str, status: StatusUpdateDTO):
         self.url = url
         self.run_id = run_id
@@ -57,7 +62,10 @@ class StatusCallback:
         self._terminal_sent = False
         self._running_update_executor: Optional[TracedThreadPoolExecutor] = None
         self._running_update_futures: list[Future] = []
-        self._running_update_lock = Lock()
+        self._running_update_lock = RLock()
+        self._pending_running_update: Optional[dict[str, Any]] = None
+        self._flush_requested = Event()
+        self._last_post_at = float("-inf")
 
     def _serialize_status(self) -> dict[str, Any]:
         """Serialize the current status for the Artemis wire format."""
@@ -67,20 +75,13 @@ class StatusCallback:
         self, payload: dict[str, Any], timeout: int = 200
     ) -> requests.Response:
         """Send a pre-serialized status payload to Artemis."""
-        return requests.post(
-            self.url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.run_id}",
-            },
-            json=payload,
-            timeout=timeout,
-        )
+        return post_status(self.url, self.run_id, payload, timeout)
 
     def _send_status_payload(
         self, payload: dict[str, Any], *, async_running_update: bool = False
     ) -> bool:
         """Send a status payload and log timing for every attempted POST."""
+        self._last_post_at = time.monotonic()
         post_start = time.perf_counter()
         try:
             resp = self._post_status_payload(payload)
@@ -91,8 +92,10 @@ class StatusCallback:
                 (time.perf_counter() - post_start) * 1000,
             )
             resp.raise_for_status()
+            status_update_stats.record_sent(True)
             return True
         except requests.exceptions.RequestException as e:
+            status_update_stats.record_sent(False)
             duration_ms = (time.perf_counter() - post_start) * 1000
             if async_running_update:
                 logger.warning(
@@ -136,7 +139,11 @@ class StatusCallback:
             self._terminal_sent = True
 
     def _enqueue_running_update(self, payload: Optional[dict[str, Any]] = None) -> None:
-        """Queue a running status update without blocking the pipeline."""
+        """Queue a running status update without blocking the pipeline.
+
+        Queued updates are full snapshots, so one that has not been sent yet
+        is replaced by a newer one instead of being posted as well.
+        """
         queued_payload = payload if payload is not None else self._serialize_status()
         with self._running_update_lock:
             if self._terminal_sent:
@@ -145,26 +152,46 @@ class StatusCallback:
                 # the terminal payload already superseded it (spec guard c).
                 logger.debug("Dropping async status update after terminal send")
                 return
+            superseded = self._pending_running_update is not None
+            self._pending_running_update = queued_payload
+            if superseded:
+                # The flush queued for the older snapshot sends this one.
+                status_update_stats.record_coalesced()
+                return
             future = self._get_running_update_executor_locked().submit(
-                self._send_status_payload,
-                queued_payload,
-                async_running_update=True,
+                self._send_pending_running_update
             )
             self._running_update_futures.append(future)
 
+    def _send_pending_running_update(self) -> None:
+        """Send the latest queued running update once the rate limit allows."""
+        delay = self._last_post_at + self.running_update_min_interval - time.monotonic()
+        if delay > 0:
+            self._flush_requested.wait(delay)
+        with self._running_update_lock:
+            payload = self._pending_running_update
+            self._pending_running_update = None
+        if payload is not None:
+            self._send_status_payload(payload, async_running_update=True)
+
     def _drain_running_updates(self) -> None:
-        """Wait for all queued running updates before sync sends."""
-        while True:
-            with self._running_update_lock:
-                futures = self._running_update_futures
-                self._running_update_futures = []
-            if not futures:
-                return
-            for future in futures:
-                try:
-                    future.result()
-                except Exception as e:  # pragma: no cover - worker logs expected errors
-                    logger.warning("Async status update failed: %s", e)
+        """Send queued running updates without delay and wait for them before sync sends."""
+        self._flush_requested.set()
+        try:
+            while True:
+                with self._running_update_lock:
+                    futures = self._running_update_futures
+                    self._running_update_futures = []
+                if not futures:
+                    return
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        # The worker already logs expected errors.
+                        logger.warning("Async status update failed: %s", e)
+        finally:
+            self._flush_requested.clear()
 
     def on_status_update(self) -> bool:
         """Send the current status to the Artemis API."""
@@ -1,8 +1,11 @@
+import threading
+import time
 from unittest.mock import patch
 
 import requests
 
 from iris.domain.status.activity_dto import ActivityDTO, ActivityKind, ActivityState
+from iris.web.status.status_sender import status_update_stats
 from iris.web.status.status_update import ChatRunCallback
 
 
@@ -33,7 +36,7 @@ def _activity(state=ActivityState.RUNNING):
 def test_send_result_retries_then_succeeds():
     cb = _callback()
     with (
-        patch("requests.post") as post,
+        patch("requests.Session.post") as post,
         patch("time.sleep") as sleep,
     ):
         post.side_effect = [
@@ -51,7 +54,7 @@ def test_send_result_retries_then_succeeds():
 def test_undelivered_result_rides_next_send():
     cb = _callback()
     with (
-        patch("requests.post") as post,
+        patch("requests.Session.post") as post,
         patch("time.sleep"),
     ):
         post.side_effect = [
@@ -78,7 +81,7 @@ def test_terminal_finish_retries_carried_result_on_transient_failure():
     backoff instead of dropping it on a single transient failure."""
     cb = _callback()
     with (
-        patch("requests.post") as post,
+        patch("requests.Session.post") as post,
         patch("time.sleep") as sleep,
     ):
         post.side_effect = [
@@ -111,7 +114,7 @@ def test_terminal_finish_without_carried_result_is_single_shot():
     so the common (already-delivered) path is not slowed by retries."""
     cb = _callback()
     with (
-        patch("requests.post") as post,
+        patch("requests.Session.post") as post,
         patch("time.sleep") as sleep,
     ):
         post.side_effect = [requests.RequestException()]
@@ -124,7 +127,7 @@ def test_terminal_finish_without_carried_result_is_single_shot():
 def test_send_intermediate_uses_final_false_without_retry_or_carry_forward():
     cb = _callback()
     with (
-        patch("requests.post") as post,
+        patch("requests.Session.post") as post,
         patch("time.sleep") as sleep,
     ):
         post.side_effect = [requests.RequestException(), _ok()]
@@ -143,7 +146,7 @@ def test_send_intermediate_uses_final_false_without_retry_or_carry_forward():
 
 def test_send_result_uses_final_true():
     cb = _callback()
-    with patch("requests.post", return_value=_ok()) as post:
+    with patch("requests.Session.post", return_value=_ok()) as post:
         assert cb.send_result("answer", tokens=[]) is True
 
     payload = post.call_args.kwargs["json"]
@@ -153,19 +156,59 @@ def test_send_result_uses_final_true():
 
 def test_activity_snapshot_is_async_and_seq_ordered():
     cb = _callback()
-    with patch("requests.post", return_value=_ok()) as post:
+    with patch("requests.Session.post", return_value=_ok()) as post:
         cb.activity_snapshot([_activity()], 1)
         cb.activity_snapshot([_activity(ActivityState.FINISHED)], 2)
         cb._drain_running_updates()  # pylint: disable=protected-access
 
     payloads = [call.kwargs["json"] for call in post.call_args_list]
-    assert [payload["activitySeq"] for payload in payloads] == [1, 2]
-    assert [payload["runState"] for payload in payloads] == ["RUNNING", "RUNNING"]
+    seqs = [payload["activitySeq"] for payload in payloads]
+    # Snapshot 1 may be superseded by snapshot 2 before it is sent.
+    assert seqs in ([1, 2], [2])
+    assert {payload["runState"] for payload in payloads} == {"RUNNING"}
+
+
+def test_superseded_activity_snapshots_are_coalesced():
+    cb = _callback()
+    first_in_flight, release_first = threading.Event(), threading.Event()
+
+    def post(*_args, **kwargs):
+        if kwargs["json"]["activitySeq"] == 1:
+            first_in_flight.set()
+            release_first.wait(5)
+        return _ok()
+
+    coalesced_before = status_update_stats.coalesced
+    with patch("requests.Session.post", side_effect=post) as session_post:
+        cb.activity_snapshot([_activity()], 1)
+        assert first_in_flight.wait(5)
+        for seq in (2, 3, 4):
+            cb.activity_snapshot([_activity()], seq)
+        release_first.set()
+        cb._drain_running_updates()  # pylint: disable=protected-access
+
+    seqs = [call.kwargs["json"]["activitySeq"] for call in session_post.call_args_list]
+    assert seqs == [1, 4]
+    assert status_update_stats.coalesced - coalesced_before == 2
+
+
+def test_terminal_send_flushes_rate_limited_snapshot_immediately():
+    cb = _callback()
+    cb.running_update_min_interval = 30
+    with patch("requests.Session.post", return_value=_ok()) as post:
+        assert cb.send_suggestions(["next question"]) is True
+        cb.activity_snapshot([_activity(ActivityState.FINISHED)], 1)
+        start = time.monotonic()
+        assert cb.finish() is True
+
+    assert time.monotonic() - start < 5
+    run_states = [call.kwargs["json"]["runState"] for call in post.call_args_list]
+    assert run_states == ["RUNNING", "RUNNING", "FINISHED"]
 
 
 def test_send_result_carries_authoritative_activities():
     cb = _callback()
-    with patch("requests.post", return_value=_ok()) as post:
+    with patch("requests.Session.post", return_value=_ok()) as post:
         assert cb.send_result(
             "answer",
             tokens=[],
@@ -0,0 +1,99 @@
+"""Tests for the content-addressed embedding cache.
+
+Re-ingesting an unchanged lecture or repeating a query used to embed the same
+strings again. The cache must return the stored vector for the same
+(model id, normalized text) without calling the embedding model.
+"""
+
+# pylint: skip-file
+
+from unittest.mock import MagicMock, patch
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.llm.embedding_cache import EmbeddingCache  # noqa: E402
+from iris.llm.request_handler.llm_request_handler import (  # noqa: E402
+    LlmRequestHandler,
+)
+
+
+def _embed_many(texts):
+    return [[float(len(text)), 0.5] for text in texts]
+
+
+def test_only_unseen_texts_are_embedded():
+    cache = EmbeddingCache(max_memory_bytes=1024 * 1024)
+    embed_many = MagicMock(side_effect=_embed_many)
+
+    first = cache.get_or_embed(
+        "model", ["slide one", "slide two", "slide one"], embed_many
+    )
+    second = cache.get_or_embed("model", ["  slide   two ", "slide three"], embed_many)
+
+    assert first == [[9.0, 0.5], [9.0, 0.5], [9.0, 0.5]]
+    assert second == [[9.0, 0.5], [11.0, 0.5]]
+    assert [call.args[0] for call in embed_many.call_args_list] == [
+        ["slide one", "slide two"],
+        ["slide three"],
+    ]
+    assert cache.stats().hits == 1
+
+
+def test_vectors_are_cached_per_embedding_model():
+    cache = EmbeddingCache(max_memory_bytes=1024 * 1024)
+    embed_many = MagicMock(side_effect=_embed_many)
+
+    cache.get_or_embed("small", ["text"], embed_many)
+    cache.get_or_embed("large", ["text"], embed_many)
+
+    assert embed_many.call_count == 2
+
+
+def test_memory_tier_evicts_least_recently_used():
+    # Each two-dimensional vector takes 16 bytes.
+    cache = EmbeddingCache(max_memory_bytes=32)
+    embed_many = MagicMock(side_effect=_embed_many)
+
+    cache.get_or_embed("model", ["a", "b"], embed_many)
+    cache.get_or_embed("model", ["a"], embed_many)
+    cache.get_or_embed("model", ["c"], embed_many)
+    cache.get_or_embed("model", ["a", "b"], embed_many)
+
+    assert embed_many.call_args_list[-1].args[0] == ["b"]
+    assert cache.stats().memory_bytes == 32
+
+
+def test_disk_tier_survives_a_new_cache_instance(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    embed_many = MagicMock(side_effect=_embed_many)
+    EmbeddingCache(
+        max_memory_bytes=1024, sqlite_path=path, max_disk_bytes=1024
+    ).get_or_embed("model", ["page text"], embed_many)
+
+    reopened = EmbeddingCache(
+        max_memory_bytes=1024, sqlite_path=path, max_disk_bytes=1024
+    )
+
+    assert reopened.get_or_embed("model", ["page text"], embed_many) == [[9.0, 0.5]]
+    assert embed_many.call_count == 1
+    assert reopened.stats().disk_hits == 1
+
+
+def test_request_handler_embeds_through_the_cache():
+    handler = LlmRequestHandler.__new__(LlmRequestHandler)
+    llm = MagicMock(id="oai-embedding-small")
+    llm.embed_many.side_effect = _embed_many
+    cache = EmbeddingCache(max_memory_bytes=1024 * 1024)
+
+    with (
+        patch.object(LlmRequestHandler, "_select_model", return_value=llm),
+        patch(
+            "iris.llm.request_handler.llm_request_handler.get_embedding_cache",
+            return_value=cache,
+        ),
+    ):
+        handler.embed_many(["chunk a", "chunk b"])
+        assert handler.embed("chunk b") == [7.0, 0.5]
+        handler.embed_many(["chunk a", "chunk b"])
+
+    llm.embed_many.assert_called_once_with(["chunk a", "chunk b"])
+    llm.embed.assert_not_called()
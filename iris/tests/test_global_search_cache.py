@@ -0,0 +1,151 @@
+"""Tests for the semantic cache of global search answers.
+
+Near-identical questions of the same Artemis instance used to each run HyDE,
+the search and the answer LLM. They must now reuse the cached entry until it
+expires or the referenced course content changes.
+"""
+
+# pylint: skip-file
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.config import settings  # noqa: E402
+from iris.domain.search.lecture_search_dto import (  # noqa: E402
+    CourseInfo,
+    LectureInfo,
+    LectureSearchResultDTO,
+    LectureUnitInfo,
+)
+from iris.domain.search.search_intent_dto import SearchIntent  # noqa: E402
+from iris.pipeline.global_search_pipeline import GlobalSearchPipeline  # noqa: E402
+from iris.pipeline.shared.global_search_cache import (  # noqa: E402
+    CachedGlobalSearch,
+    GlobalSearchCache,
+    GlobalSearchCacheScope,
+)
+
+_SCOPE = GlobalSearchCacheScope("https://artemis.example/", ("hyde", "answer"), 5)
+
+
+def _source(course_id: int = 1) -> LectureSearchResultDTO:
+    return LectureSearchResultDTO(
+        course=CourseInfo(id=course_id, name="Course"),
+        lecture=LectureInfo(id=2, name="Lecture"),
+        lectureUnit=LectureUnitInfo(
+            id=3,
+            name="Unit",
+            link="/courses/1/lectures/2",
+            pageNumber=4,
+            sourceType="lecture_unit_slide",
+        ),
+        snippet="Snippet",
+    )
+
+
+def _result(answer="Answer", sources=None) -> CachedGlobalSearch:
+    sources = [_source()] if sources is None else sources
+    return CachedGlobalSearch(
+        hypothetical_answer="HyDE", sources=sources, answer=answer, used_sources=sources
+    )
+
+
+def _cache(**kwargs) -> GlobalSearchCache:
+    return GlobalSearchCache(
+        **{
+            "similarity_threshold": 0.95,
+            "ttl_seconds": 600,
+            "max_entries": 16,
+            **kwargs,
+        }
+    )
+
+
+def test_similar_questions_of_the_same_scope_share_an_entry():
+    cache = _cache()
+    cache.store(_SCOPE, [1.0, 0.0], _result())
+
+    assert cache.lookup(_SCOPE, [0.99, 0.05]).answer == "Answer"
+    assert cache.lookup(_SCOPE, [0.6, 0.8]) is None
+    other_scope = GlobalSearchCacheScope("https://other.example", ("hyde", "answer"), 5)
+    assert cache.lookup(other_scope, [1.0, 0.0]) is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_entries_expire_and_lru_is_bounded():
+    cache = _cache(ttl_seconds=0)
+    cache.store(_SCOPE, [1.0, 0.0], _result())
+    assert cache.lookup(_SCOPE, [1.0, 0.0]) is None
+    assert cache.stats().entries == 0
+
+    cache = _cache(max_entries=2)
+    cache.store(_SCOPE, [1.0, 0.0], _result("first"))
+    cache.store(_SCOPE, [0.0, 1.0], _result("second"))
+    assert cache.lookup(_SCOPE, [1.0, 0.0]).answer == "first"
+    cache.store(_SCOPE, [0.7, -0.7], _result("third"))
+    assert cache.lookup(_SCOPE, [0.0, 1.0]) is None
+    assert cache.lookup(_SCOPE, [1.0, 0.0]).answer == "first"
+
+
+def test_invalidation_drops_entries_of_changed_courses_and_empty_results():
+    cache = _cache()
+    cache.store(_SCOPE, [1.0, 0.0], _result("course 1", [_source(1)]))
+    cache.store(_SCOPE, [0.0, 1.0], _result("course 2", [_source(2)]))
+    cache.store(_SCOPE, [0.7, -0.7], _result(None, []))
+
+    assert cache.invalidate("https://other.example", [1]) == 0
+    assert cache.invalidate("https://artemis.example", [1]) == 2
+    assert cache.lookup(_SCOPE, [1.0, 0.0]) is None
+    assert cache.lookup(_SCOPE, [0.0, 1.0]).answer == "course 2"
+
+
+def _pipeline(cache, monkeypatch) -> GlobalSearchPipeline:
+    monkeypatch.setattr(
+        "iris.pipeline.global_search_pipeline.get_global_search_cache", lambda: cache
+    )
+    pipeline = GlobalSearchPipeline.__new__(GlobalSearchPipeline)
+    pipeline.cache_model_ids = ("hyde", "answer", "embedding")
+    pipeline.retriever = SimpleNamespace(llm_embedding=MagicMock())
+    pipeline.retriever.llm_embedding.embed.return_value = [1.0, 0.0]
+    pipeline._retrieve = MagicMock(return_value=("HyDE", [_source()]))
+    pipeline._answer = MagicMock(
+        side_effect=lambda query, sources: (f"answer to {query}", sources)
+    )
+    return pipeline
+
+
+def _ask(pipeline, query):
+    return pipeline(
+        query,
+        limit=5,
+        intent=SearchIntent.TRIGGER_AI,
+        base_url="https://artemis.example",
+    )
+
+
+def test_pipeline_answers_repeated_questions_from_the_cache(monkeypatch):
+    cache = _cache()
+    pipeline = _pipeline(cache, monkeypatch)
+
+    first = _ask(pipeline, "What is a monad?")
+    second = _ask(pipeline, "what is a monad")
+
+    assert second.answer == first.answer == "answer to What is a monad?"
+    pipeline._retrieve.assert_called_once()
+    pipeline._answer.assert_called_once()
+    stats = cache.stats()
+    assert (stats.hits, stats.hit_requests, stats.miss_requests) == (1, 1, 1)
+
+
+def test_pipeline_reuses_only_retrieval_when_answers_are_not_reused(monkeypatch):
+    monkeypatch.setattr(settings.global_search_cache, "reuse_answers", False)
+    pipeline = _pipeline(_cache(), monkeypatch)
+
+    _ask(pipeline, "What is a monad?")
+    second = _ask(pipeline, "what is a monad")
+
+    assert second.answer == "answer to what is a monad"
+    pipeline._retrieve.assert_called_once()
+    assert pipeline._answer.call_count == 2
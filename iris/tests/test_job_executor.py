@@ -0,0 +1,116 @@
+"""Tests for the bounded, prioritised job executor.
+
+Pipeline and webhook endpoints used to start one unbounded thread per request.
+Jobs now run in fixed-size pools per workload class with a bounded priority
+queue, admission control and a graceful drain on shutdown.
+"""
+
+# pylint: skip-file
+
+import contextvars
+import threading
+from concurrent.futures import Future
+
+import pytest
+from fastapi import status
+
+from iris.common.custom_exceptions import (
+    JobQueueFullException,
+    ServiceShuttingDownException,
+)
+from iris.common.job_executor import JobPool, JobPriority, Workload
+from iris.ingestion.ingestion_job_handler import IngestionJobHandler
+
+
+def _blocked_pool(max_queue_size: int):
+    """A single-worker pool whose worker is blocked until ``release`` is set."""
+    pool = JobPool(Workload.INTERACTIVE, max_workers=1, max_queue_size=max_queue_size)
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    pool.submit(block)
+    assert started.wait(5)
+    return pool, release
+
+
+def test_queued_jobs_run_by_priority_then_submission_order():
+    pool, release = _blocked_pool(max_queue_size=4)
+    order = []
+    futures = [
+        pool.submit(order.append, "low", priority=JobPriority.LOW),
+        pool.submit(order.append, "normal-1"),
+        pool.submit(order.append, "high", priority=JobPriority.HIGH),
+        pool.submit(order.append, "normal-2"),
+    ]
+
+    release.set()
+    for future in futures:
+        future.result(5)
+
+    assert order == ["high", "normal-1", "normal-2", "low"]
+    stats = pool.stats()
+    assert stats.completed == 5
+    assert stats.wait_max_ms > 0
+
+
+def test_saturated_pool_rejects_with_429():
+    pool, release = _blocked_pool(max_queue_size=1)
+    pool.submit(lambda: None)
+
+    with pytest.raises(JobQueueFullException) as excinfo:
+        pool.submit(lambda: None)
+
+    assert excinfo.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert pool.stats().rejected == 1
+    assert pool.stats().saturated
+    release.set()
+
+
+def test_shutdown_drains_queued_jobs_and_then_rejects_with_503():
+    pool, release = _blocked_pool(max_queue_size=2)
+    queued = pool.submit(lambda: "done")
+    threading.Timer(0.05, release.set).start()
+
+    assert pool.shutdown(timeout=5)
+    assert queued.result(0) == "done"
+    with pytest.raises(ServiceShuttingDownException) as excinfo:
+        pool.submit(lambda: None)
+    assert excinfo.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def test_shutdown_reports_timeout_when_jobs_do_not_finish():
+    pool, release = _blocked_pool(max_queue_size=0)
+
+    assert not pool.shutdown(timeout=0.05)
+    release.set()
+
+
+def test_jobs_see_the_submitters_context_and_surface_errors():
+    request_id = contextvars.ContextVar("request_id", default=None)
+    pool = JobPool(Workload.BACKGROUND, max_workers=2, max_queue_size=0)
+    request_id.set("abc")
+
+    assert pool.submit(request_id.get).result(5) == "abc"
+    with pytest.raises(ValueError):
+        pool.submit(int, "not a number").result(5)
+
+
+def test_ingestion_handler_skips_units_with_a_pending_job():
+    handler = IngestionJobHandler()
+    pending = Future()
+    submitted = []
+
+    def submit():
+        submitted.append(True)
+        return pending
+
+    handler.add_job(submit, course_id=1, lecture_id=2, lecture_unit_id=3)
+    handler.add_job(submit, course_id=1, lecture_id=2, lecture_unit_id=3)
+    assert len(submitted) == 1
+
+    pending.set_result(None)
+    handler.add_job(submit, course_id=1, lecture_id=2, lecture_unit_id=3)
+    assert len(submitted) == 2
@@ -0,0 +1,122 @@
+"""Tests for concurrent slide vision in lecture ingestion.
+
+Pages used to be rendered at a fixed 5x zoom and sent to the vision model one
+after another, with the merged text of the previous page as context. Pages are
+now rendered in a process pool and interpreted concurrently with the raw text
+of the previous page as context; results must come back in page order.
+"""
+
+# pylint: skip-file
+
+import base64
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import fitz
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.domain.data.slide_vision_dto import SlideVisionDTO  # noqa: E402
+from iris.ingestion.pdf_rendering import render_scale, submit_render  # noqa: E402
+from iris.pipeline.lecture_ingestion_pipeline import (  # noqa: E402
+    LectureUnitPageIngestionPipeline,
+)
+from iris.vector_database.lecture_unit_page_chunk_schema import (  # noqa: E402
+    LectureUnitPageChunkSchema,
+)
+
+
+def _page(text: str):
+    return SimpleNamespace(
+        get_text=MagicMock(return_value=text),
+        get_pixmap=MagicMock(return_value=SimpleNamespace(samples=text.encode())),
+    )
+
+
+def _rendered(_pdf_path, page_num, *_args) -> Future:
+    future = Future()
+    future.set_result(f"image-{page_num}")
+    return future
+
+
+def test_pages_are_interpreted_concurrently_and_reassembled_in_order(monkeypatch):
+    pages = [_page("intro"), _page("definitions"), _page("examples")]
+    doc = SimpleNamespace(
+        page_count=3, load_page=MagicMock(side_effect=lambda i: pages[i])
+    )
+    monkeypatch.setattr(
+        "iris.pipeline.lecture_ingestion_pipeline.fitz.open",
+        MagicMock(return_value=doc),
+    )
+    monkeypatch.setattr(
+        "iris.pipeline.lecture_ingestion_pipeline.submit_render", _rendered
+    )
+
+    contexts = {}
+
+    def interpret_image(img_base64, last_page_content, *_args):
+        page_num = int(img_base64.rsplit("-", 1)[1])
+        contexts[page_num] = last_page_content
+        # Earlier pages finish last.
+        time.sleep(0.05 * (3 - page_num))
+        return SlideVisionDTO(
+            display_page_number=10 + page_num, academic_description=""
+        )
+
+    pipeline = LectureUnitPageIngestionPipeline.__new__(
+        LectureUnitPageIngestionPipeline
+    )
+    pipeline.callback = MagicMock()
+    pipeline.tokens = []
+    pipeline._hidden_until_by_page = {}
+    pipeline._existing_chunks = []
+    pipeline._reused_chunks = []
+    pipeline.get_course_language = MagicMock(return_value="en")
+    pipeline.interpret_image = MagicMock(side_effect=interpret_image)
+    lecture_unit = SimpleNamespace(
+        lecture_name="Lecture",
+        lecture_unit_name="Unit",
+        lecture_id=1,
+        lecture_unit_id=2,
+        course_id=3,
+        attachment_version=1,
+        display_page_numbers=None,
+    )
+
+    chunks = pipeline.chunk_data("/tmp/test.pdf", lecture_unit, "https://artemis")
+
+    assert [c[LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value] for c in chunks] == [
+        "intro",
+        "definitions",
+        "examples",
+    ]
+    assert [c[LectureUnitPageChunkSchema.PAGE_NUMBER.value] for c in chunks] == [
+        1,
+        2,
+        3,
+    ]
+    assert lecture_unit.display_page_numbers == [10, 11, 12]
+    assert contexts == {0: "", 1: "intro", 2: "definitions"}
+    assert pipeline.callback.update.call_count == 3
+
+
+def test_render_scale_adapts_to_page_size():
+    # A 16:9 slide of 960x540 pt rendered to a 2048 px long edge.
+    assert render_scale(960, 540, 2048) == 2048 / 960
+    # Small pages are capped at the previous fixed 5x zoom.
+    assert render_scale(100, 80, 2048) == 5.0
+    # Huge pages are never rendered below 1x.
+    assert render_scale(5000, 3000, 2048) == 1.0
+
+
+def test_inline_render_produces_jpeg_at_the_adapted_size(tmp_path):
+    path = tmp_path / "slides.pdf"
+    with fitz.open() as doc:
+        doc.new_page(width=400, height=300).insert_text((50, 50), "Slide")
+        doc.save(str(path))
+
+    image = base64.b64decode(submit_render(str(path), 0, 800, 0).result())
+
+    assert image[:2] == b"\xff\xd8"
+    assert fitz.Pixmap(image).width == 800
@@ -0,0 +1,169 @@
+"""Tests for incremental lecture re-ingestion.
+
+Re-sending a lecture unit used to delete every page chunk and run vision,
+chunking and embedding for every page again. Pages whose hash (text plus
+thumbnail) matches a stored page must now keep their stored chunks.
+"""
+
+# pylint: skip-file
+
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.domain.data.slide_vision_dto import SlideVisionDTO  # noqa: E402
+from iris.pipeline.lecture_ingestion_pipeline import (  # noqa: E402
+    LectureUnitPageIngestionPipeline,
+    compute_page_hash,
+)
+from iris.vector_database.lecture_unit_page_chunk_schema import (  # noqa: E402
+    LectureUnitPageChunkSchema,
+)
+
+_OLD_UUID = "00000000-0000-0000-0000-000000000001"
+_KEPT_UUID = "00000000-0000-0000-0000-000000000002"
+
+
+def _page(text: str, pixels: bytes = b"pixels"):
+    return SimpleNamespace(
+        get_text=MagicMock(return_value=text),
+        get_pixmap=MagicMock(
+            return_value=SimpleNamespace(samples=pixels, tobytes=lambda _: b"jpg")
+        ),
+    )
+
+
+def _stored_chunk(uuid: str, page, page_number: int, text: str):
+    return SimpleNamespace(
+        uuid=uuid,
+        vector={"default": [0.1, 0.2]},
+        properties={
+            LectureUnitPageChunkSchema.PAGE_NUMBER.value: page_number,
+            LectureUnitPageChunkSchema.DISPLAY_PAGE_NUMBER.value: page_number,
+            LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value: text,
+            LectureUnitPageChunkSchema.PAGE_HASH.value: compute_page_hash(
+                page, page.get_text()
+            ),
+        },
+    )
+
+
+def _pipeline(stored_chunks):
+    pipeline = LectureUnitPageIngestionPipeline.__new__(
+        LectureUnitPageIngestionPipeline
+    )
+    pipeline.callback = MagicMock()
+    pipeline.tokens = []
+    pipeline.course_language = None
+    pipeline._hidden_until_by_page = {}
+    pipeline._existing_chunks = stored_chunks
+    pipeline._reused_chunks = []
+    pipeline.get_course_language = MagicMock(return_value="en")
+    pipeline.interpret_image = MagicMock(
+        return_value=SlideVisionDTO(display_page_number=7, academic_description="")
+    )
+    pipeline.collection = MagicMock()
+    return pipeline
+
+
+def _rendered(*_args) -> Future:
+    future = Future()
+    future.set_result("jpg-base64")
+    return future
+
+
+def _lecture_unit():
+    return SimpleNamespace(
+        lecture_name="Lecture",
+        lecture_unit_name="Unit",
+        lecture_id=1,
+        lecture_unit_id=2,
+        course_id=3,
+        attachment_version=5,
+        display_page_numbers=None,
+    )
+
+
+def test_page_hash_covers_text_and_rendering():
+    assert compute_page_hash(_page("a"), "a") == compute_page_hash(_page("a"), "a")
+    assert compute_page_hash(_page("a"), "a") != compute_page_hash(_page("b"), "b")
+    assert compute_page_hash(_page("a", b"x"), "a") != compute_page_hash(
+        _page("a", b"y"), "a"
+    )
+
+
+def test_only_changed_pages_are_interpreted_and_unchanged_pages_are_repointed(
+    monkeypatch,
+):
+    old_first, unchanged = _page("old intro"), _page("definitions")
+    stored = [
+        _stored_chunk(_OLD_UUID, old_first, 1, "old intro"),
+        _stored_chunk(_KEPT_UUID, unchanged, 2, "definitions"),
+    ]
+    pipeline = _pipeline(stored)
+    new_page = _page("examples")
+    doc = SimpleNamespace(
+        page_count=2,
+        load_page=MagicMock(side_effect=[new_page, unchanged, new_page]),
+    )
+    monkeypatch.setattr(
+        "iris.pipeline.lecture_ingestion_pipeline.fitz.open",
+        MagicMock(return_value=doc),
+    )
+    monkeypatch.setattr(
+        "iris.pipeline.lecture_ingestion_pipeline.submit_render", _rendered
+    )
+    lecture_unit = _lecture_unit()
+
+    chunks = pipeline.chunk_data("/tmp/test.pdf", lecture_unit, "https://artemis")
+
+    pipeline.interpret_image.assert_called_once()
+    assert [c[LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value] for c in chunks] == [
+        "examples"
+    ]
+    assert chunks[0][LectureUnitPageChunkSchema.PAGE_NUMBER.value] == 2
+    assert chunks[0][LectureUnitPageChunkSchema.PAGE_HASH.value] == (
+        compute_page_hash(new_page, "examples")
+    )
+    assert lecture_unit.display_page_numbers == [2, 7]
+
+    pipeline._update_reused_chunks()
+    pipeline._delete_stale_chunks()
+
+    batch = pipeline.collection.batch.rate_limit.return_value.__enter__.return_value
+    batch.add_object.assert_called_once()
+    update = batch.add_object.call_args.kwargs
+    assert update["uuid"] == _KEPT_UUID
+    assert update["properties"][LectureUnitPageChunkSchema.PAGE_NUMBER.value] == 1
+    assert update["properties"][LectureUnitPageChunkSchema.PAGE_VERSION.value] == 5
+    assert (
+        update["properties"][LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value]
+        == "definitions"
+    )
+    assert update["vector"] == [0.1, 0.2]
+    pipeline.collection.data.update.assert_not_called()
+    pipeline.collection.data.delete_many.assert_called_once()
+
+
+def test_reused_chunks_that_did_not_change_are_not_written():
+    page = _page("definitions")
+    moved = _stored_chunk(_OLD_UUID, page, 1, "definitions")
+    unchanged = _stored_chunk(_KEPT_UUID, page, 2, "definitions")
+    unchanged.properties[LectureUnitPageChunkSchema.PAGE_VERSION.value] = 5
+    pipeline = _pipeline([moved, unchanged])
+    pipeline._reused_chunks = [
+        (moved, {LectureUnitPageChunkSchema.PAGE_NUMBER.value: 3}),
+        (unchanged, {LectureUnitPageChunkSchema.PAGE_VERSION.value: 5}),
+    ]
+
+    pipeline._update_reused_chunks()
+
+    batch = pipeline.collection.batch.rate_limit.return_value.__enter__.return_value
+    assert [c.kwargs["uuid"] for c in batch.add_object.call_args_list] == [_OLD_UUID]
+
+    pipeline.collection.reset_mock()
+    pipeline._reused_chunks = pipeline._reused_chunks[1:]
+    pipeline._update_reused_chunks()
+
+    pipeline.collection.batch.rate_limit.assert_not_called()
@@ -0,0 +1,103 @@
+"""Tests for the combined lecture query rewrite mode.
+
+Lecture retrieval used to make one LLM call per rewritten query and
+hypothetical answer. In combined mode one JSON call must return all of them,
+and unusable responses must fall back to the separate calls.
+"""
+
+# pylint: skip-file
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.common.token_usage_dto import TokenUsageDTO  # noqa: E402
+from iris.config import settings  # noqa: E402
+from iris.retrieval.lecture.lecture_query_rewrite import (  # noqa: E402
+    QueryRewriteStrategy,
+    parse_combined_rewrites,
+    query_rewrite_stats,
+    retrieval_recall,
+    rewrite_strategy_for_variant,
+)
+from iris.retrieval.lecture.lecture_retrieval import LectureRetrieval  # noqa: E402
+
+_REWRITES = {
+    "lecture_pages_query": "pages query",
+    "lecture_pages_answer": "pages answer",
+    "lecture_transcriptions_query": "transcriptions query",
+    "lecture_transcriptions_answer": "transcriptions answer",
+}
+
+
+def _retrieval(response: str) -> LectureRetrieval:
+    retrieval = LectureRetrieval.__new__(LectureRetrieval)
+    retrieval.tokens = []
+    retrieval.combined_rewrite_llm = SimpleNamespace(tokens=TokenUsageDTO())
+    retrieval.combined_rewrite_pipeline = RunnableLambda(lambda _prompt: response)
+    retrieval.run_parallel_rewrite_tasks = MagicMock(
+        return_value=("fan pages", "fan transcriptions", "fan hyde", "fan hyde t")
+    )
+    return retrieval
+
+
+def _rewrite(retrieval, include_transcriptions=True):
+    return retrieval.rewrite_queries(
+        QueryRewriteStrategy.COMBINED,
+        [],
+        "What is {a} monad?",
+        "en",
+        "Functional Programming",
+        include_transcriptions=include_transcriptions,
+    )
+
+
+def test_combined_mode_writes_all_queries_in_one_call():
+    retrieval = _retrieval(f"```json\n{json.dumps(_REWRITES)}\n```")
+
+    rewrites = _rewrite(retrieval)
+
+    assert rewrites.lecture_pages_query == "pages query"
+    assert rewrites.lecture_transcriptions_answer == "transcriptions answer"
+    retrieval.run_parallel_rewrite_tasks.assert_not_called()
+    assert len(retrieval.tokens) == 1
+
+
+def test_unusable_combined_response_falls_back_to_fan_out():
+    fallbacks = query_rewrite_stats.stats().fallbacks
+    retrieval = _retrieval(json.dumps({"lecture_pages_query": "pages query"}))
+
+    rewrites = _rewrite(retrieval)
+
+    assert rewrites.lecture_pages_query == "fan pages"
+    retrieval.run_parallel_rewrite_tasks.assert_called_once()
+    assert query_rewrite_stats.stats().fallbacks == fallbacks + 1
+
+
+def test_transcription_texts_are_optional_without_transcriptions():
+    rewrites = parse_combined_rewrites(
+        json.dumps({"lecture_pages_query": "q", "lecture_pages_answer": "a"}), False
+    )
+    assert rewrites.lecture_transcriptions_query is None
+
+    with pytest.raises(ValueError):
+        parse_combined_rewrites("[]", False)
+
+
+def test_rewrite_mode_is_selected_per_variant(monkeypatch):
+    config = settings.lecture_query_rewrite
+    monkeypatch.setattr(config, "mode", "fan_out")
+    monkeypatch.setattr(config, "variant_modes", {"default": "combined"})
+
+    assert rewrite_strategy_for_variant("default") is QueryRewriteStrategy.COMBINED
+    assert rewrite_strategy_for_variant("advanced") is QueryRewriteStrategy.FAN_OUT
+    assert rewrite_strategy_for_variant(None) is QueryRewriteStrategy.FAN_OUT
+
+
+def test_recall_is_the_share_of_reference_hits_found():
+    assert retrieval_recall({"a", "b"}, {"a", "c"}) == 0.5
+    assert retrieval_recall(set(), {"a"}) == 1.0
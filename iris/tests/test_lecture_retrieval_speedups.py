@@ -10,6 +10,7 @@ from uuid import uuid4
 import pytest
 
 import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.config import settings  # noqa: E402
 from iris.domain.retrieval.lecture.lecture_retrieval_dto import (  # noqa: E402
     LectureTranscriptionRetrievalDTO,
     LectureUnitPageChunkRetrievalDTO,
@@ -20,6 +21,11 @@ from iris.llm.llm_configuration import LlmConfigurationError  # noqa: E402
 from iris.retrieval.lecture.lecture_page_chunk_retrieval import (  # noqa: E402
     LecturePageChunkRetrieval,
 )
+from iris.retrieval.lecture.lecture_query_rewrite import (  # noqa: E402
+    LectureQueryRewrites,
+    QueryRewriteStrategy,
+    query_rewrite_stats,
+)
 from iris.retrieval.lecture.lecture_retrieval import (  # noqa: E402
     LectureRetrieval,
     QueryRewriteMode,
@@ -133,8 +139,8 @@ def _make_retrieval(probe_objects=None) -> LectureRetrieval:
     retrieval.lecture_unit_segment_pipeline = MagicMock(return_value=[])
     retrieval.lecture_transcription_pipeline = MagicMock(return_value=[])
     retrieval.lecture_unit_page_chunk_pipeline = MagicMock(return_value=[])
-    retrieval.get_lecture_transcription_of_lecture_unit = MagicMock(return_value=[])
-    retrieval.get_lecture_page_chunks_of_lecture_unit = MagicMock(return_value=[])
+    retrieval.get_lecture_transcriptions_of_segments = MagicMock(return_value=[])
+    retrieval.get_lecture_page_chunks_of_segments = MagicMock(return_value=[])
 
     retrieval.cohere_client = MagicMock()
     retrieval.cohere_client.rerank.side_effect = (
@@ -146,7 +152,7 @@ def _make_retrieval(probe_objects=None) -> LectureRetrieval:
 def test_no_transcriptions_skips_transcription_domain_and_caches_probe():
     retrieval = _make_retrieval(probe_objects=[])
     retrieval.lecture_unit_segment_pipeline.return_value = [_segment()]
-    retrieval.get_lecture_transcription_of_lecture_unit.return_value = [
+    retrieval.get_lecture_transcriptions_of_segments.return_value = [
         _transcription("Should not be fetched")
     ]
 
@@ -167,7 +173,7 @@ def test_no_transcriptions_skips_transcription_domain_and_caches_probe():
         QueryRewriteMode.LECTURE_PAGES
     )
     retrieval.lecture_transcription_pipeline.assert_not_called()
-    retrieval.get_lecture_transcription_of_lecture_unit.assert_not_called()
+    retrieval.get_lecture_transcriptions_of_segments.assert_not_called()
     assert result.lecture_transcriptions == []
 
     segment_call = retrieval.lecture_unit_segment_pipeline.call_args
@@ -260,6 +266,40 @@ def test_final_reranks_run_concurrently_and_preserve_results():
     } == {"segment_text", "page_text_content"}
 
 
+def test_compared_retrievals_search_with_both_rewrite_modes(monkeypatch):
+    monkeypatch.setattr(settings.lecture_query_rewrite, "compare_fraction", 1.0)
+    retrieval = _make_retrieval(probe_objects=[])
+    retrieval.rewrite_queries = MagicMock(
+        side_effect=lambda strategy, *_args: LectureQueryRewrites(
+            f"{strategy.value} pages", None, f"{strategy.value} hyde", None
+        )
+    )
+    shared, fan_out_only = _page_chunk("shared"), _page_chunk("fan out only")
+    retrieval.lecture_unit_page_chunk_pipeline.side_effect = (
+        lambda _query, pages_query, *_args, **_kwargs: (
+            [shared, fan_out_only] if pages_query == "fan_out pages" else [shared]
+        )
+    )
+    compared = query_rewrite_stats.stats()
+
+    result = retrieval(
+        "student query",
+        course_id=1,
+        chat_history=[],
+        lecture_id=2,
+        lecture_unit_id=3,
+    )
+
+    assert {call.args[0] for call in retrieval.rewrite_queries.call_args_list} == {
+        QueryRewriteStrategy.FAN_OUT,
+        QueryRewriteStrategy.COMBINED,
+    }
+    assert result.lecture_unit_page_chunks == [shared, fan_out_only]
+    stats = query_rewrite_stats.stats()
+    assert stats.compared == compared.compared + 1
+    assert stats.recall_sum == pytest.approx(compared.recall_sum + 0.5)
+
+
 def test_distinct_queries_embed_once_and_subpipeline_fallback_still_embeds():
     retrieval = _make_retrieval(probe_objects=[SimpleNamespace(uuid=uuid4())])
     retrieval.run_parallel_rewrite_tasks = MagicMock(
@@ -378,3 +418,77 @@ def test_page_chunk_lookup_skips_none_filter_values():
 
     assert retrieval.get_lecture_page_chunks_of_lecture_unit(segment) == []
     retrieval.lecture_unit_page_chunk_collection.query.fetch_objects.assert_not_called()
+
+
+def _chunk_object(uuid, page_number, lecture_unit_id=3):
+    return SimpleNamespace(
+        uuid=uuid,
+        properties={
+            "course_id": 1,
+            "lecture_id": 2,
+            "lecture_unit_id": lecture_unit_id,
+            "base_url": "http://example.com",
+            "course_language": "en",
+            "page_number": page_number,
+            "page_text_content": f"Slide {page_number}",
+        },
+    )
+
+
+def test_segment_page_chunks_are_fetched_in_one_query_and_deduplicated():
+    retrieval = LectureRetrieval.__new__(LectureRetrieval)
+    retrieval.lecture_unit_page_chunk_collection = MagicMock()
+    fetch_objects = retrieval.lecture_unit_page_chunk_collection.query.fetch_objects
+    fetch_objects.return_value = SimpleNamespace(
+        objects=[
+            _chunk_object("chunk-4", 4),
+            _chunk_object("chunk-4", 4),
+            _chunk_object("chunk-5", 5),
+            _chunk_object("chunk-other-unit", 1, lecture_unit_id=9),
+        ]
+    )
+    segments = [_segment(), _segment(), _segment(), _segment()]
+    segments[2].page_number = 5
+    segments[3].lecture_unit_id = 9
+    segments[3].lecture_unit_name = "Other unit"
+    segments[3].page_number = 1
+
+    page_chunks = retrieval.get_lecture_page_chunks_of_segments(segments)
+
+    fetch_objects.assert_called_once()
+    assert [chunk.uuid for chunk in page_chunks] == [
+        "chunk-4",
+        "chunk-5",
+        "chunk-other-unit",
+    ]
+    assert [chunk.page_number for chunk in page_chunks] == [4, 5, 1]
+    assert page_chunks[2].lecture_unit_name == "Other unit"
+
+
+def test_segment_transcriptions_are_fetched_in_one_query_and_deduplicated():
+    retrieval = LectureRetrieval.__new__(LectureRetrieval)
+    retrieval.lecture_transcription_collection = MagicMock()
+    fetch_objects = retrieval.lecture_transcription_collection.query.fetch_objects
+    fetch_objects.return_value = SimpleNamespace(
+        objects=[
+            SimpleNamespace(uuid="t-1", properties={}),
+            SimpleNamespace(uuid="t-1", properties={}),
+            SimpleNamespace(uuid="t-2", properties={}),
+        ]
+    )
+    retrieval.lecture_transcription_pipeline = MagicMock()
+    retrieval.lecture_transcription_pipeline.generate_retrieval_dtos.side_effect = (
+        lambda _properties, uuid: uuid
+    )
+    unknown_display_page = _segment()
+    unknown_display_page.display_page_number = -1
+    segments = [_segment(), _segment(), unknown_display_page]
+
+    assert retrieval.get_lecture_transcriptions_of_segments(segments) == [
+        "t-1",
+        "t-2",
+    ]
+    fetch_objects.assert_called_once()
+    assert (
+        retrieval.lecture_transcription_pipeline.generate_retrieval_dtos.call_count == 2
+    )
@@ -700,6 +700,11 @@ def test_concurrent_visibility_property_add_is_treated_as_idempotent(
         SimpleNamespace(properties=existing_properties),
         SimpleNamespace(properties=[]),
         SimpleNamespace(properties=[SimpleNamespace(name=property_name)]),
+        SimpleNamespace(
+            properties=[
+                SimpleNamespace(name=LectureUnitPageChunkSchema.PAGE_HASH.value)
+            ]
+        ),
     ]
     collection.config.add_property.side_effect = WeaviateInvalidInputError(
         "property already exists"
@@ -0,0 +1,30 @@
+"""Tests for the check whether a user has memories.
+
+The chat pipeline asks this on every turn to decide whether to offer the
+memory tools, so it must not load the memories of the user.
+"""
+
+# pylint: skip-file
+
+from unittest.mock import MagicMock
+
+from memiris import MemoryService
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.common.memiris_setup import has_memories_for_tenant  # noqa: E402
+
+
+def test_existence_query_is_used_instead_of_loading_memories():
+    memory_service = MagicMock(spec=MemoryService)
+    memory_service.has_memories.return_value = True
+
+    assert has_memories_for_tenant("artemis-user-1", memory_service)
+    memory_service.has_memories.assert_called_once_with("artemis-user-1")
+    memory_service.get_all_memories.assert_not_called()
+
+
+def test_failing_check_counts_as_no_memories():
+    memory_service = MagicMock(spec=MemoryService)
+    memory_service.has_memories.side_effect = ValueError("Weaviate unavailable")
+
+    assert not has_memories_for_tenant("artemis-user-1", memory_service)
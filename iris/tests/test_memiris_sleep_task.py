@@ -0,0 +1,96 @@
+"""Tests for the nightly Memiris sleep of all users.
+
+The sleep used to process one tenant after another. It now hands the tenants
+to a scheduler that sleeps them in parallel, while the LLM calls of memory
+creation and sleep share one budget.
+"""
+
+# pylint: skip-file
+
+from unittest.mock import MagicMock
+
+import pytest
+from memiris import (
+    AbstractLanguageModel,
+    BudgetedLanguageModel,
+    SleepSchedulerStats,
+)
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.common import memiris_setup  # noqa: E402
+from iris.config import settings  # noqa: E402
+from iris.llm import OllamaModel  # noqa: E402
+from iris.memiris_sleep import main  # noqa: E402
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(
+        memiris_setup,
+        "VectorDatabase",
+        lambda: MagicMock(static_client_instance=MagicMock()),
+    )
+    monkeypatch.setattr(memiris_setup, "_create_vectorizer", MagicMock())
+    monkeypatch.setattr(memiris_setup, "MemoryService", MagicMock())
+    scheduler_class = MagicMock()
+    scheduler_class.return_value.run.return_value = SleepSchedulerStats(
+        tenants=2, completed=2
+    )
+    monkeypatch.setattr(memiris_setup, "MemorySleepScheduler", scheduler_class)
+    return scheduler_class
+
+
+def test_sleep_task_schedules_artemis_users_under_the_shared_budget(scheduler):
+    stats = memiris_setup.memory_sleep_task()
+
+    kwargs = scheduler.call_args.kwargs
+    assert kwargs["llm_budget"] is memiris_setup._llm_budget
+    assert kwargs["max_parallel_tenants"] == settings.memiris.sleep_max_parallel_tenants
+    assert kwargs["tenant_filter"]("artemis-user-1")
+    assert not kwargs["tenant_filter"]("other")
+    scheduler.return_value.run.assert_called_once_with(None)
+    assert stats.completed == 2
+
+
+def test_sleep_task_is_skipped_when_disabled(scheduler, monkeypatch):
+    monkeypatch.setattr(settings.memiris, "sleep_enabled", False)
+
+    assert memiris_setup.memory_sleep_task() is None
+    scheduler.assert_not_called()
+
+
+def test_cli_sleeps_the_given_tenants(scheduler):
+    assert main(["--tenant", "artemis-user-1", "--tenant", "artemis-user-2"]) == 0
+
+    scheduler.return_value.run.assert_called_once_with(
+        ["artemis-user-1", "artemis-user-2"]
+    )
+
+
+def test_cli_fails_if_a_tenant_failed(scheduler):
+    scheduler.return_value.run.return_value = SleepSchedulerStats(tenants=1, failed=1)
+
+    assert main([]) == 1
+
+
+def test_chat_models_use_the_shared_budget_but_embeddings_do_not(monkeypatch):
+    model = MagicMock(
+        spec=OllamaModel, model="llama", host="http://ollama", api_key=None
+    )
+    monkeypatch.setattr(
+        memiris_setup, "LlmManager", lambda: MagicMock(get_llm_by_id=lambda _: model)
+    )
+    monkeypatch.setattr(
+        memiris_setup,
+        "OllamaLanguageModel",
+        lambda *args: MagicMock(spec=AbstractLanguageModel),
+    )
+
+    chat_llm = memiris_setup._convert_iris_model_to_memiris_llm("llama")
+    embedding_llm = memiris_setup._convert_iris_model_to_memiris_llm(
+        "llama", with_budget=False
+    )
+
+    assert isinstance(chat_llm, BudgetedLanguageModel)
+    assert chat_llm.budget is memiris_setup._llm_budget
+    assert not isinstance(embedding_llm, BudgetedLanguageModel)
@@ -0,0 +1,107 @@
+"""Tests for the Prometheus span and LLM usage metrics.
+
+Span latencies used to be available only as log lines. Every timed span must
+now also feed a histogram labelled with the pipeline, span and the variant of
+the run, and LLM completions must be counted for the run that caused them.
+"""
+
+# pylint: skip-file
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.common import metrics  # noqa: E402
+from iris.common.profiling import profiled  # noqa: E402
+from iris.common.timing import timed_span  # noqa: E402
+from iris.tracing import TracedThreadPoolExecutor  # noqa: E402
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    collectors = SimpleNamespace(
+        span_seconds=MagicMock(), llm_calls=MagicMock(), llm_tokens=MagicMock()
+    )
+    monkeypatch.setattr(metrics, "_get_metrics", lambda: collectors)
+    return collectors
+
+
+def _rewrite_queries():
+    with timed_span("LectureRetrieval", "query_rewrites"):
+        pass
+
+
+def test_spans_are_labelled_with_the_variant_of_the_run(recorded):
+    with metrics.run_labels("ChatPipeline", "advanced"):
+        with TracedThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(_rewrite_queries).result()
+        with timed_span("LectureRetrieval", "final_rerank"):
+            pass
+    with timed_span("GlobalSearchPipeline", "answer"):
+        pass
+
+    labels = [call.args for call in recorded.span_seconds.labels.call_args_list]
+    assert ("LectureRetrieval", "query_rewrites", "advanced") in labels
+    assert ("LectureRetrieval", "final_rerank", "advanced") in labels
+    assert ("GlobalSearchPipeline", "answer", "-") in labels
+    recorded.span_seconds.labels.return_value.observe.assert_called()
+
+
+def test_llm_calls_count_tokens_for_the_current_pipeline(recorded):
+    with metrics.run_labels("ChatPipeline", "default"):
+        metrics.record_llm_call("gpt-x", 120, 30)
+
+    recorded.llm_calls.labels.assert_called_once_with("gpt-x", "ChatPipeline")
+    tokens = recorded.llm_tokens.labels
+    assert [call.args for call in tokens.call_args_list] == [
+        ("gpt-x", "ChatPipeline", "input"),
+        ("gpt-x", "ChatPipeline", "output"),
+    ]
+    assert [call.args for call in tokens.return_value.inc.call_args_list] == [
+        (120,),
+        (30,),
+    ]
+
+
+def test_exposition_contains_the_span_histogram():
+    with timed_span("LectureRetrieval", "search_pipelines"):
+        pass
+
+    body, content_type = metrics.render_metrics()
+
+    assert content_type.startswith("text/plain")
+    assert (
+        b'iris_pipeline_span_seconds_count{pipeline="LectureRetrieval",'
+        b'span="search_pipelines",variant="-"}' in body
+    )
+
+
+def test_jobs_are_not_profiled_unless_requested(tmp_path, monkeypatch):
+    from iris.config import settings
+
+    monkeypatch.setattr(settings.metrics, "profile_dir", str(tmp_path))
+
+    with profiled("job"):
+        pass
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_requested_jobs_are_profiled(tmp_path, monkeypatch):
+    from iris.common import profiling
+    from iris.config import settings
+
+    monkeypatch.setattr(settings.metrics, "profiling_enabled", True)
+    monkeypatch.setattr(settings.metrics, "profile_dir", str(tmp_path))
+    monkeypatch.setattr(
+        profiling, "_profile_requested", profiling.ContextVar("test", default=False)
+    )
+
+    profiling.request_profile("1")
+    with profiled("job"):
+        pass
+
+    (profile,) = tmp_path.iterdir()
+    assert profile.name.endswith("-job.html")
@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import openai
+import pytest
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.llm.external.openai_embeddings import (  # noqa: E402
+    DirectOpenAIEmbeddingModel,
+)
+from iris.pipeline.lecture_ingestion_pipeline import (  # noqa: E402
+    LectureUnitPageIngestionPipeline,
+)
+from iris.vector_database.lecture_unit_page_chunk_schema import (  # noqa: E402
+    LectureUnitPageChunkSchema,
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """The LangChain embeddings client the model under test creates."""
+    client = MagicMock()
+    client.embed_documents.side_effect = lambda batch: [
+        [float(len(text))] for text in batch
+    ]
+    monkeypatch.setattr(
+        "iris.llm.external.openai_embeddings.OpenAIEmbeddings",
+        MagicMock(return_value=client),
+    )
+    return client
+
+
+def _build_model(**kwargs):
+    return DirectOpenAIEmbeddingModel(
+        id="test-embedding",
+        type="openai_embedding",
+        model="text-embedding-test",
+        api_key="sk-test",  # pragma: allowlist secret
+        **kwargs,
+    )
+
+
+def test_embed_many_batches_by_size_and_keeps_order(client):
+    model = _build_model(embed_batch_size=2, embed_max_concurrency=3)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    vectors = model.embed_many(texts)
+
+    assert vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    batches = sorted(call.args[0] for call in client.embed_documents.call_args_list)
+    assert batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+
+def test_embed_many_splits_batches_at_token_budget(client):
+    model = _build_model(embed_batch_max_tokens=10, embed_max_concurrency=1)
+    texts = ["x" * 12, "y" * 12, "z" * 30]
+
+    model.embed_many(texts)
+
+    batches = [call.args[0] for call in client.embed_documents.call_args_list]
+    assert batches == [texts[:2], texts[2:]]
+
+
+def test_embed_many_retries_only_the_failed_batch(client):
+    model = _build_model(embed_batch_size=1, embed_max_concurrency=1)
+    error = openai.RateLimitError(
+        "rate limited",
+        response=httpx.Response(
+            429, request=httpx.Request("POST", "https://example.com/v1/embeddings")
+        ),
+        body=None,
+    )
+    client.embed_documents.side_effect = [[[1.0]], error, [[2.0]]]
+
+    with patch("time.sleep") as sleep:
+        vectors = model.embed_many(["first", "second"])
+
+    assert vectors == [[1.0], [2.0]]
+    assert client.embed_documents.call_count == 3
+    sleep.assert_called_once_with(1)
+
+
+def test_lecture_batch_update_embeds_before_taking_the_write_lock():
+    pipeline = LectureUnitPageIngestionPipeline.__new__(
+        LectureUnitPageIngestionPipeline
+    )
+    lock = SimpleNamespace(inside=False)
+
+    class TrackingLock:
+        def __enter__(self):
+            lock.inside = True
+
+        def __exit__(self, *_args):
+            lock.inside = False
+
+    def embed_many(texts):
+        assert lock.inside is False
+        return [[float(i)] for i, _ in enumerate(texts)]
+
+    batch = MagicMock()
+    rate_limit_context = MagicMock()
+    rate_limit_context.__enter__.return_value = batch
+    rate_limit_context.__exit__.return_value = None
+    pipeline.collection = SimpleNamespace(
+        batch=SimpleNamespace(rate_limit=MagicMock(return_value=rate_limit_context))
+    )
+    pipeline.callback = MagicMock()
+    pipeline.llm_embedding = SimpleNamespace(
+        embed_many=MagicMock(side_effect=embed_many)
+    )
+    chunks = [
+        {LectureUnitPageChunkSchema.PAGE_TEXT_CONTENT.value: f"page {i}"}
+        for i in range(3)
+    ]
+
+    with patch(
+        "iris.pipeline.lecture_ingestion_pipeline.batch_update_lock", TrackingLock()
+    ):
+        pipeline.batch_update(chunks)
+
+    pipeline.llm_embedding.embed_many.assert_called_once_with(
+        ["page 0", "page 1", "page 2"]
+    )
+    assert [call.kwargs["vector"] for call in batch.add_object.call_args_list] == [
+        [0.0],
+        [1.0],
+        [2.0],
+    ]
@@ -0,0 +1,112 @@
+"""Tests for the registry of warm, reusable pipeline instances.
+
+Every chat request used to construct its pipeline and retrievers from
+scratch. Idle instances must now be reused, leased to one request at a time,
+and discarded when the LLM configuration changes.
+"""
+
+# pylint: skip-file
+
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.pipeline.chat.chat_pipeline import ChatPipeline  # noqa: E402
+from iris.pipeline.pipeline_registry import PipelineRegistry  # noqa: E402
+
+_KEY = ("chat_pipeline", "COURSE_CHAT", False)
+
+
+def test_released_instances_are_reset_and_reused():
+    registry = PipelineRegistry(max_idle_per_key=2)
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    with registry.lease(_KEY, factory) as first:
+        pass
+    with registry.lease(_KEY, factory) as second:
+        pass
+
+    assert second is first
+    factory.assert_called_once()
+    first.reset_request_state.assert_called_once()
+    stats = registry.stats()
+    assert (stats.leases, stats.reused, stats.built, stats.idle) == (2, 1, 1, 1)
+
+
+def test_an_instance_is_leased_to_one_request_at_a_time():
+    registry = PipelineRegistry(max_idle_per_key=2)
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    leased, release = threading.Event(), threading.Event()
+
+    def hold():
+        with registry.lease(_KEY, factory):
+            leased.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    assert leased.wait(5)
+    with registry.lease(_KEY, factory):
+        pass
+    release.set()
+    holder.join(5)
+
+    assert factory.call_count == 2
+    assert registry.stats().idle == 2
+
+
+def test_llm_config_change_reloads_and_drops_idle_instances(tmp_path, monkeypatch):
+    config = tmp_path / "llm_config.yml"
+    config.write_text("llms: []")
+    llm_manager = MagicMock()
+    monkeypatch.setattr(
+        "iris.pipeline.pipeline_registry.LlmManager", lambda: llm_manager
+    )
+    registry = PipelineRegistry(max_idle_per_key=2, llm_config_path=str(config))
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    with registry.lease(_KEY, factory) as first:
+        mtime = config.stat().st_mtime + 10
+        os.utime(config, (mtime, mtime))
+    with registry.lease(_KEY, factory) as second:
+        pass
+
+    assert second is not first
+    assert factory.call_count == 2
+    llm_manager.load_llms.assert_called_once()
+    stats = registry.stats()
+    assert (stats.reloads, stats.idle) == (1, 1)
+
+
+def test_zero_idle_instances_disables_reuse():
+    registry = PipelineRegistry(max_idle_per_key=0)
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    for _ in range(2):
+        with registry.lease(_KEY, factory):
+            pass
+    registry.warm(_KEY, factory)
+
+    assert factory.call_count == 2
+    assert registry.stats().idle == 0
+
+
+def test_chat_pipeline_reset_clears_sub_pipeline_tokens():
+    pipeline = ChatPipeline.__new__(ChatPipeline)
+    pipeline.tokens = ["chat"]
+    pipeline.session_title_pipeline = SimpleNamespace(tokens="title")
+    pipeline.citation_pipeline = SimpleNamespace(tokens=["citation"])
+    pipeline.suggestion_pipeline = SimpleNamespace(tokens="suggestion")
+    pipeline.code_feedback_pipeline = SimpleNamespace(tokens="code feedback")
+    pipeline.mcq_pipeline = SimpleNamespace(tokens=["mcq"])
+
+    pipeline.reset_request_state()
+
+    assert pipeline.tokens == []
+    assert pipeline.session_title_pipeline.tokens is None
+    assert pipeline.citation_pipeline.tokens == []
+    assert pipeline.suggestion_pipeline.tokens is None
+    assert pipeline.code_feedback_pipeline.tokens is None
+    assert pipeline.mcq_pipeline.tokens == []
@@ -76,7 +76,7 @@ def test_transcription_batch_insert_does_not_hold_lock_while_updating_status():
         batch=SimpleNamespace(dynamic=MagicMock(return_value=dynamic_context))
     )
     pipeline.callback = SimpleNamespace(update=MagicMock(side_effect=update))
-    pipeline.llm_embedding = SimpleNamespace(embed=MagicMock(return_value=[0.1]))
+    pipeline.llm_embedding = SimpleNamespace(embed_many=MagicMock(return_value=[[0.1]]))
     chunk = {LectureTranscriptionSchema.SEGMENT_TEXT.value: "transcript"}
 
     with patch(
@@ -0,0 +1,96 @@
+"""Tests for the visual change pre-filter of SlideTurnDetector.
+
+Slide numbers used to be found by probing every 50th segment with GPT Vision
+and bisecting between disagreeing anchors, seeking the video for every probe.
+A sequential perceptual-hash scan now decides where slides change, so vision
+calls only go to the segments right after a visual change.
+"""
+
+# pylint: skip-file
+
+import cv2
+import numpy as np
+
+import iris.pipeline.pipeline  # noqa: F401  pylint: disable=unused-import
+from iris.pipeline.shared.transcription.slide_turn_detector import (  # noqa: E402
+    SlideTurnDetector,
+    scan_visual_changes,
+)
+
+# 200 segments of 5 s each; the slide changes at segments 30, 90 and 150.
+_SEGMENTS = [{"start": i * 5.0, "end": i * 5.0 + 5.0} for i in range(200)]
+_SLIDE_STARTS = {0: 1, 30: 2, 90: 3, 150: 4}
+
+
+def _slide_at(idx: int) -> int:
+    return _SLIDE_STARTS[max(s for s in _SLIDE_STARTS if s <= idx)]
+
+
+def _detector(monkeypatch, visual_changes, sample_seconds=2.0):
+    monkeypatch.setattr(
+        "iris.pipeline.shared.transcription.slide_turn_detector.scan_visual_changes",
+        lambda *_args: visual_changes,
+    )
+    detector = SlideTurnDetector(
+        video_path="/nonexistent.mp4",
+        segments=_SEGMENTS,
+        request_handler=None,
+        visual_scan_sample_seconds=sample_seconds,
+    )
+    detector.frame_cache.get = lambda idx: f"frame-{idx}"
+    detector._ask_gpt_for_slide_number = lambda frame: _slide_at(
+        int(frame.rsplit("-", 1)[1])
+    )
+    return detector
+
+
+def _expected_change_points():
+    return [(idx * 5.0, slide) for idx, slide in sorted(_SLIDE_STARTS.items())]
+
+
+def test_visual_changes_limit_vision_calls(monkeypatch):
+    baseline = _detector(monkeypatch, None, sample_seconds=0)
+    assert baseline.detect() == _expected_change_points()
+
+    detector = _detector(monkeypatch, [150.0, 450.0, 750.0])
+    assert detector.detect() == _expected_change_points()
+    assert detector.gpt_calls < baseline.gpt_calls
+    assert detector.gpt_calls <= 8
+
+
+def test_change_between_two_samples_is_resolved_by_probing(monkeypatch):
+    # Sampled every 8 s, the slide changes at 150 s, 450 s and 750 s are first
+    # seen at 152 s, 456 s and 752 s, after segments 30, 90 and 150 were captured.
+    detector = _detector(monkeypatch, [152.0, 456.0, 752.0], sample_seconds=8.0)
+    assert detector.detect() == _expected_change_points()
+    assert detector.gpt_calls <= 12
+
+
+def test_slide_change_missed_by_the_scan_is_still_found(monkeypatch):
+    # The change at segment 90 is not detected visually.
+    detector = _detector(monkeypatch, [150.0, 750.0])
+    assert detector.detect() == _expected_change_points()
+
+
+def test_falls_back_to_anchor_probing_when_video_cannot_be_scanned(monkeypatch):
+    detector = _detector(monkeypatch, None)
+    assert detector.detect() == _expected_change_points()
+
+
+def test_scan_reports_visual_change_without_seeking(tmp_path):
+    path = str(tmp_path / "lecture.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (320, 240))
+    for i in range(60):
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        left = 20 if i < 30 else 180
+        cv2.rectangle(frame, (left, 140), (left + 120, 220), (255, 255, 255), -1)
+        writer.write(frame)
+    writer.release()
+
+    changes = scan_visual_changes(path, sample_seconds=0.5, hash_threshold=16)
+
+    assert changes == [3.0]
+
+
+def test_scan_returns_none_for_unreadable_video(tmp_path):
+    assert scan_visual_changes(str(tmp_path / "missing.mp4"), 2.0, 16) is None
@@ -39,7 +39,7 @@ def _ingestion_callback() -> StatusCallback:
 
 def test_update_posts_running_and_fields():
     cb = _callback()
-    with patch("requests.post", return_value=_Response()) as post:
+    with patch("requests.Session.post", return_value=_Response()) as post:
         assert cb.update(result="answer") is True
 
     payload = post.call_args.kwargs["json"]
@@ -50,7 +50,7 @@ def test_update_posts_running_and_fields():
 
 def test_finish_is_terminal_and_last():
     cb = _callback()
-    with patch("requests.post", return_value=_Response()) as post:
+    with patch("requests.Session.post", return_value=_Response()) as post:
         assert cb.finish(result="answer") is True
         assert cb.update(result="late") is False
 
@@ -60,7 +60,7 @@ def test_finish_is_terminal_and_last():
 
 def test_fail_builds_error_object():
     cb = _callback()
-    with patch("requests.post", return_value=_Response()) as post:
+    with patch("requests.Session.post", return_value=_Response()) as post:
         assert cb.fail(message="m", code="C") is True
 
     payload = post.call_args.kwargs["json"]
@@ -70,7 +70,7 @@ def test_fail_builds_error_object():
 
 def test_terminal_drains_async_queue_first():
     cb = _callback()
-    with patch("requests.post", return_value=_Response()) as post:
+    with patch("requests.Session.post", return_value=_Response()) as post:
         cb.status.result = "async"
         cb._enqueue_running_update()  # pylint: disable=protected-access
         assert cb.finish(result="terminal") is True
@@ -82,7 +82,7 @@ def test_terminal_drains_async_queue_first():
 
 def test_non_terminal_request_exception_returns_false():
     cb = _callback()
-    with patch("requests.post", side_effect=requests.RequestException):
+    with patch("requests.Session.post", side_effect=requests.RequestException):
         assert cb.update(result="answer") is False
 
 
@@ -90,7 +90,7 @@ def test_successful_update_clears_transient_result_and_page_numbers():
     """After a delivered checkpoint update, transient result-like fields are
     cleared on the reusable DTO so later heartbeats don't re-send them."""
     cb = _ingestion_callback()
-    with patch("requests.post", return_value=_Response()):
+    with patch("requests.Session.post", return_value=_Response()):
         assert cb.update(result="checkpoint-1", display_page_numbers=[1, 2]) is True
 
     assert cb.status.result is None
@@ -102,7 +102,7 @@ def test_successful_update_keeps_persistent_fields():
     successful update and NOT be cleared as transient."""
     cb = _ingestion_callback()
     token = TokenUsageDTO(num_input_tokens=5)
-    with patch("requests.post", return_value=_Response()):
+    with patch("requests.Session.post", return_value=_Response()):
         assert cb.update(result="checkpoint-1", tokens=[token]) is True
 
     assert cb.status.tokens == [token]
@@ -113,7 +113,7 @@ def test_next_heartbeat_does_not_resend_cleared_result():
     """A bare heartbeat following a delivered checkpoint must not re-send the
     stale checkpoint JSON."""
     cb = _ingestion_callback()
-    with patch("requests.post", return_value=_Response()) as post:
+    with patch("requests.Session.post", return_value=_Response()) as post:
         assert cb.update(result="checkpoint-1") is True
         assert cb.update() is True
 
@@ -127,12 +127,12 @@ def test_failed_update_keeps_transient_result_for_retry():
     """If the POST fails, the transient result is kept so the next update
     re-attempts delivery instead of silently dropping the checkpoint."""
     cb = _ingestion_callback()
-    with patch("requests.post", side_effect=requests.RequestException):
+    with patch("requests.Session.post", side_effect=requests.RequestException):
         assert cb.update(result="checkpoint-1") is False
 
     assert cb.status.result == "checkpoint-1"
 
-    with patch("requests.post", return_value=_Response()) as post:
+    with patch("requests.Session.post", return_value=_Response()) as post:
         assert cb.update() is True
 
     assert post.call_args.kwargs["json"]["result"] == "checkpoint-1"
@@ -151,7 +151,7 @@ def test_running_update_executor_creation_uses_lock():
             return None
 
     cb._running_update_lock = ProbeLock()  # pylint: disable=protected-access
-    with patch("requests.post", return_value=_Response()):
+    with patch("requests.Session.post", return_value=_Response()):
         cb._get_running_update_executor()  # pylint: disable=protected-access
         cb._shutdown_running_update_executor()  # pylint: disable=protected-access
 
@@ -176,7 +176,7 @@ def test_terminal_send_shuts_down_running_update_executor():
             "iris.web.status.status_update.TracedThreadPoolExecutor",
             return_value=ImmediateExecutor(),
         ),
-        patch("requests.post", return_value=_Response()),
+        patch("requests.Session.post", return_value=_Response()),
     ):
         cb._enqueue_running_update()  # pylint: disable=protected-access
         assert cb.finish(result="terminal") is True
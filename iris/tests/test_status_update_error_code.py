@@ -37,7 +37,7 @@ def test_base_status_dto_does_not_carry_error_code():
 def test_ingestion_callback_fail_sends_error_code_in_error_object(monkeypatch):
     post_mock = MagicMock(return_value=MagicMock(status_code=200))
     monkeypatch.setattr(
-        "iris.web.status.ingestion_status_callback.http_requests.post",
+        "requests.Session.post",
         post_mock,
     )
     cb = IngestionStatusCallback(
@@ -73,7 +73,7 @@ def test_ingestion_callback_finish_sends_display_page_numbers_in_dedicated_field
 ):
     post_mock = MagicMock(return_value=MagicMock(status_code=200))
     monkeypatch.setattr(
-        "iris.web.status.ingestion_status_callback.http_requests.post",
+        "requests.Session.post",
         post_mock,
     )
     cb = IngestionStatusCallback(
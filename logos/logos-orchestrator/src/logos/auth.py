@@ -3,6 +3,7 @@ from typing import Dict, Optional
 
 from fastapi import HTTPException
 
+from logos.auth_cache import ResolvedLimits, get_auth_cache
 from logos.dbutils.dbmanager import DBManager
 
 
@@ -61,10 +62,14 @@ class AuthContext:
     local_rl: Optional[dict] = None
 
 
+def _load_api_key_row(logos_key: str) -> Optional[dict]:
+    with DBManager() as db:
+        return db.get_api_key_by_value(logos_key)
+
+
 def authenticate_api_key(headers: Optional[Dict[str, str]]) -> AuthContext:
     logos_key = _resolve_logos_key(headers)
-    with DBManager() as db:
-        row = db.get_api_key_by_value(logos_key)
+    row = get_auth_cache().get_api_key(logos_key, lambda: _load_api_key_row(logos_key))
 
     if row is None:
         raise HTTPException(status_code=401, detail="Invalid or inactive logos key")
@@ -82,6 +87,48 @@ def authenticate_api_key(headers: Optional[Dict[str, str]]) -> AuthContext:
         user_id=row["user_id"],
         environment=row["environment"],
         log_level=row.get("log") or "BILLING",
-        settings=row.get("settings") if row.get("settings") is not None else {},
+        settings=dict(row["settings"]) if row.get("settings") is not None else {},
         default_priority=row.get("default_priority") or 1,
     )
+
+
+def resolve_limits(db: DBManager, auth: AuthContext) -> ResolvedLimits:
+    """
+    Resolve the rate limits and budget caps that apply to *auth*'s key.
+
+    Key settings win over the generic ``rpm_limit``/``tpm_limit`` settings,
+    which win over the team defaults. The result is cached per key and team;
+    *db* is only queried on a miss.
+
+    Params:
+        db: Open DBManager used for cache misses.
+        auth: Authenticated request context.
+
+    Returns:
+        The ResolvedLimits for the key.
+    """
+
+    def _resolve() -> ResolvedLimits:
+        s = auth.settings or {}
+        team_info = (
+            get_auth_cache().get_team(auth.team_id, lambda: db.get_team(auth.team_id))
+            if auth.team_id is not None
+            else None
+        )
+
+        generic_rpm = s.get("rpm_limit")
+        generic_tpm = s.get("tpm_limit")
+
+        cloud_rpm = s.get("cloud_rpm_limit") or generic_rpm or (team_info and team_info.get("default_cloud_rpm_limit"))
+        cloud_tpm = s.get("cloud_tpm_limit") or generic_tpm or (team_info and team_info.get("default_cloud_tpm_limit"))
+        local_rpm = s.get("local_rpm_limit") or generic_rpm or (team_info and team_info.get("default_local_rpm_limit"))
+        local_tpm = s.get("local_tpm_limit") or generic_tpm or (team_info and team_info.get("default_local_tpm_limit"))
+
+        return ResolvedLimits(
+            cloud_rl={"rpm": cloud_rpm, "tpm": cloud_tpm} if cloud_rpm is not None or cloud_tpm is not None else None,
+            local_rl={"rpm": local_rpm, "tpm": local_tpm} if local_rpm is not None or local_tpm is not None else None,
+            budget_limit=db.get_api_key_budget_limit(auth.api_key_id),
+            team_budget_limit=(team_info.get("team_monthly_budget_micro_cents") or None) if team_info else None,
+        )
+
+    return get_auth_cache().get_limits(auth.api_key_id, auth.team_id, _resolve)
@@ -0,0 +1,220 @@
+"""
+In-process cache for the auth data read on every inference request.
+
+``authenticate_api_key`` and ``auth_parse_log`` used to open a synchronous
+``DBManager`` session for the API-key row, the owning team and the resolved
+rate-limit/budget policy on every call — blocking the event loop on Postgres
+round-trips for data that changes only when an admin edits it.
+
+Entries live for a short TTL and the cache is LRU-bounded. Staleness is
+further bounded by explicit invalidation: the webservice calls
+``/internal/auth_cache/invalidate`` after mutating keys, teams or limits, and
+``DBManager.update``/``delete`` on ``api_keys``/``teams`` invalidate locally.
+Only positive lookups are cached, so a freshly created key works immediately.
+Budget *usage* is never cached.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from logos.monitoring import prometheus_metrics as prom
+
+
+@dataclass(frozen=True)
+class AuthCacheConfig:
+    """Cache knobs.
+
+    LOGOS_AUTH_CACHE_TTL_S            entry lifetime in seconds; 0 disables the cache (default 30)
+    LOGOS_AUTH_CACHE_MAX_ENTRIES      LRU bound per cache (default 10000)
+    """
+
+    ttl_s: float = 30.0
+    max_entries: int = 10_000
+
+    @classmethod
+    def from_env(cls) -> "AuthCacheConfig":
+        """Build an AuthCacheConfig from environment variables (with defaults)."""
+        try:
+            ttl_s = max(0.0, float(os.getenv("LOGOS_AUTH_CACHE_TTL_S", "30")))
+        except ValueError:
+            ttl_s = 30.0
+        try:
+            max_entries = max(1, int(os.getenv("LOGOS_AUTH_CACHE_MAX_ENTRIES", "10000")))
+        except ValueError:
+            max_entries = 10_000
+        return cls(ttl_s=ttl_s, max_entries=max_entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0
+
+
+@dataclass(frozen=True)
+class ResolvedLimits:
+    """Rate-limit and budget policy of one API key, derived from its row and team."""
+
+    cloud_rl: Optional[dict]
+    local_rl: Optional[dict]
+    budget_limit: Optional[int]
+    team_budget_limit: Optional[int]
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire ``ttl_s`` after insertion."""
+
+    def __init__(self, name: str, ttl_s: float, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value for *key*, or None (counted as a miss)."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                value = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                value = None
+        prom.AUTH_CACHE_LOOKUPS_TOTAL.labels(cache=self.name, result="miss" if value is None else "hit").inc()
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = self._clock() + self._ttl_s
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> int:
+        with self._lock:
+            return 1 if self._entries.pop(key, None) is not None else 0
+
+    def discard_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Drop every entry for which ``predicate(key, value)`` is true."""
+        with self._lock:
+            doomed = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> int:
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+        return dropped
+
+
+class AuthCache:
+    """
+    API-key rows (by key value), team rows (by id) and resolved limits
+    (by ``(api_key_id, team_id)``), each behind its own :class:`TTLCache`.
+    """
+
+    def __init__(self, config: Optional[AuthCacheConfig] = None, clock: Callable[[], float] = time.monotonic):
+        self.config = config or AuthCacheConfig()
+        ttl_s, max_entries = self.config.ttl_s, self.config.max_entries
+        self.api_keys = TTLCache("api_key", ttl_s, max_entries, clock)
+        self.teams = TTLCache("team", ttl_s, max_entries, clock)
+        self.limits = TTLCache("limits", ttl_s, max_entries, clock)
+        # Bumped by every invalidation; a load that raced one is not stored.
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def get_api_key(self, key_value: str, load: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Return the active api_keys row for *key_value*, calling *load* on a miss."""
+        if not self.enabled:
+            return load()
+        row = self.api_keys.get(key_value)
+        if row is None:
+            generation = self._generation
+            row = load()
+            if row is not None and generation == self._generation:
+                self.api_keys.put(key_value, row)
+        return row
+
+    def get_team(self, team_id: int, load: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Return the teams row for *team_id*, calling *load* on a miss."""
+        if not self.enabled:
+            return load()
+        row = self.teams.get(team_id)
+        if row is None:
+            generation = self._generation
+            row = load()
+            if row is not None and generation == self._generation:
+                self.teams.put(team_id, row)
+        return row
+
+    def get_limits(
+        self, api_key_id: int, team_id: Optional[int], resolve: Callable[[], ResolvedLimits]
+    ) -> ResolvedLimits:
+        """Return the resolved limits for a key, calling *resolve* on a miss."""
+        if not self.enabled:
+            return resolve()
+        limits = self.limits.get((api_key_id, team_id))
+        if limits is None:
+            generation = self._generation
+            limits = resolve()
+            if generation == self._generation:
+                self.limits.put((api_key_id, team_id), limits)
+        return limits
+
+    def invalidate_api_key(self, api_key_id: Optional[int] = None, key_value: Optional[str] = None) -> int:
+        """Forget one key, by id (covers rotated values) and/or by value."""
+        self._generation += 1
+        dropped = 0
+        if key_value is not None:
+            dropped += self.api_keys.discard(key_value)
+        if api_key_id is not None:
+            dropped += self.api_keys.discard_where(lambda _kv, row: row.get("id") == api_key_id)
+            dropped += self.limits.discard_where(lambda key, _limits: key[0] == api_key_id)
+        prom.AUTH_CACHE_INVALIDATIONS_TOTAL.labels(scope="api_key").inc()
+        return dropped
+
+    def invalidate_team(self, team_id: int) -> int:
+        """Forget a team and the limits of every key that inherited from it."""
+        self._generation += 1
+        dropped = self.teams.discard(team_id)
+        dropped += self.limits.discard_where(lambda key, _limits: key[1] == team_id)
+        prom.AUTH_CACHE_INVALIDATIONS_TOTAL.labels(scope="team").inc()
+        return dropped
+
+    def clear(self) -> int:
+        self._generation += 1
+        dropped = self.api_keys.clear() + self.teams.clear() + self.limits.clear()
+        prom.AUTH_CACHE_INVALIDATIONS_TOTAL.labels(scope="all").inc()
+        return dropped
+
+
+_auth_cache: Optional[AuthCache] = None
+_auth_cache_lock = threading.Lock()
+
+
+def get_auth_cache() -> AuthCache:
+    global _auth_cache
+
+    if _auth_cache is None:
+        with _auth_cache_lock:
+            if _auth_cache is None:
+                _auth_cache = AuthCache(AuthCacheConfig.from_env())
+
+    return _auth_cache
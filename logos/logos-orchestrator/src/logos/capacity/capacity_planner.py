@@ -37,14 +37,52 @@ from logos.terminal_logging import (
     wrap_plain,
 )
 
+from .cluster_state import ClusterStateModel, parse_gpu_memory
 from .demand_tracker import DemandTracker
 from .host_ram_ledger import HostRamLedger
 from .lane_comparator import best_lane
+from .reclaim_solver import RECLAIM_SOLVER_BUDGET_SECONDS, best_reclaim_subset
 from .vram_ledger import VRAMLedger
 
 logger = logging.getLogger(__name__)
 
 
+class _EvictionCandidate:
+    """One evictable lane: the action to take and how much VRAM it frees."""
+
+    __slots__ = ("lane", "action", "eff_demand", "freed_total", "lane_gpus")
+
+    def __init__(
+        self,
+        lane: LaneSchedulerSignals,
+        action: str,
+        eff_demand: float,
+        freed_total: float,
+        lane_gpus: frozenset[int],
+    ):
+        self.lane = lane
+        self.action = action
+        self.eff_demand = eff_demand
+        self.freed_total = freed_total
+        self.lane_gpus = lane_gpus
+
+    def freed_per_gpu(self, required_gpus: frozenset[int]) -> dict[int, float]:
+        """Freed VRAM on each GPU of ``required_gpus`` (all GPUs if empty).
+
+        An empty/"all" gpu_devices string parses to (), but semantically the
+        lane uses every GPU on the worker. Without this expansion the lane
+        gets filtered as "disjoint" against any specific required_gpus set
+        and the eviction picker silently loses the candidate — which is the
+        root cause of the Mistral-disappears starvation pattern. Use
+        required_gpus as a sensible fallback.
+        """
+        lane_gpus = self.lane_gpus
+        if not lane_gpus and required_gpus:
+            lane_gpus = required_gpus
+        per_gpu = self.freed_total / max(len(lane_gpus), 1)
+        return {g: per_gpu for g in (lane_gpus & required_gpus if required_gpus else lane_gpus)}
+
+
 class CapacityPlanner:
     """
     Background planner running every cycle_seconds.
@@ -230,6 +268,10 @@ class CapacityPlanner:
     # layers — empirically ~60% of total VRAM for TP=2;
     # use 0.62 for safety margin
 
+    # Set in __init__ when the registry can notify runtime updates; None means
+    # every read goes straight to the facade/registry snapshot.
+    _cluster_state: Optional[ClusterStateModel] = None
+
     def __init__(
         self,
         logosnode_facade: LogosNodeSchedulingDataFacade,
@@ -245,6 +287,12 @@ class CapacityPlanner:
         self._cycle_seconds = cycle_seconds
         self._enabled = enabled
         self._on_state_change = on_state_change
+        # Lanes, profiles, per-GPU memory and cluster-wide loaded-lane counts,
+        # rebuilt per provider only after that worker reports a new runtime
+        # snapshot instead of on every read. Registry doubles without runtime
+        # notifications (tests, tools) keep reading through directly.
+        if isinstance(logosnode_registry, LogosNodeRuntimeRegistry):
+            self._cluster_state = ClusterStateModel(logosnode_facade, logosnode_registry)
         self._lane_idle_since: dict[tuple[int, str], float] = {}
         self._lane_sleep_since: dict[tuple[int, str], float] = {}
         self._lane_sleep_level: dict[tuple[int, str], int] = {}
@@ -620,9 +668,8 @@ class CapacityPlanner:
                 )
                 continue
 
-            try:
-                lanes = self._facade.get_all_provider_lane_signals(provider_id)
-            except Exception:
+            lanes = self._get_provider_lanes(provider_id)
+            if lanes is None:
                 continue
 
             self._update_idle_tracking(provider_id, lanes)
@@ -664,6 +711,9 @@ class CapacityPlanner:
             self._log_action_plan(all_actions)
 
         validated = self._validate_vram_budget(all_actions)
+        # Planning only; the full-cycle histogram below also covers action
+        # execution, which waits on worker confirmations for up to minutes.
+        prom.CAPACITY_PLANNER_PLANNING_DURATION_SECONDS.observe(time.time() - cycle_start)
 
         for action in validated:
             try:
@@ -1945,19 +1995,73 @@ class CapacityPlanner:
         if all(d <= 0 for d in per_gpu_deficit.values()):
             return []
 
-        # Build candidate list: idle/sleeping lanes on overlapping GPUs
-        now = time.time()
+        candidates, skipped = self._eviction_candidates(
+            provider_id,
+            lanes,
+            profiles,
+            required_gpus=required_gpus,
+            target_model_name=target_model_name,
+            target_lane_id=target_lane_id,
+        )
 
-        class _Cand:
-            __slots__ = ("lane", "action", "eff_demand", "freed_per_gpu")
+        skipped_str = "; ".join(f"{lid}[{mn}]:{reason}" for lid, mn, reason in skipped) if skipped else "none"
+        logger.info(
+            "Eviction candidates for worker=%s gpus=%s deficit=%s: [%s]" " | skipped: [%s]",
+            self._facade.get_provider_name(provider_id) or provider_id,
+            sorted(required_gpus) if required_gpus else "any",
+            {g: f"{d:.0f}MB" for g, d in per_gpu_deficit.items()},
+            (
+                ", ".join(
+                    f"{c.lane.lane_id}(eff={c.eff_demand:.2f}, action={c.action}, free={c.freed_total:.0f}MB)"
+                    for c in candidates
+                )
+                if candidates
+                else "none"
+            ),
+            skipped_str,
+        )
+
+        chosen, remaining = self._cover_eviction_deficit(
+            candidates,
+            required_gpus,
+            per_gpu_deficit,
+            replicas_only=replicas_only,
+            cluster_lanes_by_model=cluster_lanes_by_model,
+            skipped=skipped,
+        )
+        if all(v <= 0 for v in remaining.values()):
+            return chosen
+        logger.info(
+            "Eviction set INSUFFICIENT for worker=%s%s: remaining deficit=%s " "after %d candidates",
+            self._facade.get_provider_name(provider_id) or provider_id,
+            " (replicas-only)" if replicas_only else "",
+            {g: f"{d:.0f}MB" for g, d in remaining.items() if d > 0},
+            len(chosen),
+        )
+        return None  # couldn't cover the deficit
 
-            def __init__(self, lane, action, eff_demand, freed_per_gpu):
-                self.lane = lane
-                self.action = action
-                self.eff_demand = eff_demand
-                self.freed_per_gpu: dict[int, float] = freed_per_gpu
+    def _eviction_candidates(
+        self,
+        provider_id: int,
+        lanes: List[LaneSchedulerSignals],
+        profiles: dict[str, "ModelProfile"],
+        *,
+        required_gpus: Optional[frozenset[int]] = None,
+        target_model_name: Optional[str] = None,
+        target_lane_id: Optional[str] = None,
+    ) -> tuple[list["_EvictionCandidate"], list[tuple[str, str, str]]]:
+        """Collect the evictable lanes for ``_find_eviction_set``.
+
+        Returns ``(candidates, skipped)``: candidates sorted cheapest-first
+        (sleep before stop, then ascending effective demand) and a list of
+        ``(lane_id, model_name, reason)`` for lanes that were rejected.
 
-        candidates: list[_Cand] = []
+        With a non-empty ``required_gpus``, lanes on disjoint GPUs are
+        rejected up front. With ``None`` the result is independent of the GPU
+        set, so placement search can reuse it across every candidate set.
+        """
+        now = time.time()
+        candidates: list[_EvictionCandidate] = []
         # Phase 1.5: track per-candidate skip reasons so the existing
         # "Eviction candidates ... [none]" log line explains *why* the set is
         # empty. Each entry is (lane_id, model_name, reason).
@@ -2023,26 +2127,13 @@ class CapacityPlanner:
             in_min_tenure = lane_loaded_at is not None and (now - lane_loaded_at) < tenure_seconds
 
             lane_gpus = frozenset(self._parse_gpu_device_ids(lane.gpu_devices))
-            # An empty/"all" gpu_devices string parses to (), but semantically
-            # the lane uses every GPU on the worker. Without this expansion,
-            # the lane gets filtered as "disjoint" against any specific
-            # required_gpus set and the eviction picker silently loses the
-            # candidate — which is the root cause of the Mistral-disappears
-            # starvation pattern. Use required_gpus as a sensible fallback.
-            if not lane_gpus and required_gpus:
-                lane_gpus = required_gpus
-            # Determine GPU overlap with required set
-            if required_gpus:
-                overlap = lane_gpus & required_gpus
-            else:
-                overlap = lane_gpus  # no constraint → all GPUs count
-
-            if not overlap and required_gpus:
+            # An empty/"all" gpu_devices string means the lane uses every GPU
+            # on the worker; it is never disjoint (see _EvictionCandidate).
+            if required_gpus and lane_gpus and not (lane_gpus & required_gpus):
                 skipped.append((lane.lane_id, lane.model_name, "gpu_disjoint"))
                 continue  # This lane is on disjoint GPUs — useless
 
             profile = profiles.get(lane.model_name)
-            tp = max(len(lane_gpus), 1)
 
             # Prefer sleep (less disruptive); fall back to stop
             if lane.is_vllm and lane.runtime_state in ("loaded", "running") and lane.sleep_state == "awake":
@@ -2220,12 +2311,8 @@ class CapacityPlanner:
                 skipped.append((lane.lane_id, lane.model_name, "no-freed-vram"))
                 continue
 
-            # Distribute freed VRAM across the GPUs this lane occupies
-            freed_per_gpu_val = freed_total / tp
-            freed_per_gpu: dict[int, float] = {g: freed_per_gpu_val for g in (overlap if required_gpus else lane_gpus)}
-
             eff = self._effective_demand(lane.model_name, provider_id, lanes, lane)
-            candidates.append(_Cand(lane, action, eff, freed_per_gpu))
+            candidates.append(_EvictionCandidate(lane, action, eff, freed_total, lane_gpus))
 
         # Sort by (action_cost, effective_demand) ascending: prefer sleep over
         # stop at any demand level, then sacrifice least-valued models first.
@@ -2233,26 +2320,23 @@ class CapacityPlanner:
         # while sleeping a loaded lane is cheap (fast wake, ~2-3s).
         _action_cost = {"sleep_l1": 0, "sleep_l2": 0, "stop": 1}
         candidates.sort(key=lambda c: (_action_cost.get(c.action, 2), c.eff_demand))
+        return candidates, skipped
 
-        skipped_str = "; ".join(f"{lid}[{mn}]:{reason}" for lid, mn, reason in skipped) if skipped else "none"
-        logger.info(
-            "Eviction candidates for worker=%s gpus=%s deficit=%s: [%s]" " | skipped: [%s]",
-            self._facade.get_provider_name(provider_id) or provider_id,
-            sorted(required_gpus) if required_gpus else "any",
-            {g: f"{d:.0f}MB" for g, d in per_gpu_deficit.items()},
-            (
-                ", ".join(
-                    f"{c.lane.lane_id}(eff={c.eff_demand:.2f}, action={c.action}, "
-                    f"free={sum(c.freed_per_gpu.values()):.0f}MB)"
-                    for c in candidates
-                )
-                if candidates
-                else "none"
-            ),
-            skipped_str,
-        )
+    @staticmethod
+    def _cover_eviction_deficit(
+        candidates: list["_EvictionCandidate"],
+        required_gpus: frozenset[int],
+        per_gpu_deficit: dict[int, float],
+        *,
+        replicas_only: bool = False,
+        cluster_lanes_by_model: Optional[dict[str, int]] = None,
+        skipped: Optional[list[tuple[str, str, str]]] = None,
+    ) -> tuple[list[tuple[LaneSchedulerSignals, str, float]], dict[int, float]]:
+        """Greedy covering: pick candidates until all per-GPU deficits are met.
 
-        # Greedy covering: pick candidates until all per-GPU deficits are met
+        Returns ``(chosen, remaining)``; the deficit is covered when every
+        value of ``remaining`` is <= 0.
+        """
         remaining: dict[int, float] = dict(per_gpu_deficit)
         chosen: list[tuple[LaneSchedulerSignals, str, float]] = []
         # Working copy of per-model loaded-lane counts. Decremented every time
@@ -2270,35 +2354,27 @@ class CapacityPlanner:
             if replicas_only:
                 model_count = working_counts.get(cand.lane.model_name, 0)
                 if model_count <= 1:
-                    skipped.append(
-                        (
-                            cand.lane.lane_id,
-                            cand.lane.model_name,
-                            "primary (last loaded copy in cluster)",
+                    if skipped is not None:
+                        skipped.append(
+                            (
+                                cand.lane.lane_id,
+                                cand.lane.model_name,
+                                "primary (last loaded copy in cluster)",
+                            )
                         )
-                    )
                     continue
+            freed_per_gpu = cand.freed_per_gpu(required_gpus)
             # Only include if it helps at least one still-deficient GPU
-            useful = any(remaining.get(g, 0) > 0 for g in cand.freed_per_gpu)
+            useful = any(remaining.get(g, 0) > 0 for g in freed_per_gpu)
             if not useful:
                 continue
             chosen.append((cand.lane, cand.action, cand.eff_demand))
-            for g, freed in cand.freed_per_gpu.items():
+            for g, freed in freed_per_gpu.items():
                 if g in remaining:
                     remaining[g] = max(0.0, remaining[g] - freed)
             if replicas_only:
                 working_counts[cand.lane.model_name] = working_counts.get(cand.lane.model_name, 0) - 1
-
-        if all(v <= 0 for v in remaining.values()):
-            return chosen
-        logger.info(
-            "Eviction set INSUFFICIENT for worker=%s%s: remaining deficit=%s " "after %d candidates",
-            self._facade.get_provider_name(provider_id) or provider_id,
-            " (replicas-only)" if replicas_only else "",
-            {g: f"{d:.0f}MB" for g, d in remaining.items() if d > 0},
-            len(chosen),
-        )
-        return None  # couldn't cover the deficit
+        return chosen, remaining
 
     def _pick_cold_load_placement(
         self,
@@ -2313,13 +2389,15 @@ class CapacityPlanner:
     ) -> Optional[tuple[frozenset[int], list[tuple[LaneSchedulerSignals, str, float]]]]:
         """Find the best GPU set for a cold load and its required eviction set.
 
-        Tries every combination of `tp` GPUs. For each combination, computes
-        the per-GPU deficit using the same headroom rule as
+        Considers every combination of `tp` GPUs. For each combination, the
+        per-GPU deficit follows the same headroom rule as
         ``_passes_minimum_load_feasibility`` / ``_check_per_gpu_feasibility``
         (even split of ``load_cost_mb`` + fixed ``PER_GPU_COLD_START_MB``) and
-        calls ``_find_eviction_set``. Returns the placement whose eviction set
-        has the lowest maximum effective-demand score (sacrifice least-valued
-        models first).
+        the eviction set is the ``_find_eviction_set`` greedy cover. Returns
+        the placement whose eviction set has the lowest maximum
+        effective-demand score (sacrifice least-valued models first); see
+        ``_search_cold_load_placement`` for how that is found without
+        enumerating every combination.
 
         Replicas-first: when ``self._replica_first_eviction`` is on AND
         ``cluster_lanes_by_model`` is provided, runs a Pass 1 over all GPU
@@ -2380,36 +2458,41 @@ class CapacityPlanner:
         # evict (sleep/stop) a resident lane — is computed against what vLLM will
         # actually occupy, not just the smaller weights+KV footprint.
         per_gpu_total = self._get_per_gpu_total(provider_id) or {}
+        per_gpu_deficit: dict[int, float] = {}
+        for g in all_gpu_ids:
+            floor_reservation = self.VLLM_GMU_FLOOR * per_gpu_total.get(g, 0.0)
+            need_g = max(per_gpu_needed, floor_reservation)
+            deficit = max(0.0, need_g - per_gpu_free.get(g, 0.0))
+            if deficit > 0:
+                per_gpu_deficit[g] = deficit
+
+        # Candidates do not depend on the GPU set, so collect them once
+        # instead of once per combination.
+        candidates, skipped = self._eviction_candidates(
+            provider_id,
+            lanes,
+            profiles,
+            target_model_name=target_model_name,
+        )
+        logger.info(
+            "Cold-load placement for worker=%s tp=%d deficit=%s: %d eviction candidates | skipped: [%s]",
+            self._facade.get_provider_name(provider_id) or provider_id,
+            tp,
+            {g: f"{d:.0f}MB" for g, d in per_gpu_deficit.items()},
+            len(candidates),
+            "; ".join(f"{lid}[{mn}]:{reason}" for lid, mn, reason in skipped) if skipped else "none",
+        )
 
         def _try(replicas_only: bool):
-            """Iterate GPU combos, return cheapest placement found in this mode."""
-            best_local: Optional[tuple[frozenset[int], list, float]] = None
-            for gpu_combo in combinations(all_gpu_ids, tp):
-                gpu_set = frozenset(gpu_combo)
-                per_gpu_deficit: dict[int, float] = {}
-                for g in gpu_set:
-                    free = per_gpu_free.get(g, 0.0)
-                    floor_reservation = self.VLLM_GMU_FLOOR * per_gpu_total.get(g, 0.0)
-                    need_g = max(per_gpu_needed, floor_reservation)
-                    deficit = max(0.0, need_g - free)
-                    if deficit > 0:
-                        per_gpu_deficit[g] = deficit
-                eviction_set = self._find_eviction_set(
-                    provider_id,
-                    gpu_set,
-                    per_gpu_deficit,
-                    lanes,
-                    profiles,
-                    target_model_name=target_model_name,
-                    replicas_only=replicas_only,
-                    cluster_lanes_by_model=cluster_lanes_by_model,
-                )
-                if eviction_set is None:
-                    continue
-                max_score = max((s for _, _, s in eviction_set), default=0.0)
-                if best_local is None or max_score < best_local[2]:
-                    best_local = (gpu_set, eviction_set, max_score)
-            return best_local
+            """Return the cheapest placement found in this mode."""
+            return self._search_cold_load_placement(
+                all_gpu_ids,
+                tp,
+                per_gpu_deficit,
+                candidates,
+                replicas_only=replicas_only,
+                cluster_lanes_by_model=cluster_lanes_by_model,
+            )
 
         # Pass 1: replicas-only — preserves the last loaded copy of each model.
         if self._replica_first_eviction and cluster_lanes_by_model is not None:
@@ -2424,6 +2507,145 @@ class CapacityPlanner:
             return None
         return best[0], best[1]
 
+    def _search_cold_load_placement(
+        self,
+        all_gpu_ids: list[int],
+        tp: int,
+        per_gpu_deficit: dict[int, float],
+        candidates: list[_EvictionCandidate],
+        *,
+        replicas_only: bool = False,
+        cluster_lanes_by_model: Optional[dict[str, int]] = None,
+    ) -> Optional[tuple[frozenset[int], list[tuple[LaneSchedulerSignals, str, float]], float]]:
+        """Pick the `tp`-GPU set with the cheapest eviction cover.
+
+        Same answer as scoring every ``combinations(all_gpu_ids, tp)`` with the
+        greedy cover and keeping the first strict minimum of the eviction
+        set's max effective demand, but without the combinatorial cost:
+
+        * The cover of a GPU set depends only on which of its GPUs have a
+          deficit, so results are memoised per deficit state.
+        * Without replica coupling (``replicas_only`` off, or no model has
+          enough candidates to reach its last copy), the greedy cover splits
+          per GPU: a set is coverable iff each deficient GPU is coverable on
+          its own, and its score is the max of the per-GPU scores. The best
+          set is then the `tp` lowest-numbered GPUs whose score is <= the
+          tp-th smallest per-GPU score. This is computed directly.
+        * Otherwise the combinations are walked with the memo. A set holding
+          a GPU that cannot be covered even with every candidate is skipped.
+          The walk stops once the lower bound is reached or
+          ``RECLAIM_SOLVER_BUDGET_SECONDS`` runs out. If it runs out before
+          any placement is found, it falls back to the `tp` least-deficient
+          GPUs.
+
+        Returns ``(gpu_set, eviction_set, max_score)`` or None.
+        """
+        memo: dict[tuple[int, ...], Optional[list[tuple[LaneSchedulerSignals, str, float]]]] = {}
+
+        def _cover(gpu_set: frozenset[int], cands: list[_EvictionCandidate], replicas: bool):
+            deficient = tuple(sorted(g for g in gpu_set if g in per_gpu_deficit))
+            if deficient in memo:
+                return memo[deficient]
+            if not deficient:
+                result: Optional[list] = []
+            else:
+                chosen, remaining = self._cover_eviction_deficit(
+                    cands,
+                    gpu_set,
+                    {g: per_gpu_deficit[g] for g in deficient},
+                    replicas_only=replicas,
+                    cluster_lanes_by_model=cluster_lanes_by_model,
+                )
+                result = chosen if all(v <= 0 for v in remaining.values()) else None
+            memo[deficient] = result
+            return result
+
+        def _score(eviction_set: list) -> float:
+            return max((s for _, _, s in eviction_set), default=0.0)
+
+        def _with(g: int) -> frozenset[int]:
+            # Any tp-sized set containing g: only g's deficit is looked at by
+            # the per-GPU covers below, the rest just fixes the set size.
+            others = [o for o in all_gpu_ids if o != g][: tp - 1]
+            return frozenset([g, *others])
+
+        def _solo(g: int, cands: list[_EvictionCandidate], replicas: bool) -> Optional[list]:
+            chosen, remaining = self._cover_eviction_deficit(
+                cands,
+                _with(g),
+                {g: per_gpu_deficit[g]},
+                replicas_only=replicas,
+                cluster_lanes_by_model=cluster_lanes_by_model,
+            )
+            return chosen if all(v <= 0 for v in remaining.values()) else None
+
+        # Replica gating only couples GPUs when picking a lane can use up a
+        # model's spare copies; otherwise it is a static filter.
+        decomposable_cands: Optional[list[_EvictionCandidate]] = candidates
+        if replicas_only:
+            counts = cluster_lanes_by_model or {}
+            per_model: dict[str, int] = {}
+            for cand in candidates:
+                per_model[cand.lane.model_name] = per_model.get(cand.lane.model_name, 0) + 1
+            if all(
+                counts.get(model, 0) <= 1 or n_cands <= counts.get(model, 0) - 1 for model, n_cands in per_model.items()
+            ):
+                decomposable_cands = [c for c in candidates if counts.get(c.lane.model_name, 0) > 1]
+            else:
+                decomposable_cands = None
+        if decomposable_cands is not None and any(c.eff_demand < 0 for c in decomposable_cands):
+            decomposable_cands = None  # the max-of-scores argument needs scores >= 0
+
+        if decomposable_cands is not None:
+            gpu_value: dict[int, float] = {}
+            for g in all_gpu_ids:
+                if g not in per_gpu_deficit:
+                    gpu_value[g] = 0.0
+                    continue
+                solo = _solo(g, decomposable_cands, False)
+                gpu_value[g] = _score(solo) if solo is not None else float("inf")
+            threshold = sorted(gpu_value.values())[tp - 1]
+            if threshold == float("inf"):
+                return None
+            gpu_set = frozenset([g for g in all_gpu_ids if gpu_value[g] <= threshold][:tp])
+            eviction_set = _cover(gpu_set, decomposable_cands, False)
+            if eviction_set is None:
+                return None
+            return gpu_set, eviction_set, _score(eviction_set)
+
+        # A GPU no candidate subset can cover rules out every set holding it.
+        uncoverable = {g for g in per_gpu_deficit if _solo(g, candidates, False) is None}
+        lower_bound = min([0.0, *(c.eff_demand for c in candidates)])
+        deadline = time.monotonic() + RECLAIM_SOLVER_BUDGET_SECONDS
+        best: Optional[tuple[frozenset[int], list, float]] = None
+        for index, gpu_combo in enumerate(combinations(all_gpu_ids, tp)):
+            if index % 256 == 255 and time.monotonic() > deadline:
+                logger.warning(
+                    "Cold-load placement search over %d GPUs (tp=%d) exceeded %.0fms budget; using %s placement",
+                    len(all_gpu_ids),
+                    tp,
+                    RECLAIM_SOLVER_BUDGET_SECONDS * 1000,
+                    "best-so-far" if best is not None else "greedy",
+                )
+                if best is None:
+                    fallback = frozenset(sorted(all_gpu_ids, key=lambda g: (per_gpu_deficit.get(g, 0.0), g))[:tp])
+                    eviction_set = _cover(fallback, candidates, replicas_only)
+                    if eviction_set is not None:
+                        best = (fallback, eviction_set, _score(eviction_set))
+                break
+            if uncoverable.intersection(gpu_combo):
+                continue
+            gpu_set = frozenset(gpu_combo)
+            eviction_set = _cover(gpu_set, candidates, replicas_only)
+            if eviction_set is None:
+                continue
+            max_score = _score(eviction_set)
+            if best is None or max_score < best[2]:
+                best = (gpu_set, eviction_set, max_score)
+                if max_score <= lower_bound:
+                    break
+        return best
+
     @staticmethod
     def _parse_gpu_device_ids(gpu_devices: str | None) -> tuple[int, ...]:
         if not gpu_devices:
@@ -2590,9 +2812,8 @@ class CapacityPlanner:
 
         # Would need eviction — check if any candidate lane is in cooldown
         now = time.time()
-        try:
-            lanes = self._facade.get_all_provider_lane_signals(provider_id)
-        except Exception:
+        lanes = self._get_provider_lanes(provider_id)
+        if lanes is None:
             return False
         for lane in lanes:
             if lane.model_name == model_name:
@@ -2616,9 +2837,8 @@ class CapacityPlanner:
             return False
 
         # Check if any demanded model has no lane (would need a cold load)
-        try:
-            lanes = self._facade.get_all_provider_lane_signals(provider_id)
-        except Exception:
+        lanes = self._get_provider_lanes(provider_id)
+        if lanes is None:
             return False
         active_models = {lane.model_name for lane in lanes}
         for name, score in other_demand:
@@ -2647,6 +2867,8 @@ class CapacityPlanner:
         model (count == 1). Sleeping lanes are not counted — a sleeping
         replica isn't a serving replica.
         """
+        if self._cluster_state is not None:
+            return self._cluster_state.loaded_lanes_by_model()
         counts: dict[str, int] = {}
         for pid in self._facade.provider_ids():
             try:
@@ -2780,14 +3002,10 @@ class CapacityPlanner:
         scored_by_model: dict[str, list[tuple[int, float, float]]] = {}
 
         for provider_id in provider_ids:
-            try:
-                lanes = self._facade.get_all_provider_lane_signals(provider_id)
-            except Exception:
+            lanes = self._get_provider_lanes(provider_id)
+            if lanes is None:
                 continue
-            try:
-                profiles = self._facade.get_model_profiles(provider_id)
-            except Exception:
-                profiles = {}
+            profiles = self._safe_get_profiles(provider_id)
             try:
                 capabilities = set(self._facade.get_worker_capabilities(provider_id))
             except Exception:
@@ -2907,10 +3125,7 @@ class CapacityPlanner:
 
         actions = []
         ranked = self._demand.get_ranked_models()
-        try:
-            profiles = self._facade.get_model_profiles(provider_id)
-        except Exception:
-            profiles = {}
+        profiles = self._safe_get_profiles(provider_id)
         try:
             capabilities = set(self._facade.get_worker_capabilities(provider_id))
         except Exception:
@@ -3532,9 +3747,8 @@ class CapacityPlanner:
             for pid in provider_ids:
                 if not self._is_plannable(pid):
                     continue
-                try:
-                    lanes = self._facade.get_all_provider_lane_signals(pid)
-                except Exception:
+                lanes = self._get_provider_lanes(pid)
+                if lanes is None:
                     continue
                 # Skip workers that already host the model in any non-terminal
                 # state — including sleeping (would wake instead of replicate)
@@ -3555,10 +3769,7 @@ class CapacityPlanner:
                     capacity = self._facade.get_capacity_info(pid)
                 except Exception:
                     continue
-                try:
-                    profiles = self._facade.get_model_profiles(pid)
-                except Exception:
-                    profiles = {}
+                profiles = self._safe_get_profiles(pid)
                 profile = profiles.get(model_name)
                 if profile is None:
                     continue
@@ -3760,6 +3971,8 @@ class CapacityPlanner:
         return actions
 
     def _safe_get_profiles(self, provider_id: int) -> dict[str, ModelProfile]:
+        if self._cluster_state is not None:
+            return self._cluster_state.profiles(provider_id)
         try:
             return self._facade.get_model_profiles(provider_id)
         except Exception:
@@ -3806,10 +4019,16 @@ class CapacityPlanner:
                 return capacity
 
     def _safe_get_lanes(self, provider_id: int) -> list[LaneSchedulerSignals]:
+        return self._get_provider_lanes(provider_id) or []
+
+    def _get_provider_lanes(self, provider_id: int) -> Optional[list[LaneSchedulerSignals]]:
+        """Lane signals for a provider, or None if the provider is unknown."""
+        if self._cluster_state is not None:
+            return self._cluster_state.lanes(provider_id)
         try:
             return self._facade.get_all_provider_lane_signals(provider_id)
         except Exception:
-            return []
+            return None
 
     def _pick_request_target_lane(
         self,
@@ -4644,30 +4863,18 @@ class CapacityPlanner:
         3. Fewer actions
         4. Stable lane-id ordering
 
-        Request-time lane counts are small, so an exact subset search is fine.
+        Exact, via the bounded branch-and-bound in ``reclaim_solver``.
         """
         if required_free_mb <= 0:
             return []
         if not candidates:
             return []
 
-        best_combo: tuple[int, ...] | None = None
-        best_score: tuple[float, float, int, tuple[str, ...]] | None = None
-
-        for size in range(1, len(candidates) + 1):
-            for combo in combinations(range(len(candidates)), size):
-                total_freed = sum(candidates[i][0] for i in combo)
-                if total_freed + 1e-6 < required_free_mb:
-                    continue
-                max_single_freed = max(candidates[i][0] for i in combo)
-                lane_ids = tuple(sorted(candidates[i][1].lane_id for i in combo))
-                score = (total_freed, max_single_freed, size, lane_ids)
-                if best_score is None or score < best_score:
-                    best_score = score
-                    best_combo = combo
-
-        if best_combo is None:
-            return []
+        best_combo = best_reclaim_subset(
+            [freed for freed, _ in candidates],
+            [action.lane_id for _, action in candidates],
+            required_free_mb=required_free_mb,
+        )
         return [candidates[i] for i in best_combo]
 
     @staticmethod
@@ -4686,36 +4893,17 @@ class CapacityPlanner:
         if required_free_mb <= 0 or not candidates:
             return []
 
-        # Deduplicate: for each lane, only consider the combo entry that actually
-        # appears. We filter combos that pick both sleep and stop for the same lane.
-        best_combo: tuple[int, ...] | None = None
-        best_score: tuple[int, float, float, int, tuple[str, ...]] | None = None
-
-        for size in range(1, min(len(candidates) + 1, 6)):  # cap at 5 to avoid explosion
-            for combo in combinations(range(len(candidates)), size):
-                # Check for duplicate lanes (same lane as both sleep and stop)
-                lane_ids_in_combo = [candidates[i][1].lane_id for i in combo]
-                if len(lane_ids_in_combo) != len(set(lane_ids_in_combo)):
-                    continue
-
-                total_freed = sum(candidates[i][0] for i in combo)
-                if total_freed + 1e-6 < required_free_mb:
-                    continue
-
-                stop_penalty = sum(
-                    int((candidates[i][1].params or {}).get("_stop_penalty", 1))
-                    for i in combo
-                    if candidates[i][1].action == "stop"
-                )
-                max_single_freed = max(candidates[i][0] for i in combo)
-                lane_ids = tuple(sorted(candidates[i][1].lane_id for i in combo))
-                score = (stop_penalty, total_freed, max_single_freed, size, lane_ids)
-                if best_score is None or score < best_score:
-                    best_score = score
-                    best_combo = combo
-
-        if best_combo is None:
-            return []
+        best_combo = best_reclaim_subset(
+            [freed for freed, _ in candidates],
+            [action.lane_id for _, action in candidates],
+            required_free_mb=required_free_mb,
+            stop_penalties=[
+                int((action.params or {}).get("_stop_penalty", 1)) if action.action == "stop" else 0
+                for _, action in candidates
+            ],
+            max_size=5,  # cap at 5 to avoid explosion
+            distinct_lanes=True,
+        )
         return [candidates[i] for i in best_combo]
 
     @staticmethod
@@ -5249,10 +5437,7 @@ class CapacityPlanner:
 
         # Credit freed VRAM from sleep/stop actions to cumulative tracking
         for action in free_actions:
-            try:
-                profiles = self._facade.get_model_profiles(action.provider_id)
-            except Exception:
-                profiles = {}
+            profiles = self._safe_get_profiles(action.provider_id)
             profile = profiles.get(action.model_name)
             freed = self._estimate_freed_vram(action, profile)
             if freed > 0:
@@ -5277,10 +5462,7 @@ class CapacityPlanner:
                 )
                 continue
 
-            try:
-                profiles = self._facade.get_model_profiles(provider_id)
-            except Exception:
-                profiles = {}
+            profiles = self._safe_get_profiles(provider_id)
 
             profile = profiles.get(action.model_name)
             estimated_vram = self._estimate_action_vram(action, profile, capacity)
@@ -6374,83 +6556,37 @@ class CapacityPlanner:
         return 0.0
 
     def _get_per_gpu_free(self, provider_id: int) -> dict[int, float] | None:
-        """Read per-GPU free memory from the runtime snapshot.
+        """Per-GPU free memory from the runtime snapshot, net of VRAM ledger reservations.
 
         Returns a dict mapping device_id (int) → free_mb, or None if the
         snapshot is unavailable.
         """
-        if self._registry is None:
-            return None
-        snap = self._registry.peek_runtime_snapshot(provider_id)
-        if snap is None:
-            return None
-        devices_info = (snap.get("runtime") or {}).get("devices") or {}
-        device_list = devices_info.get("devices") or []
-        if not isinstance(device_list, list) or not device_list:
+        reported = self._read_gpu_memory(provider_id)[0]
+        if not reported:
             return None
-        result: dict[int, float] = {}
-        for dev in device_list:
-            if not isinstance(dev, dict):
-                continue
-            # Prefer extra["index"] (integer GPU index set by the GPU collector).
-            # device_id is the nvidia-smi UUID string (e.g. "GPU-abc123-..."),
-            # not parseable as an integer, so we cannot use it directly.
-            extra = dev.get("extra") or {}
-            raw_id = extra.get("index")
-            if raw_id is None:
-                # Fallback: try device_id in case it's a plain integer string
-                raw_id = dev.get("device_id", -1)
-            try:
-                dev_id = int(raw_id)
-            except (ValueError, TypeError):
-                continue
-            if dev_id < 0:
-                continue
-            free_mb = float(dev.get("memory_free_mb", 0) or 0)
-            if free_mb <= 0:
-                total_mb = float(dev.get("memory_total_mb", 0) or 0)
-                used_mb = float(dev.get("memory_used_mb", 0) or 0)
-                if total_mb > 0 and used_mb >= 0:
-                    free_mb = max(total_mb - used_mb, 0.0)
-            free_mb = self._vram_ledger.get_gpu_effective_available_mb(
-                provider_id,
-                dev_id,
-                free_mb,
-            )
-            result[dev_id] = free_mb
-        return result if result else None
+        return {
+            dev_id: self._vram_ledger.get_gpu_effective_available_mb(provider_id, dev_id, free_mb)
+            for dev_id, free_mb in reported.items()
+        }
 
     def _get_per_gpu_total(self, provider_id: int) -> dict[int, float] | None:
-        """Read per-GPU total memory (MB) from the runtime snapshot.
+        """Per-GPU total memory (MB) from the runtime snapshot.
 
-        Mirrors _get_per_gpu_free's device parsing. Used to size the vLLM
-        GMU-floor reservation (VLLM_GMU_FLOOR × total) per GPU during placement.
+        Used to size the vLLM GMU-floor reservation (VLLM_GMU_FLOOR × total)
+        per GPU during placement.
         """
+        return self._read_gpu_memory(provider_id)[1] or None
+
+    def _read_gpu_memory(self, provider_id: int) -> tuple[dict[int, float], dict[int, float]]:
+        """Reported (free_mb, total_mb) per GPU, before ledger reservations."""
+        if self._cluster_state is not None:
+            return self._cluster_state.gpu_free_mb(provider_id), self._cluster_state.gpu_total_mb(provider_id)
         if self._registry is None:
-            return None
+            return {}, {}
         snap = self._registry.peek_runtime_snapshot(provider_id)
         if snap is None:
-            return None
-        device_list = ((snap.get("runtime") or {}).get("devices") or {}).get("devices") or []
-        if not isinstance(device_list, list) or not device_list:
-            return None
-        result: dict[int, float] = {}
-        for dev in device_list:
-            if not isinstance(dev, dict):
-                continue
-            raw_id = (dev.get("extra") or {}).get("index")
-            if raw_id is None:
-                raw_id = dev.get("device_id", -1)
-            try:
-                dev_id = int(raw_id)
-            except (ValueError, TypeError):
-                continue
-            if dev_id < 0:
-                continue
-            total_mb = float(dev.get("memory_total_mb", 0) or 0)
-            if total_mb > 0:
-                result[dev_id] = total_mb
-        return result if result else None
+            return {}, {}
+        return parse_gpu_memory(snap.get("runtime") or {})
 
     def _lane_gpu_devices_str(
         self,
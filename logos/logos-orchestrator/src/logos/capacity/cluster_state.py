@@ -0,0 +1,175 @@
+"""Incrementally maintained cluster view for the capacity planner.
+
+The planner reads the same per-provider state many times per cycle: lane
+signals, model profiles, per-GPU free/total VRAM, and the cluster-wide
+count of loaded lanes per model. Rebuilding these from the runtime snapshots
+on every read makes a planner cycle cost O(fleet size) several times over,
+even when no worker reported anything new since the last cycle.
+
+``ClusterStateModel`` subscribes to ``LogosNodeRuntimeRegistry`` runtime
+updates and marks a provider dirty when its snapshot is replaced (status
+update, session attach/detach). Derived state is rebuilt lazily, only for
+dirty providers, on the next read. Several status updates between two reads
+therefore cost one rebuild. The cluster-wide loaded-lane counts are kept as
+a running sum: a rebuilt provider subtracts its old contribution and adds
+its new one.
+
+Everything is derived from the runtime snapshot, so a cached read returns
+exactly what a fresh read of the same snapshot would. The only state the
+planner layers on top (VRAM ledger reservations) is applied by the caller.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from logos.logosnode_registry import LogosNodeRuntimeRegistry
+from logos.monitoring import prometheus_metrics as prom
+from logos.sdi.models import LaneSchedulerSignals, ModelProfile
+
+LOADED_RUNTIME_STATES = ("loaded", "running")
+
+
+def parse_gpu_memory(runtime: dict[str, Any]) -> tuple[dict[int, float], dict[int, float]]:
+    """Read per-GPU (free_mb, total_mb) from a worker runtime payload.
+
+    Free memory falls back to ``total - used`` when the worker reports zero
+    free. Devices without a usable integer index are skipped; GPUs with an
+    unknown total are omitted from the totals only.
+    """
+    device_list = ((runtime or {}).get("devices") or {}).get("devices") or []
+    free: dict[int, float] = {}
+    total: dict[int, float] = {}
+    if not isinstance(device_list, list):
+        return free, total
+    for dev in device_list:
+        if not isinstance(dev, dict):
+            continue
+        # Prefer extra["index"] (integer GPU index set by the GPU collector).
+        # device_id is the nvidia-smi UUID string (e.g. "GPU-abc123-..."),
+        # not parseable as an integer, so we cannot use it directly.
+        raw_id = (dev.get("extra") or {}).get("index")
+        if raw_id is None:
+            # Fallback: try device_id in case it's a plain integer string
+            raw_id = dev.get("device_id", -1)
+        try:
+            dev_id = int(raw_id)
+        except (ValueError, TypeError):
+            continue
+        if dev_id < 0:
+            continue
+        total_mb = float(dev.get("memory_total_mb", 0) or 0)
+        free_mb = float(dev.get("memory_free_mb", 0) or 0)
+        if free_mb <= 0:
+            used_mb = float(dev.get("memory_used_mb", 0) or 0)
+            if total_mb > 0 and used_mb >= 0:
+                free_mb = max(total_mb - used_mb, 0.0)
+        free[dev_id] = free_mb
+        if total_mb > 0:
+            total[dev_id] = total_mb
+    return free, total
+
+
+@dataclass
+class _ProviderState:
+    """Derived view of one provider's latest runtime snapshot."""
+
+    # None when the facade does not know the provider (unregistered/removed).
+    lanes: Optional[list[LaneSchedulerSignals]] = None
+    profiles: dict[str, ModelProfile] = field(default_factory=dict)
+    gpu_free_mb: dict[int, float] = field(default_factory=dict)
+    gpu_total_mb: dict[int, float] = field(default_factory=dict)
+    loaded_lanes_by_model: dict[str, int] = field(default_factory=dict)
+
+
+class ClusterStateModel:
+    """Per-provider planner inputs, rebuilt only when a worker reports a change."""
+
+    def __init__(self, logosnode_facade, logosnode_registry: LogosNodeRuntimeRegistry) -> None:
+        self._facade = logosnode_facade
+        self._registry = logosnode_registry
+        self._providers: dict[int, _ProviderState] = {}
+        self._dirty: set[int] = set()
+        self._loaded_lanes_by_model: dict[str, int] = {}
+        logosnode_registry.subscribe_to_runtime_updates(self.mark_dirty)
+
+    def mark_dirty(self, provider_id: int) -> None:
+        """Invalidate one provider; the next read rebuilds it from its snapshot."""
+        self._dirty.add(int(provider_id))
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def lanes(self, provider_id: int) -> Optional[list[LaneSchedulerSignals]]:
+        """Lane signals of a provider, or None if the facade does not know it."""
+        lanes = self._state(provider_id).lanes
+        return list(lanes) if lanes is not None else None
+
+    def profiles(self, provider_id: int) -> dict[str, ModelProfile]:
+        return dict(self._state(provider_id).profiles)
+
+    def gpu_free_mb(self, provider_id: int) -> dict[int, float]:
+        """Reported per-GPU free VRAM, before VRAM ledger reservations."""
+        return dict(self._state(provider_id).gpu_free_mb)
+
+    def gpu_total_mb(self, provider_id: int) -> dict[int, float]:
+        return dict(self._state(provider_id).gpu_total_mb)
+
+    def loaded_lanes_by_model(self) -> dict[str, int]:
+        """Loaded/running lanes across all registered providers, keyed by model."""
+        provider_ids = set(self._facade.provider_ids())
+        for provider_id in set(self._providers) - provider_ids:
+            self._replace(provider_id, None)
+        for provider_id in provider_ids:
+            if provider_id in self._dirty or provider_id not in self._providers:
+                self._rebuild(provider_id)
+        return dict(self._loaded_lanes_by_model)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _state(self, provider_id: int) -> _ProviderState:
+        provider_id = int(provider_id)
+        state = self._providers.get(provider_id)
+        if state is None or provider_id in self._dirty:
+            state = self._rebuild(provider_id)
+        return state
+
+    def _rebuild(self, provider_id: int) -> _ProviderState:
+        self._dirty.discard(provider_id)
+        prom.CAPACITY_PLANNER_STATE_REBUILDS_TOTAL.inc()
+        state = _ProviderState()
+        try:
+            state.lanes = self._facade.get_all_provider_lane_signals(provider_id)
+        except Exception:
+            state.lanes = None
+        try:
+            state.profiles = self._facade.get_model_profiles(provider_id)
+        except Exception:
+            state.profiles = {}
+        snap = self._registry.peek_runtime_snapshot(provider_id)
+        if snap is not None:
+            state.gpu_free_mb, state.gpu_total_mb = parse_gpu_memory(snap.get("runtime") or {})
+        for lane in state.lanes or ():
+            if lane.runtime_state in LOADED_RUNTIME_STATES:
+                state.loaded_lanes_by_model[lane.model_name] = state.loaded_lanes_by_model.get(lane.model_name, 0) + 1
+        self._replace(provider_id, state)
+        return state
+
+    def _replace(self, provider_id: int, state: Optional[_ProviderState]) -> None:
+        old = self._providers.pop(provider_id, None)
+        if old is not None:
+            for model_name, count in old.loaded_lanes_by_model.items():
+                remaining = self._loaded_lanes_by_model.get(model_name, 0) - count
+                if remaining > 0:
+                    self._loaded_lanes_by_model[model_name] = remaining
+                else:
+                    self._loaded_lanes_by_model.pop(model_name, None)
+        if state is None:
+            return
+        self._providers[provider_id] = state
+        for model_name, count in state.loaded_lanes_by_model.items():
+            self._loaded_lanes_by_model[model_name] = self._loaded_lanes_by_model.get(model_name, 0) + count
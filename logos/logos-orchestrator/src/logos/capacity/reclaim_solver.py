@@ -0,0 +1,288 @@
+"""Bounded exact search for the request-time reclaim plan.
+
+``CapacityPlanner._best_reclaim_plan`` and ``_best_reclaim_plan_combined``
+pick the least-destructive subset of sleep/stop candidates whose freed VRAM
+covers a shortfall. Enumerating every ``combinations(range(n), size)`` is
+exponential in the number of idle/sleeping lanes, which on 8/16-GPU nodes
+runs inside the planner cycle.
+
+``best_reclaim_subset`` returns the same subset as that enumeration (same
+score tuple, same first-found tie-break) in one of two ways:
+
+* Unconstrained (``_best_reclaim_plan``): meet-in-the-middle. The subset sums
+  of each half of the candidates are enumerated (2 x 2^(n/2) instead of
+  2^n), the smallest covering total is found by bisection, and only the
+  subsets whose total lies in that near-optimal window are scored exactly.
+* Penalised / lane-distinct / size-capped (``_best_reclaim_plan_combined``):
+  depth-first branch-and-bound.
+  - A feasible set is never extended. Every extension scores at least as
+    high in every component and has one more action, so it cannot win.
+  - A branch is cut when even taking every remaining candidate cannot cover
+    the shortfall.
+  - A branch is cut when its stop penalty or freed total already exceeds
+    the best plan found so far. Both only grow as candidates are added.
+
+Both run under a hard wall-clock budget. If the budget expires, the best
+plan found so far is returned, or a greedy largest-first plan if none was
+found yet.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+from itertools import combinations
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on time spent inside one reclaim search. Small fleets finish
+# in microseconds; the budget only matters on very wide nodes.
+RECLAIM_SOLVER_BUDGET_SECONDS = 0.05
+
+# Matches the ``total_freed + 1e-6 < required_free_mb`` feasibility test of
+# the exhaustive search. Bounds use a wider slack so float re-association
+# (partial sums are accumulated in a different order) can never prune a set
+# the exact test would accept.
+_FEASIBILITY_EPS = 1e-6
+_BOUND_SLACK = 1e-3
+# How many search nodes are expanded between deadline checks.
+_DEADLINE_CHECK_INTERVAL = 256
+# Above this many candidates even the half-subset tables get too large and
+# the unconstrained search uses branch-and-bound under the budget instead.
+_MEET_IN_THE_MIDDLE_MAX_CANDIDATES = 32
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def _log_budget_exceeded(n: int, budget_seconds: float, have_best: bool) -> None:
+    logger.warning(
+        "Reclaim search over %d candidates exceeded %.0fms budget; using %s plan",
+        n,
+        budget_seconds * 1000,
+        "best-so-far" if have_best else "greedy",
+    )
+
+
+def _score(
+    combo: tuple[int, ...],
+    freed_mb: Sequence[float],
+    lane_ids: Sequence[str],
+    stop_penalties: Optional[Sequence[int]],
+) -> tuple:
+    """Score tuple of the exhaustive search, plus the index tuple.
+
+    The trailing ``combo`` reproduces ``combinations()`` order on exact ties,
+    where the exhaustive loop kept the first set it saw.
+    """
+    total_freed = sum(freed_mb[i] for i in combo)
+    max_single_freed = max(freed_mb[i] for i in combo)
+    lane_key = tuple(sorted(lane_ids[i] for i in combo))
+    penalty = sum(stop_penalties[i] for i in combo) if stop_penalties is not None else 0
+    return (penalty, total_freed, max_single_freed, len(combo), lane_key, combo)
+
+
+def _exhaustive(
+    freed_mb: Sequence[float],
+    lane_ids: Sequence[str],
+    required_free_mb: float,
+    stop_penalties: Optional[Sequence[int]],
+    max_size: int,
+    distinct_lanes: bool,
+) -> tuple[int, ...]:
+    best: Optional[tuple] = None
+    for size in range(1, max_size + 1):
+        for combo in combinations(range(len(freed_mb)), size):
+            if distinct_lanes and len({lane_ids[i] for i in combo}) != size:
+                continue
+            if sum(freed_mb[i] for i in combo) + _FEASIBILITY_EPS < required_free_mb:
+                continue
+            score = _score(combo, freed_mb, lane_ids, stop_penalties)
+            if best is None or score < best:
+                best = score
+    return best[-1] if best is not None else ()
+
+
+def _greedy(
+    freed_mb: Sequence[float],
+    lane_ids: Sequence[str],
+    required_free_mb: float,
+    stop_penalties: Optional[Sequence[int]],
+    max_size: int,
+    distinct_lanes: bool,
+) -> tuple[int, ...]:
+    """Cheapest-penalty, largest-first plan. Feasible but not minimal."""
+    order = sorted(
+        range(len(freed_mb)),
+        key=lambda i: (stop_penalties[i] if stop_penalties is not None else 0, -freed_mb[i], lane_ids[i], i),
+    )
+    chosen: list[int] = []
+    seen: set[str] = set()
+    total = 0.0
+    for i in order:
+        if len(chosen) >= max_size:
+            break
+        if distinct_lanes and lane_ids[i] in seen:
+            continue
+        chosen.append(i)
+        seen.add(lane_ids[i])
+        total += freed_mb[i]
+        if total + _FEASIBILITY_EPS >= required_free_mb:
+            return tuple(sorted(chosen))
+    return ()
+
+
+def _meet_in_the_middle(
+    freed_mb: Sequence[float],
+    lane_ids: Sequence[str],
+    required_free_mb: float,
+    deadline: float,
+) -> Optional[tuple]:
+    """Best unconstrained subset via half-subset sums; returns its score tuple."""
+    n = len(freed_mb)
+    half = n // 2
+
+    def _subset_sums(indices: range) -> list[tuple[float, int]]:
+        sums: list[tuple[float, int]] = [(0.0, 0)]
+        for i in indices:
+            bit, freed = 1 << i, freed_mb[i]
+            sums += [(total + freed, mask | bit) for total, mask in sums]
+            if time.monotonic() > deadline:
+                raise _BudgetExceeded
+        return sums
+
+    left = _subset_sums(range(half))
+    right = sorted(_subset_sums(range(half, n)))
+    right_totals = [total for total, _ in right]
+    threshold = required_free_mb - _FEASIBILITY_EPS
+
+    # Smallest pair total that is feasible with margin; any subset the exact
+    # test accepts and that beats it lies within the slack window below.
+    best_total = float("inf")
+    for total, _ in left:
+        k = bisect.bisect_left(right_totals, threshold + _BOUND_SLACK - total)
+        if k < len(right_totals):
+            best_total = min(best_total, total + right_totals[k])
+    low = threshold - _BOUND_SLACK
+    high = (best_total if best_total != float("inf") else threshold) + _BOUND_SLACK
+
+    best: Optional[tuple] = None
+    examined = 0
+    for left_total, left_mask in left:
+        start = bisect.bisect_left(right_totals, low - left_total)
+        stop = bisect.bisect_right(right_totals, high - left_total)
+        for right_total, right_mask in right[start:stop]:
+            mask = left_mask | right_mask
+            if not mask:
+                continue
+            examined += 1
+            if examined % _DEADLINE_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+                raise _BudgetExceeded(best)
+            combo = tuple(i for i in range(n) if mask >> i & 1)
+            if sum(freed_mb[i] for i in combo) + _FEASIBILITY_EPS < required_free_mb:
+                continue
+            score = _score(combo, freed_mb, lane_ids, None)
+            if best is None or score < best:
+                best = score
+    return best
+
+
+def best_reclaim_subset(
+    freed_mb: Sequence[float],
+    lane_ids: Sequence[str],
+    *,
+    required_free_mb: float,
+    stop_penalties: Optional[Sequence[int]] = None,
+    max_size: Optional[int] = None,
+    distinct_lanes: bool = False,
+    budget_seconds: float = RECLAIM_SOLVER_BUDGET_SECONDS,
+) -> tuple[int, ...]:
+    """Return the indices of the least-destructive covering subset.
+
+    Minimises ``(stop_penalty, total_freed, max_single_freed, size,
+    sorted lane ids)`` over subsets of at most ``max_size`` candidates whose
+    freed VRAM covers ``required_free_mb``. ``distinct_lanes`` rejects
+    subsets that name the same lane twice (a lane offered as both sleep and
+    stop). Returns ``()`` when no subset covers the shortfall.
+    """
+    n = len(freed_mb)
+    if required_free_mb <= 0 or n == 0:
+        return ()
+    max_size = n if max_size is None else min(max_size, n)
+    if max_size <= 0:
+        return ()
+
+    # The pruning rules assume adding a candidate never lowers the total or
+    # the penalty. Anything else is not produced by the planner; keep the
+    # exhaustive semantics for it rather than guess.
+    if any(f < 0 for f in freed_mb) or (stop_penalties is not None and any(p < 0 for p in stop_penalties)):
+        return _exhaustive(freed_mb, lane_ids, required_free_mb, stop_penalties, max_size, distinct_lanes)
+
+    deadline = time.monotonic() + budget_seconds
+    if stop_penalties is None and not distinct_lanes and max_size == n and n <= _MEET_IN_THE_MIDDLE_MAX_CANDIDATES:
+        try:
+            best = _meet_in_the_middle(freed_mb, lane_ids, required_free_mb, deadline)
+        except _BudgetExceeded as exc:
+            best = exc.args[0] if exc.args else None
+            _log_budget_exceeded(n, budget_seconds, best is not None)
+            if best is None:
+                return _greedy(freed_mb, lane_ids, required_free_mb, stop_penalties, max_size, distinct_lanes)
+        return best[-1] if best is not None else ()
+
+    # Visit large candidates first so feasible sets (and a tight bound) are
+    # found early; scores are always computed on the sorted index tuple.
+    order = sorted(range(n), key=lambda i: (-freed_mb[i], i))
+    suffix = [0.0] * (n + 1)
+    for pos in range(n - 1, -1, -1):
+        suffix[pos] = suffix[pos + 1] + freed_mb[order[pos]]
+
+    penalties = stop_penalties if stop_penalties is not None else [0] * n
+    best: Optional[tuple] = None
+    expanded = 0
+    chosen: list[int] = []
+    chosen_lanes: dict[str, int] = {}
+
+    def _visit(pos: int, total: float, penalty: int) -> None:
+        nonlocal best, expanded
+        expanded += 1
+        if expanded % _DEADLINE_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            raise _BudgetExceeded
+
+        if chosen and total + _BOUND_SLACK >= required_free_mb:
+            combo = tuple(sorted(chosen))
+            if sum(freed_mb[i] for i in combo) + _FEASIBILITY_EPS >= required_free_mb:
+                score = _score(combo, freed_mb, lane_ids, stop_penalties)
+                if best is None or score < best:
+                    best = score
+                return
+        if pos >= n or len(chosen) >= max_size:
+            return
+        if total + suffix[pos] + _BOUND_SLACK < required_free_mb:
+            return
+        if best is not None:
+            best_penalty, best_total = best[0], best[1]
+            # Any completion frees at least max(total, required) MB.
+            floor_total = max(total, required_free_mb) - _BOUND_SLACK
+            if penalty > best_penalty or (penalty == best_penalty and floor_total > best_total):
+                return
+
+        index = order[pos]
+        lane_id = lane_ids[index]
+        if not (distinct_lanes and chosen_lanes.get(lane_id)):
+            chosen.append(index)
+            chosen_lanes[lane_id] = chosen_lanes.get(lane_id, 0) + 1
+            _visit(pos + 1, total + freed_mb[index], penalty + penalties[index])
+            chosen.pop()
+            chosen_lanes[lane_id] -= 1
+        _visit(pos + 1, total, penalty)
+
+    try:
+        _visit(0, 0.0, 0)
+    except _BudgetExceeded:
+        _log_budget_exceeded(n, budget_seconds, best is not None)
+        if best is None:
+            return _greedy(freed_mb, lane_ids, required_free_mb, stop_penalties, max_size, distinct_lanes)
+    return best[-1] if best is not None else ()
@@ -14,9 +14,10 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 import sqlalchemy.exc
 import yaml
 from dateutil.parser import isoparse
-from sqlalchemy import MetaData, Table, create_engine, text
+from sqlalchemy import MetaData, Table, bindparam, create_engine, text
 from sqlalchemy.orm import sessionmaker
 
+from logos.auth_cache import get_auth_cache
 from logos.dbutils.dbmodules import *
 from logos.dbutils.dbmodules import JobStatus
 from logos.dbutils.types import (
@@ -190,6 +191,31 @@ def _json_for_jsonb(value: Any) -> str:
     return json.dumps(_strip_nul(value))
 
 
+def _invalidate_auth_cache(table_name: str, record_id: int) -> None:
+    """Drop cached auth data after a generic write to ``api_keys`` or ``teams``."""
+    if table_name == "api_keys":
+        get_auth_cache().invalidate_api_key(api_key_id=record_id)
+    elif table_name == "teams":
+        get_auth_cache().invalidate_team(record_id)
+
+
+_RESPONSE_PAYLOAD_UPDATE_SQL = text(
+    """
+    UPDATE log_entry
+    SET response_payload = :payload,
+        provider_id      = COALESCE(:provider_id, provider_id),
+        model_id         = COALESCE(:model_id, model_id),
+        timestamp_response = :timestamp,
+        policy_id        = COALESCE(:policy_id, policy_id),
+        classification_statistics = :classification_statistics,
+        request_id = COALESCE(:request_id, request_id),
+        queue_depth_at_arrival = COALESCE(:queue_depth, queue_depth_at_arrival),
+        utilization_at_arrival = COALESCE(:utilization, utilization_at_arrival)
+    WHERE id = :log_id
+    """
+)
+
+
 # noinspection PyUnresolvedReferences
 class DBManager:
     def __init__(self):
@@ -280,12 +306,14 @@ class DBManager:
         *,
         log_id: Optional[int] = None,
         request_id: Optional[str] = None,
+        commit: bool = True,
         **fields: Any,
     ) -> None:
         """
         Update scheduler/runtime/completion metrics on a log_entry row.
 
         The log row can be targeted either by `log_id` or by `request_id`.
+        With ``commit=False`` the update joins the caller's transaction.
         """
         if log_id is None and not request_id:
             raise ValueError("Either log_id or request_id must be provided")
@@ -362,7 +390,8 @@ class DBManager:
 
         sql = text(f"UPDATE log_entry SET {assignments} WHERE {where_clause}")
         self.session.execute(sql, params)
-        self.session.commit()
+        if commit:
+            self.session.commit()
 
     def update_request_log_metrics(
         self,
@@ -381,12 +410,14 @@ class DBManager:
         update_stmt = table.update().where(table.c.id == record_id).values(**data)
         self.session.execute(update_stmt)
         self.session.commit()
+        _invalidate_auth_cache(table_name, record_id)
 
     def delete(self, table_name: str, record_id: int) -> None:
         table = Table(table_name, self.metadata, autoload_with=self.engine)
         delete_stmt = table.delete().where(table.c.id == record_id)
         self.session.execute(delete_stmt)
         self.session.commit()
+        _invalidate_auth_cache(table_name, record_id)
 
     def fetch_by_id(self, table_name: str, record_id: int) -> Optional[Dict[str, Any]]:
         table = Table(table_name, self.metadata, autoload_with=self.engine)
@@ -2228,23 +2259,8 @@ class DBManager:
                     },
                 )
 
-        sql = text(
-            """
-                   UPDATE log_entry
-                   SET response_payload = :payload,
-                       provider_id      = COALESCE(:provider_id, provider_id),
-                       model_id         = COALESCE(:model_id, model_id),
-                       timestamp_response = :timestamp,
-                       policy_id        = COALESCE(:policy_id, policy_id),
-                       classification_statistics = :classification_statistics,
-                       request_id = COALESCE(:request_id, request_id),
-                       queue_depth_at_arrival = COALESCE(:queue_depth, queue_depth_at_arrival),
-                       utilization_at_arrival = COALESCE(:utilization, utilization_at_arrival)
-                   WHERE id = :log_id
-                   """
-        )
         self.session.execute(
-            sql,
+            _RESPONSE_PAYLOAD_UPDATE_SQL,
             {
                 "payload": _json_for_jsonb(payload) if payload else None,
                 "provider_id": provider_id,
@@ -2261,6 +2277,96 @@ class DBManager:
         self.session.commit()
         return {"result": "response_payload set"}, 200
 
+    def set_time_at_first_token_many(self, rows: List[Tuple[int, datetime.datetime]], *, commit: bool = True) -> None:
+        """Batched ``set_time_at_first_token`` with caller-supplied timestamps."""
+        if not rows:
+            return
+        self.session.execute(
+            text("UPDATE log_entry SET time_at_first_token = :timestamp WHERE id = :log_id"),
+            [{"log_id": log_id, "timestamp": timestamp} for log_id, timestamp in rows],
+        )
+        if commit:
+            self.session.commit()
+
+    def resolve_token_types(self, names) -> Dict[str, int]:
+        """
+        Map token-type names to ids, creating unknown types.
+
+        Creating a type commits, so batched writers resolve every name before
+        they start their own transaction.
+        """
+        type_ids: Dict[str, int] = {}
+        for name in names:
+            if name in type_ids:
+                continue
+            r, _ = self.add_token_type(name, "")
+            if "error" in r:
+                raise RuntimeError(f"Could not resolve token type {name!r}: {r['error']}")
+            type_ids[name] = r["token-type-id"]
+        return type_ids
+
+    def set_response_payload_many(self, rows: List[Dict[str, Any]], *, commit: bool = True) -> None:
+        """
+        Batched ``set_response_payload``: one privacy lookup, one multi-row
+        ``usage_tokens`` insert and one executemany ``UPDATE`` for all rows.
+
+        Each row carries the ``set_response_payload`` arguments by name plus the
+        ``timestamp`` at which the response was produced. Rows for unknown log
+        entries are skipped, as the single-row variant does.
+        """
+        rows = [row for row in rows if isinstance(row.get("log_id"), int)]
+        if not rows:
+            return
+        privacy_rows = self.session.execute(
+            text("SELECT id, privacy_level FROM log_entry WHERE id IN :log_ids").bindparams(
+                bindparam("log_ids", expanding=True)
+            ),
+            {"log_ids": sorted({row["log_id"] for row in rows})},
+        ).fetchall()
+        privacy_levels = {privacy_row[0]: privacy_row[1] for privacy_row in privacy_rows}
+
+        type_ids = self.resolve_token_types(token_type for row in rows for token_type in (row.get("usage") or {}))
+        usage_rows: List[Dict[str, Any]] = []
+        update_rows: List[Dict[str, Any]] = []
+        for row in rows:
+            log_id = row["log_id"]
+            if log_id not in privacy_levels:
+                continue
+            for token_type, token_count in (row.get("usage") or {}).items():
+                if token_count:
+                    usage_rows.append(
+                        {"log_entry_id": log_id, "type_id": type_ids[token_type], "token_count": token_count}
+                    )
+            payload = row.get("payload") if privacy_levels[log_id] == "FULL" else None
+            policy_id = row.get("policy_id", -1)
+            update_rows.append(
+                {
+                    "payload": _json_for_jsonb(payload) if payload else None,
+                    "provider_id": row.get("provider_id"),
+                    "model_id": row.get("model_id"),
+                    "timestamp": row["timestamp"],
+                    "log_id": log_id,
+                    "policy_id": policy_id if policy_id != -1 else None,
+                    "classification_statistics": _json_for_jsonb(row.get("classified") or {}),
+                    "request_id": row.get("request_id"),
+                    "queue_depth": row.get("queue_depth_at_arrival"),
+                    "utilization": row.get("utilization_at_arrival"),
+                }
+            )
+
+        if usage_rows:
+            self.session.execute(
+                text(
+                    "INSERT INTO usage_tokens (log_entry_id, type_id, token_count) "
+                    "VALUES (:log_entry_id, :type_id, :token_count)"
+                ),
+                usage_rows,
+            )
+        if update_rows:
+            self.session.execute(_RESPONSE_PAYLOAD_UPDATE_SQL, update_rows)
+        if commit:
+            self.session.commit()
+
     def get_usage_cost_micro_cents(
         self,
         model_id: int,
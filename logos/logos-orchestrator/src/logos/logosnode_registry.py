@@ -14,6 +14,7 @@ from typing import Any, AsyncIterator, Callable
 
 from fastapi import WebSocket
 
+from logos.logosnode_frames import BINARY_STREAM_ENCODING, StreamFrameError, decode_stream_frame
 from logos.terminal_logging import (
     BOLD,
     CYAN,
@@ -303,6 +304,10 @@ class ProviderSession:
     # worker has freed all VRAM for its probes, so its idle lanes and free
     # VRAM are reserved rather than available.
     calibrating: bool = False
+    # Encodings the worker can relay infer_stream output in (hello
+    # "stream_encodings"). Empty for workers that predate the field, which
+    # keeps them on JSON text frames with base64 chunks.
+    stream_encodings: set[str] = field(default_factory=set)
 
     def is_stale(self, stale_after_seconds: int) -> bool:
         return (_utc_now() - self.last_heartbeat) > timedelta(seconds=stale_after_seconds)
@@ -314,6 +319,7 @@ class LogosNodeRuntimeRegistry:
     def __init__(
         self,
         on_capabilities_changed: Callable[[int, list[str]], None] | None = None,
+        binary_stream_frames: bool = True,
     ) -> None:
         self._tickets: dict[str, AuthTicket] = {}
         self._sessions: dict[int, ProviderSession] = {}
@@ -331,6 +337,14 @@ class LogosNodeRuntimeRegistry:
         # orchestrator uses this to react to terminal session events
         # without polling. Signature: (provider_id, event_dict) -> None
         self._event_subscribers: list[Callable[[int, dict[str, Any]], None]] = []
+        # Subscribers notified whenever a provider's runtime snapshot is
+        # replaced (status update, session attach/detach). The capacity
+        # planner's ClusterStateModel uses this to recompute only the
+        # providers that changed. Signature: (provider_id) -> None
+        self._runtime_subscribers: list[Callable[[int], None]] = []
+        # Ask workers that advertise it to relay streams as binary frames
+        # (raw chunk bytes behind a short header) instead of base64-in-JSON.
+        self._binary_stream_frames = binary_stream_frames
 
     def _fire_capabilities_changed(self, provider_id: int, model_names: list[str]) -> None:
         if self._on_capabilities_changed is not None:
@@ -344,6 +358,13 @@ class LogosNodeRuntimeRegistry:
                     worker_name,
                 )
 
+    def _fire_runtime_changed(self, provider_id: int) -> None:
+        for subscriber in tuple(self._runtime_subscribers):
+            try:
+                subscriber(provider_id)
+            except Exception:
+                logger.exception("Runtime subscriber failed for provider=%s", provider_id)
+
     def _session_diagnostic_lines(
         self,
         session: ProviderSession,
@@ -482,6 +503,7 @@ class LogosNodeRuntimeRegistry:
                     f"provider '{ticket.worker_id}' is already connected as worker '{old.worker_id}'"
                 )
             self._sessions[ticket.provider_id] = session
+        self._fire_runtime_changed(ticket.provider_id)
         if old is not None:
             body_lines = [
                 f"provider={paint(ticket.worker_id, BOLD)} status={paint('reconnected', YELLOW, BOLD)}",
@@ -545,6 +567,7 @@ class LogosNodeRuntimeRegistry:
             if websocket is not None and session.websocket is not websocket:
                 return
             self._sessions.pop(provider_id, None)
+        self._fire_runtime_changed(provider_id)
         pending_cmds = len(session.pending_commands)
         pending_streams = len(session.pending_streams)
         logger.warning(
@@ -589,6 +612,7 @@ class LogosNodeRuntimeRegistry:
         max_lanes: int = 0,
         configured_models: list[str] | None = None,
         calibrating: bool | None = None,
+        stream_encodings: list[str] | None = None,
     ) -> None:
         session = await self._get_session(provider_id)
         if session is None:
@@ -611,6 +635,7 @@ class LogosNodeRuntimeRegistry:
                 self._fire_capabilities_changed(provider_id, sorted(new_caps))
         if configured_models is not None:
             session.configured_models = {m for m in configured_models if isinstance(m, str) and m.strip()}
+        session.stream_encodings = {e for e in stream_encodings or [] if isinstance(e, str)}
 
     async def update_runtime(
         self,
@@ -629,6 +654,7 @@ class LogosNodeRuntimeRegistry:
         session.last_heartbeat = _utc_now()
         if was_first:
             self.sync_desired_lanes_from_runtime(provider_id)
+        self._fire_runtime_changed(provider_id)
 
         # Detect node-health transitions and log loudly on the master side
         # so operators see the condition in the logos-orchestrator container
@@ -834,6 +860,24 @@ class LogosNodeRuntimeRegistry:
         except ValueError:
             pass
 
+    def subscribe_to_runtime_updates(self, callback: Callable[[int], None]) -> None:
+        """Register a callback fired whenever a provider's runtime snapshot changes.
+
+        Called synchronously from ``update_runtime``, ``attach_session`` and
+        ``detach_session`` with the provider id only; subscribers re-read the
+        snapshot when they need it. Same contract as ``subscribe_to_events``:
+        cheap, non-blocking work only.
+        """
+        if callback not in self._runtime_subscribers:
+            self._runtime_subscribers.append(callback)
+
+    def unsubscribe_from_runtime_updates(self, callback: Callable[[int], None]) -> None:
+        """Remove a previously registered runtime subscriber."""
+        try:
+            self._runtime_subscribers.remove(callback)
+        except ValueError:
+            pass
+
     async def mark_heartbeat(self, provider_id: int) -> None:
         session = await self._get_session(provider_id)
         if session is not None:
@@ -874,13 +918,16 @@ class LogosNodeRuntimeRegistry:
         queue = session.pending_streams.get(cmd_id)
         if queue is None:
             return
-        encoded = payload.get("chunk_b64")
-        if not isinstance(encoded, str):
-            return
-        try:
-            chunk = base64.b64decode(encoded)
-        except Exception:  # noqa: BLE001
-            chunk = b""
+        # Binary frames hand over the raw bytes; JSON frames carry base64.
+        chunk = payload.get("chunk")
+        if not isinstance(chunk, bytes):
+            encoded = payload.get("chunk_b64")
+            if not isinstance(encoded, str):
+                return
+            try:
+                chunk = base64.b64decode(encoded)
+            except Exception:  # noqa: BLE001
+                chunk = b""
         await queue.put({"type": "stream_chunk", "chunk": chunk})
 
     async def on_stream_end(self, provider_id: int, payload: dict[str, Any]) -> None:
@@ -901,6 +948,21 @@ class LogosNodeRuntimeRegistry:
                 }
             )
 
+    async def on_stream_frame(self, provider_id: int, data: bytes) -> None:
+        """Dispatch a binary stream frame to the matching ``on_stream_*`` handler."""
+        try:
+            payload = decode_stream_frame(data)
+        except StreamFrameError as exc:
+            logger.debug("Dropping malformed binary stream frame from provider %s: %s", provider_id, exc)
+            return
+        frame_type = payload["type"]
+        if frame_type == "stream_start":
+            await self.on_stream_start(provider_id, payload)
+        elif frame_type == "stream_chunk":
+            await self.on_stream_chunk(provider_id, payload)
+        elif frame_type == "stream_end":
+            await self.on_stream_end(provider_id, payload)
+
     async def send_command(
         self,
         provider_id: int,
@@ -1007,6 +1069,8 @@ class LogosNodeRuntimeRegistry:
             "action": action,
             "params": params or {},
         }
+        if self._binary_stream_frames and BINARY_STREAM_ENCODING in session.stream_encodings:
+            message["stream_encoding"] = BINARY_STREAM_ENCODING
         try:
             async with session.send_lock:
                 await session.websocket.send_json(message)
@@ -25,7 +25,8 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from grpclocal import model_pb2_grpc
 from grpclocal.grpc_server import LogosServicer
-from logos.auth import authenticate_api_key
+from logos.auth import authenticate_api_key, resolve_limits
+from logos.auth_cache import get_auth_cache
 from logos.capacity.calibration_orchestrator import CalibrationConfig, CalibrationOrchestrator
 from logos.capacity.capacity_planner import CapacityPlanner
 from logos.capacity.demand_tracker import DemandTracker
@@ -48,11 +49,14 @@ from logos.logosnode_registry import (
     LogosNodeRuntimeRegistry,
     LogosNodeSessionConflictError,
 )
+from logos.monitoring.log_writer import RequestLogWriter, RequestLogWriterConfig
 from logos.monitoring.prometheus_metrics import metrics_response as _prometheus_metrics_response
+from logos.monitoring.recorder import MonitoringRecorder
 from logos.pipeline.context_resolver import ContextResolver
 from logos.pipeline.correcting_scheduler import ClassificationCorrectingScheduler
 from logos.pipeline.executor import ExecutionResult, Executor, StreamingExecutionStatus
 from logos.pipeline.pipeline import PipelineRequest, RequestPipeline
+from logos.pipeline.upstream_clients import UpstreamClientRegistry, UpstreamPoolConfig
 from logos.queue.priority_queue import PriorityQueueManager
 from logos.request_content import (
     force_non_streaming_payload,
@@ -157,11 +161,19 @@ def _sync_logosnode_capabilities_to_db(provider_id: int, model_names: list[str])
 
 _logosnode_registry = LogosNodeRuntimeRegistry(
     on_capabilities_changed=_sync_logosnode_capabilities_to_db,
+    binary_stream_frames=os.getenv("LOGOSNODE_BINARY_STREAM_FRAMES", "true").lower() == "true",
 )
 _demand_tracker: Optional[DemandTracker] = None
 _capacity_planner: Optional[CapacityPlanner] = None
 _calibration_orchestrator: Optional[CalibrationOrchestrator] = None
 _azure_deployment_sync: Optional[AzureDeploymentSyncService] = None
+_upstream_clients: Optional[UpstreamClientRegistry] = None
+# Per-request log_entry writes (first token, response/usage, metrics). Writes
+# inline until started; the lambda keeps DBManager patchable in tests.
+_request_log_writer = RequestLogWriter(
+    db_factory=lambda: DBManager(),
+    config=RequestLogWriterConfig.from_env(),
+)
 
 
 def _env_int(name: str, default: int) -> int:
@@ -1020,28 +1032,27 @@ def _record_log_failure(
     classification_stats = classification_stats or {}
 
     try:
-        with DBManager() as db:
-            db.set_response_payload(
-                log_id,
-                payload,
-                provider_id,
-                model_id,
-                {},
-                -1,
-                classification_stats,
-                request_id=request_id,
-                queue_depth_at_arrival=scheduling_stats.get("queue_depth_at_arrival"),
-                utilization_at_arrival=scheduling_stats.get("utilization_at_arrival"),
-            )
-            db.update_log_entry_metrics(
-                log_id=log_id,
-                request_id=request_id,
-                model_id=model_id,
-                provider_id=provider_id,
-                result_status=result_status,
-                error_message=error_message,
-                cold_start=scheduling_stats.get("is_cold_start"),
-            )
+        _request_log_writer.response(
+            log_id,
+            payload,
+            provider_id,
+            model_id,
+            {},
+            -1,
+            classification_stats,
+            request_id=request_id,
+            queue_depth_at_arrival=scheduling_stats.get("queue_depth_at_arrival"),
+            utilization_at_arrival=scheduling_stats.get("utilization_at_arrival"),
+        )
+        _request_log_writer.metrics(
+            log_id=log_id,
+            request_id=request_id,
+            model_id=model_id,
+            provider_id=provider_id,
+            result_status=result_status,
+            error_message=error_message,
+            cold_start=scheduling_stats.get("is_cold_start"),
+        )
     except Exception:
         logger.exception(
             "Failed to record terminal log failure (log_id=%s, request_id=%s)",
@@ -1375,6 +1386,10 @@ async def lifespan(app: FastAPI):
         await _azure_deployment_sync.stop()
     if _grpc_server:
         await _grpc_server.stop(0)
+    # Durably flush queued request-log writes (billing usage included).
+    await _request_log_writer.stop()
+    if _upstream_clients:
+        await _upstream_clients.aclose()
 
 
 # Prometheus metrics auth: set PROMETHEUS_API_KEY env var to require auth; if unset, deny all.
@@ -1672,6 +1687,39 @@ async def internal_refresh_pipeline(data: _RefreshPipelineRequest, request: Requ
     return {"status": "ok"}
 
 
+class _AuthCacheInvalidateRequest(BaseModel):
+    api_key_id: Optional[int] = None
+    team_id: Optional[int] = None
+
+
+@app.post("/internal/auth_cache/invalidate", tags=["admin"])
+async def internal_auth_cache_invalidate(data: _AuthCacheInvalidateRequest, request: Request):
+    """Drop cached auth data after Spring mutates a key, team or limit.
+
+    With neither ``api_key_id`` nor ``team_id`` the whole cache is flushed.
+    """
+    if not _INTERNAL_SECRET:
+        raise HTTPException(status_code=403, detail="Internal endpoint disabled")
+    auth_header = request.headers.get("authorization", "")
+    token = (
+        auth_header.removeprefix("Bearer ").strip()
+        if auth_header.lower().startswith("bearer ")
+        else auth_header.strip()
+    )
+    if not hmac.compare_digest(token, _INTERNAL_SECRET):
+        raise HTTPException(status_code=401, detail="Invalid or missing internal secret")
+
+    cache = get_auth_cache()
+    dropped = 0
+    if data.api_key_id is not None:
+        dropped += cache.invalidate_api_key(api_key_id=data.api_key_id)
+    if data.team_id is not None:
+        dropped += cache.invalidate_team(data.team_id)
+    if data.api_key_id is None and data.team_id is None:
+        dropped = cache.clear()
+    return {"status": "ok", "dropped": dropped}
+
+
 @app.get("/internal/provider_status", tags=["admin"])
 async def internal_provider_status(request: Request):
     """Connection state of every local provider, for the Spring webservice.
@@ -1987,7 +2035,7 @@ async def _filter_logosnode_deployments(
 async def start_pipeline():
     """Initialize the new request pipeline components."""
     global _pipeline, _queue_mgr, _logosnode_facade, _azure_facade, _context_resolver
-    global _demand_tracker, _capacity_planner
+    global _demand_tracker, _capacity_planner, _upstream_clients
 
     logger.info("Initializing Request Pipeline...")
 
@@ -2011,8 +2059,9 @@ async def start_pipeline():
     )
     logger.info("Scheduler: ClassificationCorrectingScheduler (ettft_enabled=%s)", ettft_enabled)
 
-    # 5. Executor
-    executor = Executor()
+    # 5. Executor (pooled, long-lived upstream clients; closed in lifespan)
+    _upstream_clients = UpstreamClientRegistry(UpstreamPoolConfig.from_env())
+    executor = Executor(_upstream_clients)
 
     # 6. Context Resolver
     _context_resolver = ContextResolver(logosnode_registry=_logosnode_registry)
@@ -2023,16 +2072,21 @@ async def start_pipeline():
     # 8. Demand Tracker (for capacity planner)
     _demand_tracker = DemandTracker()
 
-    # 9. Pipeline
+    # 9. Request-log writer (ablatable via env var; inline writes when disabled)
+    if os.getenv("LOGOS_ASYNC_REQUEST_LOG", "true").lower() == "true":
+        await _request_log_writer.start()
+
+    # 10. Pipeline
     _pipeline = RequestPipeline(
         classifier=clf,
         scheduler=scheduler,
         executor=executor,
         context_resolver=_context_resolver,
+        monitoring=MonitoringRecorder(writer=_request_log_writer),
         demand_tracker=_demand_tracker,
     )
 
-    # 10. Capacity Planner (ablatable via env var)
+    # 11. Capacity Planner (ablatable via env var)
     planner_enabled = os.getenv("LOGOS_CAPACITY_PLANNER_ENABLED", "true").lower() == "true"
     _capacity_planner = CapacityPlanner(
         logosnode_facade=_logosnode_facade,
@@ -2432,32 +2486,31 @@ async def _streaming_response(
         _release()
         if log_id:
             try:
-                with DBManager() as db:
-                    db.set_response_payload(
-                        log_id,
-                        error_body,
-                        provider_id,
-                        model_id,
-                        {},
-                        policy_id,
-                        classification_stats,
-                        request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
-                        queue_depth_at_arrival=(
-                            scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None
-                        ),
-                        utilization_at_arrival=(
-                            scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None
-                        ),
-                    )
-                    db.update_log_entry_metrics(
-                        log_id=log_id,
-                        request_id=request_id,
-                        model_id=model_id,
-                        provider_id=provider_id,
-                        result_status="error",
-                        error_message=error_message,
-                        cold_start=(scheduling_stats.get("is_cold_start") if scheduling_stats else None),
-                    )
+                _request_log_writer.response(
+                    log_id,
+                    error_body,
+                    provider_id,
+                    model_id,
+                    {},
+                    policy_id,
+                    classification_stats,
+                    request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
+                    queue_depth_at_arrival=(
+                        scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None
+                    ),
+                    utilization_at_arrival=(
+                        scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None
+                    ),
+                )
+                _request_log_writer.metrics(
+                    log_id=log_id,
+                    request_id=request_id,
+                    model_id=model_id,
+                    provider_id=provider_id,
+                    result_status="error",
+                    error_message=error_message,
+                    cold_start=(scheduling_stats.get("is_cold_start") if scheduling_stats else None),
+                )
             except Exception:
                 logger.exception(
                     "Failed to record pre-stream error (log_id=%s, request_id=%s)",
@@ -2523,8 +2576,7 @@ async def _streaming_response(
                             yield chunk
                             if chunk and not ttft_recorded:
                                 if log_id:
-                                    with DBManager() as db:
-                                        db.set_time_at_first_token(log_id)
+                                    _request_log_writer.first_token(log_id)
                                 ttft_recorded = True
                             stream_log.feed(chunk)
                     except Exception as e:
@@ -2551,23 +2603,22 @@ async def _streaming_response(
                 response_payload = stream_log.response_payload()
                 usage_tokens = _usage_tokens_from_payload(response_payload)
                 if log_id:
-                    with DBManager() as db:
-                        db.set_response_payload(
-                            log_id,
-                            response_payload,
-                            provider_id,
-                            model_id,
-                            usage_tokens,
-                            policy_id,
-                            classification_stats,
-                            request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
-                            queue_depth_at_arrival=(
-                                scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None
-                            ),
-                            utilization_at_arrival=(
-                                scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None
-                            ),
-                        )
+                    _request_log_writer.response(
+                        log_id,
+                        response_payload,
+                        provider_id,
+                        model_id,
+                        usage_tokens,
+                        policy_id,
+                        classification_stats,
+                        request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
+                        queue_depth_at_arrival=(
+                            scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None
+                        ),
+                        utilization_at_arrival=(
+                            scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None
+                        ),
+                    )
                 if rl_key:
                     from logos.rate_limiter import get_rate_limiter
 
@@ -2659,8 +2710,7 @@ async def _streaming_response(
                     stream_log.feed(outgoing_chunk)
                 if not ttft_recorded:
                     if log_id:
-                        with DBManager() as db:
-                            db.set_time_at_first_token(log_id)
+                        _request_log_writer.first_token(log_id)
                     ttft_recorded = True
 
             async for chunk in chunk_iter:
@@ -2669,8 +2719,7 @@ async def _streaming_response(
                     stream_log.feed(outgoing_chunk)
                 if chunk and not ttft_recorded:
                     if log_id:
-                        with DBManager() as db:
-                            db.set_time_at_first_token(log_id)
+                        _request_log_writer.first_token(log_id)
                     ttft_recorded = True
             if cost_enricher:
                 for outgoing_chunk in cost_enricher.finish():
@@ -2702,32 +2751,31 @@ async def _streaming_response(
             response_payload = stream_log.response_payload()
             usage_tokens = _usage_tokens_from_payload(response_payload)
             if log_id:
-                with DBManager() as db:
-                    db.set_response_payload(
-                        log_id,
-                        response_payload,
-                        provider_id,
-                        model_id,
-                        usage_tokens,
-                        policy_id,
-                        classification_stats,
-                        request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
-                        queue_depth_at_arrival=(
-                            scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None
-                        ),
-                        utilization_at_arrival=(
-                            scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None
-                        ),
+                _request_log_writer.response(
+                    log_id,
+                    response_payload,
+                    provider_id,
+                    model_id,
+                    usage_tokens,
+                    policy_id,
+                    classification_stats,
+                    request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
+                    queue_depth_at_arrival=(
+                        scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None
+                    ),
+                    utilization_at_arrival=(
+                        scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None
+                    ),
+                )
+                if failed:
+                    _request_log_writer.metrics(
+                        log_id=log_id,
+                        request_id=request_id,
+                        model_id=model_id,
+                        provider_id=provider_id,
+                        result_status="error",
+                        error_message=error_message,
                     )
-                    if failed:
-                        db.update_log_entry_metrics(
-                            log_id=log_id,
-                            request_id=request_id,
-                            model_id=model_id,
-                            provider_id=provider_id,
-                            result_status="error",
-                            error_message=error_message,
-                        )
             if rl_key:
                 from logos.rate_limiter import get_rate_limiter
 
@@ -2916,39 +2964,34 @@ async def _sync_response(
         usage_tokens = _usage_tokens_from_payload(response_payload)
 
         if log_id:
-            with DBManager() as db:
-                if exec_result.success:
-                    db.set_time_at_first_token(log_id)
-                db.set_response_payload(
-                    log_id,
-                    response_payload,
-                    provider_id,
-                    model_id,
-                    usage_tokens,
-                    policy_id,
-                    classification_stats,
-                    request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
-                    queue_depth_at_arrival=(
-                        scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None
-                    ),
-                    utilization_at_arrival=(
-                        scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None
-                    ),
-                )
-                # Persist the final result_status directly by log_id. record_completion
-                # below only runs when scheduling_stats is present (it keys off
-                # request_id), which left cloud requests with no scheduling stats —
-                # e.g. a failed Azure call — at result_status NULL, rendering grey
-                # (neither success nor error) on the statistics page.
-                db.update_log_entry_metrics(
-                    log_id=log_id,
-                    provider_id=provider_id,
-                    model_id=model_id,
-                    result_status=("timeout" if timed_out else ("success" if exec_result.success else "error")),
-                    error_message=(
-                        error_message if timed_out else (exec_result.error if not exec_result.success else None)
-                    ),
-                )
+            if exec_result.success:
+                _request_log_writer.first_token(log_id)
+            _request_log_writer.response(
+                log_id,
+                response_payload,
+                provider_id,
+                model_id,
+                usage_tokens,
+                policy_id,
+                classification_stats,
+                request_id=(scheduling_stats.get("request_id") if scheduling_stats else None),
+                queue_depth_at_arrival=(scheduling_stats.get("queue_depth_at_arrival") if scheduling_stats else None),
+                utilization_at_arrival=(scheduling_stats.get("utilization_at_arrival") if scheduling_stats else None),
+            )
+            # Persist the final result_status directly by log_id. record_completion
+            # below only runs when scheduling_stats is present (it keys off
+            # request_id), which left cloud requests with no scheduling stats —
+            # e.g. a failed Azure call — at result_status NULL, rendering grey
+            # (neither success nor error) on the statistics page.
+            _request_log_writer.metrics(
+                log_id=log_id,
+                provider_id=provider_id,
+                model_id=model_id,
+                result_status=("timeout" if timed_out else ("success" if exec_result.success else "error")),
+                error_message=(
+                    error_message if timed_out else (exec_result.error if not exec_result.success else None)
+                ),
+            )
 
         if scheduling_stats:
             status = "timeout" if timed_out else ("success" if exec_result.success else "error")
@@ -3090,8 +3133,7 @@ def _proxy_streaming_response(
                 if ttft is None:
                     ttft = datetime.datetime.now(datetime.timezone.utc)
                     if log_id:
-                        with DBManager() as db:
-                            db.set_time_at_first_token(log_id)
+                        _request_log_writer.first_token(log_id)
 
                 for outgoing_chunk in cost_enricher.feed(chunk):
                     yield outgoing_chunk
@@ -3115,25 +3157,24 @@ def _proxy_streaming_response(
                 response_payload = stream_log.response_payload()
                 usage_tokens = _usage_tokens_from_payload(response_payload)
 
-                with DBManager() as db:
-                    if ttft is None and stream_log.first_chunk is not None and not error_message:
-                        db.set_time_at_first_token(log_id)
-                    db.set_response_payload(
-                        log_id,
-                        response_payload,
-                        provider_id,
-                        model_id,
-                        usage_tokens,
-                        policy_id,
-                        classified,
-                    )
-                    db.update_log_entry_metrics(
-                        log_id=log_id,
-                        provider_id=provider_id,
-                        model_id=model_id,
-                        result_status="error" if failed else "success",
-                        error_message=error_message,
-                    )
+                if ttft is None and stream_log.first_chunk is not None and not error_message:
+                    _request_log_writer.first_token(log_id)
+                _request_log_writer.response(
+                    log_id,
+                    response_payload,
+                    provider_id,
+                    model_id,
+                    usage_tokens,
+                    policy_id,
+                    classified,
+                )
+                _request_log_writer.metrics(
+                    log_id=log_id,
+                    provider_id=provider_id,
+                    model_id=model_id,
+                    result_status="error" if failed else "success",
+                    error_message=error_message,
+                )
 
     response_headers = {"X-Request-ID": request_id} if request_id else None
     return StreamingResponse(streamer(), media_type="text/event-stream", headers=response_headers)
@@ -3168,25 +3209,24 @@ async def _proxy_sync_response(
     if log_id:
         usage_tokens = _usage_tokens_from_payload(response_payload)
 
-        with DBManager() as db:
-            if exec_result.success:
-                db.set_time_at_first_token(log_id)
-            db.set_response_payload(
-                log_id,
-                response_payload,
-                provider_id,
-                model_id,
-                usage_tokens,
-                policy_id,
-                classified,
-            )
-            db.update_log_entry_metrics(
-                log_id=log_id,
-                provider_id=provider_id,
-                model_id=model_id,
-                result_status="success" if exec_result.success else "error",
-                error_message=None if exec_result.success else exec_result.error,
-            )
+        if exec_result.success:
+            _request_log_writer.first_token(log_id)
+        _request_log_writer.response(
+            log_id,
+            response_payload,
+            provider_id,
+            model_id,
+            usage_tokens,
+            policy_id,
+            classified,
+        )
+        _request_log_writer.metrics(
+            log_id=log_id,
+            provider_id=provider_id,
+            model_id=model_id,
+            result_status="success" if exec_result.success else "error",
+            error_message=None if exec_result.success else exec_result.error,
+        )
 
     # Use upstream HTTP status code; fall back to 200/500 if unavailable
     status_code = (
@@ -3643,8 +3683,8 @@ async def _execute_cancelling_on_disconnect(request: Request, **kwargs):
     Uvicorn does not tear the handler down when a client vanishes mid-request,
     so the call kept a worker generating a response nobody would read — a ghost
     request holding a GPU lane for as long as the generation took. Cancelling
-    the task unwinds the executor's ``httpx.AsyncClient`` context, which closes
-    the upstream connection so vLLM aborts the sequence.
+    the task unwinds the executor's upstream stream context, which discards
+    the unread pooled connection so vLLM aborts the sequence.
 
     Whether the response ends up streaming is decided deep inside the pipeline:
     resource mode can resolve to Whisper and answer synchronously even for
@@ -3694,12 +3734,11 @@ async def handle_sync_request(path: str, request: Request):
     headers, auth, body, client_ip, log_id = await auth_parse_log(request, use_profile_auth=True)
     request_id = secrets.token_urlsafe(16)
     if log_id:
-        with DBManager() as db:
-            db.update_log_entry_metrics(
-                log_id=log_id,
-                request_id=request_id,
-                timeout_s=body.get("timeout_s"),
-            )
+        _request_log_writer.metrics(
+            log_id=log_id,
+            request_id=request_id,
+            timeout_s=body.get("timeout_s"),
+        )
 
     try:
         deployments, allowed_models = request_setup(headers, auth.api_key_id)
@@ -3779,35 +3818,16 @@ async def auth_parse_log(request: Request, use_profile_auth: bool = False):
 
             # Rate limits and budgets apply to every key, including those owned
             # by logos_admins. Admin keys derive their limits from their team /
-            # key settings exactly like any other key.
-            s = auth.settings or {}
-            team_info = db.get_team(auth.team_id) if auth.team_id is not None else None
-
-            generic_rpm = s.get("rpm_limit")
-            generic_tpm = s.get("tpm_limit")
-
-            cloud_rpm = (
-                s.get("cloud_rpm_limit") or generic_rpm or (team_info and team_info.get("default_cloud_rpm_limit"))
-            )
-            cloud_tpm = (
-                s.get("cloud_tpm_limit") or generic_tpm or (team_info and team_info.get("default_cloud_tpm_limit"))
-            )
-            local_rpm = (
-                s.get("local_rpm_limit") or generic_rpm or (team_info and team_info.get("default_local_rpm_limit"))
-            )
-            local_tpm = (
-                s.get("local_tpm_limit") or generic_tpm or (team_info and team_info.get("default_local_tpm_limit"))
-            )
-
-            if cloud_rpm is not None or cloud_tpm is not None:
-                auth.cloud_rl = {"rpm": cloud_rpm, "tpm": cloud_tpm}
-            if local_rpm is not None or local_tpm is not None:
-                auth.local_rl = {"rpm": local_rpm, "tpm": local_tpm}
+            # key settings exactly like any other key. The resolved policy is
+            # cached; only the month's usage is read on every request.
+            limits = resolve_limits(db, auth)
+            auth.cloud_rl = limits.cloud_rl
+            auth.local_rl = limits.local_rl
 
             key_type = getattr(auth, "key_type", "user")
 
             if key_type == "application":
-                app_budget_limit = db.get_api_key_budget_limit(auth.api_key_id)
+                app_budget_limit = limits.budget_limit
                 if app_budget_limit is not None:
                     app_used = db.get_api_key_budget_usage(auth.api_key_id, month_start)
                     if app_used >= app_budget_limit:
@@ -3816,18 +3836,16 @@ async def auth_parse_log(request: Request, use_profile_auth: bool = False):
                             detail="Application monthly budget exceeded.",
                         )
             else:
-                if auth.team_id is not None:
-                    team_info = db.get_team(auth.team_id)
-                    if team_info and team_info.get("team_monthly_budget_micro_cents"):
-                        team_limit = team_info["team_monthly_budget_micro_cents"]
-                        team_used = db.get_team_budget_usage(auth.team_id, month_start)
-                        if team_used >= team_limit:
-                            raise HTTPException(
-                                status_code=402,
-                                detail="Team monthly budget exceeded. Contact your admin.",
-                            )
+                if auth.team_id is not None and limits.team_budget_limit:
+                    team_limit = limits.team_budget_limit
+                    team_used = db.get_team_budget_usage(auth.team_id, month_start)
+                    if team_used >= team_limit:
+                        raise HTTPException(
+                            status_code=402,
+                            detail="Team monthly budget exceeded. Contact your admin.",
+                        )
 
-                personal_limit = db.get_api_key_budget_limit(auth.api_key_id)
+                personal_limit = limits.budget_limit
                 if personal_limit is not None:
                     personal_used = db.get_api_key_budget_usage(auth.api_key_id, month_start)
                     if personal_used >= personal_limit:
@@ -3961,12 +3979,11 @@ async def execute_proxy_job(
 
     request_id = secrets.token_urlsafe(16)
     if log_id:
-        with DBManager() as db:
-            db.update_log_entry_metrics(
-                log_id=log_id,
-                request_id=request_id,
-                timeout_s=json_data.get("timeout_s"),
-            )
+        _request_log_writer.metrics(
+            log_id=log_id,
+            request_id=request_id,
+            timeout_s=json_data.get("timeout_s"),
+        )
 
     # Get available models for this API key
     try:
@@ -4123,7 +4140,15 @@ async def logosnode_session(websocket: WebSocket, token: str):
 
     try:
         while True:
-            payload = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            frame = message.get("bytes")
+            if frame is not None:
+                # Binary frames are only ever negotiated stream_start/chunk/end.
+                await _logosnode_registry.on_stream_frame(ticket.provider_id, frame)
+                continue
+            payload = json.loads(message.get("text") or "null")
             if not isinstance(payload, dict):
                 continue
             msg_type = payload.get("type")
@@ -4145,6 +4170,9 @@ async def logosnode_session(websocket: WebSocket, token: str):
                     calibrating=(
                         bool(payload.get("calibrating")) if isinstance(payload.get("calibrating"), bool) else None
                     ),
+                    stream_encodings=(
+                        payload.get("stream_encodings") if isinstance(payload.get("stream_encodings"), list) else None
+                    ),
                 )
             elif msg_type == "status":
                 runtime = payload.get("runtime") if isinstance(payload.get("runtime"), dict) else {}
@@ -0,0 +1,342 @@
+"""
+Asynchronous, batched writer for per-request ``log_entry`` updates.
+
+Every request used to open one or more synchronous ``DBManager`` sessions on
+the event loop after its response: time-to-first-token, the response payload
+with its ``usage_tokens`` rows, and the lifecycle metrics written by
+``MonitoringRecorder``. Under load those round-trips and commits dominate the
+request tail.
+
+``RequestLogWriter`` queues those writes in a bounded in-memory map keyed by
+log entry and flushes them from a background task in multi-row batches, one
+transaction per batch:
+
+- consecutive metric updates of one entry are merged (last value wins, as
+  sequential ``UPDATE``s would), while responses are never merged, so every
+  ``usage_tokens`` row — and therefore billing — stays exact;
+- timestamps (``time_at_first_token``, ``timestamp_response``) are captured at
+  submit time, not at flush time;
+- when the queue is full, best-effort writes (first token, metrics) for new
+  entries are dropped and counted, and billing-relevant responses are written
+  inline instead;
+- a failed batch is rolled back and retried entry by entry;
+- ``stop()`` drains everything before returning.
+
+When the writer is not running (tests, scripts, ``LOGOS_ASYNC_REQUEST_LOG=false``)
+every call is written inline with the same ``DBManager`` methods as before.
+
+``log_usage`` stays synchronous: the id it returns keys all later writes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from logos.dbutils.dbmanager import DBManager
+from logos.monitoring import prometheus_metrics as prom
+
+logger = logging.getLogger(__name__)
+
+_FIRST_TOKEN = "first_token"
+_RESPONSE = "response"
+_METRICS = "metrics"
+
+_Op = Tuple[str, Dict[str, Any]]
+_Batch = List[Tuple[Hashable, List[_Op]]]
+
+
+@dataclass(frozen=True)
+class RequestLogWriterConfig:
+    """Writer knobs.
+
+    LOGOS_LOG_WRITER_MAX_PENDING          log entries that may wait for a flush (default 10000)
+    LOGOS_LOG_WRITER_BATCH_SIZE           log entries written per transaction (default 200)
+    LOGOS_LOG_WRITER_FLUSH_INTERVAL_MS    pause between flushes (default 50)
+    """
+
+    max_pending: int = 10_000
+    batch_size: int = 200
+    flush_interval_s: float = 0.05
+
+    @classmethod
+    def from_env(cls) -> "RequestLogWriterConfig":
+        """Build a RequestLogWriterConfig from environment variables (with defaults)."""
+        try:
+            max_pending = max(1, int(os.getenv("LOGOS_LOG_WRITER_MAX_PENDING", "10000")))
+        except ValueError:
+            max_pending = 10_000
+        try:
+            batch_size = max(1, int(os.getenv("LOGOS_LOG_WRITER_BATCH_SIZE", "200")))
+        except ValueError:
+            batch_size = 200
+        try:
+            flush_interval_s = max(0.0, float(os.getenv("LOGOS_LOG_WRITER_FLUSH_INTERVAL_MS", "50")) / 1000.0)
+        except ValueError:
+            flush_interval_s = 0.05
+        return cls(max_pending=max_pending, batch_size=batch_size, flush_interval_s=flush_interval_s)
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class RequestLogWriter:
+    """
+    Queue of pending ``log_entry`` writes, flushed in batches by a background task.
+
+    Submissions are thread-safe; ``start``/``stop`` must run on the event loop.
+    """
+
+    def __init__(
+        self,
+        db_factory: Callable[[], DBManager] = DBManager,
+        config: Optional[RequestLogWriterConfig] = None,
+    ) -> None:
+        self._db_factory = db_factory
+        self.config = config or RequestLogWriterConfig()
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[Hashable, List[_Op]]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def first_token(self, log_id: int) -> None:
+        """Record the time of the first streamed token for *log_id*."""
+        if not self.running:
+            with self._db_factory() as db:
+                db.set_time_at_first_token(log_id)
+            return
+        self._submit(log_id, _FIRST_TOKEN, {"log_id": log_id, "timestamp": _now()})
+
+    def response(
+        self,
+        log_id: int,
+        payload: Any,
+        provider_id: Optional[int] = None,
+        model_id: Optional[int] = None,
+        usage: Optional[Dict[str, int]] = None,
+        policy_id: int = -1,
+        classified: Optional[Dict[str, Any]] = None,
+        **extra: Any,
+    ) -> None:
+        """Record the response payload and token usage, as ``DBManager.set_response_payload``."""
+        if not self.running:
+            with self._db_factory() as db:
+                db.set_response_payload(log_id, payload, provider_id, model_id, usage, policy_id, classified, **extra)
+            return
+        row = {
+            "log_id": log_id,
+            "payload": payload,
+            "provider_id": provider_id,
+            "model_id": model_id,
+            "usage": dict(usage or {}),
+            "policy_id": policy_id,
+            "classified": classified or {},
+            "request_id": extra.get("request_id"),
+            "queue_depth_at_arrival": extra.get("queue_depth_at_arrival"),
+            "utilization_at_arrival": extra.get("utilization_at_arrival"),
+            "timestamp": _now(),
+        }
+        self._submit(log_id, _RESPONSE, row)
+
+    def metrics(self, **fields: Any) -> None:
+        """Record lifecycle metrics, as ``DBManager.update_log_entry_metrics``."""
+        log_id, request_id = fields.get("log_id"), fields.get("request_id")
+        if log_id is None and not request_id:
+            raise ValueError("Either log_id or request_id must be provided")
+        if not self.running:
+            # Forward the caller's keywords unchanged, as the inline call sites did.
+            with self._db_factory() as db:
+                db.update_log_entry_metrics(**fields)
+            return
+        key = log_id if log_id is not None else ("request_id", request_id)
+        self._submit(key, _METRICS, {"log_id": log_id, "request_id": request_id, **fields})
+
+    def _submit(self, key: Hashable, kind: str, op: Dict[str, Any]) -> None:
+        with self._lock:
+            ops = self._pending.get(key)
+            if ops is None and len(self._pending) < self.config.max_pending:
+                ops = self._pending[key] = []
+            if ops is not None:
+                outcome = self._append(ops, kind, op)
+                prom.REQUEST_LOG_PENDING.set(len(self._pending))
+                if outcome is not None:
+                    prom.REQUEST_LOG_WRITES_TOTAL.labels(kind=kind, outcome=outcome).inc()
+                return
+
+        if kind != _RESPONSE:
+            prom.REQUEST_LOG_WRITES_TOTAL.labels(kind=kind, outcome="dropped").inc()
+            logger.debug("Request-log queue full; dropped %s write for %s", kind, key)
+            return
+        # Billing data is never dropped: write it on the caller's thread.
+        prom.REQUEST_LOG_WRITES_TOTAL.labels(kind=kind, outcome="inline").inc()
+        with self._db_factory() as db:
+            self._apply(db, [(key, [(kind, op)])])
+            db.session.commit()
+
+    @staticmethod
+    def _append(ops: List[_Op], kind: str, op: Dict[str, Any]) -> Optional[str]:
+        """Append *op*, merging it into the previous op where that is equivalent."""
+        if ops and ops[-1][0] == kind and kind in (_FIRST_TOKEN, _METRICS):
+            previous = ops[-1][1]
+            if kind == _FIRST_TOKEN:
+                previous["timestamp"] = op["timestamp"]
+                return "coalesced"
+            if previous.get("log_id") == op.get("log_id") and previous.get("request_id") == op.get("request_id"):
+                # update_log_entry_metrics ignores None, so None must not clobber.
+                previous.update({name: value for name, value in op.items() if value is not None})
+                return "coalesced"
+        ops.append((kind, op))
+        return None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="request-log-writer")
+        logger.info(
+            "Request-log writer started (max_pending=%d, batch_size=%d, flush_interval=%.0fms)",
+            self.config.max_pending,
+            self.config.batch_size,
+            self.config.flush_interval_s * 1000,
+        )
+
+    async def stop(self) -> None:
+        """Stop accepting queued writes and flush everything still pending."""
+        task = self._task
+        if task is None:
+            return
+        self._closing = True
+        try:
+            await task
+        finally:
+            self._task = None
+        # Anything submitted while the last flush was running.
+        await asyncio.to_thread(self.flush)
+        logger.info("Request-log writer stopped")
+
+    async def _run(self) -> None:
+        while True:
+            if not self._closing:
+                await asyncio.sleep(self.config.flush_interval_s)
+            while self._pending:
+                try:
+                    await asyncio.to_thread(self._flush_batch, self._take_batch())
+                except Exception:  # pragma: no cover - _flush_batch logs its own failures
+                    logger.exception("Request-log flush failed")
+            if self._closing:
+                return
+
+    def flush(self) -> None:
+        """Synchronously write everything that is pending."""
+        while self._pending:
+            self._flush_batch(self._take_batch())
+
+    def _take_batch(self) -> _Batch:
+        with self._lock:
+            batch = []
+            while self._pending and len(batch) < self.config.batch_size:
+                batch.append(self._pending.popitem(last=False))
+            prom.REQUEST_LOG_PENDING.set(len(self._pending))
+        return batch
+
+    # ------------------------------------------------------------------
+    # Flushing (runs in a worker thread)
+    # ------------------------------------------------------------------
+
+    def _flush_batch(self, batch: _Batch) -> None:
+        if not batch:
+            return
+        started = time.perf_counter()
+        try:
+            with self._db_factory() as db:
+                try:
+                    self._apply(db, batch)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+        except Exception:
+            logger.warning("Batched request-log flush of %d entries failed; retrying one by one", len(batch))
+            for entry in batch:
+                self._flush_entry(entry)
+        else:
+            self._count(batch, "flushed")
+        finally:
+            prom.REQUEST_LOG_FLUSH_DURATION_SECONDS.observe(time.perf_counter() - started)
+
+    def _flush_entry(self, entry: Tuple[Hashable, List[_Op]]) -> None:
+        try:
+            with self._db_factory() as db:
+                try:
+                    self._apply(db, [entry])
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+        except Exception:
+            key, ops = entry
+            if any(kind == _RESPONSE for kind, _ in ops):
+                logger.exception("Failed to write response and usage for log entry %s", key)
+            else:
+                logger.warning("Failed to write request-log metrics for %s", key, exc_info=True)
+            self._count([entry], "failed")
+        else:
+            self._count([entry], "flushed")
+
+    @staticmethod
+    def _apply(db: DBManager, batch: _Batch) -> None:
+        """
+        Write *batch* inside the caller's transaction.
+
+        Op *k* of every entry is written in round *k*, so each entry's writes
+        keep their submission order while each round is one statement per kind.
+        """
+        # Creating a token type commits; do it before this batch writes anything.
+        db.resolve_token_types(
+            {name for _, ops in batch for kind, op in ops if kind == _RESPONSE for name in op["usage"]}
+        )
+        for k in range(max(len(ops) for _, ops in batch)):
+            first_tokens, responses, metrics = [], [], []
+            for _, ops in batch:
+                if k >= len(ops):
+                    continue
+                kind, op = ops[k]
+                if kind == _FIRST_TOKEN:
+                    first_tokens.append((op["log_id"], op["timestamp"]))
+                elif kind == _RESPONSE:
+                    responses.append(op)
+                else:
+                    metrics.append(op)
+            db.set_time_at_first_token_many(first_tokens, commit=False)
+            db.set_response_payload_many(responses, commit=False)
+            for op in metrics:
+                db.update_log_entry_metrics(commit=False, **op)
+
+    @staticmethod
+    def _count(batch: _Batch, outcome: str) -> None:
+        for _, ops in batch:
+            for kind, _ in ops:
+                prom.REQUEST_LOG_WRITES_TOTAL.labels(kind=kind, outcome=outcome).inc()
@@ -45,6 +45,72 @@ QUEUE_DEPTH = Gauge(
     registry=registry,
 )
 
+# ---------------------------------------------------------------------------
+# Upstream HTTP connection pools (Executor)
+# ---------------------------------------------------------------------------
+
+UPSTREAM_HTTP_CLIENTS = Gauge(
+    "logos_upstream_http_clients",
+    "Pooled upstream HTTP clients currently open (one per upstream origin)",
+    registry=registry,
+)
+
+UPSTREAM_HTTP_CONNECTIONS = Gauge(
+    "logos_upstream_http_connections",
+    "Connections held by an upstream client's pool",
+    ["upstream", "state"],  # active, idle
+    registry=registry,
+)
+
+UPSTREAM_HTTP_REQUESTS_TOTAL = Counter(
+    "logos_upstream_http_requests_total",
+    "Upstream requests by whether they reused a pooled connection",
+    ["upstream", "connection"],  # new, reused
+    registry=registry,
+)
+
+# ---------------------------------------------------------------------------
+# Auth cache (API keys, teams, resolved limits)
+# ---------------------------------------------------------------------------
+
+AUTH_CACHE_LOOKUPS_TOTAL = Counter(
+    "logos_auth_cache_lookups_total",
+    "Auth cache lookups on the request path",
+    ["cache", "result"],  # cache: api_key, team, limits; result: hit, miss
+    registry=registry,
+)
+
+AUTH_CACHE_INVALIDATIONS_TOTAL = Counter(
+    "logos_auth_cache_invalidations_total",
+    "Explicit auth cache invalidations",
+    ["scope"],  # api_key, team, all
+    registry=registry,
+)
+
+# ---------------------------------------------------------------------------
+# Request-log writer (batched log_entry / usage_tokens writes)
+# ---------------------------------------------------------------------------
+
+REQUEST_LOG_PENDING = Gauge(
+    "logos_request_log_pending",
+    "Log entries with writes queued for the request-log writer",
+    registry=registry,
+)
+
+REQUEST_LOG_WRITES_TOTAL = Counter(
+    "logos_request_log_writes_total",
+    "Request-log writes by kind and outcome",
+    ["kind", "outcome"],  # kind: first_token, response, metrics; outcome: flushed, coalesced, dropped, inline, failed
+    registry=registry,
+)
+
+REQUEST_LOG_FLUSH_DURATION_SECONDS = Histogram(
+    "logos_request_log_flush_duration_seconds",
+    "Duration of one batched request-log flush",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    registry=registry,
+)
+
 # ---------------------------------------------------------------------------
 # Classification
 # ---------------------------------------------------------------------------
@@ -117,6 +183,19 @@ CAPACITY_PLANNER_CYCLE_DURATION_SECONDS = Histogram(
     registry=registry,
 )
 
+CAPACITY_PLANNER_PLANNING_DURATION_SECONDS = Histogram(
+    "logos_capacity_planner_planning_duration_seconds",
+    "Time spent computing one cycle's action plan, excluding action execution",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    registry=registry,
+)
+
+CAPACITY_PLANNER_STATE_REBUILDS_TOTAL = Counter(
+    "logos_capacity_planner_state_rebuilds_total",
+    "Per-provider rebuilds of the planner's cluster state after a runtime update",
+    registry=registry,
+)
+
 CAPACITY_PLANNER_SWITCHES_TOTAL = Counter(
     "logos_capacity_planner_switches_total",
     "Total model switch events (wake/load of a different model)",
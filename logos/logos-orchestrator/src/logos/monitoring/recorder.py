@@ -16,6 +16,7 @@ from typing import Any, Callable, Dict, Optional
 from logos.dbutils.dbmanager import DBManager
 from logos.dbutils.dbmodules import ResultStatus
 from logos.monitoring import prometheus_metrics as prom
+from logos.monitoring.log_writer import RequestLogWriter
 from logos.terminal_logging import model_name_cache, provider_name_cache
 
 logger = logging.getLogger(__name__)
@@ -42,10 +43,18 @@ def _resolve_label_names(model_id: Optional[int], provider_id: Optional[int]) ->
 class MonitoringRecorder:
     """
     Minimal recorder that updates request lifecycle fields on log_entry.
+
+    With a running ``writer`` the updates are queued and batched instead of
+    written synchronously.
     """
 
-    def __init__(self, db_factory: Callable[[], DBManager] = DBManager) -> None:
+    def __init__(
+        self,
+        db_factory: Callable[[], DBManager] = DBManager,
+        writer: Optional[RequestLogWriter] = None,
+    ) -> None:
         self._db_factory = db_factory
+        self._writer = writer
 
     def record_enqueue(
         self,
@@ -186,6 +195,9 @@ class MonitoringRecorder:
 
     def _write(self, request_id: str, **fields: object) -> None:
         try:
+            if self._writer is not None and self._writer.running:
+                self._writer.metrics(request_id=request_id, **fields)
+                return
             with self._db_factory() as db:
                 db.update_request_log_metrics(request_id=request_id, **fields)
         except Exception as exc:  # pragma: no cover - monitoring must not break prod
@@ -13,6 +13,7 @@ from typing import Any, AsyncIterator, Callable, Dict, Optional
 import httpx
 
 from logos.errors import UpstreamStreamError, coerce_upstream_error
+from logos.pipeline.upstream_clients import UpstreamClientRegistry
 from logos.request_content import (
     force_non_streaming_payload,
     httpx_multipart_parts,
@@ -52,8 +53,19 @@ class Executor:
     Responsibilities:
     - Make sync or streaming HTTP calls
     - Parse responses and extract usage
+
+    Requests go through long-lived per-upstream clients so connections (and
+    their TLS sessions) are reused across requests instead of being opened
+    for every call.
     """
 
+    def __init__(self, clients: Optional[UpstreamClientRegistry] = None) -> None:
+        self._clients = clients if clients is not None else UpstreamClientRegistry()
+
+    async def aclose(self) -> None:
+        """Close the pooled upstream clients (called on application shutdown)."""
+        await self._clients.aclose()
+
     async def execute_streaming(
         self,
         url: str,
@@ -97,7 +109,8 @@ class Executor:
         logger.info(f"Streaming request to {url}")
 
         request_kwargs = self._request_kwargs(payload)
-        async with httpx.AsyncClient(timeout=None) as client:
+        client = self._clients.client_for(url)
+        try:
             async with client.stream("POST", url, headers=headers, **request_kwargs) as resp:
                 resp_headers = dict(resp.headers)
                 if on_response_start:
@@ -146,6 +159,8 @@ class Executor:
                     yield b"\n\n"
                     yield f"data: {json.dumps(error_body)}\n\n".encode()
                     yield b"data: [DONE]\n\n"
+        finally:
+            self._clients.record_pool_occupancy(url)
 
     async def execute_sync(
         self,
@@ -173,13 +188,13 @@ class Executor:
         logger.info(f"Sync request to {url}")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    timeout=None,  # No timeout to handle long-running LLM requests and cold starts
-                    **self._request_kwargs(payload),
-                )
+            response: httpx.Response = await self._clients.client_for(url).post(
+                url,
+                headers=headers,
+                timeout=None,  # No timeout to handle long-running LLM requests and cold starts
+                **self._request_kwargs(payload),
+            )
+            self._clients.record_pool_occupancy(url)
 
             logger.debug(f"Response status: {response.status_code}, headers: {dict(response.headers)}")
 
@@ -0,0 +1,177 @@
+# src/logos/pipeline/upstream_clients.py
+"""
+Long-lived, pooled HTTP clients for upstream AI providers.
+
+Opening an ``httpx.AsyncClient`` per request costs a TCP connect and a TLS
+handshake to Azure/OpenAI/Ollama before the first token can arrive. The
+registry here keeps one client per upstream origin (scheme, host, port) for
+the lifetime of the process, so consecutive requests reuse warm keep-alive
+connections — or a single multiplexed HTTP/2 connection where the upstream
+negotiates it via ALPN.
+
+Cancelling a request still aborts the upstream generation: closing an unread
+streaming response discards its connection instead of returning it to the
+pool, which is what tells vLLM to drop the sequence.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+from logos.monitoring import prometheus_metrics as prom
+
+logger = logging.getLogger(__name__)
+
+try:  # HTTP/2 needs the optional ``h2`` package (httpx[http2]).
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the installed extras
+    _HTTP2_AVAILABLE = False
+
+# Set on the request by the trace hook when httpcore had to open a new
+# connection for it; absent means an idle pooled connection was reused.
+_NEW_CONNECTION_EXTENSION = "logos_new_connection"
+_CONNECT_EVENTS = frozenset({"connection.connect_tcp.started", "connection.connect_unix_socket.started"})
+
+
+@dataclass(frozen=True)
+class UpstreamPoolConfig:
+    """Connection-pool knobs shared by every upstream client.
+
+    LOGOS_UPSTREAM_MAX_CONNECTIONS        per upstream; 0 = unlimited (default 0)
+    LOGOS_UPSTREAM_MAX_KEEPALIVE          idle connections kept per upstream (default 32)
+    LOGOS_UPSTREAM_KEEPALIVE_EXPIRY_S     idle connection lifetime in seconds (default 60)
+    LOGOS_UPSTREAM_HTTP2                  "true" / "false" (default true; needs h2)
+    """
+
+    max_connections: Optional[int] = None
+    max_keepalive_connections: int = 32
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+
+    @classmethod
+    def from_env(cls) -> "UpstreamPoolConfig":
+        """Build an UpstreamPoolConfig from environment variables (with defaults)."""
+
+        def _parse_int(name: str, default: int) -> int:
+            raw = os.getenv(name, "").strip()
+            try:
+                return max(0, int(raw)) if raw else default
+            except ValueError:
+                return default
+
+        def _parse_float(name: str, default: float) -> float:
+            raw = os.getenv(name, "").strip()
+            try:
+                return max(0.0, float(raw)) if raw else default
+            except ValueError:
+                return default
+
+        max_connections = _parse_int("LOGOS_UPSTREAM_MAX_CONNECTIONS", 0)
+        return cls(
+            max_connections=max_connections or None,
+            max_keepalive_connections=_parse_int("LOGOS_UPSTREAM_MAX_KEEPALIVE", 32),
+            keepalive_expiry=_parse_float("LOGOS_UPSTREAM_KEEPALIVE_EXPIRY_S", 60.0),
+            http2=os.getenv("LOGOS_UPSTREAM_HTTP2", "true").strip().lower() in {"1", "true", "yes"},
+        )
+
+
+def upstream_key(url: str) -> str:
+    """Origin that identifies the pooled client for *url* (``scheme://host:port``)."""
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return f"{parsed.scheme}://{parsed.host}:{port}"
+
+
+class UpstreamClientRegistry:
+    """
+    One shared ``httpx.AsyncClient`` per upstream origin.
+
+    Clients are created lazily on first use and live until :meth:`aclose`,
+    which the FastAPI lifespan calls on shutdown. Timeouts stay disabled, as
+    before, so long generations and cold starts are never cut off here.
+    """
+
+    def __init__(self, config: Optional[UpstreamPoolConfig] = None) -> None:
+        self._config = config or UpstreamPoolConfig()
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._closed = False
+        if self._config.http2 and not _HTTP2_AVAILABLE:
+            logger.info("HTTP/2 requested for upstream clients but 'h2' is not installed; using HTTP/1.1")
+
+    @property
+    def http2(self) -> bool:
+        return self._config.http2 and _HTTP2_AVAILABLE
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Return the pooled client for *url*'s origin, creating it on first use."""
+        if self._closed:
+            raise RuntimeError("Upstream client registry is closed")
+        key = upstream_key(url)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._build_client(key)
+            self._clients[key] = client
+            prom.UPSTREAM_HTTP_CLIENTS.set(len(self._clients))
+            logger.info("Opened pooled upstream client for %s (http2=%s)", key, self.http2)
+        return client
+
+    def record_pool_occupancy(self, url: str) -> None:
+        """Refresh the active/idle connection gauges for *url*'s upstream."""
+        key = upstream_key(url)
+        client = self._clients.get(key)
+        if client is None:
+            return
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return
+        idle = sum(1 for conn in connections if conn.is_idle())
+        prom.UPSTREAM_HTTP_CONNECTIONS.labels(upstream=key, state="idle").set(idle)
+        prom.UPSTREAM_HTTP_CONNECTIONS.labels(upstream=key, state="active").set(len(connections) - idle)
+
+    async def aclose(self) -> None:
+        """Close every pooled client; in-flight streams are torn down with them."""
+        self._closed = True
+        clients, self._clients = self._clients, {}
+        results = await asyncio.gather(*(client.aclose() for client in clients.values()), return_exceptions=True)
+        for key, result in zip(clients, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to close upstream client for %s: %s", key, result)
+        prom.UPSTREAM_HTTP_CLIENTS.set(0)
+        if clients:
+            logger.info("Closed %d pooled upstream client(s)", len(clients))
+
+    def _build_client(self, key: str) -> httpx.AsyncClient:
+        config = self._config
+
+        async def _on_request(request: httpx.Request) -> None:
+            async def _trace(event_name: str, _info: Dict[str, Any]) -> None:
+                if event_name in _CONNECT_EVENTS:
+                    request.extensions[_NEW_CONNECTION_EXTENSION] = True
+
+            request.extensions["trace"] = _trace
+
+        async def _on_response(response: httpx.Response) -> None:
+            reused = not response.request.extensions.get(_NEW_CONNECTION_EXTENSION, False)
+            prom.UPSTREAM_HTTP_REQUESTS_TOTAL.labels(
+                upstream=key,
+                connection="reused" if reused else "new",
+            ).inc()
+            self.record_pool_occupancy(key)
+
+        return httpx.AsyncClient(
+            timeout=None,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=self.http2,
+            event_hooks={"request": [_on_request], "response": [_on_response]},
+        )
@@ -8,9 +8,16 @@ queued request can be served by any provider with capability for that model
 For backward compatibility every public method that previously took a
 ``provider_id`` still accepts it (positional or kwarg) and silently ignores
 it. The kwarg pattern lets callers be migrated gradually.
+
+Heaps use lazy deletion: ``remove`` and ``move_priority`` only drop the
+entry from the index, and stale heap items are discarded when they reach
+the top (or compacted once they outnumber live ones). Depths and the
+cold-entry count are maintained counters, so the scheduler and capacity
+planner can poll them every cycle without walking the heaps.
 """
 
 import heapq
+import itertools
 import logging
 import uuid
 from collections import defaultdict
@@ -20,12 +27,18 @@ from typing import Dict, List, Optional, Tuple, Union
 
 from logos.queue.models import Priority, QueueEntry, QueueStatePerPriority
 
+# Heap item: (-priority, sequence, entry_id, entry). The sequence number keeps
+# FIFO order within a priority.
+_HeapItem = Tuple[int, int, str, QueueEntry]
+
+_PRIORITIES_DESC = (Priority.HIGH, Priority.NORMAL, Priority.LOW)
+
 
 class PriorityQueueManager:
     """Thread-safe priority queue manager keyed by ``model_id``.
 
     Maintains separate priority heaps per model:
-        queues[model_id][Priority.HIGH] = [(neg_priority, ts, entry_id, QueueEntry), ...]
+        queues[model_id][Priority.HIGH] = [(neg_priority, seq, entry_id, QueueEntry), ...]
         queues[model_id][Priority.NORMAL] = [...]
         queues[model_id][Priority.LOW] = [...]
 
@@ -36,11 +49,12 @@ class PriorityQueueManager:
       from the same queue (release path picks via lane_comparator).
     - Backward-compatible: every method that previously accepted
       ``provider_id`` still accepts it and ignores it.
+    - O(log n) enqueue/dequeue/move, O(1) remove, lookups and depth queries.
     """
 
     def __init__(self):
-        # queues[model_id][priority] = heap of (-priority, ts, entry_id, QueueEntry)
-        self._queues: Dict[int, Dict[Priority, List[Tuple[int, float, str, QueueEntry]]]] = defaultdict(
+        # queues[model_id][priority] = heap of _HeapItem, possibly holding stale items
+        self._queues: Dict[int, Dict[Priority, List[_HeapItem]]] = defaultdict(
             lambda: {
                 Priority.LOW: [],
                 Priority.NORMAL: [],
@@ -48,14 +62,73 @@ class PriorityQueueManager:
             }
         )
 
-        # Fast lookup: entry_id → (model_id, priority)
-        self._entry_lookup: Dict[str, Tuple[int, Priority]] = {}
+        # Index of live entries: entry_id → (model_id, priority, heap item).
+        # A heap item is live only while it is the one recorded here.
+        self._entry_lookup: Dict[str, Tuple[int, Priority, _HeapItem]] = {}
+
+        # Maintained counters (live entries only).
+        self._depth: Dict[int, Dict[Priority, int]] = defaultdict(lambda: dict.fromkeys(Priority, 0))
+        self._cold_depth: Dict[int, int] = defaultdict(int)
+        self._stale: Dict[Tuple[int, Priority], int] = defaultdict(int)
 
         self._lock = RLock()
         self._entry_counter = 0
+        self._sequence = itertools.count()
 
         logging.info("PriorityQueueManager initialized (model-only queue)")
 
+    # ------------------------------------------------------------------
+    # Internal index maintenance (caller holds ``_lock``)
+    # ------------------------------------------------------------------
+
+    def _push(self, entry: QueueEntry, priority: Priority) -> None:
+        model_id = entry.model_id
+        item = (-int(priority), next(self._sequence), entry.entry_id, entry)
+        heapq.heappush(self._queues[model_id][priority], item)
+        self._entry_lookup[entry.entry_id] = (model_id, priority, item)
+        self._depth[model_id][priority] += 1
+        if entry.is_cold_at_queue:
+            self._cold_depth[model_id] += 1
+
+    def _unlink(self, entry_id: str) -> Optional[Tuple[int, Priority, QueueEntry]]:
+        """Drop a live entry from the index and counters; its heap item turns stale."""
+        located = self._entry_lookup.pop(entry_id, None)
+        if located is None:
+            return None
+        model_id, priority, item = located
+        entry = item[3]
+        self._depth[model_id][priority] -= 1
+        if entry.is_cold_at_queue:
+            self._cold_depth[model_id] -= 1
+        return model_id, priority, entry
+
+    def _is_live(self, item: _HeapItem) -> bool:
+        located = self._entry_lookup.get(item[2])
+        return located is not None and located[2] is item
+
+    def _prune(self, model_id: int, priority: Priority) -> List[_HeapItem]:
+        """Discard stale items from the top of a heap and return the heap."""
+        queue = self._queues[model_id][priority]
+        key = (model_id, priority)
+        while queue and not self._is_live(queue[0]):
+            heapq.heappop(queue)
+            self._stale[key] -= 1
+        return queue
+
+    def _mark_stale(self, model_id: int, priority: Priority) -> None:
+        """Account for one stale item; compact once they outnumber live items."""
+        key = (model_id, priority)
+        self._stale[key] += 1
+        if self._stale[key] > max(64, self._depth[model_id][priority]):
+            queue = self._queues[model_id][priority]
+            queue[:] = [item for item in queue if self._is_live(item)]
+            heapq.heapify(queue)
+            self._stale[key] = 0
+
+    # ------------------------------------------------------------------
+    # Queue operations
+    # ------------------------------------------------------------------
+
     def enqueue(
         self,
         task: any,
@@ -82,15 +155,7 @@ class PriorityQueueManager:
                 enqueue_time=datetime.now(),
                 is_cold_at_queue=is_cold_at_queue,
             )
-
-            heap_entry = (
-                -int(priority),
-                datetime.now().timestamp(),
-                entry_id,
-                entry,
-            )
-            heapq.heappush(self._queues[model_id][priority], heap_entry)
-            self._entry_lookup[entry_id] = (model_id, priority)
+            self._push(entry, priority)
 
             logging.debug(
                 f"Enqueued task {task.get_id() if hasattr(task, 'get_id') else 'unknown'} "
@@ -108,15 +173,8 @@ class PriorityQueueManager:
 
         ``provider_id`` is accepted but ignored.
         """
-        with self._lock:
-            if priority is not None:
-                task, _ = self._dequeue_from_priority(model_id, priority)
-                return task
-            for p in [Priority.HIGH, Priority.NORMAL, Priority.LOW]:
-                task, _ = self._dequeue_from_priority(model_id, p)
-                if task is not None:
-                    return task
-            return None
+        task, _ = self.dequeue_with_entry(model_id, priority=priority)
+        return task
 
     def dequeue_with_entry(
         self,
@@ -128,9 +186,9 @@ class PriorityQueueManager:
         with self._lock:
             if priority is not None:
                 return self._dequeue_from_priority(model_id, priority)
-            for p in [Priority.HIGH, Priority.NORMAL, Priority.LOW]:
+            for p in _PRIORITIES_DESC:
                 task, entry = self._dequeue_from_priority(model_id, p)
-                if task is not None:
+                if entry is not None:
                     return task, entry
             return None, None
 
@@ -140,12 +198,12 @@ class PriorityQueueManager:
         priority: Priority,
     ) -> Tuple[Optional[any], Optional[QueueEntry]]:
         """Dequeue from a specific priority heap. Caller must hold ``_lock``."""
-        queue = self._queues[model_id][priority]
-        if not queue:
+        if model_id not in self._depth or not self._depth[model_id][priority]:
             return None, None
+        queue = self._prune(model_id, priority)
 
         _, _, entry_id, entry = heapq.heappop(queue)
-        del self._entry_lookup[entry_id]
+        self._unlink(entry_id)
 
         logging.debug(
             f"Dequeued task {entry.task.get_id() if hasattr(entry.task, 'get_id') else 'unknown'} "
@@ -163,48 +221,34 @@ class PriorityQueueManager:
         ``provider_id`` is accepted but ignored.
         """
         with self._lock:
-            for priority in [Priority.HIGH, Priority.NORMAL, Priority.LOW]:
-                queue = self._queues[model_id][priority]
-                if queue:
-                    _, _, _, entry = queue[0]
+            if model_id not in self._depth:
+                return None
+            for priority in _PRIORITIES_DESC:
+                if self._depth[model_id][priority]:
+                    entry = self._prune(model_id, priority)[0][3]
                     return entry.task, priority
             return None
 
     def move_priority(self, entry_id: str, new_priority: Priority) -> bool:
-        """Move a queued entry to a different priority level (escalation)."""
+        """Move a queued entry to a different priority level (escalation).
+
+        The entry joins the back of ``new_priority``; its old heap item is
+        left behind as a stale item rather than searched for.
+        """
         with self._lock:
-            if entry_id not in self._entry_lookup:
+            located = self._entry_lookup.get(entry_id)
+            if located is None:
                 logging.warning(f"Cannot move entry {entry_id}: not found in queue")
                 return False
 
-            model_id, current_priority = self._entry_lookup[entry_id]
+            model_id, current_priority, _ = located
             if current_priority == new_priority:
                 return True
 
-            current_queue = self._queues[model_id][current_priority]
-            entry_to_move = None
-            for i, (_, _, eid, entry) in enumerate(current_queue):
-                if eid == entry_id:
-                    entry_to_move = entry
-                    del current_queue[i]
-                    heapq.heapify(current_queue)
-                    break
-
-            if entry_to_move is None:
-                logging.error(f"Entry {entry_id} found in lookup but not in queue!")
-                del self._entry_lookup[entry_id]
-                return False
-
+            _, _, entry_to_move = self._unlink(entry_id)
+            self._mark_stale(model_id, current_priority)
             entry_to_move.escalate(new_priority)
-
-            heap_entry = (
-                -int(new_priority),
-                datetime.now().timestamp(),
-                entry_id,
-                entry_to_move,
-            )
-            heapq.heappush(self._queues[model_id][new_priority], heap_entry)
-            self._entry_lookup[entry_id] = (model_id, new_priority)
+            self._push(entry_to_move, new_priority)
 
             logging.info(
                 f"Moved entry {entry_id} from {current_priority.name} to "
@@ -222,10 +266,13 @@ class PriorityQueueManager:
         ``provider_id`` is accepted but ignored.
         """
         with self._lock:
+            depth = self._depth.get(model_id)
+            if depth is None:
+                return QueueStatePerPriority()
             return QueueStatePerPriority(
-                low=len(self._queues[model_id][Priority.LOW]),
-                normal=len(self._queues[model_id][Priority.NORMAL]),
-                high=len(self._queues[model_id][Priority.HIGH]),
+                low=depth[Priority.LOW],
+                normal=depth[Priority.NORMAL],
+                high=depth[Priority.HIGH],
             )
 
     def get_entries_for_priority(
@@ -252,43 +299,34 @@ class PriorityQueueManager:
             raise TypeError("get_entries_for_priority requires a Priority value")
 
         with self._lock:
+            if model_id not in self._depth:
+                return []
             queue = self._queues[model_id][priority]
-            entries = [entry for (_, _, _, entry) in queue]
+            entries = [item[3] for item in queue if self._is_live(item)]
             entries.sort(key=lambda e: e.enqueue_time)
             return entries
 
     def get_entry_info(self, entry_id: str) -> Optional[QueueEntry]:
         """Metadata about a specific queue entry."""
         with self._lock:
-            if entry_id not in self._entry_lookup:
-                return None
-            model_id, priority = self._entry_lookup[entry_id]
-            queue = self._queues[model_id][priority]
-            for _, _, eid, entry in queue:
-                if eid == entry_id:
-                    return entry
-            return None
+            located = self._entry_lookup.get(entry_id)
+            return located[2][3] if located is not None else None
 
     def remove(self, entry_id: str) -> bool:
         """Remove a specific entry from the queue (cancellation)."""
         with self._lock:
-            if entry_id not in self._entry_lookup:
+            unlinked = self._unlink(entry_id)
+            if unlinked is None:
                 return False
-            model_id, priority = self._entry_lookup[entry_id]
-            queue = self._queues[model_id][priority]
-            for i, (_, _, eid, _) in enumerate(queue):
-                if eid == entry_id:
-                    del queue[i]
-                    heapq.heapify(queue)
-                    del self._entry_lookup[entry_id]
-                    logging.info(f"Removed entry {entry_id} from queue")
-                    return True
-            return False
+            model_id, priority, _ = unlinked
+            self._mark_stale(model_id, priority)
+            logging.info(f"Removed entry {entry_id} from queue")
+            return True
 
     def is_empty(self) -> bool:
         """True if no tasks are queued across all models/priorities."""
         with self._lock:
-            return all(len(queue) == 0 for model_queues in self._queues.values() for queue in model_queues.values())
+            return not self._entry_lookup
 
     def get_total_depth_by_model(self, model_id: int) -> int:
         """Total queue depth for a model (all priorities combined)."""
@@ -310,14 +348,7 @@ class PriorityQueueManager:
         ``provider_id`` is accepted but ignored.
         """
         with self._lock:
-            model_queues = self._queues.get(model_id)
-            if not model_queues:
-                return False
-            for queue in model_queues.values():
-                for _neg_pri, _ts, _eid, entry in queue:
-                    if entry.is_cold_at_queue:
-                        return True
-            return False
+            return self._cold_depth.get(model_id, 0) > 0
 
     def get_total_depth_by_provider(self, provider_id: int = None) -> int:
         """Back-compat: total queued tasks. With model-only queues "per
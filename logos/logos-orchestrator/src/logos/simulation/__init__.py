@@ -0,0 +1,26 @@
+"""Offline simulation of the capacity planner and scheduler on a virtual clock."""
+
+from .clock import VirtualClock, VirtualTimeEventLoop, patch_module_clocks
+from .simulator import CapacitySimulator, RequestOutcome, SimulationConfig, SimulationReport
+from .trace import TraceRequest, WorkloadTrace, load_log_entry_csv, load_trace, load_workload_csv
+from .worker import LatencyModel, SimulatedRuntimeRegistry, SimulatedWorker, WorkerSpec, load_model_profiles
+
+__all__ = [
+    "CapacitySimulator",
+    "LatencyModel",
+    "RequestOutcome",
+    "SimulatedRuntimeRegistry",
+    "SimulatedWorker",
+    "SimulationConfig",
+    "SimulationReport",
+    "TraceRequest",
+    "VirtualClock",
+    "VirtualTimeEventLoop",
+    "WorkerSpec",
+    "WorkloadTrace",
+    "load_log_entry_csv",
+    "load_model_profiles",
+    "load_trace",
+    "load_workload_csv",
+    "patch_module_clocks",
+]
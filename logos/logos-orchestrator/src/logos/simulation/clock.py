@@ -0,0 +1,173 @@
+"""Virtual clock and event loop for offline planner/scheduler simulation.
+
+The capacity planner, demand tracker, VRAM ledgers, queue manager and SDI
+providers all read ``time.time()`` / ``time.monotonic()`` directly and wait
+with ``asyncio.sleep``.  To replay hours of traffic in seconds we run them on
+an event loop whose clock only moves when there is nothing left to do: when
+the loop would block in ``select`` until the next timer, the virtual clock
+jumps straight to that timer instead.
+
+``patch_module_clocks`` swaps the ``time`` / ``datetime`` globals of the
+listed modules for shims that read the same virtual clock, so wall-clock
+bookkeeping (tenure, idle timers, demand decay, queue aging) stays
+consistent with the loop's notion of "now".
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime as _datetime
+import importlib
+import selectors
+import time as _time
+from typing import Iterator, Sequence
+
+# Modules whose ``time`` / ``datetime`` globals are swapped while a simulation
+# runs. Everything the planner and scheduler touch on a request's path.
+SIMULATED_CLOCK_MODULES: tuple[str, ...] = (
+    "logos.capacity.capacity_planner",
+    "logos.capacity.demand_tracker",
+    "logos.capacity.vram_ledger",
+    "logos.capacity.host_ram_ledger",
+    "logos.pipeline.correcting_scheduler",
+    "logos.sdi.logosnode_facade",
+    "logos.sdi.providers.logosnode_provider",
+    "logos.queue.priority_queue",
+    "logos.queue.models",
+)
+
+# Default epoch the virtual clock starts at when a trace carries no absolute
+# timestamps (2024-01-01T00:00:00Z). Any fixed value keeps runs reproducible.
+DEFAULT_EPOCH_S = 1_704_067_200.0
+
+
+class VirtualClock:
+    """Monotonic simulated wall clock, in epoch seconds."""
+
+    def __init__(self, start: float = DEFAULT_EPOCH_S) -> None:
+        self._start = float(start)
+        self._now = float(start)
+
+    @property
+    def start(self) -> float:
+        return self._start
+
+    def now(self) -> float:
+        return self._now
+
+    def elapsed(self) -> float:
+        """Simulated seconds since the clock was created."""
+        return self._now - self._start
+
+    def advance(self, seconds: float) -> None:
+        if seconds > 0:
+            self._now += seconds
+
+
+class _VirtualSelector:
+    """Selector wrapper that turns blocking waits into clock jumps.
+
+    ``BaseEventLoop._run_once`` passes the time until the next scheduled
+    callback as the select timeout. Instead of sleeping, advance the virtual
+    clock by that amount and poll the real selector without blocking, so
+    sockets/self-pipe wakeups still get serviced.
+    """
+
+    def __init__(self, selector: selectors.BaseSelector, clock: VirtualClock) -> None:
+        self._selector = selector
+        self._clock = clock
+
+    def select(self, timeout: float | None = None):
+        if timeout is None:
+            events = self._selector.select(0)
+            if not events:
+                raise RuntimeError("Simulation deadlocked: no ready callbacks and no pending timers")
+            return events
+        self._clock.advance(timeout)
+        return self._selector.select(0)
+
+    def __getattr__(self, name: str):
+        return getattr(self._selector, name)
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Selector event loop whose ``time()`` is a :class:`VirtualClock`."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        super().__init__()
+        self.clock = clock
+        self._selector = _VirtualSelector(self._selector, clock)
+        # At epoch magnitudes one float ULP is ~2e-7 s, so sub-microsecond
+        # timeouts would never move the clock and ``_run_once`` would spin.
+        # Treat timers that close as due.
+        self._clock_resolution = max(self._clock_resolution, 1e-6)
+
+    def time(self) -> float:
+        return self.clock.now()
+
+
+class _VirtualTimeModule:
+    """Stand-in for the ``time`` module that reads the virtual clock.
+
+    Only the clock readers are overridden; everything else (``strftime``,
+    ``gmtime``, ...) is delegated to the real module.
+    """
+
+    def __init__(self, clock: VirtualClock) -> None:
+        self._clock = clock
+
+    def time(self) -> float:
+        return self._clock.now()
+
+    def monotonic(self) -> float:
+        return self._clock.now()
+
+    def perf_counter(self) -> float:
+        return self._clock.now()
+
+    def __getattr__(self, name: str):
+        return getattr(_time, name)
+
+
+def _virtual_datetime(clock: VirtualClock) -> type[_datetime.datetime]:
+    """Build a ``datetime`` subclass whose ``now()`` reads the virtual clock."""
+
+    class _VirtualDatetime(_datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return _datetime.datetime.fromtimestamp(clock.now(), tz)
+
+        @classmethod
+        def utcnow(cls):
+            return _datetime.datetime.fromtimestamp(clock.now(), _datetime.timezone.utc).replace(tzinfo=None)
+
+    return _VirtualDatetime
+
+
+@contextlib.contextmanager
+def patch_module_clocks(
+    clock: VirtualClock,
+    module_names: Sequence[str] = SIMULATED_CLOCK_MODULES,
+) -> Iterator[None]:
+    """Point the ``time``/``datetime`` globals of *module_names* at *clock*.
+
+    Only globals that are the real ``time`` module or ``datetime.datetime``
+    class are replaced, and every replacement is restored on exit.
+    """
+    time_shim = _VirtualTimeModule(clock)
+    datetime_shim = _virtual_datetime(clock)
+    restore: list[tuple[object, str, object]] = []
+    try:
+        for name in module_names:
+            module = importlib.import_module(name)
+            if getattr(module, "time", None) is _time:
+                restore.append((module, "time", _time))
+                setattr(module, "time", time_shim)
+            if getattr(module, "datetime", None) is _datetime.datetime:
+                restore.append((module, "datetime", _datetime.datetime))
+                setattr(module, "datetime", datetime_shim)
+        yield
+    finally:
+        for module, attr, original in reversed(restore):
+            setattr(module, attr, original)
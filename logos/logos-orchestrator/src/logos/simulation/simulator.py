@@ -0,0 +1,408 @@
+"""Offline discrete-event simulator for the capacity planner and scheduler.
+
+Replays a workload trace against the production ``CapacityPlanner``,
+``DemandTracker``, ``ClassificationCorrectingScheduler`` (with its ETTFT
+estimator), ``PriorityQueueManager`` and ``LogosNodeSchedulingDataFacade``,
+wired to simulated workers instead of real GPU nodes. Everything runs on a
+virtual clock, so an hour-long trace finishes in seconds on a CPU-only box
+and two runs with the same inputs produce the same report.
+
+Typical use::
+
+    trace = load_trace("tests/performance/workloads/explicit/10m/....csv")
+    config = SimulationConfig(
+        workers=[WorkerSpec(1, "node-a", [24576.0, 24576.0], trace.models())],
+        model_profiles=load_model_profiles(),
+    )
+    report = CapacitySimulator(config).run(trace)
+
+Planner heuristics are compared by varying ``planner_overrides`` (planner
+attributes such as ``_replica_first_eviction``) or ``env`` (the
+``LOGOS_*`` variables the planner and scheduler read at construction).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Iterator, Optional
+
+from logos.capacity.capacity_planner import CapacityPlanner
+from logos.capacity.demand_tracker import DemandTracker
+from logos.pipeline.correcting_scheduler import ClassificationCorrectingScheduler
+from logos.pipeline.scheduler_interface import QueueTimeoutError, SchedulingRequest
+from logos.queue.priority_queue import Priority, PriorityQueueManager
+from logos.sdi.logosnode_facade import LogosNodeSchedulingDataFacade
+
+from .clock import DEFAULT_EPOCH_S, VirtualClock, VirtualTimeEventLoop, patch_module_clocks
+from .trace import TraceRequest, WorkloadTrace
+from .worker import LatencyModel, SimulatedRuntimeRegistry, SimulatedWorker, WorkerSpec
+
+logger = logging.getLogger(__name__)
+
+# Mirrors RequestPipeline._CONTEXT_RESOLVE_INTERVAL_S: how often a scheduled
+# request re-checks for a ready lane before giving up.
+_LANE_POLL_INTERVAL_S = 2.0
+_COLD_TIERS = frozenset({"cold", "cold_reclaim"})
+
+
+@dataclass
+class SimulationConfig:
+    """Cluster, timing model and planner knobs for one simulation run."""
+
+    workers: list[WorkerSpec]
+    model_profiles: dict[str, dict[str, Any]]
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    # Models with a ready lane at t=0, per provider id.
+    initial_lanes: dict[int, list[str]] = field(default_factory=dict)
+    planner_cycle_seconds: float = 10.0
+    planner_overrides: dict[str, Any] = field(default_factory=dict)
+    env: dict[str, str] = field(default_factory=dict)
+    ettft_enabled: bool = True
+    queue_timeout_s: Optional[float] = None  # None = scheduler default
+    context_timeout_s: float = 600.0  # mirrors RequestPipeline._CONTEXT_RESOLVE_TIMEOUT_S
+    tail_seconds: float = 0.0  # keep the planner running after the last request
+    seed: int = 0
+
+
+@dataclass
+class RequestOutcome:
+    """What happened to one replayed request."""
+
+    request_id: str
+    model: Optional[str]
+    arrival_s: float
+    status: str = "pending"  # success | queue_timeout | unavailable | context_timeout | unknown_model
+    served_model: Optional[str] = None
+    provider_id: Optional[int] = None
+    was_queued: bool = False
+    cold_start: bool = False
+    ttft_s: Optional[float] = None
+    ttlt_s: Optional[float] = None
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_latencies(values: list[float]) -> dict[str, float]:
+    """Count, mean and nearest-rank percentiles, rounded to milliseconds.
+
+    Virtual timestamps are epoch-sized floats, so differences carry ~1e-7 s
+    of noise; rounding keeps reports stable and diffable.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": round(_percentile(ordered, 50), 3),
+        "p90": round(_percentile(ordered, 90), 3),
+        "p95": round(_percentile(ordered, 95), 3),
+        "p99": round(_percentile(ordered, 99), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+@dataclass
+class SimulationReport:
+    """Aggregate results of one simulation run."""
+
+    requests: int
+    status_counts: dict[str, int]
+    ttft_s: dict[str, float]
+    ttlt_s: dict[str, float]
+    cold_start_requests: int
+    cold_loads: int
+    wakes: int
+    sleeps: int
+    stops: int
+    rejected_loads: int
+    gpu_seconds_allocated: float
+    gpu_seconds_busy: float
+    simulated_seconds: float
+    wall_seconds: float
+    per_model: dict[str, dict[str, Any]]
+    outcomes: list[RequestOutcome] = field(default_factory=list, repr=False)
+
+    def to_dict(self, include_outcomes: bool = False) -> dict[str, Any]:
+        data = asdict(self)
+        if not include_outcomes:
+            data.pop("outcomes")
+        return data
+
+
+@contextlib.contextmanager
+def _patched_environ(overrides: dict[str, str]) -> Iterator[None]:
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update({key: str(value) for key, value in overrides.items()})
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class _StaticProviderConfig:
+    """Provider-config source for the facade; simulated providers have none."""
+
+    def get_provider_config(self, provider_id: int) -> dict[str, Any]:
+        return {}
+
+    def get_provider_auth(self, provider_id: int) -> dict[str, Any]:
+        return {}
+
+
+class CapacitySimulator:
+    """Replay a :class:`WorkloadTrace` against the real planner and scheduler."""
+
+    def __init__(self, config: SimulationConfig) -> None:
+        self._config = config
+
+    def run(self, trace: WorkloadTrace) -> SimulationReport:
+        """Run the whole trace to completion and return the report.
+
+        Creates its own virtual-time event loop; must not be called from a
+        running loop.
+        """
+        clock = VirtualClock(trace.start_epoch or DEFAULT_EPOCH_S)
+        loop = VirtualTimeEventLoop(clock)
+        random_state = random.getstate()
+        random.seed(self._config.seed)
+        wall_start = time.perf_counter()
+        try:
+            with patch_module_clocks(clock), _patched_environ(self._config.env):
+                report = loop.run_until_complete(self._simulate(trace, clock))
+        finally:
+            random.setstate(random_state)
+            loop.close()
+        report.wall_seconds = time.perf_counter() - wall_start
+        return report
+
+    async def _simulate(self, trace: WorkloadTrace, clock: VirtualClock) -> SimulationReport:
+        config = self._config
+        workers = {
+            spec.provider_id: SimulatedWorker(spec, config.model_profiles, config.latency) for spec in config.workers
+        }
+        registry = SimulatedRuntimeRegistry(workers)
+        queue_mgr = PriorityQueueManager()
+        facade = LogosNodeSchedulingDataFacade(queue_mgr, _StaticProviderConfig(), runtime_registry=registry)
+
+        model_names = sorted({model for spec in config.workers for model in spec.models})
+        model_ids = {name: index for index, name in enumerate(model_names, start=1)}
+        model_registry: dict[tuple[int, int], str] = {}
+        for spec in config.workers:
+            for model in spec.models:
+                facade.register_model(
+                    model_ids[model],
+                    spec.name,
+                    None,
+                    model,
+                    int(sum(spec.gpu_vram_mb)),
+                    provider_id=spec.provider_id,
+                )
+                model_registry[(model_ids[model], spec.provider_id)] = "logosnode"
+
+        scheduler = ClassificationCorrectingScheduler(
+            queue_manager=queue_mgr,
+            logosnode_facade=facade,
+            azure_facade=None,
+            model_registry=model_registry,
+            ettft_enabled=config.ettft_enabled,
+        )
+        demand = DemandTracker()
+        planner = CapacityPlanner(
+            logosnode_facade=facade,
+            logosnode_registry=registry,
+            demand_tracker=demand,
+            cycle_seconds=config.planner_cycle_seconds,
+            on_state_change=scheduler.reevaluate_model_queues,
+        )
+        for name, value in config.planner_overrides.items():
+            if not hasattr(planner, name):
+                raise AttributeError(f"CapacityPlanner has no attribute {name!r}")
+            setattr(planner, name, value)
+
+        async def _on_capacity_needed(model_name: str, provider_id: int | None = None) -> None:
+            planner.hint_capacity_needed(model_name, provider_id=provider_id)
+
+        scheduler._on_capacity_needed = _on_capacity_needed
+
+        await self._preload(workers, registry, planner)
+        await planner.start()
+
+        start = clock.now()
+        context = _ReplayContext(
+            clock=clock,
+            scheduler=scheduler,
+            demand=demand,
+            workers=workers,
+            model_ids=model_ids,
+            model_names={mid: name for name, mid in model_ids.items()},
+        )
+        tasks = []
+        for request in trace.requests:
+            delay = start + request.arrival_s - clock.now()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self._replay(context, request), name=f"sim-{request.request_id}"))
+        outcomes = list(await asyncio.gather(*tasks))
+        if config.tail_seconds > 0:
+            await asyncio.sleep(config.tail_seconds)
+        await planner.stop()
+        for worker in workers.values():
+            worker.touch()
+        return self._build_report(outcomes, workers, clock.now() - start)
+
+    async def _preload(
+        self,
+        workers: dict[int, SimulatedWorker],
+        registry: SimulatedRuntimeRegistry,
+        planner: CapacityPlanner,
+    ) -> None:
+        for provider_id, models in self._config.initial_lanes.items():
+            worker = workers[provider_id]
+            for model in models:
+                profile = worker.model_profiles.get(model, {})
+                lane_id = planner._planner_lane_id(model)
+                params = {
+                    "lane_id": lane_id,
+                    "model": model,
+                    "vllm": True,
+                    "vllm_config": {"tensor_parallel_size": int(profile.get("tensor_parallel_size") or 1)},
+                }
+                worker.handle_command("add_lane", params)
+                registry.update_desired_lane_add(provider_id, params)
+                lane = worker.lanes[lane_id]
+                lane.cancel_transition()
+                worker.mark_loaded(lane)
+            worker.counters["cold_loads"] = 0
+
+    async def _replay(self, ctx: "_ReplayContext", request: TraceRequest) -> RequestOutcome:
+        outcome = RequestOutcome(request_id=request.request_id, model=request.model, arrival_s=request.arrival_s)
+        arrived_at = ctx.clock.now()
+        priority_int = int(Priority.from_string(request.priority))
+
+        if request.model is not None:
+            if request.model not in ctx.model_ids:
+                outcome.status = "unknown_model"
+                return outcome
+            candidates = [(ctx.model_ids[request.model], 1.0, priority_int, 1)]
+        else:
+            candidates = [(mid, 1.0, priority_int, 1) for mid in ctx.model_names]
+        deployments = [
+            {"model_id": mid, "provider_id": pid, "type": "logosnode"}
+            for mid, _, _, _ in candidates
+            for pid, worker in ctx.workers.items()
+            if ctx.model_names[mid] in worker.spec.models
+        ]
+        # RequestPipeline records demand for the top candidate at classification time.
+        ctx.demand.record_request(ctx.model_names[candidates[0][0]])
+
+        try:
+            result = await ctx.scheduler.schedule(
+                SchedulingRequest(
+                    request_id=request.request_id,
+                    payload={},
+                    deployments=deployments,
+                    classified_models=candidates,
+                    timeout_s=self._config.queue_timeout_s,
+                )
+            )
+        except QueueTimeoutError:
+            outcome.status = "queue_timeout"
+            return outcome
+        if result is None:
+            outcome.status = "unavailable"
+            return outcome
+
+        model_name = ctx.model_names[result.model_id]
+        outcome.served_model = model_name
+        outcome.provider_id = result.provider_id
+        outcome.was_queued = result.was_queued
+        outcome.cold_start = (result.ettft_tier or "") in _COLD_TIERS
+        try:
+            worker = ctx.workers[result.provider_id]
+            deadline = ctx.clock.now() + self._config.context_timeout_s
+            lane = worker.ready_lane(model_name)
+            while lane is None and ctx.clock.now() < deadline:
+                await asyncio.sleep(_LANE_POLL_INTERVAL_S)
+                lane = worker.ready_lane(model_name)
+            if lane is None:
+                outcome.status = "context_timeout"
+                return outcome
+            admitted_at = ctx.clock.now()
+            ttft_s, e2e_s = await lane.execute(request.prompt_tokens, request.output_tokens)
+            outcome.ttft_s = admitted_at - arrived_at + ttft_s
+            outcome.ttlt_s = admitted_at - arrived_at + e2e_s
+            outcome.status = "success"
+            return outcome
+        finally:
+            ctx.scheduler.release(result.model_id, result.provider_id, "logosnode", request.request_id)
+
+    @staticmethod
+    def _build_report(
+        outcomes: list[RequestOutcome],
+        workers: dict[int, SimulatedWorker],
+        simulated_seconds: float,
+    ) -> SimulationReport:
+        status_counts: dict[str, int] = {}
+        for outcome in outcomes:
+            status_counts[outcome.status] = status_counts.get(outcome.status, 0) + 1
+        served = [o for o in outcomes if o.status == "success"]
+
+        per_model: dict[str, dict[str, Any]] = {}
+        for model in sorted({o.served_model or o.model or "" for o in outcomes}):
+            rows = [o for o in served if o.served_model == model]
+            per_model[model] = {
+                "served": len(rows),
+                "cold_start_requests": sum(1 for o in rows if o.cold_start),
+                "ttft_s": summarize_latencies([o.ttft_s for o in rows]),
+                "ttlt_s": summarize_latencies([o.ttlt_s for o in rows]),
+            }
+
+        def _total(counter: str) -> int:
+            return sum(worker.counters[counter] for worker in workers.values())
+
+        return SimulationReport(
+            requests=len(outcomes),
+            status_counts=status_counts,
+            ttft_s=summarize_latencies([o.ttft_s for o in served]),
+            ttlt_s=summarize_latencies([o.ttlt_s for o in served]),
+            cold_start_requests=sum(1 for o in served if o.cold_start),
+            cold_loads=_total("cold_loads"),
+            wakes=_total("wakes"),
+            sleeps=_total("sleeps"),
+            stops=_total("stops"),
+            rejected_loads=_total("rejected_loads"),
+            gpu_seconds_allocated=round(sum(w.gpu_seconds_allocated for w in workers.values()), 3),
+            gpu_seconds_busy=round(sum(w.gpu_seconds_busy for w in workers.values()), 3),
+            simulated_seconds=round(simulated_seconds, 3),
+            wall_seconds=0.0,
+            per_model=per_model,
+            outcomes=outcomes,
+        )
+
+
+@dataclass
+class _ReplayContext:
+    clock: VirtualClock
+    scheduler: ClassificationCorrectingScheduler
+    demand: DemandTracker
+    workers: dict[int, SimulatedWorker]
+    model_ids: dict[str, int]
+    model_names: dict[int, str]
@@ -0,0 +1,179 @@
+"""Workload trace loading for the capacity simulator.
+
+Two CSV layouts are understood:
+
+* Benchmark workloads (``tests/performance/workloads/**``), replayed live by
+  ``run_api_workload.py``: ``request_id,arrival_offset,mode,priority,body_json``
+  with millisecond offsets and the chat-completions body inline.
+* Production ``log_entry`` exports as read by
+  ``benchmarks/analyze_workload.py``: one row per request with
+  ``timestamp_request``, ``time_at_first_token``, ``timestamp_response`` and
+  ``model_id`` (resolved through an accompanying ``models.csv``).
+
+Both are normalised to :class:`TraceRequest` rows ordered by arrival.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import math
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_TOKENS = 256
+# Rough chars-per-token ratio used to size prompts from raw message text.
+CHARS_PER_TOKEN = 4.0
+# Decode speed assumed when inferring output length from a logged
+# first-token → response interval (log exports carry no token counts).
+LOG_DECODE_SECONDS_PER_TOKEN = 0.025
+
+
+@dataclass(frozen=True)
+class TraceRequest:
+    """One replayed request."""
+
+    request_id: str
+    arrival_s: float  # seconds after trace start
+    model: Optional[str]  # None = let the simulator offer every model
+    priority: str = "mid"  # parsed with Priority.from_string
+    mode: str = "interactive"
+    prompt_tokens: int = 0
+    output_tokens: int = DEFAULT_OUTPUT_TOKENS
+
+
+@dataclass
+class WorkloadTrace:
+    """An ordered request trace plus the epoch it started at (if known)."""
+
+    requests: list[TraceRequest]
+    start_epoch: Optional[float] = None
+    source: str = ""
+
+    @property
+    def duration_s(self) -> float:
+        return self.requests[-1].arrival_s if self.requests else 0.0
+
+    def models(self) -> list[str]:
+        return sorted({r.model for r in self.requests if r.model})
+
+
+def _estimate_prompt_tokens(body: dict) -> int:
+    chars = 0
+    for message in body.get("messages") or []:
+        if not isinstance(message, dict):
+            continue
+        content = message.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    chars += len(part["text"])
+    return int(math.ceil(chars / CHARS_PER_TOKEN))
+
+
+def _parse_timestamp(raw: Optional[str]) -> Optional[float]:
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw.strip().replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def load_workload_csv(path: str | Path) -> WorkloadTrace:
+    """Load a ``request_id,arrival_offset,mode,priority,body_json`` workload."""
+    path = Path(path)
+    requests: list[TraceRequest] = []
+    with path.open(newline="", encoding="utf-8") as handle:
+        for index, row in enumerate(csv.DictReader(handle)):
+            try:
+                body = json.loads(row.get("body_json") or "{}")
+            except json.JSONDecodeError:
+                logger.warning("Skipping row %d of %s: invalid body_json", index + 1, path)
+                continue
+            model = body.get("model")
+            requests.append(
+                TraceRequest(
+                    request_id=row.get("request_id") or f"req-{index + 1}",
+                    arrival_s=float(row.get("arrival_offset") or 0) / 1000.0,
+                    model=str(model) if model else None,
+                    priority=(row.get("priority") or "mid").strip() or "mid",
+                    mode=(row.get("mode") or "interactive").strip() or "interactive",
+                    prompt_tokens=_estimate_prompt_tokens(body),
+                    output_tokens=int(body.get("max_tokens") or DEFAULT_OUTPUT_TOKENS),
+                )
+            )
+    requests.sort(key=lambda r: r.arrival_s)
+    return WorkloadTrace(requests=requests, source=str(path))
+
+
+def _load_model_names(models_csv: Path) -> dict[str, str]:
+    with models_csv.open(newline="", encoding="utf-8") as handle:
+        return {str(row["id"]): row["name"] for row in csv.DictReader(handle) if row.get("id") and row.get("name")}
+
+
+def load_log_entry_csv(path: str | Path, models_csv: str | Path | None = None) -> WorkloadTrace:
+    """Load a production ``log_entry`` export.
+
+    Only successful requests are replayed, matching ``analyze_workload.py``.
+    Output length is inferred from the logged decode interval at
+    ``LOG_DECODE_SECONDS_PER_TOKEN``; requests without a first-token
+    timestamp fall back to ``DEFAULT_OUTPUT_TOKENS``.
+    """
+    path = Path(path)
+    if models_csv is None and (path.parent / "models.csv").exists():
+        models_csv = path.parent / "models.csv"
+    model_names = _load_model_names(Path(models_csv)) if models_csv else {}
+
+    rows: list[tuple[float, TraceRequest]] = []
+    with path.open(newline="", encoding="utf-8") as handle:
+        for index, row in enumerate(csv.DictReader(handle)):
+            status = (row.get("result_status") or "success").strip().lower()
+            if status != "success":
+                continue
+            requested_at = _parse_timestamp(row.get("timestamp_request"))
+            if requested_at is None:
+                continue
+            model = row.get("model_name") or model_names.get(str(row.get("model_id") or "").strip())
+            first_token_at = _parse_timestamp(row.get("time_at_first_token"))
+            responded_at = _parse_timestamp(row.get("timestamp_response"))
+            output_tokens = DEFAULT_OUTPUT_TOKENS
+            if first_token_at is not None and responded_at is not None and responded_at > first_token_at:
+                output_tokens = max(1, int(round((responded_at - first_token_at) / LOG_DECODE_SECONDS_PER_TOKEN)))
+            rows.append(
+                (
+                    requested_at,
+                    TraceRequest(
+                        request_id=row.get("request_id") or f"log-{row.get('id') or index + 1}",
+                        arrival_s=0.0,
+                        model=model or None,
+                        priority=(row.get("priority") or "mid").strip() or "mid",
+                        output_tokens=output_tokens,
+                    ),
+                )
+            )
+    if not rows:
+        return WorkloadTrace(requests=[], source=str(path))
+    rows.sort(key=lambda item: item[0])
+    start = rows[0][0]
+    requests = [replace(req, arrival_s=ts - start) for ts, req in rows]
+    return WorkloadTrace(requests=requests, start_epoch=start, source=str(path))
+
+
+def load_trace(path: str | Path, models_csv: str | Path | None = None) -> WorkloadTrace:
+    """Load either trace layout, detected from the CSV header."""
+    path = Path(path)
+    with path.open(newline="", encoding="utf-8") as handle:
+        header = next(csv.reader(handle), [])
+    if "arrival_offset" in header:
+        return load_workload_csv(path)
+    if "timestamp_request" in header:
+        return load_log_entry_csv(path, models_csv=models_csv)
+    raise ValueError(f"Unrecognised trace format in {path}: header={header}")
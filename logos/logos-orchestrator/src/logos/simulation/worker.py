@@ -0,0 +1,540 @@
+"""Fake logosnode workers and runtime registry for the capacity simulator.
+
+A :class:`SimulatedWorker` stands in for one logos-workernode: it owns a set
+of GPUs, applies the lane commands the capacity planner sends
+(``add_lane``/``apply_lanes``/``delete_lane``/``sleep_lane``/``wake_lane``/
+``reconfigure_lane``) with modelled latencies, and serves requests on its
+lanes with a simple prefill + batched-decode model whose concurrency is
+bounded by each lane's KV budget.
+
+:class:`SimulatedRuntimeRegistry` exposes the workers through the same
+surface as :class:`~logos.logosnode_registry.LogosNodeRuntimeRegistry`, so the
+real facade, scheduler and planner run against it unmodified. Snapshots use
+the worker's runtime status layout (``lanes``/``devices``/``model_profiles``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+from logos.logosnode_registry import LogosNodeCommandError, LogosNodeOfflineError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PROFILES_PATH = Path(__file__).resolve().parents[4] / "logos-workernode" / "data" / "model_profiles.yml"
+
+_READY_STATES = frozenset({"loaded", "running"})
+_BYTES_SUFFIX = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+@dataclass
+class LatencyModel:
+    """Timing and sizing assumptions for simulated workers.
+
+    Defaults are in line with the ETTFT estimator's overheads
+    (``OVERHEAD_COLD_S``/``OVERHEAD_SLEEPING_S``) for mid-sized AWQ models.
+    """
+
+    command_rtt_s: float = 0.05  # orchestrator → worker → orchestrator
+    cold_load_base_s: float = 30.0  # process spawn, CUDA init, graph capture
+    load_bandwidth_mb_s: float = 1500.0  # weight load throughput on cold load / L2 wake
+    sleep_s: float = 1.5
+    wake_l1_s: float = 2.5
+    stop_s: float = 3.0
+    prefill_tokens_per_s: float = 4000.0
+    decode_s_per_token: float = 0.02
+    batch_slowdown: float = 0.04  # per additional running sequence
+    kv_mb_per_sequence: float = 512.0  # KV footprint of one in-flight sequence
+
+
+@dataclass
+class WorkerSpec:
+    """Static description of one simulated worker."""
+
+    provider_id: int
+    name: str
+    gpu_vram_mb: list[float]
+    models: list[str]
+    gpu_performance_score: int = 100
+    sleep_mode_disabled: bool = False
+
+
+def load_model_profiles(path: str | Path = DEFAULT_MODEL_PROFILES_PATH) -> dict[str, dict[str, Any]]:
+    """Read a worker ``model_profiles.yml`` into ``{model_name: raw_profile}``."""
+    with Path(path).open(encoding="utf-8") as handle:
+        data = yaml.safe_load(handle) or {}
+    profiles = data.get("model_profiles", data)
+    return {str(name): dict(profile or {}) for name, profile in profiles.items()}
+
+
+def _parse_bytes_mb(raw: Any) -> Optional[float]:
+    """Parse a ``kv_cache_memory_bytes`` value (``"4G"``, ``"512M"``, int) into MB."""
+    if raw is None:
+        return None
+    if isinstance(raw, (int, float)):
+        return float(raw) / (1024**2)
+    match = re.fullmatch(r"\s*([0-9.]+)\s*([KMGT]?)i?B?\s*", str(raw).upper())
+    if not match:
+        return None
+    return float(match.group(1)) * _BYTES_SUFFIX[match.group(2)] / (1024**2)
+
+
+class SimulatedLane:
+    """One model lane on a simulated worker."""
+
+    def __init__(
+        self,
+        worker: "SimulatedWorker",
+        lane_config: dict[str, Any],
+        gpu_devices: tuple[int, ...],
+        weights_mb: float,
+        kv_mb: float,
+        residual_mb: float,
+    ) -> None:
+        self.worker = worker
+        self.lane_id = str(lane_config["lane_id"])
+        self.model = str(lane_config["model"])
+        self.lane_config = dict(lane_config)
+        self.gpu_devices = gpu_devices
+        self.weights_mb = weights_mb
+        self.kv_mb = kv_mb
+        self.residual_mb = residual_mb
+        self.num_parallel = max(1, int(kv_mb // worker.latency.kv_mb_per_sequence))
+        self.runtime_state = "starting"
+        self.sleep_state = "awake"
+        self.sleep_level = 0
+        self.running = 0
+        self._waiting: deque[asyncio.Future] = deque()
+        self._transition: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def footprint_mb(self) -> float:
+        return self.weights_mb + self.kv_mb
+
+    @property
+    def resident_mb(self) -> float:
+        """VRAM the lane currently holds across all of its GPUs."""
+        if self.runtime_state == "sleeping":
+            return self.residual_mb
+        return self.footprint_mb
+
+    @property
+    def holds_gpus(self) -> bool:
+        return self.runtime_state in ("starting", "loaded", "running")
+
+    @property
+    def is_ready(self) -> bool:
+        return self.runtime_state in _READY_STATES
+
+    def schedule_transition(self, delay_s: float, callback) -> None:
+        if self._transition is not None:
+            self._transition.cancel()
+        self._transition = asyncio.get_running_loop().call_later(delay_s, callback)
+
+    def cancel_transition(self) -> None:
+        if self._transition is not None:
+            self._transition.cancel()
+            self._transition = None
+
+    def _refresh_running_state(self) -> None:
+        if self.runtime_state in _READY_STATES:
+            self.runtime_state = "running" if self.running or self._waiting else "loaded"
+
+    async def execute(self, prompt_tokens: int, output_tokens: int) -> tuple[float, float]:
+        """Serve one request; returns ``(ttft_s, e2e_s)`` measured from admission.
+
+        Sequences beyond ``num_parallel`` wait in the engine queue (reported
+        as ``queue_waiting``). Per-token decode time grows with the batch size
+        at admission, which is how KV pressure shows up in TTLT.
+        """
+        loop = asyncio.get_running_loop()
+        submitted = loop.time()
+        self.worker.touch()
+        if self.running >= self.num_parallel:
+            waiter = loop.create_future()
+            self._waiting.append(waiter)
+            self._refresh_running_state()
+            try:
+                await waiter  # the finishing sequence hands over its slot
+            except asyncio.CancelledError:
+                if waiter in self._waiting:
+                    self._waiting.remove(waiter)
+                raise
+        else:
+            self.running += 1
+        self._refresh_running_state()
+        self.worker.touch()
+        latency = self.worker.latency
+        try:
+            prefill_s = prompt_tokens / latency.prefill_tokens_per_s if latency.prefill_tokens_per_s > 0 else 0.0
+            per_token_s = latency.decode_s_per_token * (1.0 + latency.batch_slowdown * (self.running - 1))
+            await asyncio.sleep(prefill_s + per_token_s)
+            ttft_s = loop.time() - submitted
+            await asyncio.sleep(per_token_s * max(output_tokens - 1, 0))
+            return ttft_s, loop.time() - submitted
+        finally:
+            self.worker.touch()
+            while self._waiting and self._waiting[0].done():
+                self._waiting.popleft()
+            if self._waiting:
+                self._waiting.popleft().set_result(None)
+            else:
+                self.running -= 1
+            self._refresh_running_state()
+
+    def to_runtime_status(self) -> dict[str, Any]:
+        loaded = self.runtime_state in ("loaded", "running", "sleeping")
+        return {
+            "lane_id": self.lane_id,
+            "model": self.model,
+            "vllm": True,
+            "runtime_state": self.runtime_state,
+            "sleep_state": self.sleep_state,
+            "active_requests": self.running + len(self._waiting),
+            "num_parallel": self.num_parallel,
+            "effective_vram_mb": self.resident_mb,
+            "gpu_devices": ",".join(str(d) for d in self.gpu_devices),
+            "backend_metrics": {
+                "queue_waiting": float(len(self._waiting)),
+                "requests_running": float(self.running),
+                "gpu_cache_usage_percent": 100.0 * self.running / self.num_parallel,
+            },
+            "lane_config": {
+                **self.lane_config,
+                "gpu_devices": ",".join(str(d) for d in self.gpu_devices),
+            },
+            "loaded_models": [{"name": self.model}] if loaded else [],
+        }
+
+
+class SimulatedWorker:
+    """A fake logosnode worker on the simulation's virtual clock."""
+
+    def __init__(
+        self,
+        spec: WorkerSpec,
+        model_profiles: dict[str, dict[str, Any]],
+        latency: LatencyModel,
+    ) -> None:
+        self.spec = spec
+        self.provider_id = spec.provider_id
+        self.latency = latency
+        self.model_profiles = {name: model_profiles[name] for name in spec.models if name in model_profiles}
+        self.lanes: dict[str, SimulatedLane] = {}
+        self.version = 0
+        self.counters = {"cold_loads": 0, "wakes": 0, "sleeps": 0, "stops": 0, "rejected_loads": 0}
+        self.gpu_seconds_allocated = 0.0
+        self.gpu_seconds_busy = 0.0
+        self._accounted_at: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def touch(self) -> None:
+        """Settle GPU-second counters up to now and invalidate snapshots.
+
+        Must run *before* any lane state changes so the elapsed interval is
+        charged to the state that was actually in effect.
+        """
+        now = asyncio.get_running_loop().time()
+        if self._accounted_at is not None:
+            elapsed = now - self._accounted_at
+            for lane in self.lanes.values():
+                if lane.holds_gpus:
+                    self.gpu_seconds_allocated += elapsed * len(lane.gpu_devices)
+                    if lane.running:
+                        self.gpu_seconds_busy += elapsed * len(lane.gpu_devices)
+        self._accounted_at = now
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # Runtime status
+    # ------------------------------------------------------------------
+
+    def _gpu_used_mb(self) -> list[float]:
+        used = [0.0] * len(self.spec.gpu_vram_mb)
+        for lane in self.lanes.values():
+            share = lane.resident_mb / len(lane.gpu_devices)
+            for device in lane.gpu_devices:
+                used[device] += share
+        return used
+
+    def runtime_status(self) -> dict[str, Any]:
+        used = self._gpu_used_mb()
+        devices = [
+            {
+                "device_id": str(index),
+                "extra": {"index": index},
+                "memory_total_mb": total,
+                "memory_used_mb": used[index],
+                "memory_free_mb": max(total - used[index], 0.0),
+            }
+            for index, total in enumerate(self.spec.gpu_vram_mb)
+        ]
+        return {
+            "lanes": [lane.to_runtime_status() for lane in self.lanes.values()],
+            "devices": {
+                "nvidia_smi_available": True,
+                "total_memory_mb": sum(self.spec.gpu_vram_mb),
+                "free_memory_mb": sum(device["memory_free_mb"] for device in devices),
+                "devices": devices,
+            },
+            "model_profiles": self.model_profiles,
+            "gpu_performance_score": self.spec.gpu_performance_score,
+            "sleep_mode_disabled": self.spec.sleep_mode_disabled,
+        }
+
+    def ready_lane(self, model_name: str) -> Optional[SimulatedLane]:
+        """Least-loaded ready lane serving *model_name*, if any."""
+        ready = [lane for lane in self.lanes.values() if lane.model == model_name and lane.is_ready]
+        return min(ready, key=lambda lane: lane.running, default=None)
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def handle_command(self, action: str, params: dict[str, Any]) -> dict[str, Any]:
+        handler = getattr(self, f"_cmd_{action}", None)
+        if handler is None:
+            raise LogosNodeCommandError(f"unsupported action '{action}'")
+        self.touch()
+        return handler(params)
+
+    def _lane(self, params: dict[str, Any]) -> SimulatedLane:
+        lane = self.lanes.get(str(params.get("lane_id") or ""))
+        if lane is None:
+            raise LogosNodeCommandError(f"lane '{params.get('lane_id')}' not found")
+        return lane
+
+    def _load_seconds(self, weights_mb: float) -> float:
+        return self.latency.cold_load_base_s + weights_mb / self.latency.load_bandwidth_mb_s
+
+    def _cmd_add_lane(self, params: dict[str, Any]) -> dict[str, Any]:
+        lane_id = str(params.get("lane_id") or "")
+        if lane_id in self.lanes:
+            raise LogosNodeCommandError(f"lane '{lane_id}' already exists")
+        model = str(params.get("model") or "")
+        profile = self.model_profiles.get(model)
+        if profile is None:
+            self.counters["rejected_loads"] += 1
+            raise LogosNodeCommandError(f"model '{model}' is not configured on this worker")
+
+        vllm_config = params.get("vllm_config") or {}
+        tp = max(1, int(vllm_config.get("tensor_parallel_size") or 1))
+        profile_kv = float(profile.get("kv_budget_mb") or 0.0)
+        kv_mb = _parse_bytes_mb(vllm_config.get("kv_cache_memory_bytes")) or profile_kv
+        measured = [float(profile[k]) for k in ("base_residency_mb", "loaded_vram_mb") if profile.get(k)]
+        # Calibrated footprints include the profile's own KV budget.
+        weights_mb = max(min(measured) - profile_kv, 0.0) if measured else 0.0
+        residual_mb = float(profile.get("sleeping_residual_mb") or 0.0)
+
+        gpu_devices = self._place(tp, (weights_mb + kv_mb) / tp, params.get("gpu_devices"))
+        if gpu_devices is None:
+            self.counters["rejected_loads"] += 1
+            raise LogosNodeCommandError(f"no feasible GPU subset for {model} (tp={tp})")
+
+        lane = SimulatedLane(self, params, gpu_devices, weights_mb, kv_mb, residual_mb)
+        self.lanes[lane_id] = lane
+        self.counters["cold_loads"] += 1
+        lane.schedule_transition(self._load_seconds(weights_mb), lambda: self.mark_loaded(lane))
+        return {"ok": True, "lane_id": lane_id}
+
+    def _place(self, tp: int, per_gpu_mb: float, requested: Any) -> Optional[tuple[int, ...]]:
+        free = [total - used for total, used in zip(self.spec.gpu_vram_mb, self._gpu_used_mb())]
+        if requested:
+            devices = tuple(int(part) for part in str(requested).split(",") if part.strip().isdigit())
+        else:
+            ranked = sorted(range(len(free)), key=lambda index: (-free[index], index))
+            devices = tuple(sorted(ranked[:tp]))
+        if len(devices) != tp or any(d >= len(free) or free[d] < per_gpu_mb for d in devices):
+            return None
+        return devices
+
+    def mark_loaded(self, lane: SimulatedLane) -> None:
+        """Complete a load/wake: the lane is awake and routable."""
+        if self.lanes.get(lane.lane_id) is not lane:
+            return
+        self.touch()
+        lane.runtime_state = "loaded"
+        lane.sleep_state = "awake"
+        lane._refresh_running_state()
+
+    def _cmd_delete_lane(self, params: dict[str, Any]) -> dict[str, Any]:
+        lane = self._lane(params)
+        lane.cancel_transition()
+        lane.runtime_state = "stopped"
+        self.counters["stops"] += 1
+        lane.schedule_transition(self.latency.stop_s, lambda: self._finish_stop(lane))
+        return {"ok": True}
+
+    def _finish_stop(self, lane: SimulatedLane) -> None:
+        if self.lanes.get(lane.lane_id) is lane:
+            self.touch()
+            del self.lanes[lane.lane_id]
+
+    def _cmd_apply_lanes(self, params: dict[str, Any]) -> dict[str, Any]:
+        desired = {str(lc.get("lane_id") or lc.get("model")): lc for lc in params.get("lanes") or []}
+        for lane_id in [lid for lid in self.lanes if lid not in desired]:
+            self._cmd_delete_lane({"lane_id": lane_id})
+        for lane_id, lane_config in desired.items():
+            if lane_id not in self.lanes:
+                self._cmd_add_lane({**lane_config, "lane_id": lane_id})
+        return {"ok": True, "rolled_back": False}
+
+    def _cmd_sleep_lane(self, params: dict[str, Any]) -> dict[str, Any]:
+        lane = self._lane(params)
+        if self.spec.sleep_mode_disabled:
+            raise LogosNodeCommandError("sleep mode is disabled on this worker")
+        level = int(params.get("level") or 1)
+        self.counters["sleeps"] += 1
+
+        def _finish() -> None:
+            self.touch()
+            lane.runtime_state = "sleeping"
+            lane.sleep_state = "sleeping"
+            lane.sleep_level = level
+
+        lane.schedule_transition(self.latency.sleep_s, _finish)
+        return {"ok": True}
+
+    def _cmd_wake_lane(self, params: dict[str, Any]) -> dict[str, Any]:
+        lane = self._lane(params)
+        if lane.runtime_state != "sleeping":
+            return {"ok": True, "already_awake": True}
+        self.counters["wakes"] += 1
+        # An L2 sleep discarded the weights; waking reloads them from host/disk.
+        delay = self.latency.wake_l1_s
+        if lane.sleep_level >= 2:
+            delay += lane.weights_mb / self.latency.load_bandwidth_mb_s
+        lane.runtime_state = "starting"
+        lane.schedule_transition(delay, lambda: self.mark_loaded(lane))
+        return {"ok": True}
+
+    def _cmd_reconfigure_lane(self, params: dict[str, Any]) -> dict[str, Any]:
+        lane = self._lane(params)
+        kv_mb = _parse_bytes_mb((params.get("vllm_config") or {}).get("kv_cache_memory_bytes"))
+        if kv_mb:
+            lane.kv_mb = kv_mb
+            lane.num_parallel = max(1, int(kv_mb // self.latency.kv_mb_per_sequence))
+        lane.lane_config.update({k: v for k, v in params.items() if k != "lane_id"})
+        lane.runtime_state = "starting"
+        lane.schedule_transition(self._load_seconds(lane.weights_mb), lambda: self.mark_loaded(lane))
+        return {"ok": True}
+
+
+class SimulatedRuntimeRegistry:
+    """In-process stand-in for ``LogosNodeRuntimeRegistry`` backed by fake workers.
+
+    Every worker is online, has sent its first status and is never
+    calibrating. Snapshots are rebuilt lazily whenever a worker's state
+    version changes, so the facade's frequent ``peek_runtime_snapshot`` calls
+    stay cheap.
+    """
+
+    def __init__(self, workers: dict[int, SimulatedWorker]) -> None:
+        self._workers = workers
+        self._desired_lanes: dict[int, dict[str, dict[str, Any]]] = {pid: {} for pid in workers}
+        self._cold_marked_lanes: set[tuple[int, str]] = set()
+        self._snapshots: dict[int, tuple[int, dict[str, Any]]] = {}
+
+    def peek_runtime_snapshot(self, provider_id: int) -> dict[str, Any] | None:
+        worker = self._workers.get(int(provider_id))
+        if worker is None:
+            return None
+        cached = self._snapshots.get(worker.provider_id)
+        if cached is not None and cached[0] == worker.version:
+            return cached[1]
+        snapshot = {
+            "provider_id": worker.provider_id,
+            "worker_id": worker.spec.name,
+            "capabilities_models": sorted(worker.model_profiles),
+            "configured_models": sorted(worker.spec.models),
+            "first_status_received": True,
+            "runtime": worker.runtime_status(),
+            "events": [],
+            "max_lanes": None,
+        }
+        self._snapshots[worker.provider_id] = (worker.version, snapshot)
+        return snapshot
+
+    def peek_recent_samples(self, provider_id: int, *, after_snapshot_id: int = 0) -> list[dict[str, Any]]:
+        return []
+
+    def has_received_first_status(self, provider_id: int) -> bool:
+        return int(provider_id) in self._workers
+
+    def is_provider_online(self, provider_id: int, stale_after_seconds: int = 30) -> bool:
+        return int(provider_id) in self._workers
+
+    def is_calibrating(self, provider_id: int) -> bool:
+        return False
+
+    async def send_command(
+        self,
+        provider_id: int,
+        action: str,
+        params: dict[str, Any] | None = None,
+        timeout_seconds: int = 20,
+        stale_after_seconds: int = 30,
+    ) -> dict[str, Any]:
+        worker = self._workers.get(int(provider_id))
+        if worker is None:
+            raise LogosNodeOfflineError("No active logosnode worker session")
+        await asyncio.sleep(worker.latency.command_rtt_s)
+        return worker.handle_command(action, dict(params or {}))
+
+    async def select_lane_for_model(
+        self,
+        provider_id: int,
+        model_name: str,
+        stale_after_seconds: int = 30,
+    ) -> dict[str, Any] | None:
+        snapshot = self.peek_runtime_snapshot(provider_id)
+        if snapshot is None:
+            raise LogosNodeOfflineError("No active logosnode worker session")
+        for lane in snapshot["runtime"]["lanes"]:
+            if lane.get("model") != model_name or lane.get("runtime_state") not in {
+                "loaded",
+                "running",
+                "cold",
+                "starting",
+            }:
+                continue
+            if self.is_lane_cold_marked(provider_id, str(lane.get("lane_id") or "")):
+                continue
+            return lane
+        return None
+
+    def get_desired_lane_set(self, provider_id: int) -> list[dict[str, Any]]:
+        return list(self._desired_lanes.get(int(provider_id), {}).values())
+
+    def update_desired_lanes(self, provider_id: int, lane_configs: list[dict[str, Any]]) -> None:
+        self._desired_lanes[int(provider_id)] = {
+            str(lc.get("lane_id") or lc.get("model", "")): dict(lc) for lc in lane_configs if isinstance(lc, dict)
+        }
+
+    def update_desired_lane_add(self, provider_id: int, lane_config: dict[str, Any]) -> None:
+        lane_id = str(lane_config.get("lane_id") or lane_config.get("model", ""))
+        if lane_id:
+            self._desired_lanes.setdefault(int(provider_id), {})[lane_id] = dict(lane_config)
+
+    def update_desired_lane_remove(self, provider_id: int, lane_id: str) -> None:
+        self._desired_lanes.get(int(provider_id), {}).pop(lane_id, None)
+
+    def mark_lane_cold(self, provider_id: int, lane_id: str) -> None:
+        self._cold_marked_lanes.add((int(provider_id), lane_id))
+
+    def unmark_lane_cold(self, provider_id: int, lane_id: str) -> None:
+        self._cold_marked_lanes.discard((int(provider_id), lane_id))
+
+    def is_lane_cold_marked(self, provider_id: int, lane_id: str) -> bool:
+        return (int(provider_id), lane_id) in self._cold_marked_lanes
@@ -0,0 +1,144 @@
+"""
+Benchmark the auth hot path (key lookup, team defaults, limit resolution) with
+and without the in-process auth cache.
+
+Each simulated request does what ``auth_parse_log`` does before logging:
+``authenticate_api_key``, ``resolve_limits`` and the per-request budget-usage
+read, all against the real ``DBManager`` queries running on SQLite. Postgres'
+network round-trip is emulated with ``--db-latency-ms`` of blocking sleep per
+statement, which is exactly what stalls the event loop in production.
+
+USAGE:
+
+    poetry run python tests/performance/bench_auth_cache.py --requests 5000 --concurrency 64 --db-latency-ms 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from logos import auth, auth_cache
+from logos.auth_cache import AuthCache, AuthCacheConfig
+from logos.dbutils.dbmanager import DBManager
+
+_SCHEMA = [
+    """CREATE TABLE users (id INTEGER PRIMARY KEY, role TEXT)""",
+    """CREATE TABLE teams (
+        id INTEGER PRIMARY KEY, name TEXT,
+        default_cloud_rpm_limit INTEGER, default_cloud_tpm_limit INTEGER,
+        default_local_rpm_limit INTEGER, default_local_tpm_limit INTEGER,
+        default_monthly_budget_micro_cents INTEGER, team_monthly_budget_micro_cents INTEGER)""",
+    """CREATE TABLE api_keys (
+        id INTEGER PRIMARY KEY, key_value TEXT UNIQUE, name TEXT, key_type TEXT,
+        team_id INTEGER, user_id INTEGER, environment TEXT, log TEXT, settings TEXT,
+        default_priority INTEGER, is_active BOOLEAN, use_custom_permissions BOOLEAN)""",
+    """CREATE TABLE budget_usage (api_key_id INTEGER, month TEXT, cost_micro_cents INTEGER)""",
+]
+
+
+class _LatencySession:
+    """Session proxy that blocks for a fixed time per statement (a network round-trip)."""
+
+    def __init__(self, session, latency_s: float):
+        self._session = session
+        self._latency_s = latency_s
+
+    def execute(self, *args, **kwargs):
+        if self._latency_s:
+            time.sleep(self._latency_s)
+        return self._session.execute(*args, **kwargs)
+
+    def close(self):
+        self._session.close()
+
+
+def _make_db_factory(keys: int, teams: int, latency_s: float):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        for ddl in _SCHEMA:
+            conn.execute(text(ddl))
+        for team_id in range(1, teams + 1):
+            conn.execute(
+                text("INSERT INTO teams VALUES (:id, :name, 600, 100000, 1200, 200000, 5000000, 50000000)"),
+                {"id": team_id, "name": f"team-{team_id}"},
+            )
+        for key_id in range(1, keys + 1):
+            conn.execute(text("INSERT INTO users VALUES (:id, 'app_developer')"), {"id": key_id})
+            conn.execute(
+                text(
+                    "INSERT INTO api_keys VALUES "
+                    "(:id, :kv, :name, 'user', :team, :id, 'prod', 'BILLING', NULL, 1, 1, 0)"
+                ),
+                {"id": key_id, "kv": f"lg-bench-{key_id}", "name": f"key-{key_id}", "team": key_id % teams + 1},
+            )
+    session_factory = sessionmaker(bind=engine)
+
+    class _BenchDBManager:
+        get_api_key_by_value = DBManager.get_api_key_by_value
+        get_team = DBManager.get_team
+        get_api_key_budget_limit = DBManager.get_api_key_budget_limit
+        get_api_key_budget_usage = DBManager.get_api_key_budget_usage
+
+        def __enter__(self):
+            self.session = _LatencySession(session_factory(), latency_s)
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            self.session.close()
+            return False
+
+    return _BenchDBManager
+
+
+async def _handle(key_value: str, db_factory) -> None:
+    ctx = auth.authenticate_api_key({"authorization": f"Bearer {key_value}"})
+    with db_factory() as db:
+        limits = auth.resolve_limits(db, ctx)
+        if limits.budget_limit is not None:
+            db.get_api_key_budget_usage(ctx.api_key_id, "2026-01-01")
+    # Yield like a real handler awaiting the request body would.
+    await asyncio.sleep(0)
+
+
+async def _run(requests: int, concurrency: int, keys: int, db_factory) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(i: int) -> None:
+        async with semaphore:
+            await _handle(f"lg-bench-{i % keys + 1}", db_factory)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(requests)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--keys", type=int, default=200, help="distinct API keys in the workload")
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--db-latency-ms", type=float, default=0.5, help="emulated round-trip per statement")
+    args = parser.parse_args()
+
+    db_factory = _make_db_factory(args.keys, args.teams, args.db_latency_ms / 1000.0)
+    auth.DBManager = db_factory
+
+    print(f"requests={args.requests} concurrency={args.concurrency} keys={args.keys} db_latency={args.db_latency_ms}ms")
+    results = {}
+    for label, ttl_s in (("uncached", 0.0), ("cached", 30.0)):
+        auth_cache._auth_cache = AuthCache(AuthCacheConfig(ttl_s=ttl_s))
+        elapsed = asyncio.run(_run(args.requests, args.concurrency, args.keys, db_factory))
+        results[label] = args.requests / elapsed
+        print(f"{label:<10}{results[label]:>10.0f} req/s  ({elapsed / args.requests * 1e6:.1f} us/request)")
+    print(f"speedup   {results['cached'] / results['uncached']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
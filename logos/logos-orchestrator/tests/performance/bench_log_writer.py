@@ -0,0 +1,166 @@
+"""
+Benchmark per-request log writes: synchronous ``DBManager`` sessions versus the
+batched ``RequestLogWriter``.
+
+Each simulated request writes what a streamed completion writes after
+``log_usage``: the lifecycle metrics, time-to-first-token and the response
+payload with its ``usage_tokens`` rows. Writes run against the real
+``DBManager`` SQL on SQLite; Postgres' network round-trip is emulated with
+``--db-latency-ms`` of blocking sleep per statement and per commit.
+
+After each run the benchmark checks that every request's usage was recorded
+exactly, so the batched path cannot win by dropping billing rows.
+
+USAGE:
+
+    poetry run python tests/performance/bench_log_writer.py --requests 5000 --concurrency 64 --db-latency-ms 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import MetaData, create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from logos.dbutils.dbmanager import DBManager
+from logos.monitoring.log_writer import RequestLogWriter, RequestLogWriterConfig
+
+_SCHEMA = [
+    """CREATE TABLE log_entry (
+        id INTEGER PRIMARY KEY, privacy_level TEXT, response_payload TEXT, provider_id INTEGER,
+        model_id INTEGER, timestamp_request TIMESTAMP, timestamp_forwarding TIMESTAMP,
+        timestamp_response TIMESTAMP, time_at_first_token TIMESTAMP, policy_id INTEGER,
+        classification_statistics TEXT, request_id TEXT, queue_depth_at_arrival INTEGER,
+        utilization_at_arrival REAL, result_status TEXT, error_message TEXT, was_cold_start BOOLEAN,
+        timeout_s INTEGER)""",
+    """CREATE TABLE token_types (id INTEGER PRIMARY KEY, name TEXT, description TEXT)""",
+    """CREATE TABLE usage_tokens (
+        id INTEGER PRIMARY KEY, log_entry_id INTEGER, type_id INTEGER, token_count INTEGER)""",
+]
+
+
+class _LatencySession:
+    """Session proxy that blocks for a fixed time per statement and commit (a network round-trip)."""
+
+    def __init__(self, session, latency_s: float):
+        self._session = session
+        self._latency_s = latency_s
+
+    def execute(self, *args, **kwargs):
+        time.sleep(self._latency_s)
+        return self._session.execute(*args, **kwargs)
+
+    def commit(self):
+        time.sleep(self._latency_s)
+        self._session.commit()
+
+    def rollback(self):
+        self._session.rollback()
+
+    def close(self):
+        self._session.close()
+
+
+def _make_db_factory(requests: int, latency_s: float):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        for ddl in _SCHEMA:
+            conn.execute(text(ddl))
+        conn.execute(
+            text("INSERT INTO log_entry (id, privacy_level, request_id) VALUES (:id, 'BILLING', :rid)"),
+            [{"id": log_id, "rid": f"req-{log_id}"} for log_id in range(1, requests + 1)],
+        )
+    session_factory = sessionmaker(bind=engine)
+    metadata = MetaData()
+
+    class _BenchDBManager(DBManager):
+        def __enter__(self):
+            self.engine = engine
+            self.metadata = metadata
+            self.session = _LatencySession(session_factory(), latency_s)
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            self.session.close()
+            return False
+
+    return engine, _BenchDBManager
+
+
+def _usage(log_id: int) -> dict:
+    return {"prompt_tokens": 100 + log_id % 7, "completion_tokens": 20 + log_id % 13, "total_tokens": 0}
+
+
+async def _handle(log_id: int, writer: RequestLogWriter) -> None:
+    writer.metrics(request_id=f"req-{log_id}", model_id=1, provider_id=1, timeout_s=30)
+    await asyncio.sleep(0)
+    writer.first_token(log_id)
+    await asyncio.sleep(0)
+    writer.response(log_id, {"text": "..."}, 1, 1, _usage(log_id), -1, {}, request_id=f"req-{log_id}")
+    writer.metrics(log_id=log_id, request_id=f"req-{log_id}", result_status="success")
+
+
+async def _run(requests: int, concurrency: int, writer: RequestLogWriter, batched: bool) -> tuple[float, float]:
+    """Return (time until every request has submitted its writes, time until they are durable)."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(log_id: int) -> None:
+        async with semaphore:
+            await _handle(log_id, writer)
+
+    if batched:
+        await writer.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(log_id) for log_id in range(1, requests + 1)))
+    elapsed = time.perf_counter() - start
+    if batched:
+        await writer.stop()
+    return elapsed, time.perf_counter() - start
+
+
+def _check_usage(engine, requests: int) -> None:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT u.log_entry_id, t.name, u.token_count "
+                "FROM usage_tokens u JOIN token_types t ON t.id = u.type_id"
+            )
+        ).fetchall()
+        missing_status = conn.execute(text("SELECT COUNT(*) FROM log_entry WHERE result_status IS NULL")).scalar()
+    expected = {
+        (log_id, name, count) for log_id in range(1, requests + 1) for name, count in _usage(log_id).items() if count
+    }
+    recorded = [tuple(row) for row in rows]
+    assert len(recorded) == len(expected) and set(recorded) == expected, "usage_tokens differ from submitted usage"
+    assert missing_status == 0, f"{missing_status} log entries lost their metrics"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--db-latency-ms", type=float, default=0.5, help="emulated round-trip per statement")
+    args = parser.parse_args()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} db_latency={args.db_latency_ms}ms")
+    results = {}
+    for label, batched in (("inline", False), ("batched", True)):
+        engine, db_factory = _make_db_factory(args.requests, args.db_latency_ms / 1000.0)
+        writer = RequestLogWriter(db_factory=db_factory, config=RequestLogWriterConfig(batch_size=args.batch_size))
+        elapsed, durable = asyncio.run(_run(args.requests, args.concurrency, writer, batched))
+        _check_usage(engine, args.requests)
+        results[label] = args.requests / elapsed
+        print(
+            f"{label:<10}{results[label]:>10.0f} req/s  ({elapsed / args.requests * 1e6:.1f} us/request on the loop, "
+            f"all writes durable after {durable:.2f}s)"
+        )
+    print(f"speedup   {results['batched'] / results['inline']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Micro-benchmark for ``PriorityQueueManager`` under a deep, wide backlog.
+
+Fills the queue with ``--entries`` requests spread over ``--models`` models
+and all three priorities, then times the operations the scheduler and the
+capacity planner issue on every cycle: per-model depth and cold-entry checks,
+``is_empty``/total depth, escalation (``move_priority``), cancellation
+(``remove``), entry lookups and dequeues.
+
+USAGE:
+
+    poetry run python tests/performance/bench_priority_queue.py --entries 10000 --models 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Sequence
+
+from logos.queue import Priority, PriorityQueueManager
+
+
+class _Task:
+    def __init__(self, task_id: int):
+        self._id = task_id
+
+    def get_id(self) -> int:
+        return self._id
+
+
+def _fill(entries: int, models: int, seed: int) -> tuple[PriorityQueueManager, list[str]]:
+    rng = random.Random(seed)
+    mgr = PriorityQueueManager()
+    ids = []
+    for i in range(entries):
+        ids.append(
+            mgr.enqueue(
+                _Task(i),
+                model_id=i % models,
+                priority=rng.choice((Priority.LOW, Priority.NORMAL, Priority.HIGH)),
+                is_cold_at_queue=rng.random() < 0.1,
+            )
+        )
+    return mgr, ids
+
+
+def _time(label: str, ops: Sequence, op: Callable) -> None:
+    start = time.perf_counter()
+    for arg in ops:
+        op(arg)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{len(ops):>8} ops  {elapsed / len(ops) * 1e6:>10.2f} us/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--models", type=int, default=50)
+    parser.add_argument("--ops", type=int, default=2_000, help="operations timed per kind")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"entries={args.entries} models={args.models}")
+
+    start = time.perf_counter()
+    mgr, ids = _fill(args.entries, args.models, args.seed)
+    print(f"{'enqueue':<28}{args.entries:>8} ops  {(time.perf_counter() - start) / args.entries * 1e6:>10.2f} us/op")
+
+    model_ids = [rng.randrange(args.models) for _ in range(args.ops)]
+    _time("get_state", model_ids, mgr.get_state)
+    _time("has_cold_queued_entries", model_ids, mgr.has_cold_queued_entries)
+    _time("is_empty", model_ids, lambda _: mgr.is_empty())
+    _time("get_total_depth_all", model_ids, lambda _: mgr.get_total_depth_all())
+
+    sample = rng.sample(ids, min(len(ids), args.ops * 2))
+    lookups, moves = sample[: args.ops], sample[args.ops :]
+    _time("get_entry_info", lookups, mgr.get_entry_info)
+    _time("move_priority", moves, lambda entry_id: mgr.move_priority(entry_id, Priority.HIGH))
+    _time("remove", lookups, mgr.remove)
+    _time("dequeue", model_ids, mgr.dequeue)
+
+
+if __name__ == "__main__":
+    main()
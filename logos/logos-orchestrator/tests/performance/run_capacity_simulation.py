@@ -0,0 +1,164 @@
+"""
+Replay a workload trace against the capacity planner and scheduler offline.
+
+Runs the real ``CapacityPlanner`` / ``ClassificationCorrectingScheduler`` /
+ETTFT estimator stack against simulated logosnode workers on a virtual clock
+(see ``logos.simulation``). Accepts both the benchmark workload CSVs in
+``tests/performance/workloads/`` and ``log_entry`` exports as read by
+``benchmarks/analyze_workload.py``.
+
+USAGE:
+
+    poetry run python tests/performance/run_capacity_simulation.py \
+        tests/performance/workloads/explicit/10m/workload_explicit_hw3_even_random_300_10m.csv \
+        --gpus 24576,24576
+
+    # Compare a planner heuristic: run twice and diff the JSON reports
+    poetry run python tests/performance/run_capacity_simulation.py TRACE --env LOGOS_REPLICA_FIRST_EVICTION=false \
+        --output /tmp/no_replica_first.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+from logos.simulation import (
+    CapacitySimulator,
+    LatencyModel,
+    SimulationConfig,
+    WorkerSpec,
+    load_model_profiles,
+    load_trace,
+)
+from logos.simulation.worker import DEFAULT_MODEL_PROFILES_PATH
+
+
+def _parse_pairs(values: list[str], option: str) -> dict[str, str]:
+    pairs = {}
+    for value in values:
+        key, sep, raw = value.partition("=")
+        if not sep or not key:
+            raise SystemExit(f"{option} expects KEY=VALUE, got {value!r}")
+        pairs[key.strip()] = raw
+    return pairs
+
+
+def _parse_literal(raw: str):
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return raw
+
+
+def _format_summary(label: str, summary: dict) -> str:
+    if not summary.get("count"):
+        return f"  {label:<5} n=0"
+    return (
+        f"  {label:<5} n={summary['count']:<5} mean={summary['mean']:8.2f}s  p50={summary['p50']:8.2f}s  "
+        f"p95={summary['p95']:8.2f}s  p99={summary['p99']:8.2f}s  max={summary['max']:8.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline capacity planner / scheduler simulation")
+    parser.add_argument("trace", type=Path, help="Workload CSV or log_entry export")
+    parser.add_argument("--models-csv", type=Path, default=None, help="models.csv for log_entry exports")
+    parser.add_argument("--profiles", type=Path, default=DEFAULT_MODEL_PROFILES_PATH, help="model_profiles.yml")
+    parser.add_argument(
+        "--gpus",
+        action="append",
+        default=None,
+        help="Comma-separated per-GPU VRAM (MB) of one worker; repeat for more workers (default: 24576,24576)",
+    )
+    parser.add_argument("--preload", action="append", default=[], help="Model lane loaded on worker 1 at t=0")
+    parser.add_argument("--cycle-seconds", type=float, default=10.0, help="Planner cycle interval")
+    parser.add_argument("--queue-timeout", type=float, default=None, help="Scheduler queue timeout (s)")
+    parser.add_argument("--tail-seconds", type=float, default=0.0, help="Keep simulating after the last request")
+    parser.add_argument("--latency", action="append", default=[], help="LatencyModel field override, e.g. sleep_s=2")
+    parser.add_argument(
+        "--planner-override",
+        action="append",
+        default=[],
+        help="CapacityPlanner attribute override, e.g. _load_cooldown_seconds=60 (JSON literal)",
+    )
+    parser.add_argument("--env", action="append", default=[], help="LOGOS_* variable for planner/scheduler")
+    parser.add_argument("--no-ettft", action="store_true", help="Disable ETTFT ranking in the scheduler")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    parser.add_argument("--include-outcomes", action="store_true", help="Include per-request outcomes in --output")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s %(name)s: %(message)s")
+
+    trace = load_trace(args.trace, models_csv=args.models_csv)
+    if not trace.requests:
+        sys.exit(f"No replayable requests in {args.trace}")
+    profiles = load_model_profiles(args.profiles)
+    models = trace.models()
+    missing = [m for m in models if m not in profiles]
+    if missing:
+        print(f"warning: no profile for {missing}; they will be rejected at load time", file=sys.stderr)
+
+    latency_fields = {f.name for f in fields(LatencyModel)}
+    latency_overrides = {}
+    for key, raw in _parse_pairs(args.latency, "--latency").items():
+        if key not in latency_fields:
+            sys.exit(f"Unknown LatencyModel field {key!r}; expected one of {sorted(latency_fields)}")
+        latency_overrides[key] = float(raw)
+
+    workers = [
+        WorkerSpec(
+            provider_id=index + 1,
+            name=f"sim-node-{index + 1}",
+            gpu_vram_mb=[float(v) for v in spec.split(",") if v.strip()],
+            models=models,
+        )
+        for index, spec in enumerate(args.gpus or ["24576,24576"])
+    ]
+    config = SimulationConfig(
+        workers=workers,
+        model_profiles=profiles,
+        latency=LatencyModel(**latency_overrides),
+        initial_lanes={1: list(args.preload)} if args.preload else {},
+        planner_cycle_seconds=args.cycle_seconds,
+        planner_overrides={
+            k: _parse_literal(v) for k, v in _parse_pairs(args.planner_override, "--planner-override").items()
+        },
+        env=_parse_pairs(args.env, "--env"),
+        ettft_enabled=not args.no_ettft,
+        queue_timeout_s=args.queue_timeout,
+        tail_seconds=args.tail_seconds,
+    )
+
+    report = CapacitySimulator(config).run(trace)
+
+    print(f"Trace:      {args.trace} ({report.requests} requests, {len(models)} models)")
+    print(f"Simulated:  {report.simulated_seconds:.0f}s in {report.wall_seconds:.2f}s wall")
+    print(f"Outcomes:   {report.status_counts}")
+    print(_format_summary("TTFT", report.ttft_s))
+    print(_format_summary("TTLT", report.ttlt_s))
+    print(
+        f"Lanes:      cold_loads={report.cold_loads} wakes={report.wakes} sleeps={report.sleeps} "
+        f"stops={report.stops} rejected={report.rejected_loads}"
+    )
+    print(f"Cold-start requests: {report.cold_start_requests}")
+    print(f"GPU-seconds: allocated={report.gpu_seconds_allocated:.0f} busy={report.gpu_seconds_busy:.0f}")
+    for model, stats in report.per_model.items():
+        print(f"  {model}: served={stats['served']} cold={stats['cold_start_requests']}")
+        print("  " + _format_summary("TTFT", stats["ttft_s"]))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(report.to_dict(include_outcomes=args.include_outcomes), indent=2, default=str)
+        )
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""ClusterStateModel: planner inputs rebuilt only on runtime updates.
+
+The planner used to rebuild lanes, profiles and per-GPU memory from the
+runtime snapshot on every read, and recount loaded lanes across the whole
+cluster every cycle. The model caches all of it per provider and drops a
+provider's cache when the registry reports a new snapshot for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from logos.capacity.capacity_planner import CapacityPlanner
+from logos.capacity.cluster_state import ClusterStateModel, parse_gpu_memory
+from logos.capacity.demand_tracker import DemandTracker
+from logos.logosnode_registry import LogosNodeRuntimeRegistry, ProviderSession
+from logos.sdi.logosnode_facade import LogosNodeSchedulingDataFacade
+
+
+def _lane(lane_id: str, model: str, state: str = "loaded", gpus: str = "0") -> dict:
+    return {
+        "lane_id": lane_id,
+        "model": model,
+        "runtime_state": state,
+        "sleep_state": "sleeping" if state == "sleeping" else "awake",
+        "vllm": True,
+        "effective_vram_mb": 8000.0,
+        "lane_config": {"gpu_devices": gpus},
+    }
+
+
+def _runtime(lanes: list[dict], free_mb: tuple[float, ...] = (10_000.0, 20_000.0)) -> dict:
+    return {
+        "lanes": lanes,
+        "devices": {
+            "devices": [
+                {"extra": {"index": i}, "memory_total_mb": 24_000.0, "memory_free_mb": free}
+                for i, free in enumerate(free_mb)
+            ]
+        },
+        "model_profiles": {"m1": {"loaded_vram_mb": 8000.0}, "m2": {"loaded_vram_mb": 9000.0}},
+    }
+
+
+def _cluster(*provider_ids: int) -> tuple[LogosNodeRuntimeRegistry, LogosNodeSchedulingDataFacade]:
+    registry = LogosNodeRuntimeRegistry()
+    facade = LogosNodeSchedulingDataFacade(queue_manager=MagicMock(), runtime_registry=registry)
+    for provider_id in provider_ids:
+        registry._sessions[provider_id] = ProviderSession(  # noqa: SLF001
+            provider_id=provider_id, worker_id=f"worker-{provider_id}", websocket=MagicMock()
+        )
+        facade.register_model(
+            provider_id * 10, f"worker-{provider_id}", model_name="m1", total_vram_mb=48_000, provider_id=provider_id
+        )
+    return registry, facade
+
+
+def _update(registry: LogosNodeRuntimeRegistry, provider_id: int, runtime: dict) -> None:
+    asyncio.run(registry.update_runtime(provider_id, runtime))
+
+
+def test_reads_are_cached_until_the_worker_reports_a_new_snapshot():
+    registry, facade = _cluster(1)
+    _update(registry, 1, _runtime([_lane("a", "m1")]))
+    state = ClusterStateModel(facade, registry)
+    build = MagicMock(wraps=facade.get_all_provider_lane_signals)
+    facade.get_all_provider_lane_signals = build
+
+    for _ in range(3):
+        assert [lane.lane_id for lane in state.lanes(1)] == ["a"]
+        assert state.gpu_free_mb(1) == {0: 10_000.0, 1: 20_000.0}
+        assert set(state.profiles(1)) == {"m1", "m2"}
+    assert build.call_count == 1
+
+    _update(registry, 1, _runtime([_lane("a", "m1"), _lane("b", "m2")], free_mb=(2_000.0, 20_000.0)))
+
+    assert [lane.lane_id for lane in state.lanes(1)] == ["a", "b"]
+    assert state.gpu_free_mb(1) == {0: 2_000.0, 1: 20_000.0}
+    assert state.gpu_total_mb(1) == {0: 24_000.0, 1: 24_000.0}
+    assert build.call_count == 2
+
+
+def test_loaded_lane_counts_follow_per_provider_deltas():
+    registry, facade = _cluster(1, 2)
+    _update(registry, 1, _runtime([_lane("a", "m1"), _lane("b", "m2", state="sleeping")]))
+    _update(registry, 2, _runtime([_lane("c", "m1", state="running")]))
+    state = ClusterStateModel(facade, registry)
+
+    assert state.loaded_lanes_by_model() == {"m1": 2}
+
+    _update(registry, 1, _runtime([_lane("b", "m2")]))
+    assert state.loaded_lanes_by_model() == {"m1": 1, "m2": 1}
+
+    asyncio.run(registry.detach_session(2))
+    assert state.loaded_lanes_by_model() == {"m2": 1}
+
+
+def test_unknown_provider_reads_as_absent():
+    registry, facade = _cluster(1)
+    state = ClusterStateModel(facade, registry)
+
+    assert state.lanes(99) is None
+    assert state.profiles(99) == {}
+    assert state.gpu_free_mb(99) == {}
+
+
+def test_parse_gpu_memory_falls_back_to_total_minus_used():
+    free, total = parse_gpu_memory(
+        {
+            "devices": {
+                "devices": [
+                    {"extra": {"index": 0}, "memory_total_mb": 24_000, "memory_free_mb": 0, "memory_used_mb": 6_000},
+                    {"device_id": "GPU-uuid", "memory_total_mb": 24_000},
+                    {"device_id": "1", "memory_free_mb": 500},
+                ]
+            }
+        }
+    )
+
+    assert free == {0: 18_000.0, 1: 500.0}
+    assert total == {0: 24_000.0}
+
+
+def test_planner_reads_through_the_cluster_state():
+    registry, facade = _cluster(1, 2)
+    _update(registry, 1, _runtime([_lane("a", "m1"), _lane("b", "m2")]))
+    _update(registry, 2, _runtime([_lane("c", "m1")], free_mb=(4_000.0,)))
+    planner = CapacityPlanner(facade, registry, DemandTracker(), enabled=False)
+
+    assert planner._cluster_state is not None
+    assert planner._count_loaded_lanes_per_model() == {"m1": 2, "m2": 1}
+    assert planner._get_per_gpu_total(2) == {0: 24_000.0}
+
+    planner._vram_ledger.try_reserve_atomic(
+        provider_id=2,
+        lane_id="c",
+        operation="load",
+        vram_mb=1_000.0,
+        raw_available_mb=4_000.0,
+        safety_margin=1.0,
+        gpu_devices="0",
+    )
+    assert planner._get_per_gpu_free(2) == {0: 3_000.0}
+
+    _update(registry, 2, _runtime([], free_mb=(4_000.0,)))
+    assert planner._count_loaded_lanes_per_model() == {"m1": 1, "m2": 1}
+    assert planner._safe_get_lanes(2) == []
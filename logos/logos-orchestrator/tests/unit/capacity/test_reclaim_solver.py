@@ -0,0 +1,170 @@
+"""Equivalence tests for the bounded reclaim / cold-placement search.
+
+Both searches used to enumerate ``itertools.combinations`` exhaustively. The
+references below are those original loops; the solver must return exactly the
+same plan on randomized instances, including heavy ties.
+"""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations
+
+import pytest
+
+from logos.capacity import reclaim_solver
+from logos.capacity.reclaim_solver import best_reclaim_subset
+from tests.unit.capacity.test_best_first_scenarios import _lane, _MockProvider, _planner, _profile
+
+# ---------------------------------------------------------------------------
+# Subset search (_best_reclaim_plan / _best_reclaim_plan_combined)
+# ---------------------------------------------------------------------------
+
+
+def _reference_subset(freed, lane_ids, required, penalties=None, max_size=None, distinct=False):
+    best_combo, best_score = None, None
+    limit = len(freed) if max_size is None else min(max_size, len(freed))
+    for size in range(1, limit + 1):
+        for combo in combinations(range(len(freed)), size):
+            if distinct and len({lane_ids[i] for i in combo}) != size:
+                continue
+            total = sum(freed[i] for i in combo)
+            if total + 1e-6 < required:
+                continue
+            penalty = sum(penalties[i] for i in combo) if penalties else 0
+            score = (penalty, total, max(freed[i] for i in combo), size, tuple(sorted(lane_ids[i] for i in combo)))
+            if best_score is None or score < best_score:
+                best_score, best_combo = score, combo
+    return best_combo or ()
+
+
+def test_subset_matches_exhaustive_search():
+    rng = random.Random(7)
+    for _ in range(300):
+        n = rng.randint(1, 11)
+        # Coarse sizes force many exact ties on total/max/size.
+        freed = [float(rng.choice([500, 1000, 1500, 4000, 8000, 8000, 16000])) for _ in range(n)]
+        lane_ids = [f"lane-{rng.randint(0, n)}" for _ in range(n)]
+        required = rng.uniform(0, sum(freed) * 1.1)
+
+        assert best_reclaim_subset(freed, lane_ids, required_free_mb=required) == _reference_subset(
+            freed, lane_ids, required
+        )
+
+        penalties = [rng.choice([0, 0, 1]) for _ in range(n)]
+        assert best_reclaim_subset(
+            freed, lane_ids, required_free_mb=required, stop_penalties=penalties, max_size=5, distinct_lanes=True
+        ) == _reference_subset(freed, lane_ids, required, penalties, max_size=5, distinct=True)
+
+
+def test_subset_budget_exhaustion_falls_back_to_a_feasible_plan(monkeypatch):
+    freed = [float(1000 + i) for i in range(40)]
+    lane_ids = [f"lane-{i}" for i in range(40)]
+    monkeypatch.setattr(reclaim_solver, "_DEADLINE_CHECK_INTERVAL", 1)
+
+    plan = best_reclaim_subset(freed, lane_ids, required_free_mb=15_500.0, budget_seconds=0.0)
+
+    assert plan
+    assert sum(freed[i] for i in plan) >= 15_500.0
+
+
+def test_subset_returns_empty_when_shortfall_cannot_be_covered():
+    assert best_reclaim_subset([100.0, 200.0], ["a", "b"], required_free_mb=1_000.0) == ()
+
+
+# ---------------------------------------------------------------------------
+# Cold-load placement (_pick_cold_load_placement)
+# ---------------------------------------------------------------------------
+
+
+def _reference_placement(planner, provider_id, load_cost_mb, tp, lanes, profiles, cluster, per_gpu_free, per_gpu_total):
+    per_gpu_needed = load_cost_mb / tp + planner.PER_GPU_COLD_START_MB
+
+    def _try(replicas_only):
+        best = None
+        for combo in combinations(sorted(per_gpu_free), tp):
+            gpu_set = frozenset(combo)
+            deficit = {}
+            for g in gpu_set:
+                need = max(per_gpu_needed, planner.VLLM_GMU_FLOOR * per_gpu_total.get(g, 0.0))
+                if need - per_gpu_free[g] > 0:
+                    deficit[g] = need - per_gpu_free[g]
+            eviction = planner._find_eviction_set(
+                provider_id,
+                gpu_set,
+                deficit,
+                lanes,
+                profiles,
+                replicas_only=replicas_only,
+                cluster_lanes_by_model=cluster,
+            )
+            if eviction is None:
+                continue
+            score = max((s for _, _, s in eviction), default=0.0)
+            if best is None or score < best[2]:
+                best = (gpu_set, eviction, score)
+        return best
+
+    best = _try(True) if cluster is not None else None
+    if best is None:
+        best = _try(False)
+    return None if best is None else (best[0], best[1])
+
+
+def _random_fleet(rng: random.Random, gpus: int):
+    models = [f"m{i}" for i in range(rng.randint(2, 6))]
+    lanes, used = [], {g: 0.0 for g in range(gpus)}
+    for index in range(rng.randint(gpus // 2, 2 * gpus + 2)):
+        lane_tp = rng.choice([1, 1, 2])
+        devices = sorted(rng.sample(range(gpus), lane_tp))
+        asleep = rng.random() < 0.4
+        vram = rng.choice([4000.0, 9000.0, 14000.0, 20000.0])
+        for g in devices:
+            used[g] += vram / lane_tp
+        lanes.append(
+            _lane(
+                lane_id=f"lane-{index}",
+                model_name=rng.choice(models),
+                runtime_state="sleeping" if asleep else "loaded",
+                sleep_state="sleeping" if asleep else "awake",
+                effective_vram_mb=1000.0 if asleep else vram,
+                gpu_devices="" if rng.random() < 0.1 else ",".join(map(str, devices)),
+            )
+        )
+    profiles = {m: _profile(loaded_vram_mb=rng.choice([9000.0, 14000.0, 20000.0])) for m in models}
+    per_gpu_total = {g: 24_000.0 for g in range(gpus)}
+    per_gpu_free = {g: max(0.0, 24_000.0 - used[g]) for g in range(gpus)}
+    cluster = {m: rng.randint(0, 3) for m in models} if rng.random() < 0.7 else None
+    return lanes, profiles, per_gpu_free, per_gpu_total, cluster
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_placement_matches_exhaustive_search(seed):
+    for case in range(60):
+        _check_placement(random.Random(seed * 1000 + case))
+
+
+def _check_placement(rng: random.Random) -> None:
+    gpus = rng.choice([2, 4, 8])
+    tp = rng.choice([t for t in (1, 2, 4) if t <= gpus])
+    lanes, profiles, per_gpu_free, per_gpu_total, cluster = _random_fleet(rng, gpus)
+    provider = _MockProvider(provider_id=1, name="A", lanes=lanes, profiles=profiles)
+    planner = _planner([provider])
+    planner._get_per_gpu_free = lambda _pid: dict(per_gpu_free)
+    planner._get_per_gpu_total = lambda _pid: dict(per_gpu_total)
+    # Per-lane demand gives the max-score objective something to rank on.
+    scores = {m: float(rng.randint(0, 3)) for m in profiles}
+    planner._demand.get_score = lambda model: scores.get(model, 0.0)
+    load_cost = rng.choice([8000.0, 16000.0, 30000.0]) * tp
+
+    expected = _reference_placement(planner, 1, load_cost, tp, lanes, profiles, cluster, per_gpu_free, per_gpu_total)
+    actual = planner._pick_cold_load_placement(1, load_cost, tp, lanes, profiles, cluster_lanes_by_model=cluster)
+
+    if expected is None:
+        assert actual is None
+    else:
+        assert actual is not None
+        assert actual[0] == expected[0]
+        assert [(lane.lane_id, action) for lane, action, _ in actual[1]] == [
+            (lane.lane_id, action) for lane, action, _ in expected[1]
+        ]
@@ -16,6 +16,7 @@ from logos import (
     LogosNodeSessionConflictError,
 )
 from logos.dbutils.dbrequest import ConnectModelProviderRequest, LogosNodeAuthRequest, LogosNodeRegisterRequest
+from logos.logosnode_frames import encode_stream_chunk, encode_stream_control
 
 
 class _FakeWebSocket:
@@ -286,6 +287,53 @@ async def test_registry_parallel_stream_roundtrip_is_isolated():
     assert chunks_b == [b"b-1", b"b-2"]
 
 
+@pytest.mark.asyncio
+async def test_registry_stream_binary_frames_roundtrip():
+    registry = LogosNodeRuntimeRegistry()
+    ticket = await registry.consume_ticket(await registry.issue_ticket(15, "worker-binary", []))
+    assert ticket is not None
+    ws = _FakeWebSocket()
+    await registry.attach_session(ticket, ws)
+    await registry.on_hello(15, "worker-binary", stream_encodings=["json", "binary"])
+
+    async def _collect():
+        chunks = []
+        async for chunk in registry.send_stream_command(15, "infer_stream", {}, timeout_seconds=3):
+            chunks.append(chunk)
+        return chunks
+
+    task = asyncio.create_task(_collect())
+    await asyncio.sleep(0)
+    assert ws.sent[0]["stream_encoding"] == "binary"
+    cmd_id = ws.sent[0]["cmd_id"]
+
+    await registry.on_stream_frame(
+        15, encode_stream_control({"type": "stream_start", "cmd_id": cmd_id, "status_code": 200})
+    )
+    await registry.on_stream_frame(15, encode_stream_chunk(cmd_id, b"data: \xe2\x9c\x93\n"))
+    await registry.on_stream_frame(15, b"\x09garbage")
+    await registry.on_stream_frame(15, encode_stream_control({"type": "stream_end", "cmd_id": cmd_id, "success": True}))
+    assert await task == [b"data: \xe2\x9c\x93\n"]
+
+
+@pytest.mark.asyncio
+async def test_registry_stream_stays_json_for_workers_without_binary_frames():
+    registry = LogosNodeRuntimeRegistry()
+    ticket = await registry.consume_ticket(await registry.issue_ticket(16, "worker-legacy", []))
+    assert ticket is not None
+    ws = _FakeWebSocket()
+    await registry.attach_session(ticket, ws)
+    await registry.on_hello(16, "worker-legacy")
+
+    stream = registry.send_stream_command(16, "infer_stream", {}, timeout_seconds=3)
+    task = asyncio.create_task(stream.__anext__())
+    await asyncio.sleep(0)
+    assert "stream_encoding" not in ws.sent[0]
+    await registry.on_stream_end(16, {"cmd_id": ws.sent[0]["cmd_id"], "type": "stream_end", "success": True})
+    with pytest.raises(StopAsyncIteration):
+        await task
+
+
 @pytest.mark.asyncio
 async def test_registry_stale_session_raises():
     registry = LogosNodeRuntimeRegistry()
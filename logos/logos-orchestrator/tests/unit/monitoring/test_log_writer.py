@@ -0,0 +1,189 @@
+import asyncio
+
+import pytest
+
+from logos.monitoring import log_writer as log_writer_module
+from logos.monitoring.log_writer import RequestLogWriter, RequestLogWriterConfig
+
+
+class _FakeSession:
+    def __init__(self, db):
+        self._db = db
+
+    def commit(self):
+        self._db.log.append(("commit",))
+
+    def rollback(self):
+        self._db.log.append(("rollback",))
+
+
+class _FakeDB:
+    """Records the batched DBManager calls of one session."""
+
+    def __init__(self, log, fail_when=None):
+        self.log = log
+        self.session = _FakeSession(self)
+        self._fail_when = fail_when or (lambda rows: False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def resolve_token_types(self, names):
+        return {name: i for i, name in enumerate(sorted(names))}
+
+    def set_time_at_first_token(self, log_id):
+        self.log.append(("first_token_inline", log_id))
+
+    def set_response_payload(self, log_id, payload, *args, **kwargs):
+        self.log.append(("response_inline", log_id, args[2]))
+
+    def set_time_at_first_token_many(self, rows, *, commit=True):
+        if rows:
+            self.log.append(("first_token", [log_id for log_id, _ in rows]))
+
+    def set_response_payload_many(self, rows, *, commit=True):
+        if self._fail_when(rows):
+            raise RuntimeError("boom")
+        if rows:
+            self.log.append(("response", [(row["log_id"], row["usage"]) for row in rows]))
+
+    def update_log_entry_metrics(self, *, commit=True, **fields):
+        assert commit is False
+        self.log.append(("metrics", fields))
+
+
+def _writer(log, fail_when=None, **config):
+    return RequestLogWriter(
+        db_factory=lambda: _FakeDB(log, fail_when),
+        config=RequestLogWriterConfig(flush_interval_s=0.0, **config),
+    )
+
+
+def test_writes_inline_until_started():
+    log = []
+    writer = _writer(log)
+
+    writer.first_token(7)
+    writer.response(7, {"ok": True}, 1, 2, {"total_tokens": 5})
+
+    assert log == [("first_token_inline", 7), ("response_inline", 7, {"total_tokens": 5})]
+    assert len(writer) == 0
+
+
+async def test_batches_entries_in_one_transaction_keeping_per_entry_order():
+    log = []
+    writer = _writer(log)
+    await writer.start()
+    writer.first_token(1)
+    writer.response(1, None, usage={"prompt_tokens": 3})
+    writer.metrics(log_id=1, result_status="success")
+    writer.response(2, None, usage={"prompt_tokens": 4})
+    await writer.stop()
+
+    assert log == [
+        ("first_token", [1]),
+        ("response", [(2, {"prompt_tokens": 4})]),
+        ("response", [(1, {"prompt_tokens": 3})]),
+        ("metrics", {"log_id": 1, "request_id": None, "result_status": "success"}),
+        ("commit",),
+    ]
+
+
+async def test_consecutive_metrics_are_merged_but_responses_are_not():
+    log = []
+    writer = _writer(log)
+    await writer.start()
+    writer.metrics(request_id="r1", model_id=3, queue_depth_at_enqueue=2)
+    writer.metrics(request_id="r1", model_id=None, result_status="success")
+    writer.response(9, None, usage={"completion_tokens": 1})
+    writer.response(9, None, usage={"completion_tokens": 1})
+    await writer.stop()
+
+    metrics = [entry[1] for entry in log if entry[0] == "metrics"]
+    responses = [entry[1] for entry in log if entry[0] == "response"]
+    assert metrics == [
+        {"log_id": None, "request_id": "r1", "model_id": 3, "queue_depth_at_enqueue": 2, "result_status": "success"}
+    ]
+    assert responses == [[(9, {"completion_tokens": 1})], [(9, {"completion_tokens": 1})]]
+
+
+async def test_full_queue_drops_metrics_but_writes_responses_inline(monkeypatch):
+    counted = []
+
+    class _Counter:
+        def labels(self, **labels):
+            counted.append(labels)
+            return self
+
+        def inc(self, *args, **kwargs):
+            pass
+
+    monkeypatch.setattr(log_writer_module.prom, "REQUEST_LOG_WRITES_TOTAL", _Counter())
+    log = []
+    writer = _writer(log, max_pending=1)
+    await writer.start()
+    writer.metrics(log_id=1, timeout_s=30)
+    writer.metrics(log_id=2, timeout_s=30)
+    writer.response(3, None, usage={"total_tokens": 8})
+
+    assert {"kind": "metrics", "outcome": "dropped"} in counted
+    assert {"kind": "response", "outcome": "inline"} in counted
+    assert log == [("response", [(3, {"total_tokens": 8})]), ("commit",)]
+    await writer.stop()
+    assert ("metrics", {"log_id": 2, "request_id": None, "timeout_s": 30}) not in log
+
+
+async def test_failed_batch_is_retried_entry_by_entry():
+    log = []
+    writer = _writer(log, fail_when=lambda rows: any(row["log_id"] == 2 for row in rows))
+    await writer.start()
+    writer.response(1, None, usage={"total_tokens": 1})
+    writer.response(2, None, usage={"total_tokens": 2})
+    await writer.stop()
+
+    assert log == [
+        ("rollback",),
+        ("response", [(1, {"total_tokens": 1})]),
+        ("commit",),
+        ("rollback",),
+    ]
+
+
+async def test_stop_flushes_writes_submitted_during_the_last_flush():
+    log = []
+    writer = _writer(log)
+    await writer.start()
+    writer.metrics(log_id=1, timeout_s=10)
+    stopping = asyncio.create_task(writer.stop())
+    writer.metrics(log_id=2, timeout_s=20)
+    await stopping
+
+    assert not writer.running
+    assert len(writer) == 0
+    assert [entry[1]["log_id"] for entry in log if entry[0] == "metrics"] == [1, 2]
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("LOGOS_LOG_WRITER_MAX_PENDING", "50")
+    monkeypatch.setenv("LOGOS_LOG_WRITER_BATCH_SIZE", "oops")
+    monkeypatch.setenv("LOGOS_LOG_WRITER_FLUSH_INTERVAL_MS", "250")
+
+    config = RequestLogWriterConfig.from_env()
+
+    assert config == RequestLogWriterConfig(max_pending=50, batch_size=200, flush_interval_s=0.25)
+
+
+async def test_recorder_queues_metrics_on_a_running_writer():
+    from logos.monitoring.recorder import MonitoringRecorder
+
+    log = []
+    writer = _writer(log)
+    recorder = MonitoringRecorder(db_factory=lambda: pytest.fail("recorder must not write inline"), writer=writer)
+    await writer.start()
+    recorder.record_provider("r1", provider_id=4)
+    await writer.stop()
+
+    assert log == [("metrics", {"log_id": None, "request_id": "r1", "provider_id": 4}), ("commit",)]
@@ -0,0 +1,137 @@
+"""Pooled upstream clients: reuse per origin, shutdown, and pool config."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from logos.monitoring import prometheus_metrics as prom
+from logos.pipeline.executor import Executor
+from logos.pipeline.upstream_clients import UpstreamClientRegistry, UpstreamPoolConfig, upstream_key
+
+
+def _install_mock_transport(monkeypatch, handler):
+    created = []
+    real_async_client = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+
+    def _factory(*args, **kwargs):
+        client = real_async_client(*args, transport=transport, **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr("logos.pipeline.upstream_clients.httpx.AsyncClient", _factory)
+    return created
+
+
+def test_upstream_key_normalises_default_ports():
+    assert upstream_key("https://api.openai.com/v1/chat/completions") == "https://api.openai.com:443"
+    assert upstream_key("https://api.openai.com:443/v1/responses") == "https://api.openai.com:443"
+    assert upstream_key("http://ollama:11434/api/chat") == "http://ollama:11434"
+
+
+async def test_registry_shares_one_client_per_origin(monkeypatch):
+    created = _install_mock_transport(monkeypatch, lambda request: httpx.Response(200, json={}))
+    registry = UpstreamClientRegistry()
+
+    a = registry.client_for("https://azure.test/openai/deployments/a/chat/completions")
+    b = registry.client_for("https://azure.test/openai/deployments/b/chat/completions")
+    c = registry.client_for("http://ollama:11434/api/chat")
+
+    assert a is b
+    assert a is not c
+    assert len(created) == 2
+    await registry.aclose()
+
+
+async def _start_keepalive_server(body: bytes):
+    """Local HTTP/1.1 server that answers every request with *body* and counts TCP connections."""
+    connections = []
+
+    async def _serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections.append(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = next(
+                    (
+                        int(line.split(b":", 1)[1])
+                        for line in head.split(b"\r\n")
+                        if line.lower().startswith(b"content-length:")
+                    ),
+                    0,
+                )
+                await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], connections
+
+
+async def test_executor_reuses_pooled_connection_across_requests(monkeypatch):
+    server, port, connections = await _start_keepalive_server(b'{"usage": {"total_tokens": 3}}')
+    counted = []
+
+    class _RequestCounter:
+        def labels(self, **labels):
+            counted.append(labels["connection"])
+            return self
+
+        def inc(self, *args, **kwargs):
+            pass
+
+    monkeypatch.setattr(prom, "UPSTREAM_HTTP_REQUESTS_TOTAL", _RequestCounter())
+    executor = Executor()
+    url = f"http://127.0.0.1:{port}/v1/chat/completions"
+
+    try:
+        for _ in range(3):
+            result = await executor.execute_sync(url, {}, {"model": "m"})
+            assert result.success
+            assert result.usage == {"total_tokens": 3}
+    finally:
+        await executor.aclose()
+        server.close()
+        await server.wait_closed()
+
+    assert len(connections) == 1
+    assert counted == ["new", "reused", "reused"]
+
+
+async def test_registry_close_shuts_clients_and_rejects_new_requests(monkeypatch):
+    created = _install_mock_transport(monkeypatch, lambda request: httpx.Response(200, json={}))
+    registry = UpstreamClientRegistry()
+    registry.client_for("https://provider.test/v1/chat/completions")
+
+    await registry.aclose()
+
+    assert created[0].is_closed
+    with pytest.raises(RuntimeError):
+        registry.client_for("https://provider.test/v1/chat/completions")
+
+
+def test_pool_config_from_env(monkeypatch):
+    monkeypatch.setenv("LOGOS_UPSTREAM_MAX_CONNECTIONS", "64")
+    monkeypatch.setenv("LOGOS_UPSTREAM_MAX_KEEPALIVE", "16")
+    monkeypatch.setenv("LOGOS_UPSTREAM_KEEPALIVE_EXPIRY_S", "not-a-number")
+    monkeypatch.setenv("LOGOS_UPSTREAM_HTTP2", "false")
+
+    config = UpstreamPoolConfig.from_env()
+
+    assert config.max_connections == 64
+    assert config.max_keepalive_connections == 16
+    assert config.keepalive_expiry == 60.0
+    assert config.http2 is False
+
+
+def test_pool_config_defaults_to_unbounded_connections(monkeypatch):
+    monkeypatch.delenv("LOGOS_UPSTREAM_MAX_CONNECTIONS", raising=False)
+    assert UpstreamPoolConfig.from_env().max_connections is None
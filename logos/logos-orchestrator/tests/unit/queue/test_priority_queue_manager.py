@@ -80,3 +80,56 @@ def test_has_cold_queued_entries_clears_after_dequeue():
     assert mgr.has_cold_queued_entries(5, 1) is True
     mgr.dequeue(5, provider_id=1)
     assert mgr.has_cold_queued_entries(5, 1) is False
+
+
+def test_remove_and_move_keep_depth_counters_in_sync():
+    mgr = PriorityQueueManager()
+    low = mgr.enqueue(DummyTask(1), model_id=5, priority=Priority.LOW, is_cold_at_queue=True)
+    normal = mgr.enqueue(DummyTask(2), model_id=5, priority=Priority.NORMAL)
+
+    assert mgr.move_priority(low, Priority.HIGH)
+    assert (mgr.get_state(5).low, mgr.get_state(5).high) == (0, 1)
+    assert mgr.get_entry_info(low).current_priority == Priority.HIGH
+    assert mgr.has_cold_queued_entries(5) is True
+
+    assert mgr.remove(low)
+    assert not mgr.remove(low)
+    assert mgr.has_cold_queued_entries(5) is False
+    assert mgr.get_total_depth_all() == 1
+    assert mgr.get_entries_for_priority(5, Priority.HIGH) == []
+    assert mgr.dequeue(5).get_id() == 2
+    assert mgr.get_entry_info(normal) is None
+    assert mgr.is_empty()
+
+
+def test_moved_entry_is_not_served_twice_after_moving_back():
+    mgr = PriorityQueueManager()
+    first = mgr.enqueue(DummyTask(1), model_id=5, priority=Priority.NORMAL)
+    mgr.enqueue(DummyTask(2), model_id=5, priority=Priority.NORMAL)
+
+    mgr.move_priority(first, Priority.HIGH)
+    mgr.move_priority(first, Priority.NORMAL)
+
+    served = [mgr.dequeue(5) for _ in range(3)]
+    assert [task.get_id() if task else None for task in served] == [2, 1, None]
+
+
+def test_fifo_within_priority_survives_stale_compaction():
+    mgr = PriorityQueueManager()
+    ids = [mgr.enqueue(DummyTask(i), model_id=5, priority=Priority.LOW) for i in range(300)]
+    for entry_id in ids[:200]:
+        mgr.remove(entry_id)
+
+    assert len(mgr._queues[5][Priority.LOW]) < 300
+    assert [mgr.dequeue(5).get_id() for _ in range(100)] == list(range(200, 300))
+    assert mgr.is_empty()
+
+
+def test_unknown_model_queries_do_not_allocate_queues():
+    mgr = PriorityQueueManager()
+
+    assert mgr.get_state(42).total == 0
+    assert mgr.peek(42) is None
+    assert mgr.dequeue(42) is None
+    assert mgr.get_entries_for_priority(42, Priority.LOW) == []
+    assert 42 not in mgr._queues
@@ -0,0 +1,139 @@
+"""Tests for the offline capacity simulator (virtual clock, traces, end-to-end replay)."""
+
+import asyncio
+import time
+
+from logos.simulation import (
+    CapacitySimulator,
+    SimulationConfig,
+    TraceRequest,
+    VirtualClock,
+    VirtualTimeEventLoop,
+    WorkerSpec,
+    WorkloadTrace,
+    load_trace,
+)
+
+
+def _profile(base_mb: float) -> dict:
+    return {
+        "engine": "vllm",
+        "base_residency_mb": base_mb,
+        "loaded_vram_mb": base_mb,
+        "kv_budget_mb": 4096.0,
+        "sleeping_residual_mb": 1024.0,
+        "tensor_parallel_size": 1,
+        "residency_source": "calibrated",
+        "measurement_count": 10,
+    }
+
+
+PROFILES = {"model-a": _profile(14000.0), "model-b": _profile(14000.0)}
+
+
+def _config(**overrides) -> SimulationConfig:
+    # One 24 GB GPU: either model fits awake, both together do not.
+    defaults = dict(
+        workers=[WorkerSpec(provider_id=1, name="sim-node", gpu_vram_mb=[24000.0], models=["model-a", "model-b"])],
+        model_profiles=PROFILES,
+        queue_timeout_s=900.0,
+    )
+    defaults.update(overrides)
+    return SimulationConfig(**defaults)
+
+
+def _trace() -> WorkloadTrace:
+    requests = []
+    for phase, (model, start) in enumerate([("model-a", 0.0), ("model-b", 200.0), ("model-a", 400.0)]):
+        for i in range(6):
+            requests.append(
+                TraceRequest(
+                    request_id=f"p{phase}-{i}",
+                    arrival_s=start + i * 2.0,
+                    model=model,
+                    prompt_tokens=200,
+                    output_tokens=64,
+                )
+            )
+    return WorkloadTrace(requests=requests)
+
+
+def test_virtual_loop_jumps_over_sleeps():
+    clock = VirtualClock(start=1000.0)
+    loop = VirtualTimeEventLoop(clock)
+    started = time.perf_counter()
+    try:
+        loop.run_until_complete(asyncio.sleep(3600))
+    finally:
+        loop.close()
+    assert clock.elapsed() >= 3600
+    assert time.perf_counter() - started < 5
+
+
+def test_replay_serves_every_request_and_counts_cold_starts():
+    report = CapacitySimulator(_config()).run(_trace())
+
+    assert report.requests == 18
+    assert report.status_counts == {"success": 18}
+    # Both models start cold, and model-b's phase must evict model-a's lane.
+    assert report.cold_loads >= 2
+    assert report.cold_start_requests >= 1
+    assert report.ttft_s["count"] == 18
+    assert report.ttft_s["max"] >= 30.0  # at least one request waited out a cold load
+    assert report.ttlt_s["p50"] >= report.ttft_s["p50"]
+    assert report.gpu_seconds_allocated > report.gpu_seconds_busy > 0
+    assert report.simulated_seconds >= 400
+    assert report.wall_seconds < report.simulated_seconds
+    assert set(report.per_model) == {"model-a", "model-b"}
+
+
+def test_preloaded_lane_serves_warm():
+    trace = WorkloadTrace(requests=[TraceRequest(f"r{i}", float(i), "model-a", output_tokens=32) for i in range(4)])
+    report = CapacitySimulator(_config(initial_lanes={1: ["model-a"]})).run(trace)
+
+    assert report.status_counts == {"success": 4}
+    assert report.cold_loads == 0
+    assert report.cold_start_requests == 0
+    assert report.ttft_s["max"] < 1.0
+
+
+def test_replay_is_deterministic():
+    first = CapacitySimulator(_config()).run(_trace()).to_dict()
+    second = CapacitySimulator(_config()).run(_trace()).to_dict()
+    first.pop("wall_seconds")
+    second.pop("wall_seconds")
+    assert first == second
+
+
+def test_load_trace_reads_workload_csv(tmp_path):
+    path = tmp_path / "workload.csv"
+    path.write_text(
+        "request_id,arrival_offset,mode,priority,body_json\n"
+        'r2,1500,batch,low,"{""model"":""model-b"",""messages"":[{""role"":""user"",""content"":""abcdefgh""}]}"\n'
+        'r1,0,interactive,high,"{""model"":""model-a"",""max_tokens"":12,""messages"":[]}"\n'
+    )
+    trace = load_trace(path)
+
+    assert [r.request_id for r in trace.requests] == ["r1", "r2"]
+    assert trace.requests[0].output_tokens == 12
+    assert trace.requests[0].priority == "high"
+    assert trace.requests[1].arrival_s == 1.5
+    assert trace.requests[1].prompt_tokens == 2
+    assert trace.models() == ["model-a", "model-b"]
+
+
+def test_load_trace_reads_log_entry_export(tmp_path):
+    (tmp_path / "models.csv").write_text("id,name\n7,model-a\n")
+    path = tmp_path / "log_entry_30d.csv"
+    path.write_text(
+        "id,timestamp_request,time_at_first_token,timestamp_response,model_id,result_status\n"
+        "1,2026-01-01T10:00:00+00:00,2026-01-01T10:00:01+00:00,2026-01-01T10:00:03+00:00,7,success\n"
+        "2,2026-01-01T10:00:05+00:00,,,7,error\n"
+        "3,2026-01-01T10:00:10+00:00,,,7,success\n"
+    )
+    trace = load_trace(path)
+
+    assert [r.arrival_s for r in trace.requests] == [0.0, 10.0]
+    assert all(r.model == "model-a" for r in trace.requests)
+    assert trace.requests[0].output_tokens == 80  # 2 s decode at 25 ms/token
+    assert trace.start_epoch is not None
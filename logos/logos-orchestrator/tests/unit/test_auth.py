@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import importlib
+
 import pytest
 from fastapi import HTTPException
 
 from logos import auth
+from logos.auth_cache import AuthCache
+
+# ``logos`` is replaced by ``logos.main`` at import time, so ``from logos import
+# auth_cache`` would load a second copy of the module; patch the real one.
+auth_cache = importlib.import_module("logos.auth_cache")
+
+
+@pytest.fixture(autouse=True)
+def fresh_auth_cache(monkeypatch):
+    monkeypatch.setattr(auth_cache, "_auth_cache", AuthCache())
 
 
 def _api_key_row(key: str = "lg-test-abc") -> dict:
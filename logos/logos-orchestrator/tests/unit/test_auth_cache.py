@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+from logos import auth
+from logos.auth_cache import AuthCache, AuthCacheConfig, ResolvedLimits, TTLCache
+
+# ``logos`` is replaced by ``logos.main`` at import time, so ``from logos import
+# auth_cache`` would load a second copy of the module; patch the real one.
+auth_cache = importlib.import_module("logos.auth_cache")
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _api_key_row(key_id: int = 5, team_id: int = 2, settings: dict | None = None) -> dict:
+    return {
+        "id": key_id,
+        "key_value": "lg-test-abc",
+        "name": "My Key",
+        "key_type": "user",
+        "team_id": team_id,
+        "user_id": 3,
+        "environment": "prod",
+        "log": "BILLING",
+        "settings": settings,
+        "default_priority": 1,
+    }
+
+
+class _CountingDB:
+    def __init__(self, row=None, team=None, budget_limit=None):
+        self.row = row
+        self.team = team
+        self.budget_limit = budget_limit
+        self.calls: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def get_api_key_by_value(self, key_value: str):
+        self.calls.append("api_key")
+        return self.row
+
+    def get_team(self, team_id: int):
+        self.calls.append("team")
+        return self.team
+
+    def get_api_key_budget_limit(self, api_key_id: int):
+        self.calls.append("budget_limit")
+        return self.budget_limit
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    clock = _Clock()
+    fresh = AuthCache(AuthCacheConfig(ttl_s=30.0, max_entries=100), clock=clock)
+    fresh.clock = clock
+    monkeypatch.setattr(auth_cache, "_auth_cache", fresh)
+    return fresh
+
+
+def test_ttl_cache_expires_entries():
+    clock = _Clock()
+    ttl = TTLCache("api_key", ttl_s=10.0, max_entries=10, clock=clock)
+    ttl.put("k", 1)
+
+    assert ttl.get("k") == 1
+    clock.now += 10.0
+    assert ttl.get("k") is None
+    assert len(ttl) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    ttl = TTLCache("api_key", ttl_s=60.0, max_entries=2)
+    ttl.put("a", 1)
+    ttl.put("b", 2)
+    ttl.get("a")
+    ttl.put("c", 3)
+
+    assert ttl.get("a") == 1
+    assert ttl.get("b") is None
+    assert ttl.get("c") == 3
+
+
+def test_authenticate_api_key_reads_db_once_per_ttl(monkeypatch, cache):
+    db = _CountingDB(row=_api_key_row())
+    monkeypatch.setattr(auth, "DBManager", lambda: db)
+
+    for _ in range(3):
+        ctx = auth.authenticate_api_key({"logos-key": "lg-test-abc"})
+        assert ctx.api_key_id == 5
+
+    assert db.calls == ["api_key"]
+    cache.clock.now += 31.0
+    auth.authenticate_api_key({"logos-key": "lg-test-abc"})
+    assert db.calls == ["api_key", "api_key"]
+
+
+def test_invalid_keys_are_not_cached(monkeypatch, cache):
+    db = _CountingDB(row=None)
+    monkeypatch.setattr(auth, "DBManager", lambda: db)
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            auth.authenticate_api_key({"logos-key": "lg-missing"})
+
+    assert db.calls == ["api_key", "api_key"]
+    assert len(cache.api_keys) == 0
+
+
+def test_invalidate_api_key_by_id_drops_rotated_value(monkeypatch, cache):
+    db = _CountingDB(row=_api_key_row(key_id=5))
+    monkeypatch.setattr(auth, "DBManager", lambda: db)
+    auth.authenticate_api_key({"logos-key": "lg-test-abc"})
+
+    cache.invalidate_api_key(api_key_id=5)
+    auth.authenticate_api_key({"logos-key": "lg-test-abc"})
+
+    assert db.calls == ["api_key", "api_key"]
+
+
+def test_resolve_limits_prefers_key_settings_over_team_defaults(cache):
+    ctx = auth.AuthContext(
+        key_value="lg-test-abc",
+        api_key_id=5,
+        api_key_name="My Key",
+        key_type="user",
+        team_id=2,
+        user_id=3,
+        environment="prod",
+        log_level="BILLING",
+        settings={"cloud_rpm_limit": 7, "tpm_limit": 900},
+    )
+    db = _CountingDB(
+        team={
+            "default_cloud_rpm_limit": 100,
+            "default_local_rpm_limit": 50,
+            "default_local_tpm_limit": 5000,
+            "team_monthly_budget_micro_cents": 10_000,
+        },
+        budget_limit=2_000,
+    )
+
+    first = auth.resolve_limits(db, ctx)
+    second = auth.resolve_limits(db, ctx)
+
+    assert (
+        first
+        == second
+        == ResolvedLimits(
+            cloud_rl={"rpm": 7, "tpm": 900},
+            local_rl={"rpm": 50, "tpm": 900},
+            budget_limit=2_000,
+            team_budget_limit=10_000,
+        )
+    )
+    assert db.calls == ["team", "budget_limit"]
+
+
+def test_team_invalidation_drops_inherited_limits(cache):
+    ctx = auth.AuthContext(
+        key_value="lg-test-abc",
+        api_key_id=5,
+        api_key_name="My Key",
+        key_type="user",
+        team_id=2,
+        user_id=3,
+        environment="prod",
+        log_level="BILLING",
+        settings={},
+    )
+    db = _CountingDB(team={"default_cloud_rpm_limit": 100})
+    assert auth.resolve_limits(db, ctx).cloud_rl == {"rpm": 100, "tpm": None}
+
+    db.team = {"default_cloud_rpm_limit": 10}
+    cache.invalidate_team(2)
+
+    assert auth.resolve_limits(db, ctx).cloud_rl == {"rpm": 10, "tpm": None}
+
+
+def test_load_racing_an_invalidation_is_not_cached(cache):
+    def _load():
+        cache.invalidate_api_key(api_key_id=5)
+        return _api_key_row()
+
+    assert cache.get_api_key("lg-test-abc", _load) is not None
+    assert len(cache.api_keys) == 0
+
+
+def test_zero_ttl_disables_caching(monkeypatch):
+    monkeypatch.setenv("LOGOS_AUTH_CACHE_TTL_S", "0")
+    disabled = AuthCache(AuthCacheConfig.from_env())
+    loads = []
+
+    for _ in range(2):
+        disabled.get_api_key("lg-test-abc", lambda: loads.append(1) or _api_key_row())
+
+    assert len(loads) == 2
@@ -22,6 +22,7 @@ import de.tum.cit.aet.logos.logoswebservice.identity.repository.ApiKeyRepository
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.ApiKeyWithBudgetProjection;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.TeamMemberRepository;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.TeamRepository;
+import de.tum.cit.aet.logos.logoswebservice.orchestrator.OrchestratorNotificationService;
 
 @Service
 public class ApiKeyAdminService {
@@ -32,13 +33,16 @@ public class ApiKeyAdminService {
     private final ApiKeyRepository apiKeyRepository;
     private final TeamRepository teamRepository;
     private final TeamMemberRepository teamMemberRepository;
+    private final OrchestratorNotificationService orchestratorNotificationService;
 
     public ApiKeyAdminService(ApiKeyRepository apiKeyRepository,
                               TeamRepository teamRepository,
-                              TeamMemberRepository teamMemberRepository) {
+                              TeamMemberRepository teamMemberRepository,
+                              OrchestratorNotificationService orchestratorNotificationService) {
         this.apiKeyRepository = apiKeyRepository;
         this.teamRepository = teamRepository;
         this.teamMemberRepository = teamMemberRepository;
+        this.orchestratorNotificationService = orchestratorNotificationService;
     }
 
     public List<Map<String, Object>> getKeysForTeam(int teamId) {
@@ -124,6 +128,7 @@ public class ApiKeyAdminService {
             .orElseThrow(() -> new IllegalArgumentException("API key not found: " + keyId));
         k.setLog(LogLevel.valueOf(level));
         apiKeyRepository.save(k);
+        orchestratorNotificationService.notifyAuthInvalidation(keyId, null);
         return Map.of("result", "Updated log level to " + level);
     }
 
@@ -132,6 +137,7 @@ public class ApiKeyAdminService {
         apiKeyRepository.findById(keyId).ifPresent(k -> {
             k.setIsActive(false);
             apiKeyRepository.save(k);
+            orchestratorNotificationService.notifyAuthInvalidation(keyId, null);
         });
     }
 
@@ -153,6 +159,7 @@ public class ApiKeyAdminService {
         if (req.log() != null) k.setLog(LogLevel.valueOf(req.log()));
         if (req.useCustomPermissions() != null) k.setUseCustomPermissions(req.useCustomPermissions());
         apiKeyRepository.save(k);
+        orchestratorNotificationService.notifyAuthInvalidation(keyId, null);
         return Map.of("result", "API Key updated successfully");
     }
 
@@ -167,6 +174,7 @@ public class ApiKeyAdminService {
         ApiKey key = keyOpt.get();
         key.setKeyValue(rotateKeyValue(key.getKeyValue()));
         apiKeyRepository.save(key);
+        orchestratorNotificationService.notifyAuthInvalidation(keyId, null);
         return Optional.of(Map.of(
             "result", "API key rotated successfully",
             "api_key", key.getKeyValue()));
@@ -18,6 +18,7 @@ import de.tum.cit.aet.logos.logoswebservice.identity.repository.ApiKeyRepository
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.ModelAccessProjection;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.MyKeyProjection;
 import de.tum.cit.aet.logos.logoswebservice.orchestrator.OrchestratorModelWindowClient;
+import de.tum.cit.aet.logos.logoswebservice.orchestrator.OrchestratorNotificationService;
 
 @Service
 public class MeKeysService {
@@ -28,10 +29,13 @@ public class MeKeysService {
 
     private final ApiKeyRepository apiKeyRepository;
     private final OrchestratorModelWindowClient modelWindowClient;
+    private final OrchestratorNotificationService orchestratorNotificationService;
 
-    public MeKeysService(ApiKeyRepository apiKeyRepository, OrchestratorModelWindowClient modelWindowClient) {
+    public MeKeysService(ApiKeyRepository apiKeyRepository, OrchestratorModelWindowClient modelWindowClient,
+                         OrchestratorNotificationService orchestratorNotificationService) {
         this.apiKeyRepository = apiKeyRepository;
         this.modelWindowClient = modelWindowClient;
+        this.orchestratorNotificationService = orchestratorNotificationService;
     }
 
     public List<Map<String, Object>> getKeysForUser(int userId) {
@@ -58,6 +62,7 @@ public class MeKeysService {
         }
         key.setLog(LogLevel.valueOf(level));
         apiKeyRepository.save(key);
+        orchestratorNotificationService.notifyAuthInvalidation(keyId, null);
         return Optional.of(Map.of("result", "Log level updated to " + level));
     }
 
@@ -99,6 +104,7 @@ public class MeKeysService {
         }
         key.setKeyValue(rotateKeyValue(key.getKeyValue()));
         apiKeyRepository.save(key);
+        orchestratorNotificationService.notifyAuthInvalidation(keyId, null);
         return Optional.of(Map.of(
             "result", "API key rotated successfully",
             "api_key", key.getKeyValue()));
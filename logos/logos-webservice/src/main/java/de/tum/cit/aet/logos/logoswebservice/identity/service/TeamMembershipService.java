@@ -15,6 +15,7 @@ import de.tum.cit.aet.logos.logoswebservice.identity.repository.ApiKeyRepository
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.TeamMemberRepository;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.TeamRepository;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.UserRepository;
+import de.tum.cit.aet.logos.logoswebservice.orchestrator.OrchestratorNotificationService;
 
 @Service
 public class TeamMembershipService {
@@ -24,17 +25,20 @@ public class TeamMembershipService {
     private final UserRepository userRepository;
     private final TeamRepository teamRepository;
     private final ApiKeyFactory apiKeyFactory;
+    private final OrchestratorNotificationService orchestratorNotificationService;
 
     public TeamMembershipService(TeamMemberRepository memberRepository,
                                  ApiKeyRepository apiKeyRepository,
                                  UserRepository userRepository,
                                  TeamRepository teamRepository,
-                                 ApiKeyFactory apiKeyFactory) {
+                                 ApiKeyFactory apiKeyFactory,
+                                 OrchestratorNotificationService orchestratorNotificationService) {
         this.memberRepository = memberRepository;
         this.apiKeyRepository = apiKeyRepository;
         this.userRepository = userRepository;
         this.teamRepository = teamRepository;
         this.apiKeyFactory = apiKeyFactory;
+        this.orchestratorNotificationService = orchestratorNotificationService;
     }
 
     @Transactional
@@ -96,6 +100,7 @@ public class TeamMembershipService {
         for (ApiKey key : keys) {
             key.setIsActive(false);
             apiKeyRepository.save(key);
+            orchestratorNotificationService.notifyAuthInvalidation(key.getId(), null);
         }
     }
 }
@@ -29,6 +29,7 @@ import de.tum.cit.aet.logos.logoswebservice.identity.repository.ApiKeyRepository
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.TeamMemberRepository;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.TeamRepository;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.UserRepository;
+import de.tum.cit.aet.logos.logoswebservice.orchestrator.OrchestratorNotificationService;
 
 @Service
 public class TeamService {
@@ -40,12 +41,14 @@ public class TeamService {
     private final TeamModelPermissionRepository teamModelPermissionRepository;
     private final ApiKeyRepository apiKeyRepository;
     private final TeamMembershipService membershipService;
+    private final OrchestratorNotificationService orchestratorNotificationService;
 
     public TeamService(TeamRepository teamRepository, TeamMemberRepository memberRepository,
                        UserRepository userRepository, TeamBudgetRepository teamBudgetRepository,
                        TeamModelPermissionRepository teamModelPermissionRepository,
                        ApiKeyRepository apiKeyRepository,
-                       TeamMembershipService membershipService) {
+                       TeamMembershipService membershipService,
+                       OrchestratorNotificationService orchestratorNotificationService) {
         this.teamRepository = teamRepository;
         this.memberRepository = memberRepository;
         this.userRepository = userRepository;
@@ -53,6 +56,7 @@ public class TeamService {
         this.teamModelPermissionRepository = teamModelPermissionRepository;
         this.apiKeyRepository = apiKeyRepository;
         this.membershipService = membershipService;
+        this.orchestratorNotificationService = orchestratorNotificationService;
     }
 
     public List<TeamListResponseDTO> listAllTeams(Integer callerId) {
@@ -128,6 +132,7 @@ public class TeamService {
         if (teamOpt.isEmpty()) return false;
         requireUnmanaged(teamOpt.get(), "deleted");
         teamRepository.deleteById(teamId);
+        orchestratorNotificationService.notifyAuthInvalidation(null, null);
         return true;
     }
 
@@ -193,6 +198,7 @@ public class TeamService {
             if (body.default_monthly_budget_micro_cents() != null) team.setDefaultMonthlyBudgetMicroCents(body.default_monthly_budget_micro_cents());
             if (body.team_monthly_budget_micro_cents() != null) team.setTeamMonthlyBudgetMicroCents(body.team_monthly_budget_micro_cents());
             teamRepository.save(team);
+            orchestratorNotificationService.notifyAuthInvalidation(null, teamId);
             return new TeamResponseDTO(team.getId(), team.getName());
         });
     }
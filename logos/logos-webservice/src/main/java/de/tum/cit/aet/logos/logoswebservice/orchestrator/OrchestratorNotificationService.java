@@ -1,6 +1,8 @@
 package de.tum.cit.aet.logos.logoswebservice.orchestrator;
 
+import java.util.HashMap;
 import java.util.Map;
+import java.util.concurrent.CompletableFuture;
 
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
@@ -9,6 +11,8 @@ import org.springframework.http.HttpEntity;
 import org.springframework.http.HttpHeaders;
 import org.springframework.scheduling.annotation.Async;
 import org.springframework.stereotype.Service;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
 import org.springframework.web.client.RestTemplate;
 
 @Service
@@ -45,4 +49,41 @@ public class OrchestratorNotificationService {
             log.warn("Failed to notify orchestrator of pipeline refresh: {}", e.getMessage());
         }
     }
+
+    /**
+     * Tells the orchestrator to drop its cached auth data for a key and/or a team
+     * (both null flushes everything). Sent after the surrounding transaction
+     * commits, so the orchestrator cannot re-cache the pre-update row.
+     */
+    public void notifyAuthInvalidation(Integer apiKeyId, Integer teamId) {
+        if (orchestratorUrl.isBlank() || internalSecret.isBlank()) {
+            return;
+        }
+        Map<String, Object> body = new HashMap<>();
+        if (apiKeyId != null) body.put("api_key_id", apiKeyId);
+        if (teamId != null) body.put("team_id", teamId);
+        Runnable send = () -> CompletableFuture.runAsync(() -> postAuthInvalidation(body));
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    send.run();
+                }
+            });
+        } else {
+            send.run();
+        }
+    }
+
+    private void postAuthInvalidation(Map<String, Object> body) {
+        try {
+            HttpHeaders headers = new HttpHeaders();
+            headers.set("Authorization", "Bearer " + internalSecret);
+            headers.set("Content-Type", "application/json");
+            restTemplate.postForEntity(orchestratorUrl + "/internal/auth_cache/invalidate",
+                new HttpEntity<>(body, headers), Void.class);
+        } catch (Exception e) {
+            log.warn("Failed to notify orchestrator of auth cache invalidation: {}", e.getMessage());
+        }
+    }
 }
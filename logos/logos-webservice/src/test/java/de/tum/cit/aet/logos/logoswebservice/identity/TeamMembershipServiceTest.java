@@ -30,6 +30,7 @@ import de.tum.cit.aet.logos.logoswebservice.identity.repository.TeamRepository;
 import de.tum.cit.aet.logos.logoswebservice.identity.repository.UserRepository;
 import de.tum.cit.aet.logos.logoswebservice.identity.service.ApiKeyFactory;
 import de.tum.cit.aet.logos.logoswebservice.identity.service.TeamMembershipService;
+import de.tum.cit.aet.logos.logoswebservice.orchestrator.OrchestratorNotificationService;
 
 @ExtendWith(MockitoExtension.class)
 class TeamMembershipServiceTest {
@@ -39,6 +40,7 @@ class TeamMembershipServiceTest {
     @Mock UserRepository userRepository;
     @Mock TeamRepository teamRepository;
     @Mock ApiKeyFactory apiKeyFactory;
+    @Mock OrchestratorNotificationService orchestratorNotificationService;
     @InjectMocks TeamMembershipService service;
 
     private User user;
@@ -105,6 +107,7 @@ class TeamMembershipServiceTest {
         verify(memberRepository).deleteById(new TeamMemberId(1, 10));
         assertThat(activeKey.getIsActive()).isFalse();
         verify(apiKeyRepository).save(activeKey);
+        verify(orchestratorNotificationService).notifyAuthInvalidation(activeKey.getId(), null);
     }
 
     @Test
@@ -30,6 +30,7 @@ from logos_worker_node import prometheus_metrics as prom
 from logos_worker_node.models import LaneConfig, LaneEvent, LogosConfig, WorkerTransportStatus, model_can_sleep
 from logos_worker_node.request_content import MULTIPART_PAYLOAD_KEY, httpx_request_parts
 from logos_worker_node.runtime import build_runtime_status
+from logos_worker_node.stream_frames import BINARY_STREAM_ENCODING, encode_stream_chunk, encode_stream_control
 
 logger = logging.getLogger("logos_worker_node.logos_bridge")
 
@@ -383,6 +384,10 @@ class LogosBridgeClient:
                 # moment after the first status has already made this worker
                 # look plannable.
                 "calibrating": self._active_calibration_session is not None,
+                # Encodings this worker can relay infer_stream output in. The
+                # server picks one per command; older servers never ask for
+                # anything but JSON.
+                "stream_encodings": ["json", BINARY_STREAM_ENCODING],
                 "actions": [
                     "infer",
                     "infer_stream",
@@ -452,6 +457,32 @@ class LogosBridgeClient:
         async with self._send_lock:
             await ws.send(json.dumps(payload))
 
+    async def _send_stream_frame(self, ws, frame: bytes | str, encoding: str) -> None:
+        """Send one stream relay frame and count its wire size for its encoding."""
+        async with self._send_lock:
+            await ws.send(frame)
+        size = len(frame) if isinstance(frame, bytes) else len(frame.encode("utf-8"))
+        prom.BRIDGE_STREAM_BYTES_TOTAL.labels(encoding=encoding).inc(size)
+
+    async def _send_stream_control(self, ws, payload: dict[str, Any], binary: bool) -> None:
+        if binary:
+            await self._send_stream_frame(ws, encode_stream_control(payload), BINARY_STREAM_ENCODING)
+        else:
+            await self._send_stream_frame(ws, json.dumps(payload), "json")
+
+    async def _send_stream_chunk(self, ws, cmd_id: str, chunk: bytes, binary: bool) -> None:
+        if binary:
+            await self._send_stream_frame(ws, encode_stream_chunk(cmd_id, chunk), BINARY_STREAM_ENCODING)
+            return
+        raw = json.dumps(
+            {
+                "type": "stream_chunk",
+                "cmd_id": cmd_id,
+                "chunk_b64": base64.b64encode(chunk).decode("ascii"),
+            }
+        )
+        await self._send_stream_frame(ws, raw, "json")
+
     def _track_command_task(self, task: asyncio.Task, *, action: str, cmd_id: str) -> None:
         self._command_tasks.add(task)
 
@@ -558,8 +589,9 @@ class LogosBridgeClient:
             return
 
         if action == "infer_stream":
+            binary = message.get("stream_encoding") == BINARY_STREAM_ENCODING
             task = asyncio.create_task(
-                self._execute_stream_command(ws, cmd_id, params),
+                self._execute_stream_command(ws, cmd_id, params, binary=binary),
                 name=f"logos-bridge-{action}-{cmd_id[:8]}",
             )
             self._track_command_task(task, action=action, cmd_id=cmd_id)
@@ -1397,12 +1429,24 @@ class LogosBridgeClient:
             result["body_encoding"] = "base64"
         return result
 
-    async def _execute_stream_command(self, ws, cmd_id: str, params: dict[str, Any]) -> None:
+    async def _execute_stream_command(
+        self,
+        ws,
+        cmd_id: str,
+        params: dict[str, Any],
+        *,
+        binary: bool = False,
+    ) -> None:
+        """Relay a streamed lane response as stream_start/chunk/end messages.
+
+        With *binary* the messages go out as binary frames (see
+        ``stream_frames``) instead of JSON text with base64 chunks.
+        """
         lane_manager = self._app.state.lane_manager
         lane_id = str(params.get("lane_id", "")).strip()
         payload = params.get("payload") or {}
         if not isinstance(payload, dict):
-            await self._send_json(
+            await self._send_stream_control(
                 ws,
                 {
                     "type": "stream_end",
@@ -1410,6 +1454,7 @@ class LogosBridgeClient:
                     "success": False,
                     "error": "payload must be an object",
                 },
+                binary,
             )
             return
 
@@ -1420,7 +1465,7 @@ class LogosBridgeClient:
         try:
             lane_status = (await lane_manager.acquire_lane_for_infer(lane_id)).model_dump(mode="json")
         except Exception as exc:  # noqa: BLE001
-            await self._send_json(
+            await self._send_stream_control(
                 ws,
                 {
                     "type": "stream_end",
@@ -1428,6 +1473,7 @@ class LogosBridgeClient:
                     "success": False,
                     "error": str(exc),
                 },
+                binary,
             )
             return
 
@@ -1455,18 +1501,11 @@ class LogosBridgeClient:
 
             if upstream.status_code >= 400:
                 # Error response: surface status + body immediately, then end.
-                await self._send_json(ws, _start_frame())
+                await self._send_stream_control(ws, _start_frame(), binary)
                 raw = await upstream.aread()
                 if raw:
-                    await self._send_json(
-                        ws,
-                        {
-                            "type": "stream_chunk",
-                            "cmd_id": cmd_id,
-                            "chunk_b64": base64.b64encode(raw).decode("ascii"),
-                        },
-                    )
-                await self._send_json(
+                    await self._send_stream_chunk(ws, cmd_id, raw, binary)
+                await self._send_stream_control(
                     ws,
                     {
                         "type": "stream_end",
@@ -1474,6 +1513,7 @@ class LogosBridgeClient:
                         "success": False,
                         "error": f"Lane '{lane_id}' returned HTTP {upstream.status_code}",
                     },
+                    binary,
                 )
                 return
 
@@ -1491,21 +1531,14 @@ class LogosBridgeClient:
                 if not chunk:
                     continue
                 if not started:
-                    await self._send_json(ws, _start_frame())
+                    await self._send_stream_control(ws, _start_frame(), binary)
                     started = True
-                await self._send_json(
-                    ws,
-                    {
-                        "type": "stream_chunk",
-                        "cmd_id": cmd_id,
-                        "chunk_b64": base64.b64encode(chunk).decode("ascii"),
-                    },
-                )
+                await self._send_stream_chunk(ws, cmd_id, chunk, binary)
             if not started:
                 # 2xx but the upstream produced ZERO bytes (engine not ready / lane
                 # re-slept mid-request). Fail cleanly BEFORE any stream_start so the
                 # request is reroutable rather than a client-visible 200-then-drop.
-                await self._send_json(
+                await self._send_stream_control(
                     ws,
                     {
                         "type": "stream_end",
@@ -1513,11 +1546,12 @@ class LogosBridgeClient:
                         "success": False,
                         "error": f"Lane '{lane_id}' returned 200 but produced no output (not ready / re-slept)",
                     },
+                    binary,
                 )
                 return
-            await self._send_json(ws, {"type": "stream_end", "cmd_id": cmd_id, "success": True})
+            await self._send_stream_control(ws, {"type": "stream_end", "cmd_id": cmd_id, "success": True}, binary)
         except Exception as exc:  # noqa: BLE001
-            await self._send_json(
+            await self._send_stream_control(
                 ws,
                 {
                     "type": "stream_end",
@@ -1525,6 +1559,7 @@ class LogosBridgeClient:
                     "success": False,
                     "error": str(exc),
                 },
+                binary,
             )
         finally:
             # Decrement before aclose() so that a client-side disconnect that
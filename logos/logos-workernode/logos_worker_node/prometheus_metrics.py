@@ -154,6 +154,13 @@ BRIDGE_ERRORS_TOTAL = Counter(
     registry=registry,
 )
 
+BRIDGE_STREAM_BYTES_TOTAL = Counter(
+    "logos_worker_bridge_stream_bytes_total",
+    "Bytes sent to Logos for relayed inference streams, by wire encoding",
+    ["encoding"],  # json, binary
+    registry=registry,
+)
+
 # ---------------------------------------------------------------------------
 # Inference (per lane)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,102 @@
+"""Binary WebSocket framing for streamed inference relayed over the Logos bridge.
+
+The JSON protocol carries every token chunk as ``{"type": "stream_chunk",
+"cmd_id": ..., "chunk_b64": ...}``: base64 inflates the payload by a third and
+each SSE event pays a ``json.dumps`` here plus a ``json.loads`` and a base64
+decode on the server. Binary frames carry the chunk bytes verbatim behind a
+small fixed header instead.
+
+Frame layout (all integers unsigned, network byte order)::
+
+    +---------+------+------------+-----------------+----------------------+
+    | version | kind | cmd_id_len | cmd_id (ASCII)  | body                 |
+    | 1 byte  | 1 B  | 1 byte     | cmd_id_len B    | rest of the frame    |
+    +---------+------+------------+-----------------+----------------------+
+
+``body`` is the raw upstream bytes for ``stream_chunk`` and a compact JSON
+object with the remaining fields (``status_code``/``content_type``, or
+``success``/``error``) for ``stream_start`` and ``stream_end``, which occur
+once per request and are not worth a bespoke encoding.
+
+The mode is negotiated: the worker lists :data:`BINARY_STREAM_ENCODING` in
+the ``stream_encodings`` of its hello, and the server opts in per command by
+sending ``"stream_encoding": "binary"`` with ``infer_stream``. Either side
+being older leaves the JSON protocol in place.
+
+The orchestrator keeps a mirror of this module in ``logos/logosnode_frames.py``;
+the two must stay wire-compatible.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any
+
+BINARY_STREAM_ENCODING = "binary"
+STREAM_FRAME_VERSION = 1
+
+_HEADER = struct.Struct("!BBB")
+
+_KIND_BY_TYPE = {
+    "stream_start": 1,
+    "stream_chunk": 2,
+    "stream_end": 3,
+}
+_TYPE_BY_KIND = {kind: frame_type for frame_type, kind in _KIND_BY_TYPE.items()}
+
+
+class StreamFrameError(ValueError):
+    """Raised when a binary stream frame cannot be encoded or decoded."""
+
+
+def _header(frame_type: str, cmd_id: str) -> bytes:
+    cmd_id_raw = cmd_id.encode("ascii")
+    if len(cmd_id_raw) > 255:
+        raise StreamFrameError(f"cmd_id too long for a binary stream frame ({len(cmd_id_raw)} bytes)")
+    return _HEADER.pack(STREAM_FRAME_VERSION, _KIND_BY_TYPE[frame_type], len(cmd_id_raw)) + cmd_id_raw
+
+
+def encode_stream_chunk(cmd_id: str, chunk: bytes) -> bytes:
+    """Encode one upstream chunk; the bytes are carried without re-encoding."""
+    return _header("stream_chunk", cmd_id) + chunk
+
+
+def encode_stream_control(payload: dict[str, Any]) -> bytes:
+    """Encode a ``stream_start`` / ``stream_end`` message given in its JSON form."""
+    frame_type = payload.get("type")
+    if frame_type not in ("stream_start", "stream_end"):
+        raise StreamFrameError(f"not a stream control message: {frame_type!r}")
+    fields = {key: value for key, value in payload.items() if key not in ("type", "cmd_id")}
+    body = json.dumps(fields, separators=(",", ":")).encode("utf-8")
+    return _header(frame_type, str(payload.get("cmd_id", ""))) + body
+
+
+def decode_stream_frame(data: bytes) -> dict[str, Any]:
+    """Decode a binary frame back into the JSON protocol's message shape.
+
+    ``stream_chunk`` messages carry the payload as raw bytes under ``chunk``
+    rather than base64 text under ``chunk_b64``.
+    """
+    if len(data) < _HEADER.size:
+        raise StreamFrameError("binary stream frame shorter than its header")
+    version, kind, cmd_id_len = _HEADER.unpack_from(data)
+    if version != STREAM_FRAME_VERSION:
+        raise StreamFrameError(f"unsupported binary stream frame version {version}")
+    frame_type = _TYPE_BY_KIND.get(kind)
+    if frame_type is None:
+        raise StreamFrameError(f"unknown binary stream frame kind {kind}")
+    body_start = _HEADER.size + cmd_id_len
+    if len(data) < body_start:
+        raise StreamFrameError("binary stream frame truncated inside cmd_id")
+    cmd_id = bytes(data[_HEADER.size : body_start]).decode("ascii")
+    body = bytes(data[body_start:])
+    if frame_type == "stream_chunk":
+        return {"type": frame_type, "cmd_id": cmd_id, "chunk": body}
+    try:
+        fields = json.loads(body) if body else {}
+    except ValueError as exc:
+        raise StreamFrameError(f"invalid {frame_type} body: {exc}") from exc
+    if not isinstance(fields, dict):
+        raise StreamFrameError(f"invalid {frame_type} body: expected an object")
+    return {**fields, "type": frame_type, "cmd_id": cmd_id}
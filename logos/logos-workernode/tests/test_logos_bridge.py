@@ -7,8 +7,15 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from logos_worker_node import prometheus_metrics as prom
 from logos_worker_node.logos_bridge import LogosBridgeClient, _CalibrationSession
 from logos_worker_node.models import LaneStatus, LogosConfig, ProcessState, ProcessStatus
+from logos_worker_node.stream_frames import (
+    StreamFrameError,
+    decode_stream_frame,
+    encode_stream_chunk,
+    encode_stream_control,
+)
 
 
 class _DummyState:
@@ -355,8 +362,9 @@ async def test_handle_message_runs_stream_command_in_background():
     release = asyncio.Event()
     finished = asyncio.Event()
 
-    async def _fake_execute_stream_command(ws, cmd_id, params):  # noqa: ARG001
+    async def _fake_execute_stream_command(ws, cmd_id, params, binary=False):  # noqa: ARG001
         assert cmd_id == "cmd-stream"
+        assert binary is False
         assert params == {"lane_id": "lane-a"}
         started.set()
         await release.wait()
@@ -1041,8 +1049,15 @@ async def test_session_destroys_lanes_before_calibrating(tmp_path, monkeypatch):
 class _CollectWS:
     def __init__(self) -> None:
         self.frames: list[dict] = []
-
-    async def send(self, raw: str) -> None:
+        self.binary_frames = 0
+        self.wire_bytes = 0
+
+    async def send(self, raw: str | bytes) -> None:
+        self.wire_bytes += len(raw) if isinstance(raw, bytes) else len(raw.encode("utf-8"))
+        if isinstance(raw, bytes):
+            self.binary_frames += 1
+            self.frames.append(decode_stream_frame(raw))
+            return
         self.frames.append(json.loads(raw))
 
 
@@ -1077,7 +1092,13 @@ class _FakeStreamClient:
         return None
 
 
-async def _run_stream(monkeypatch, chunks: list[bytes], status_code: int = 200) -> list[dict]:
+async def _run_stream(
+    monkeypatch,
+    chunks: list[bytes],
+    status_code: int = 200,
+    binary: bool = False,
+    ws: _CollectWS | None = None,
+) -> list[dict]:
     app = _DummyApp()
     lane_manager = type("LaneMgr", (), {})()
     lane_manager.acquire_lane_for_infer = AsyncMock(return_value=_make_lane_status())
@@ -1090,18 +1111,26 @@ async def _run_stream(monkeypatch, chunks: list[bytes], status_code: int = 200)
         "logos_worker_node.logos_bridge.httpx.AsyncClient",
         lambda timeout=None: _FakeStreamClient(upstream),
     )
-    ws = _CollectWS()
+    ws = ws or _CollectWS()
     await client._execute_stream_command(  # noqa: SLF001
-        ws, "cmd-1", {"lane_id": "lane-a", "payload": {"messages": []}}
+        ws, "cmd-1", {"lane_id": "lane-a", "payload": {"messages": []}}, binary=binary
     )
     return ws.frames
 
 
+def _stream_bytes_metric(encoding: str) -> float:
+    return prom.registry.get_sample_value("logos_worker_bridge_stream_bytes_total", {"encoding": encoding}) or 0.0
+
+
 @pytest.mark.asyncio
 async def test_stream_defers_start_until_first_byte(monkeypatch):
-    frames = await _run_stream(monkeypatch, [b"tok1", b"tok2"])
+    ws = _CollectWS()
+    before = _stream_bytes_metric("json")
+    frames = await _run_stream(monkeypatch, [b"tok1", b"tok2"], ws=ws)
     assert [f["type"] for f in frames] == ["stream_start", "stream_chunk", "stream_chunk", "stream_end"]
     assert frames[-1]["success"] is True
+    # Control and chunk frames are both counted at their wire size.
+    assert _stream_bytes_metric("json") - before == ws.wire_bytes
 
 
 @pytest.mark.asyncio
@@ -1115,6 +1144,67 @@ async def test_stream_200_with_no_output_fails_clean_without_start(monkeypatch):
     assert "stream_start" not in [f["type"] for f in frames]
 
 
+@pytest.mark.asyncio
+async def test_stream_binary_mode_relays_raw_chunks(monkeypatch):
+    ws = _CollectWS()
+    before = _stream_bytes_metric("binary")
+    frames = await _run_stream(monkeypatch, [b"data: tok1\n\n", b"data: tok2\n\n"], binary=True, ws=ws)
+    assert ws.binary_frames == 4
+    assert _stream_bytes_metric("binary") - before == ws.wire_bytes
+    assert [f["type"] for f in frames] == ["stream_start", "stream_chunk", "stream_chunk", "stream_end"]
+    assert all(f["cmd_id"] == "cmd-1" for f in frames)
+    assert frames[0]["status_code"] == 200
+    assert [f["chunk"] for f in frames[1:3]] == [b"data: tok1\n\n", b"data: tok2\n\n"]
+    assert frames[-1]["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_stream_binary_mode_error_response_keeps_order(monkeypatch):
+    ws = _CollectWS()
+    frames = await _run_stream(monkeypatch, [b'{"error":"boom"}'], status_code=500, binary=True, ws=ws)
+    assert ws.binary_frames == 3
+    assert [f["type"] for f in frames] == ["stream_start", "stream_chunk", "stream_end"]
+    assert frames[0]["status_code"] == 500
+    assert frames[1]["chunk"] == b'{"error":"boom"}'
+    assert frames[-1]["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_handle_message_negotiates_binary_stream_encoding():
+    app = _DummyApp()
+    cfg = LogosConfig(enabled=True, logos_url="https://logos.example", shared_key="secret")
+    client = LogosBridgeClient(app, cfg)
+    seen: list[bool] = []
+
+    async def _fake_execute_stream_command(ws, cmd_id, params, binary=False):  # noqa: ARG001
+        seen.append(binary)
+
+    client._execute_stream_command = _fake_execute_stream_command  # type: ignore[method-assign]  # noqa: SLF001
+    for extra in ({"stream_encoding": "binary"}, {}):
+        await client._handle_message(  # noqa: SLF001
+            object(),
+            json.dumps({"type": "command", "cmd_id": "c", "action": "infer_stream", "params": {}, **extra}),
+        )
+    await asyncio.gather(*tuple(client._command_tasks))  # noqa: SLF001
+    assert seen == [True, False]
+
+
+def test_stream_frame_roundtrip_and_validation():
+    frame = encode_stream_chunk("cmd-1", b"\x00\xffraw")
+    assert len(frame) == 3 + len("cmd-1") + 5
+    assert decode_stream_frame(frame) == {"type": "stream_chunk", "cmd_id": "cmd-1", "chunk": b"\x00\xffraw"}
+
+    end = encode_stream_control({"type": "stream_end", "cmd_id": "cmd-1", "success": False, "error": "x"})
+    assert decode_stream_frame(end) == {"type": "stream_end", "cmd_id": "cmd-1", "success": False, "error": "x"}
+
+    with pytest.raises(StreamFrameError):
+        decode_stream_frame(b"\x02\x02\x00")
+    with pytest.raises(StreamFrameError):
+        decode_stream_frame(b"\x01\x09\x00")
+    with pytest.raises(StreamFrameError):
+        encode_stream_control({"type": "stream_chunk", "cmd_id": "cmd-1"})
+
+
 # ---------------------------------------------------------------------------
 # VRAM-growing commands are refused while a calibration session holds the GPU
 # ---------------------------------------------------------------------------
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-chunk cost of relaying streamed tokens over the Logos bridge.
+
+Compares the legacy JSON protocol (base64 chunk inside a JSON object,
+json.dumps on the worker, json.loads + b64decode on the server) with the
+negotiated binary frames from logos_worker_node.stream_frames.
+
+For each encoding it measures, over synthetic vLLM-style SSE events:
+  - bytes on the wire per chunk,
+  - worker encode + server decode CPU time per chunk,
+and projects both onto a fleet-level token rate (streams x tokens/s).
+
+Usage:
+  python tools/bench_stream_framing.py [--chunks 200000] [--streams 64] [--tokens-per-second 40]
+"""
+
+import argparse
+import base64
+import json
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logos_worker_node.stream_frames import decode_stream_frame, encode_stream_chunk  # noqa: E402
+
+_WORDS = ["the", " model", " returns", " a", " token", " per", " event", ",", " and", " then", "\n", " def", " x"]
+
+
+def make_sse_chunks(count: int, model: str, seed: int = 0) -> list[bytes]:
+    """Build OpenAI-compatible chat.completion.chunk SSE events, one token each."""
+    rng = random.Random(seed)
+    completion_id = f"chatcmpl-{uuid.UUID(int=rng.getrandbits(128)).hex}"
+    created = 1_700_000_000
+    chunks = []
+    for _ in range(count):
+        event = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"content": rng.choice(_WORDS)},
+                    "logprobs": None,
+                    "finish_reason": None,
+                }
+            ],
+        }
+        chunks.append(b"data: " + json.dumps(event, separators=(",", ":")).encode() + b"\n\n")
+    return chunks
+
+
+def json_roundtrip(cmd_id: str, chunk: bytes) -> tuple[int, bytes]:
+    raw = json.dumps(
+        {
+            "type": "stream_chunk",
+            "cmd_id": cmd_id,
+            "chunk_b64": base64.b64encode(chunk).decode("ascii"),
+        }
+    )
+    payload = json.loads(raw)
+    return len(raw.encode("utf-8")), base64.b64decode(payload["chunk_b64"])
+
+
+def binary_roundtrip(cmd_id: str, chunk: bytes) -> tuple[int, bytes]:
+    frame = encode_stream_chunk(cmd_id, chunk)
+    return len(frame), decode_stream_frame(frame)["chunk"]
+
+
+def measure(name: str, roundtrip, cmd_id: str, chunks: list[bytes]) -> dict:
+    wire_bytes = 0
+    t0 = time.process_time()
+    for chunk in chunks:
+        size, decoded = roundtrip(cmd_id, chunk)
+        wire_bytes += size
+    elapsed = time.process_time() - t0
+    assert decoded == chunks[-1], f"{name} roundtrip corrupted the payload"
+    return {
+        "name": name,
+        "us_per_chunk": elapsed / len(chunks) * 1e6,
+        "bytes_per_chunk": wire_bytes / len(chunks),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=200_000, help="chunks per encoding")
+    parser.add_argument("--streams", type=int, default=64, help="concurrent streams for the projection")
+    parser.add_argument("--tokens-per-second", type=float, default=40.0, help="tokens/s per stream")
+    parser.add_argument("--model", default="Qwen/Qwen2.5-Coder-32B-Instruct-AWQ")
+    args = parser.parse_args()
+
+    chunks = make_sse_chunks(args.chunks, args.model)
+    cmd_id = str(uuid.uuid4())
+    payload_bytes = sum(len(c) for c in chunks) / len(chunks)
+
+    # Warm both paths so the first measurement does not pay import/alloc costs.
+    measure("warmup", json_roundtrip, cmd_id, chunks[:1000])
+    measure("warmup", binary_roundtrip, cmd_id, chunks[:1000])
+    results = [
+        measure("json+base64", json_roundtrip, cmd_id, chunks),
+        measure("binary", binary_roundtrip, cmd_id, chunks),
+    ]
+
+    rate = args.streams * args.tokens_per_second
+    print(f"chunks={args.chunks}  avg SSE payload={payload_bytes:.1f} B")
+    print(f"projection: {args.streams} streams x {args.tokens_per_second:g} tok/s = {rate:g} chunks/s\n")
+    print(f"{'encoding':<14}{'B/chunk':>10}{'overhead':>10}{'us/chunk':>10}{'CPU ms/s':>10}{'KiB/s':>10}")
+    for r in results:
+        overhead = (r["bytes_per_chunk"] / payload_bytes - 1) * 100
+        print(
+            f"{r['name']:<14}{r['bytes_per_chunk']:>10.1f}{overhead:>9.1f}%{r['us_per_chunk']:>10.2f}"
+            f"{r['us_per_chunk'] * rate / 1000:>10.1f}{r['bytes_per_chunk'] * rate / 1024:>10.1f}"
+        )
+    legacy, binary = results
+    print(
+        f"\nbinary saves {legacy['bytes_per_chunk'] - binary['bytes_per_chunk']:.1f} B and "
+        f"{legacy['us_per_chunk'] - binary['us_per_chunk']:.2f} us per chunk "
+        f"({(1 - binary['us_per_chunk'] / legacy['us_per_chunk']) * 100:.0f}% CPU, "
+        f"{(1 - binary['bytes_per_chunk'] / legacy['bytes_per_chunk']) * 100:.0f}% bytes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
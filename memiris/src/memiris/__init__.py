@@ -18,13 +18,24 @@ from memiris.api.memory_sleep_pipeline import (
     MemorySleepPipeline,
     MemorySleepPipelineBuilder,
 )
+from memiris.api.memory_sleep_scheduler import (
+    MemorySleepScheduler,
+    SleepSchedulerStats,
+)
 from memiris.api.memory_with_relations_dto import MemoryWithRelationsDTO
 from memiris.domain.learning import Learning
 from memiris.domain.memory import Memory
 from memiris.domain.memory_connection import MemoryConnection
 from memiris.llm.abstract_language_model import AbstractLanguageModel
+from memiris.llm.llm_budget import BudgetedLanguageModel, LlmBudget, LlmBudgetStats
 from memiris.llm.ollama_language_model import OllamaLanguageModel
 from memiris.llm.openai_language_model import OpenAiLanguageModel
+from memiris.service.memory_sleep import SleepStats
+from memiris.service.sleep_checkpoint import (
+    FileSleepCheckpointStore,
+    InMemorySleepCheckpointStore,
+    SleepCheckpointStore,
+)
 
 try:
     dist_name = "MemIris"
@@ -46,6 +57,12 @@ __all__ = [
     # API services
     "MemorySleepPipeline",
     "MemorySleepPipelineBuilder",
+    "SleepStats",
+    "MemorySleepScheduler",
+    "SleepSchedulerStats",
+    "SleepCheckpointStore",
+    "FileSleepCheckpointStore",
+    "InMemorySleepCheckpointStore",
     "MemoryCreationPipeline",
     "MemoryCreationPipelineBuilder",
     "MemoryService",
@@ -55,4 +72,7 @@ __all__ = [
     "OllamaLanguageModel",
     "OpenAiLanguageModel",
     "AbstractLanguageModel",
+    "LlmBudget",
+    "LlmBudgetStats",
+    "BudgetedLanguageModel",
 ]
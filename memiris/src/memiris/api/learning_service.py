@@ -94,6 +94,18 @@ class LearningService:
         """
         return self._learning_repository.all(tenant)
 
+    def count_learnings(self, tenant: str) -> int:
+        """
+        Count the learning entries of a given tenant without loading them.
+
+        Args:
+            tenant: The tenant to which the learnings belong.
+
+        Returns:
+            int: The number of learnings of the tenant.
+        """
+        return self._learning_repository.count(tenant)
+
     def delete_learning(self, tenant: str, learning_id: UUID) -> None:
         """
         Delete a learning entry by its ID.
@@ -101,6 +101,18 @@ class MemoryConnectionService:
         """
         return self._memory_connection_repository.all(tenant)
 
+    def count_memory_connections(self, tenant: str) -> int:
+        """
+        Count the memory connection entries of a given tenant without loading them.
+
+        Args:
+            tenant: The tenant to which the memory connections belong.
+
+        Returns:
+            int: The number of memory connections of the tenant.
+        """
+        return self._memory_connection_repository.count(tenant)
+
     def delete_memory_connection(self, tenant: str, memory_connection_id: UUID) -> None:
         """
         Delete a memory connection entry by its ID.
@@ -94,6 +94,30 @@ class MemoryService:
         """
         return self._memory_repository.all(tenant)
 
+    def count_memories(self, tenant: str) -> int:
+        """
+        Count the memory entries of a given tenant without loading them.
+
+        Args:
+            tenant: The tenant to which the memories belong.
+
+        Returns:
+            int: The number of memories of the tenant.
+        """
+        return self._memory_repository.count(tenant)
+
+    def has_memories(self, tenant: str) -> bool:
+        """
+        Check if there are any memories for a given tenant without loading them.
+
+        Args:
+            tenant: The tenant to which the memories belong.
+
+        Returns:
+            bool: True if there are memories, False otherwise.
+        """
+        return self._memory_repository.has_any(tenant)
+
     def delete_memory(self, tenant: str, memory_id: UUID) -> None:
         """
         Delete a memory entry by its ID.
@@ -139,7 +163,19 @@ class MemoryService:
         Returns:
             bool: True if there are unslept memories, False otherwise.
         """
-        return len(self._memory_repository.find_unslept_memories(tenant)) > 0
+        return self._memory_repository.has_unslept_memories(tenant)
+
+    def count_unslept_memories(self, tenant: str) -> int:
+        """
+        Count the unslept memories of a given tenant without loading them.
+
+        Args:
+            tenant: The tenant to which the memories belong.
+
+        Returns:
+            int: The number of unslept memories of the tenant.
+        """
+        return self._memory_repository.count_unslept_memories(tenant)
 
     def find_all_tenants(self) -> list[str]:
         """
@@ -17,7 +17,8 @@ from memiris.repository.weaviate.weaviate_memory_connection_repository import (
 from memiris.repository.weaviate.weaviate_memory_repository import (
     WeaviateMemoryRepository,
 )
-from memiris.service.memory_sleep import MemorySleeper
+from memiris.service.memory_sleep import MemorySleeper, SleepStats
+from memiris.service.sleep_checkpoint import SleepCheckpointStore
 from memiris.service.vectorizer import Vectorizer
 
 
@@ -42,6 +43,11 @@ class MemorySleepPipelineBuilder:
         int | None
     )  # Size of memory groups, can be larger to meet the max_groups limit
     _max_groups: int | None  # Maximum number of groups to process in parallel
+    _candidate_neighbours: int | None  # Nearest neighbours compared per memory
+    _candidate_threshold: float | None  # Minimum vector similarity of compared memories
+    _neighbourhood_size: int | None  # Older memories fetched per unslept memory
+    _window_size: int | None  # Unslept memories processed together
+    _checkpoint_store: SleepCheckpointStore | None  # Where to resume interrupted sleeps
 
     def __init__(self):
         self._tool_llm = OllamaLanguageModel("gpt-oss:120b")
@@ -55,6 +61,11 @@ class MemorySleepPipelineBuilder:
         self._max_threads = None
         self._group_size = None
         self._max_groups = None
+        self._candidate_neighbours = None
+        self._candidate_threshold = None
+        self._neighbourhood_size = None
+        self._window_size = None
+        self._checkpoint_store = None
 
     def set_tool_llm(
         self, tool_llm: AbstractLanguageModel | None
@@ -110,6 +121,54 @@ class MemorySleepPipelineBuilder:
         self._group_size = group_size
         return self
 
+    def set_candidate_pruning(
+        self, neighbours: int | None, threshold: float | None = None
+    ) -> "MemorySleepPipelineBuilder":
+        """
+        Set which memories are compared when connecting them.
+        Each memory is only compared with its most similar memories by vector similarity.
+
+        Args:
+            neighbours: Number of most similar memories each memory is compared with, 0 compares all pairs.
+            threshold: Minimum cosine similarity of two compared memories.
+        """
+        if neighbours is not None and neighbours < 0:
+            raise ValueError("neighbours must be a non-negative integer.")
+        if threshold is not None and not -1.0 <= threshold <= 1.0:
+            raise ValueError("threshold must be between -1 and 1.")
+        self._candidate_neighbours = neighbours
+        self._candidate_threshold = threshold
+        return self
+
+    def set_neighbourhood_size(
+        self, neighbourhood_size: int | None
+    ) -> "MemorySleepPipelineBuilder":
+        """
+        Set the number of older memories fetched per unslept memory to be compared with it.
+        """
+        if neighbourhood_size is not None and neighbourhood_size < 0:
+            raise ValueError("neighbourhood_size must be a non-negative integer.")
+        self._neighbourhood_size = neighbourhood_size
+        return self
+
+    def set_window_size(self, window_size: int | None) -> "MemorySleepPipelineBuilder":
+        """
+        Set the number of unslept memories loaded and processed together.
+        """
+        if window_size is not None and window_size <= 0:
+            raise ValueError("window_size must be a positive integer.")
+        self._window_size = window_size
+        return self
+
+    def set_checkpoint_store(
+        self, checkpoint_store: SleepCheckpointStore | None
+    ) -> "MemorySleepPipelineBuilder":
+        """
+        Set the store used to resume interrupted sleeps after the last completed window.
+        """
+        self._checkpoint_store = checkpoint_store
+        return self
+
     @overload
     def set_learning_repository(
         self, value: LearningRepository
@@ -320,6 +379,11 @@ class MemorySleepPipelineBuilder:
                 max_threads=self._max_threads,
                 group_size=self._group_size,
                 max_groups=self._max_groups,
+                candidate_neighbours=self._candidate_neighbours,
+                candidate_threshold=self._candidate_threshold,
+                neighbourhood_size=self._neighbourhood_size,
+                window_size=self._window_size,
+                checkpoint_store=self._checkpoint_store,
             )
         )
 
@@ -335,15 +399,18 @@ class MemorySleepPipeline:
         self._memory_sleeper = memory_sleeper
 
     @observe(name="memiris.memory_sleep_pipeline.sleep")
-    def sleep(self, tenant: str, **kwargs):
+    def sleep(self, tenant: str, **kwargs) -> SleepStats:
         """
         Sleep on memories for a given tenant. Forms connections between memories and then deduplicates memories.
 
         Args:
             tenant: The tenant for which the memories should be processed.
             **kwargs: Additional keyword arguments that can be passed to the MemorySleeper's run_sleep method.
+
+        Returns:
+            SleepStats: The number of processed memories, the throughput and the peak memory usage.
         """
         if not self._memory_sleeper:
             raise ValueError("MemorySleeper must be set.")
 
-        self._memory_sleeper.run_sleep(tenant, **kwargs)
+        return self._memory_sleeper.run_sleep(tenant, **kwargs)
@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from memiris.api.memory_service import MemoryService
+from memiris.api.memory_sleep_pipeline import MemorySleepPipeline
+from memiris.llm.llm_budget import LlmBudget
+from memiris.service.memory_sleep import SleepStats
+
+
+@dataclass
+class SleepSchedulerStats:
+    """
+    Progress of a sleep of many tenants.
+    """
+
+    tenants: int = 0  # Tenants with unslept memories
+    completed: int = 0  # Tenants whose unslept memories were all processed
+    failed: int = 0  # Tenants whose sleep raised an error
+    turns: int = 0  # Turns taken by all tenants
+    windows: int = 0
+    memories: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def memories_per_s(self) -> float:
+        return self.memories / self.elapsed_s if self.elapsed_s else 0.0
+
+
+class MemorySleepScheduler:
+    """
+    Sleeps the memories of all tenants with unslept memories in parallel.
+
+    The tenants take turns of a few windows each. A tenant that is not done after its turn goes to the back of the
+    queue, so a tenant with a large backlog does not hold up the others. The LLM calls of all tenants should share
+    one LlmBudget with memory creation, which then limits the load on the LLM provider instead of the number of
+    tenants.
+    """
+
+    create_pipeline: Callable[[], MemorySleepPipeline]
+    memory_service: MemoryService
+    max_parallel_tenants: int  # Tenants sleeping at the same time
+    windows_per_turn: int  # Windows of unslept memories a tenant processes per turn
+    tenant_filter: Callable[[str], bool]  # Which tenants are slept
+    llm_budget: Optional[LlmBudget]  # Only used to report the LLM usage
+    progress_interval_s: float  # Seconds between progress logs
+
+    def __init__(
+        self,
+        create_pipeline: Callable[[], MemorySleepPipeline],
+        memory_service: MemoryService,
+        max_parallel_tenants: int | None = None,
+        windows_per_turn: int | None = None,
+        tenant_filter: Callable[[str], bool] | None = None,
+        llm_budget: LlmBudget | None = None,
+        progress_interval_s: float | None = None,
+    ):
+        """
+        Initialize the MemorySleepScheduler.
+
+        Args:
+            create_pipeline: Creates a sleep pipeline. A pipeline sleeps one tenant at a time, so one is created
+                per parallel tenant.
+            memory_service: Used to find the tenants with unslept memories.
+            max_parallel_tenants: Maximum number of tenants sleeping at the same time.
+            windows_per_turn: Windows of unslept memories a tenant processes before the next tenant's turn.
+            tenant_filter: Only tenants for which this returns True are slept.
+            llm_budget: The budget shared by the LLM calls, reported in the progress logs.
+            progress_interval_s: Seconds between progress logs.
+        """
+        self.create_pipeline = create_pipeline
+        self.memory_service = memory_service
+        self.max_parallel_tenants = max_parallel_tenants or 4
+        self.windows_per_turn = windows_per_turn or 1
+        self.tenant_filter = tenant_filter or (lambda tenant: True)
+        self.llm_budget = llm_budget
+        self.progress_interval_s = progress_interval_s or 60.0
+        self._pipelines = threading.local()
+
+    def discover_tenants(self) -> list[str]:
+        """Find the tenants with unslept memories."""
+        tenants = [
+            tenant
+            for tenant in self.memory_service.find_all_tenants()
+            if self.tenant_filter(tenant)
+        ]
+        unslept = [
+            tenant
+            for tenant in tenants
+            if self.memory_service.has_unslept_memories(tenant)
+        ]
+        logging.info(
+            "Found %d tenants with unslept memories out of %d tenants",
+            len(unslept),
+            len(tenants),
+        )
+        return unslept
+
+    def _take_turn(self, tenant: str) -> SleepStats:
+        # Pool threads are reused, so each keeps its own pipeline and its caches
+        pipeline = getattr(self._pipelines, "pipeline", None)
+        if pipeline is None:
+            pipeline = self._pipelines.pipeline = self.create_pipeline()
+        return pipeline.sleep(tenant, max_windows=self.windows_per_turn)
+
+    def _log_progress(
+        self, stats: SleepSchedulerStats, pending: int, running: int
+    ) -> None:
+        budget = self.llm_budget.stats() if self.llm_budget else None
+        logging.info(
+            "Memory sleep scheduler | tenants=%d completed=%d failed=%d pending=%d running=%d turns=%d "
+            "memories=%d memories_per_s=%.2f elapsed_s=%.1f llm_active=%d llm_waiting=%d "
+            "llm_tokens_last_minute=%d",
+            stats.tenants,
+            stats.completed,
+            stats.failed,
+            pending,
+            running,
+            stats.turns,
+            stats.memories,
+            stats.memories_per_s,
+            stats.elapsed_s,
+            budget.active if budget else 0,
+            budget.waiting if budget else 0,
+            budget.tokens_last_minute if budget else 0,
+        )
+
+    def run(self, tenants: Optional[Iterable[str]] = None) -> SleepSchedulerStats:
+        """
+        Sleep the memories of the given tenants, or of all tenants with unslept memories.
+        A failing tenant is logged and skipped.
+
+        Returns:
+            The number of completed and failed tenants and the processed memories.
+        """
+        queue = deque(self.discover_tenants() if tenants is None else tenants)
+        stats = SleepSchedulerStats(tenants=len(queue))
+        started = time.perf_counter()
+        last_progress = started
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel_tenants,
+            thread_name_prefix="MemorySleepScheduler",
+        ) as executor:
+            running: dict[Future[SleepStats], str] = {}
+            while queue or running:
+                while queue and len(running) < self.max_parallel_tenants:
+                    tenant = queue.popleft()
+                    running[executor.submit(self._take_turn, tenant)] = tenant
+
+                done, _ = wait(
+                    running,
+                    timeout=self.progress_interval_s,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    tenant = running.pop(future)
+                    stats.turns += 1
+                    try:
+                        turn = future.result()
+                    except Exception as e:
+                        stats.failed += 1
+                        logging.error(
+                            "Error sleeping memories for tenant %s: %s",
+                            tenant,
+                            e,
+                            exc_info=True,
+                        )
+                        continue
+                    stats.windows += turn.windows
+                    stats.memories += turn.memories
+                    if turn.completed:
+                        stats.completed += 1
+                    else:
+                        queue.append(tenant)
+
+                now = time.perf_counter()
+                stats.elapsed_s = now - started
+                if now - last_progress >= self.progress_interval_s:
+                    last_progress = now
+                    self._log_progress(stats, len(queue), len(running))
+
+        stats.elapsed_s = time.perf_counter() - started
+        self._log_progress(stats, 0, 0)
+        return stats
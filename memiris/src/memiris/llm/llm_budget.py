@@ -0,0 +1,312 @@
+"""
+A global budget for the LLM calls of all pipelines sharing it.
+Limits the number of concurrent calls and the tokens per minute, and admits waiting calls in arrival order.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Union
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from memiris.llm.abstract_language_model import (
+    AbstractLanguageModel,
+    WrappedChatResponse,
+    WrappedEmbeddingResponse,
+)
+
+_TOKEN_WINDOW_S = 60.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a text, about four characters per token."""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class LlmBudgetStats:
+    """
+    Usage of an LlmBudget since it was created.
+    """
+
+    calls: int = 0  # Calls admitted
+    tokens: int = 0  # Tokens used, estimated where the provider did not report them
+    waited_s: float = 0.0  # Total time calls waited for admission
+    active: int = 0  # Calls currently running
+    waiting: int = 0  # Calls currently waiting for admission
+    tokens_last_minute: int = 0
+
+
+@dataclass
+class LlmBudgetReservation:
+    """
+    An admitted call. Set used_tokens to the reported usage to correct the estimate.
+    """
+
+    estimated_tokens: int
+    used_tokens: Optional[int] = None
+
+
+class LlmBudget:
+    """
+    Limits the LLM calls of all pipelines sharing it to a number of concurrent calls and a number of tokens per
+    minute. Calls are admitted in the order they arrive, so a pipeline issuing many calls cannot starve the others.
+    A single call larger than the token budget is admitted once no other tokens were used in the last minute.
+    """
+
+    max_concurrent_calls: int  # 0 for no limit
+    tokens_per_minute: int  # 0 for no limit
+
+    def __init__(
+        self,
+        max_concurrent_calls: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        """
+        Initialize the LlmBudget.
+
+        Args:
+            max_concurrent_calls: Maximum number of calls running at the same time, None for no limit.
+            tokens_per_minute: Maximum number of tokens used in any minute, None for no limit.
+        """
+        self.max_concurrent_calls = max_concurrent_calls or 0
+        self.tokens_per_minute = tokens_per_minute or 0
+        self._condition = threading.Condition()
+        self._tickets = itertools.count()
+        self._queue: deque[int] = deque()
+        # (time, tokens) of the calls in the last minute
+        self._usage: deque[tuple[float, int]] = deque()
+        self._usage_tokens = 0
+        self._stats = LlmBudgetStats()
+
+    def _expire_usage(self, now: float) -> None:
+        while self._usage and self._usage[0][0] <= now - _TOKEN_WINDOW_S:
+            self._usage_tokens -= self._usage.popleft()[1]
+
+    def _record_usage(self, tokens: int) -> None:
+        if tokens:
+            self._usage.append((time.monotonic(), tokens))
+            self._usage_tokens += tokens
+
+    def _wait_time(self, ticket: int, estimated_tokens: int) -> Optional[float]:
+        """Seconds until the call may be admitted, 0 if it may run now, None if it waits for a release."""
+        if self._queue[0] != ticket:
+            return None
+        if (
+            self.max_concurrent_calls
+            and self._stats.active >= self.max_concurrent_calls
+        ):
+            return None
+        if not self.tokens_per_minute:
+            return 0.0
+        now = time.monotonic()
+        self._expire_usage(now)
+        if (
+            self._usage_tokens == 0
+            or self._usage_tokens + estimated_tokens <= self.tokens_per_minute
+        ):
+            return 0.0
+        return max(self._usage[0][0] + _TOKEN_WINDOW_S - now, 0.01)
+
+    def acquire(self, estimated_tokens: int = 0) -> LlmBudgetReservation:
+        """
+        Wait until a call with the estimated number of tokens fits into the budget and admit it.
+        Every acquired reservation must be released.
+        """
+        started = time.monotonic()
+        with self._condition:
+            ticket = next(self._tickets)
+            self._queue.append(ticket)
+            try:
+                while (wait := self._wait_time(ticket, estimated_tokens)) != 0.0:
+                    self._condition.wait(wait)
+            finally:
+                self._queue.remove(ticket)
+                # The next call in line may fit as well
+                self._condition.notify_all()
+            self._stats.active += 1
+            self._stats.calls += 1
+            self._stats.waited_s += time.monotonic() - started
+            self._record_usage(estimated_tokens)
+        return LlmBudgetReservation(estimated_tokens=estimated_tokens)
+
+    def release(self, reservation: LlmBudgetReservation) -> None:
+        """Finish an admitted call and replace its estimated tokens with the used tokens if known."""
+        with self._condition:
+            self._stats.active -= 1
+            used = (
+                reservation.estimated_tokens
+                if reservation.used_tokens is None
+                else reservation.used_tokens
+            )
+            self._stats.tokens += used
+            self._record_usage(used - reservation.estimated_tokens)
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, estimated_tokens: int = 0) -> Iterator[LlmBudgetReservation]:
+        """Run a call within the budget. See acquire and release."""
+        reservation = self.acquire(estimated_tokens)
+        try:
+            yield reservation
+        finally:
+            self.release(reservation)
+
+    def stats(self) -> LlmBudgetStats:
+        """Return a snapshot of the usage of the budget."""
+        with self._condition:
+            self._expire_usage(time.monotonic())
+            return LlmBudgetStats(
+                calls=self._stats.calls,
+                tokens=self._stats.tokens,
+                waited_s=self._stats.waited_s,
+                active=self._stats.active,
+                waiting=len(self._queue),
+                tokens_last_minute=self._usage_tokens,
+            )
+
+
+def _reported_tokens(raw_response: Any) -> Optional[int]:
+    """Total tokens reported by the provider for an OpenAI or Ollama response, None if not reported."""
+    usage = getattr(raw_response, "usage", None)
+    total = getattr(usage, "total_tokens", None)
+    if isinstance(total, int):
+        return total
+    counts = [
+        getattr(raw_response, name, None)
+        for name in ("prompt_eval_count", "eval_count")
+    ]
+    if any(isinstance(count, int) for count in counts):
+        return sum(count for count in counts if isinstance(count, int))
+    return None
+
+
+class _LlmBudgetCallbackHandler(BaseCallbackHandler):
+    """
+    Runs the calls of a LangChain chat model within an LlmBudget.
+    """
+
+    run_inline = True  # Acquire on the calling thread, also for async calls
+
+    def __init__(self, budget: LlmBudget) -> None:
+        self._budget = budget
+        self._reservations: dict[UUID, LlmBudgetReservation] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(  # pylint: disable=unused-argument
+        self,
+        serialized: Dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        estimated_tokens = sum(
+            estimate_tokens(str(message.content))
+            for batch in messages
+            for message in batch
+        )
+        reservation = self._budget.acquire(estimated_tokens)
+        with self._lock:
+            self._reservations[run_id] = reservation
+
+    def _release(self, run_id: UUID, used_tokens: Optional[int]) -> None:
+        with self._lock:
+            reservation = self._reservations.pop(run_id, None)
+        if reservation:
+            reservation.used_tokens = used_tokens
+            self._budget.release(reservation)
+
+    def on_llm_end(  # pylint: disable=unused-argument
+        self, response: LLMResult, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        total = usage.get("total_tokens")
+        self._release(run_id, total if isinstance(total, int) else None)
+
+    def on_llm_error(  # pylint: disable=unused-argument
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._release(run_id, None)
+
+
+class BudgetedLanguageModel(AbstractLanguageModel):
+    """
+    Runs the chat, embedding and LangChain calls of a language model within an LlmBudget.
+    """
+
+    def __init__(self, llm: AbstractLanguageModel, budget: LlmBudget) -> None:
+        self.llm = llm
+        self.budget = budget
+
+    @property
+    def model(self) -> str:
+        return self.llm.model
+
+    def chat(
+        self,
+        messages: Sequence[Union[Mapping[str, Any], Any]],
+        response_format: Optional[Dict[str, Any]] = None,
+        keep_alive: Optional[Union[str, int]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> WrappedChatResponse:
+        estimated_tokens = sum(
+            estimate_tokens(
+                str(
+                    message.get("content", "")
+                    if isinstance(message, Mapping)
+                    else getattr(message, "content", "")
+                )
+            )
+            for message in messages
+        )
+        with self.budget.reserve(estimated_tokens) as reservation:
+            response = self.llm.chat(
+                messages,
+                response_format=response_format,
+                keep_alive=keep_alive,
+                options=options,
+                **kwargs,
+            )
+            reservation.used_tokens = _reported_tokens(response.raw_response)
+            return response
+
+    def embed(self, text: str) -> WrappedEmbeddingResponse:
+        with self.budget.reserve(estimate_tokens(text)) as reservation:
+            response = self.llm.embed(text)
+            reservation.used_tokens = _reported_tokens(response.raw_response)
+            return response
+
+    def langchain_client(self) -> BaseChatModel:
+        client = self.llm.langchain_client()
+        handler = _LlmBudgetCallbackHandler(self.budget)
+        if client.callbacks is None:
+            client.callbacks = [handler]
+        elif isinstance(client.callbacks, list):
+            client.callbacks = [*client.callbacks, handler]
+        else:
+            client.callbacks.add_handler(handler)
+        return client
+
+    def ensure_present(self) -> None:
+        self.llm.ensure_present()
+
+    def is_loaded(self) -> bool:
+        return self.llm.is_loaded()
+
+    def load(self, duration: str = "5m") -> None:
+        self.llm.load(duration)
+
+    def unload(self) -> None:
+        self.llm.unload()
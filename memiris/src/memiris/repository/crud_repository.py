@@ -1,5 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Sequence
+from typing import Any, List, Mapping, Optional, Sequence
+
+
+class BatchSaveError(ValueError):
+    """
+    Raised by save_all if some entities could not be saved. All other entities are saved.
+    """
+
+    errors: dict[int, str]  # Error message by index of the entity passed to save_all
+    saved: List[Any]  # The entities that were saved
+
+    def __init__(self, errors: Mapping[int, str], saved: List[Any]):
+        self.errors = dict(errors)
+        self.saved = saved
+        first_index = min(self.errors)
+        super().__init__(
+            f"{len(self.errors)} of {len(self.errors) + len(saved)} entities could not be saved, "
+            f"first error at index {first_index}: {self.errors[first_index]}"
+        )
 
 
 class BaseRepository[Entity, EntityId](ABC):
@@ -39,6 +57,20 @@ class BaseRepository[Entity, EntityId](ABC):
         """
         pass
 
+    def count(self, tenant: str) -> int:
+        """
+        Count the entities of a given tenant.
+        This default implementation loads all entities; repositories should count in the database.
+        """
+        return len(self.all(tenant))
+
+    def has_any(self, tenant: str) -> bool:
+        """
+        Check whether a given tenant has any entity.
+        This default implementation counts all entities; repositories should stop at the first one.
+        """
+        return self.count(tenant) > 0
+
     @abstractmethod
     def delete(self, tenant: str, entity_id: EntityId) -> None:
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Mapping, Sequence
+from typing import List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
 from memiris.domain.memory import Memory
@@ -36,3 +36,47 @@ class MemoryRepository(BaseRepository[Memory, UUID], ABC):
         Find all unslept memories for a given tenant.
         """
         pass
+
+    def count_unslept_memories(self, tenant: str) -> int:
+        """
+        Count the unslept memories of a given tenant.
+        This default implementation loads all unslept memories; repositories should count in the database.
+        """
+        return len(self.find_unslept_memories(tenant))
+
+    def has_unslept_memories(self, tenant: str) -> bool:
+        """
+        Check whether a given tenant has any unslept memory.
+        This default implementation counts all unslept memories; repositories should stop at the first one.
+        """
+        return self.count_unslept_memories(tenant) > 0
+
+    def find_unslept_memories_page(
+        self, tenant: str, limit: int, after: Optional[UUID] = None
+    ) -> Tuple[List[Memory], Optional[UUID]]:
+        """
+        Find the next page of unslept memories for a given tenant.
+
+        Memories are paged by a cursor in ID order, so pages stay stable while earlier pages are marked slept on.
+        This default implementation loads all unslept memories; repositories should page in the database.
+
+        Args:
+            tenant: The tenant identifier
+            limit: The maximum number of memories in the page
+            after: The cursor returned with the previous page, None for the first page
+
+        Returns:
+            The memories of the page and the cursor of the next page, None if this is the last page
+        """
+        memories = sorted(
+            (
+                memory
+                for memory in self.find_unslept_memories(tenant)
+                if memory.id and (after is None or str(memory.id) > str(after))
+            ),
+            key=lambda memory: str(memory.id),
+        )
+        if len(memories) <= limit:
+            return memories, None
+        page = memories[:limit]
+        return page, page[-1].id
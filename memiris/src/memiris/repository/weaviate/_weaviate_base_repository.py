@@ -1,4 +1,6 @@
 from abc import ABC
+from typing import Mapping, Optional, Sequence, TypeVar
+from uuid import UUID
 
 from weaviate import WeaviateClient
 from weaviate.collections import Collection
@@ -9,11 +11,17 @@ from weaviate.collections.classes.config import (
     ReferenceProperty,
     VectorDistances,
 )
+from weaviate.collections.classes.data import DataObject
+from weaviate.collections.classes.filters import Filter, _Filters
+from weaviate.collections.classes.grpc import QueryReference
 from weaviate.collections.classes.internal import Object, ObjectSingleReturn
 
 from memiris.domain.learning import Learning
 from memiris.domain.memory import Memory
 from memiris.domain.memory_connection import ConnectionType, MemoryConnection
+from memiris.repository.crud_repository import BatchSaveError
+
+Entity = TypeVar("Entity")
 
 
 class _WeaviateBaseRepository(ABC):
@@ -31,6 +39,7 @@ class _WeaviateBaseRepository(ABC):
     memory_connection_memory_reference_name: str = "connected_memories"
     memory_connection_reference_name: str = "connections"
     _vector_count: int = 5
+    _batch_size: int = 500  # Objects per batch request and per bulk existence check
 
     client: WeaviateClient
     learning_collection: Collection
@@ -226,6 +235,151 @@ class _WeaviateBaseRepository(ABC):
                 )
             )
 
+    def _fetch_existing(
+        self,
+        collection: Collection,
+        tenant: str,
+        ids: Sequence[UUID],
+        reference_names: Sequence[str],
+        include_vector: bool = False,
+    ) -> dict[UUID, Object]:
+        """
+        Fetch the stored objects with the given IDs in bulk, e.g. to decide between insert and update.
+
+        Args:
+            collection: The collection
+            tenant: The tenant identifier
+            ids: The IDs to look up
+            reference_names: The references to return with the objects
+            include_vector: Whether to return the vectors of the objects
+
+        Returns:
+            The stored objects by ID; IDs that are not stored are missing
+        """
+        existing: dict[UUID, Object] = {}
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids or not collection.tenants.exists(tenant):
+            return existing
+
+        collection = collection.with_tenant(tenant)
+        for start in range(0, len(unique_ids), self._batch_size):
+            chunk = unique_ids[start : start + self._batch_size]
+            result = collection.query.fetch_objects(
+                filters=Filter.by_id().contains_any([str(uid) for uid in chunk]),
+                limit=len(chunk),
+                include_vector=include_vector,
+                return_references=[
+                    QueryReference(link_on=name) for name in reference_names
+                ],
+            )
+            for obj in result.objects:
+                existing[obj.uuid] = obj
+        return existing
+
+    @staticmethod
+    def _count(
+        collection: Collection, tenant: str, filters: Optional[_Filters] = None
+    ) -> int:
+        """
+        Count the objects of a tenant with an aggregate query, without loading them.
+
+        Args:
+            collection: The collection
+            tenant: The tenant identifier
+            filters: Only count the objects matching these filters
+
+        Returns:
+            The number of matching objects, 0 if the tenant does not exist
+        """
+        if not collection.tenants.exists(tenant):
+            return 0
+        result = collection.with_tenant(tenant).aggregate.over_all(
+            filters=filters, total_count=True
+        )
+        return result.total_count or 0
+
+    @staticmethod
+    def _exists(
+        collection: Collection, tenant: str, filters: Optional[_Filters] = None
+    ) -> bool:
+        """
+        Check whether a tenant has any object, loading at most one object without properties or vectors.
+
+        Args:
+            collection: The collection
+            tenant: The tenant identifier
+            filters: Only consider the objects matching these filters
+
+        Returns:
+            Whether a matching object exists, False if the tenant does not exist
+        """
+        if not collection.tenants.exists(tenant):
+            return False
+        result = collection.with_tenant(tenant).query.fetch_objects(
+            filters=filters, limit=1, return_properties=[]
+        )
+        return len(result.objects) > 0
+
+    def _insert_many(
+        self, collection: Collection, objects: Sequence[DataObject]
+    ) -> tuple[dict[int, UUID], dict[int, str]]:
+        """
+        Write objects with the batch API. Objects with the ID of a stored object replace it.
+
+        Args:
+            collection: The tenant's collection
+            objects: The objects to write
+
+        Returns:
+            The IDs of the written objects and the errors of the others, both by index in *objects*
+        """
+        uuids: dict[int, UUID] = {}
+        errors: dict[int, str] = {}
+        for start in range(0, len(objects), self._batch_size):
+            result = collection.data.insert_many(
+                list(objects[start : start + self._batch_size])
+            )
+            uuids.update({start + i: uid for i, uid in result.uuids.items()})
+            errors.update(
+                {start + i: error.message for i, error in result.errors.items()}
+            )
+        return uuids, errors
+
+    @staticmethod
+    def _reference_uuids(obj: Object | None, reference_name: str) -> list[UUID]:
+        """The IDs an object refers to with the given reference, empty if not stored."""
+        if obj is None or not obj.references or reference_name not in obj.references:
+            return []
+        return [ref.uuid for ref in obj.references[reference_name].objects or []]
+
+    @staticmethod
+    def _merge_errors(
+        errors: Mapping[int, str], more_errors: Mapping[int, str]
+    ) -> dict[int, str]:
+        merged = dict(errors)
+        for index, message in more_errors.items():
+            merged[index] = (
+                f"{merged[index]}; {message}" if index in merged else message
+            )
+        return merged
+
+    @staticmethod
+    def _saved_or_raise(
+        entities: Sequence[Entity], errors: Mapping[int, str]
+    ) -> list[Entity]:
+        """
+        Return the saved entities, or raise if some could not be saved.
+
+        Raises:
+            BatchSaveError: With the error of each entity that could not be saved
+        """
+        if errors:
+            raise BatchSaveError(
+                errors,
+                [entity for i, entity in enumerate(entities) if i not in errors],
+            )
+        return list(entities)
+
     @staticmethod
     def object_to_learning(obj: Object | ObjectSingleReturn) -> Learning:
         """
@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID
 
 from weaviate.collections import Collection
@@ -150,3 +151,45 @@ class WeaviateBidirectionalLinkHelper:
         WeaviateBidirectionalLinkHelper.add_links(
             entity1, new_entities2, property1, property2, collection1, collection2
         )
+
+    @staticmethod
+    def update_reverse_links(
+        changes: Sequence[tuple[UUID, Sequence[UUID], Sequence[UUID]]],
+        property2: str,
+        collection2: Collection,
+    ) -> dict[int, str]:
+        """
+        Update the reverse side of bidirectional links for many objects at once.
+
+        The forward side is written with the objects themselves. Each change is a tuple of the object's ID,
+        the IDs it referred to before and the IDs it refers to now. New links are added in one batch.
+
+        Returns:
+            Error messages by index of the change they belong to
+        """
+        refs: list[DataReference] = []
+        ref_changes: list[int] = []
+        errors: dict[int, str] = {}
+
+        for index, (entity1, old_entities2, new_entities2) in enumerate(changes):
+            old = set(old_entities2)
+            for entity2 in dict.fromkeys(new_entities2):
+                if entity2 not in old:
+                    refs.append(DataReference(property2, entity2, entity1))
+                    ref_changes.append(index)
+            new = set(new_entities2)
+            for entity2 in old_entities2:
+                if entity2 not in new:
+                    try:
+                        collection2.data.reference_delete(entity2, property2, entity1)
+                    except Exception as e:
+                        errors[index] = f"Could not remove link to {entity2}: {e}"
+
+        if refs:
+            result = collection2.data.reference_add_many(refs)
+            for ref_index, error in result.errors.items():
+                errors[ref_changes[ref_index]] = (
+                    f"Could not add link to {refs[ref_index].from_uuid}: {error.message}"
+                )
+
+        return errors
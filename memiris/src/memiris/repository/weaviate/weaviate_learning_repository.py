@@ -1,9 +1,10 @@
-from typing import Mapping, Optional, Sequence
+from typing import List, Mapping, Optional, Sequence
 from uuid import UUID
 
 from langfuse import observe
 from weaviate import WeaviateClient
 from weaviate.collections import Collection
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.filters import Filter
 from weaviate.collections.classes.grpc import QueryReference, TargetVectors
 from weaviate.util import _WeaviateUUIDInt
@@ -51,6 +52,50 @@ class WeaviateLearningRepository(LearningRepository, _WeaviateBaseRepository):
 
         return entity
 
+    @observe(name="weaviate.learning_repository.save_all")
+    def save_all(self, tenant: str, entities: List[Learning]) -> List[Learning]:
+        """
+        Save many Learning entities with one existence check and batched writes.
+
+        Raises:
+            BatchSaveError: If some learnings could not be saved; all others are saved.
+        """
+        if not entities:
+            return []
+
+        collection = self.collection.with_tenant(tenant)
+        existing = self._fetch_existing(
+            self.collection,
+            tenant,
+            [entity.id for entity in entities if entity.id],
+            ["memories"],
+            include_vector=True,
+        )
+
+        objects = []
+        for entity in entities:
+            stored = existing.get(entity.id) if entity.id else None
+            # Memories are linked by the memory repository
+            memories = self._reference_uuids(stored, "memories")
+            objects.append(
+                DataObject(
+                    properties={
+                        "title": entity.title,
+                        "content": entity.content,
+                        "reference": entity.reference,
+                    },
+                    uuid=entity.id,
+                    vector=entity.vectors or (stored.vector if stored else None),  # type: ignore
+                    references={"memories": memories} if memories else None,
+                )
+            )
+
+        uuids, errors = self._insert_many(collection, objects)
+        for index, uid in uuids.items():
+            entities[index].id = uid
+
+        return self._saved_or_raise(entities, errors)
+
     @observe(name="weaviate.learning_repository.find")
     def find(self, tenant: str, entity_id: UUID) -> Optional[Learning]:
         """Find a Learning by its ID."""
@@ -88,6 +133,22 @@ class WeaviateLearningRepository(LearningRepository, _WeaviateBaseRepository):
         except Exception as e:
             raise ValueError("Error retrieving all Learning objects") from e
 
+    @observe(name="weaviate.learning_repository.count")
+    def count(self, tenant: str) -> int:
+        """Count the Learning objects."""
+        try:
+            return self._count(self.collection, tenant)
+        except Exception as e:
+            raise ValueError("Error counting Learning objects") from e
+
+    @observe(name="weaviate.learning_repository.has_any")
+    def has_any(self, tenant: str) -> bool:
+        """Check whether there is a Learning object."""
+        try:
+            return self._exists(self.collection, tenant)
+        except Exception as e:
+            raise ValueError("Error checking for Learning objects") from e
+
     @observe(name="weaviate.learning_repository.delete")
     def delete(self, tenant: str, entity_id: UUID) -> None:
         """Delete a Learning by its ID."""
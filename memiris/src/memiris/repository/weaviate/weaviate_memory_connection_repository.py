@@ -4,6 +4,7 @@ from uuid import UUID
 from langfuse import observe
 from weaviate import WeaviateClient
 from weaviate.collections import Collection
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.filters import Filter
 from weaviate.collections.classes.grpc import QueryReference
 from weaviate.util import _WeaviateUUIDInt
@@ -68,6 +69,71 @@ class WeaviateMemoryConnectionRepository(
 
         return entity
 
+    @observe(name="weaviate.memory_connection_repository.save_all")
+    def save_all(
+        self, tenant: str, entities: List[MemoryConnection]
+    ) -> List[MemoryConnection]:
+        """
+        Save many MemoryConnection entities with one existence check, batched writes and batched memory links.
+
+        Raises:
+            BatchSaveError: If some connections could not be saved; all others are saved.
+        """
+        if not entities:
+            return []
+
+        collection = self.collection.with_tenant(tenant)
+        existing = self._fetch_existing(
+            self.collection,
+            tenant,
+            [entity.id for entity in entities if entity.id],
+            ["connected_memories"],
+        )
+
+        objects = [
+            DataObject(
+                properties={
+                    "connection_type": entity.connection_type.value,
+                    "description": entity.description,
+                    "weight": entity.weight,
+                },
+                uuid=entity.id,
+                references=(
+                    {"connected_memories": list(entity.memories)}
+                    if entity.memories
+                    else None
+                ),
+            )
+            for entity in entities
+        ]
+
+        uuids, errors = self._insert_many(collection, objects)
+
+        changes = []
+        for index, uid in uuids.items():
+            entities[index].id = uid
+            changes.append(
+                (
+                    index,
+                    (
+                        uid,
+                        self._reference_uuids(existing.get(uid), "connected_memories"),
+                        entities[index].memories,
+                    ),
+                )
+            )
+
+        link_errors = WeaviateBidirectionalLinkHelper.update_reverse_links(
+            [change for _, change in changes],
+            "connections",
+            self.memory_collection.with_tenant(tenant),
+        )
+        errors = self._merge_errors(
+            errors, {changes[i][0]: message for i, message in link_errors.items()}
+        )
+
+        return self._saved_or_raise(entities, errors)
+
     @observe(name="weaviate.memory_connection_repository.find")
     def find(self, tenant: str, entity_id: UUID) -> Optional[MemoryConnection]:
         """Find a MemoryConnection by its ID."""
@@ -107,6 +173,22 @@ class WeaviateMemoryConnectionRepository(
             print(e)
             raise ValueError("Error retrieving all MemoryConnection objects") from e
 
+    @observe(name="weaviate.memory_connection_repository.count")
+    def count(self, tenant: str) -> int:
+        """Count the MemoryConnection objects."""
+        try:
+            return self._count(self.collection, tenant)
+        except Exception as e:
+            raise ValueError("Error counting MemoryConnection objects") from e
+
+    @observe(name="weaviate.memory_connection_repository.has_any")
+    def has_any(self, tenant: str) -> bool:
+        """Check whether there is a MemoryConnection object."""
+        try:
+            return self._exists(self.collection, tenant)
+        except Exception as e:
+            raise ValueError("Error checking for MemoryConnection objects") from e
+
     @observe(name="weaviate.memory_connection_repository.delete")
     def delete(self, tenant: str, entity_id: UUID) -> None:
         """Delete a MemoryConnection by its ID."""
@@ -1,9 +1,10 @@
-from typing import Mapping, Optional, Sequence, Union
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
 from langfuse import observe
 from weaviate import WeaviateClient
 from weaviate.collections import Collection
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.filters import Filter
 from weaviate.collections.classes.grpc import QueryReference, TargetVectors
 from weaviate.util import _WeaviateUUIDInt
@@ -64,6 +65,78 @@ class WeaviateMemoryRepository(MemoryRepository, _WeaviateBaseRepository):
 
         return entity
 
+    @observe(name="weaviate.memory_repository.save_all")
+    def save_all(self, tenant: str, entities: List[Memory]) -> List[Memory]:
+        """
+        Save many Memory entities with one existence check, batched writes and batched learning links.
+
+        Raises:
+            BatchSaveError: If some memories could not be saved; all others are saved.
+        """
+        if not entities:
+            return []
+
+        collection = self.collection.with_tenant(tenant)
+        existing = self._fetch_existing(
+            self.collection,
+            tenant,
+            [entity.id for entity in entities if entity.id],
+            ["learnings", "connections"],
+            include_vector=True,
+        )
+
+        objects = []
+        for entity in entities:
+            stored = existing.get(entity.id) if entity.id else None
+            references = {
+                "learnings": list(entity.learnings),
+                # Connections are linked by the memory connection repository
+                "connections": self._reference_uuids(stored, "connections"),
+            }
+            objects.append(
+                DataObject(
+                    properties={
+                        "title": entity.title,
+                        "content": entity.content,
+                        "slept_on": entity.slept_on,
+                        "deleted": entity.deleted,
+                    },
+                    uuid=entity.id,
+                    vector=entity.vectors or (stored.vector if stored else None),  # type: ignore
+                    references={
+                        name: uuids for name, uuids in references.items() if uuids
+                    },
+                )
+            )
+
+        uuids, errors = self._insert_many(collection, objects)
+
+        changes = []
+        for index, uid in uuids.items():
+            entities[index].id = uid
+            stored = existing.get(uid)
+            changes.append(
+                (
+                    index,
+                    (
+                        uid,
+                        self._reference_uuids(stored, "learnings"),
+                        entities[index].learnings,
+                    ),
+                )
+            )
+
+        link_errors = WeaviateBidirectionalLinkHelper.update_reverse_links(
+            [change for _, change in changes],
+            "memories",
+            self.learning_collection.with_tenant(tenant),
+        )
+        errors = self._merge_errors(
+            errors, {changes[i][0]: message for i, message in link_errors.items()}
+        )
+
+        return self._saved_or_raise(entities, errors)
+
     @observe(name="weaviate.memory_repository.find")
     def find(self, tenant: str, entity_id: UUID) -> Optional[Memory]:
         """Find a Memory by its ID."""
@@ -116,6 +189,26 @@ class WeaviateMemoryRepository(MemoryRepository, _WeaviateBaseRepository):
         except Exception as e:
             raise ValueError("Error retrieving all Memory objects") from e
 
+    @observe(name="weaviate.memory_repository.count")
+    def count(self, tenant: str) -> int:
+        """Count the Memory objects that are not deleted."""
+        try:
+            return self._count(
+                self.collection, tenant, Filter.by_property("deleted").equal(False)
+            )
+        except Exception as e:
+            raise ValueError("Error counting Memory objects") from e
+
+    @observe(name="weaviate.memory_repository.has_any")
+    def has_any(self, tenant: str) -> bool:
+        """Check whether there is a Memory object that is not deleted."""
+        try:
+            return self._exists(
+                self.collection, tenant, Filter.by_property("deleted").equal(False)
+            )
+        except Exception as e:
+            raise ValueError("Error checking for Memory objects") from e
+
     @observe(name="weaviate.memory_repository.delete")
     def delete(self, tenant: str, entity_id: UUID) -> None:
         """Delete a Memory by its ID."""
@@ -214,6 +307,71 @@ class WeaviateMemoryRepository(MemoryRepository, _WeaviateBaseRepository):
         except Exception as e:
             raise ValueError("Error retrieving unslept Memory objects") from e
 
+    @observe(name="weaviate.memory_repository.count_unslept_memories")
+    def count_unslept_memories(self, tenant: str) -> int:
+        try:
+            return self._count(
+                self.collection,
+                tenant,
+                Filter.by_property("slept_on").equal(False)
+                & Filter.by_property("deleted").equal(False),
+            )
+        except Exception as e:
+            raise ValueError("Error counting unslept Memory objects") from e
+
+    @observe(name="weaviate.memory_repository.has_unslept_memories")
+    def has_unslept_memories(self, tenant: str) -> bool:
+        try:
+            return self._exists(
+                self.collection,
+                tenant,
+                Filter.by_property("slept_on").equal(False)
+                & Filter.by_property("deleted").equal(False),
+            )
+        except Exception as e:
+            raise ValueError("Error checking for unslept Memory objects") from e
+
+    @observe(name="weaviate.memory_repository.find_unslept_memories_page")
+    def find_unslept_memories_page(
+        self, tenant: str, limit: int, after: Optional[UUID] = None
+    ) -> Tuple[List[Memory], Optional[UUID]]:
+        """
+        Find the next page of unslept memories with the Weaviate cursor API.
+
+        The cursor API does not support filters, so the flags of the memories are scanned without vectors or
+        references, and only the unslept memories of the page are loaded in full.
+        """
+        try:
+            if not self.collection.tenants.exists(tenant):
+                return [], None
+
+            collection = self.collection.with_tenant(tenant)
+            ids: list[UUID] = []
+            cursor = after
+            while len(ids) < limit:
+                result = collection.query.fetch_objects(
+                    limit=self._batch_size,
+                    after=cursor,
+                    return_properties=["slept_on", "deleted"],
+                )
+                for item in result.objects:
+                    cursor = item.uuid
+                    if not item.properties.get("slept_on") and not item.properties.get(
+                        "deleted"
+                    ):
+                        ids.append(item.uuid)
+                        if len(ids) >= limit:
+                            break
+                else:
+                    if len(result.objects) < self._batch_size:
+                        # Scanned to the end of the collection
+                        cursor = None
+                        break
+
+            return list(self.find_by_ids(tenant, ids)), cursor
+        except Exception as e:
+            raise ValueError("Error retrieving a page of unslept Memory objects") from e
+
     @observe(name="weaviate.memory_repository.find_by_ids")
     def find_by_ids(self, tenant: str, ids: Sequence[UUID]) -> Sequence[Memory]:
         """
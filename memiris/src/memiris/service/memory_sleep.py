@@ -1,6 +1,9 @@
 import logging
+import sys
+import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import List, Optional, Tuple
 from uuid import UUID
 
@@ -19,14 +22,53 @@ from memiris.domain.learning import Learning
 from memiris.domain.memory import Memory
 from memiris.domain.memory_connection import ConnectionType, MemoryConnection
 from memiris.llm.abstract_language_model import AbstractLanguageModel
+from memiris.repository.crud_repository import BatchSaveError
 from memiris.repository.learning_repository import LearningRepository
 from memiris.repository.memory_connection_repository import MemoryConnectionRepository
 from memiris.repository.memory_repository import MemoryRepository
+from memiris.service.sleep_checkpoint import SleepCheckpointStore
 from memiris.service.vectorizer import Vectorizer
 from memiris.util.enum_util import get_enum_values_with_descriptions
-from memiris.util.grouping import greedy_cover_max_groups
+from memiris.util.grouping import (
+    greedy_cover_max_groups,
+    greedy_pair_cover_max_groups,
+    similarity_candidate_pairs,
+)
 from memiris.util.jinja_util import create_template
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of the process in MiB, 0 if unknown."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class SleepStats:
+    """
+    Progress of the sleep of one tenant.
+    """
+
+    tenant: str
+    windows: int = 0  # Windows of unslept memories processed
+    memories: int = 0  # Unslept memories processed
+    elapsed_s: float = 0.0
+    peak_rss_mb: float = 0.0  # Peak resident set size of the process
+    resumed: bool = False  # Whether the sleep resumed from a checkpoint
+    completed: bool = False  # Whether all unslept memories were processed
+
+    @property
+    def memories_per_s(self) -> float:
+        return self.memories / self.elapsed_s if self.elapsed_s else 0.0
+
 
 class MemorySleeper:
     """
@@ -53,6 +95,15 @@ class MemorySleeper:
     max_threads: int  # Maximum number of threads for parallel processing
     group_size: int  # Size of memory groups, can be larger to meet the max_groups limit
     max_groups: int  # Maximum number of groups to process in parallel
+    candidate_neighbours: (
+        int  # Nearest neighbours compared per memory, 0 compares all pairs
+    )
+    candidate_threshold: float  # Minimum vector similarity of compared memories
+    neighbourhood_size: int  # Older memories fetched per unslept memory for comparison
+    window_size: int  # Unslept memories processed together; bounds the caches of a run
+    checkpoint_store: Optional[
+        SleepCheckpointStore
+    ]  # Where to resume interrupted sleeps
 
     def __init__(
         self,
@@ -67,6 +118,11 @@ class MemorySleeper:
         max_threads: int | None = None,
         group_size: int | None = None,
         max_groups: int | None = None,
+        candidate_neighbours: int | None = None,
+        candidate_threshold: float | None = None,
+        neighbourhood_size: int | None = None,
+        window_size: int | None = None,
+        checkpoint_store: Optional[SleepCheckpointStore] = None,
     ) -> None:
         """
         Initialize the LearningExtractor
@@ -83,6 +139,14 @@ class MemorySleeper:
             template_connector: Optional template path for connector
             max_threads: Maximum number of threads for parallel processing
             group_size: Size of memory groups for processing
+            max_groups: Maximum number of memory groups, i.e. LLM calls, for connecting
+            candidate_neighbours: Number of most similar memories each memory is compared with by the LLM.
+                0 compares every pair of memories.
+            candidate_threshold: Minimum cosine similarity of two memories to be compared by the LLM
+            neighbourhood_size: Number of older, already slept on memories fetched per unslept memory
+                to be compared with it. Requires candidate_neighbours.
+            window_size: Number of unslept memories loaded and processed together
+            checkpoint_store: Optional store to resume interrupted sleeps after the last completed window
         """
         self.tool_llm = tool_llm
         self.response_llm = response_llm
@@ -108,22 +172,110 @@ class MemorySleeper:
         self.max_threads = max_threads or 5
         self.group_size = group_size or 20
         self.max_groups = max(1, max_groups or 5)
+        self.candidate_neighbours = (
+            8 if candidate_neighbours is None else max(0, candidate_neighbours)
+        )
+        self.candidate_threshold = candidate_threshold or 0.0
+        self.neighbourhood_size = max(0, neighbourhood_size or 0)
+        self.window_size = max(1, window_size or 200)
+        self.checkpoint_store = checkpoint_store
 
     @observe(name="memory-sleep")
-    def run_sleep(self, tenant: str, **kwargs):
+    def run_sleep(
+        self, tenant: str, max_windows: Optional[int] = None, **kwargs
+    ) -> SleepStats:
         """
         Run the sleep service for the memory system.
         This method will be called periodically to process recent memories.
+
+        The unslept memories are paged through in windows of window_size memories, and the caches only hold the
+        current window. With a checkpoint store, an interrupted sleep resumes after the last completed window.
+        Memories of different windows are only compared if the neighbourhood of older memories is enabled.
+
+        Args:
+            tenant: The tenant whose memories are processed.
+            max_windows: Stop after this many windows, so other tenants can take a turn. The next run continues
+                after the last processed window.
+
+        Returns:
+            The number of processed memories, the throughput and the peak memory usage
         """
+        cursor = self.checkpoint_store.load(tenant) if self.checkpoint_store else None
+        if cursor:
+            logging.info("Resuming memory sleep for tenant %s after %s", tenant, cursor)
 
-        # 1. Load recent memories
-        recent_memories = self.memory_repository.find_unslept_memories(tenant)
-        logging.debug(
-            "Loaded %s unslept memories for tenant %s", len(recent_memories), tenant
-        )
-        if not recent_memories:
+        stats = SleepStats(tenant=tenant, resumed=cursor is not None)
+        started = time.perf_counter()
+        try:
+            while True:
+                # 1. Load the next window of recent memories
+                recent_memories, cursor = (
+                    self.memory_repository.find_unslept_memories_page(
+                        tenant, self.window_size, cursor
+                    )
+                )
+                logging.debug(
+                    "Loaded %s unslept memories for tenant %s",
+                    len(recent_memories),
+                    tenant,
+                )
+
+                if recent_memories:
+                    self._sleep_window(tenant, recent_memories, **kwargs)
+                    stats.windows += 1
+                    stats.memories += len(recent_memories)
+                    stats.elapsed_s = time.perf_counter() - started
+                    logging.info(
+                        "Memory sleep window | tenant=%s window=%d memories=%d total=%d "
+                        "memories_per_s=%.2f peak_rss_mb=%.0f",
+                        tenant,
+                        stats.windows,
+                        len(recent_memories),
+                        stats.memories,
+                        stats.memories_per_s,
+                        _peak_rss_mb(),
+                    )
+
+                if cursor is None:
+                    stats.completed = True
+                    break
+                if self.checkpoint_store:
+                    self.checkpoint_store.save(tenant, cursor)
+                if max_windows and stats.windows >= max_windows:
+                    break
+        finally:
+            self.memory_cache.clear()
+            self.learning_cache.clear()
+
+        if self.checkpoint_store and stats.completed:
+            self.checkpoint_store.clear(tenant)
+
+        stats.elapsed_s = time.perf_counter() - started
+        stats.peak_rss_mb = _peak_rss_mb()
+        if not stats.memories and stats.completed:
             logging.warning("No unslept memories found for tenant %s", tenant)
-            return
+        logging.info(
+            "Memory sleep | tenant=%s windows=%d memories=%d elapsed_s=%.1f "
+            "memories_per_s=%.2f peak_rss_mb=%.0f resumed=%s completed=%s",
+            tenant,
+            stats.windows,
+            stats.memories,
+            stats.elapsed_s,
+            stats.memories_per_s,
+            stats.peak_rss_mb,
+            stats.resumed,
+            stats.completed,
+        )
+        return stats
+
+    @observe(name="memory-sleep-window")
+    def _sleep_window(self, tenant: str, recent_memories: List[Memory], **kwargs):
+        """
+        Connect, mark as slept on and deduplicate one window of unslept memories.
+        """
+        # The caches only hold the memories and learnings of the current window
+        self.memory_cache.clear()
+        self.learning_cache.clear()
 
         recent_memories = self._general_cleanup(tenant, recent_memories)
 
@@ -131,9 +283,13 @@ class MemorySleeper:
             if recent_memory.id:
                 self.memory_cache[recent_memory.id] = recent_memory
 
-        # 2. Connect memories with each other
+        # 2. Connect memories with each other and with similar older memories
+        neighbourhood = self._load_memory_neighbourhood(tenant, recent_memories)
+
         logging.debug("Connecting memories for tenant %s", tenant)
-        connection_dlos = self._create_memory_connections(recent_memories, **kwargs)
+        connection_dlos = self._create_memory_connections(
+            recent_memories, neighbourhood=neighbourhood, **kwargs
+        )
 
         connections = self._save_memory_connections(connection_dlos, tenant, **kwargs)
 
@@ -154,13 +310,67 @@ class MemorySleeper:
         for memory in recent_memories:
             memory.slept_on = True
 
-        self.memory_repository.save_all(tenant, recent_memories)
+        try:
+            self.memory_repository.save_all(tenant, recent_memories)
+        except BatchSaveError as e:
+            # The others stay unslept and are picked up by the next run
+            logging.error(
+                "Could not mark memories as slept on for tenant %s: %s", tenant, e
+            )
 
         # 4. TODO: Filter out connections that contain memories with a CONFLICT connection
 
         # 5. Deduplicate memories using LLM
         self._deduplicate_memories(duplicate_connections, tenant, **kwargs)
 
+    @observe(name="memory-neighbourhood")
+    def _load_memory_neighbourhood(
+        self, tenant: str, memories: List[Memory]
+    ) -> List[Memory]:
+        """
+        Load the older memories most similar to the given memories, so they can be connected with them.
+
+        Args:
+            tenant: The tenant identifier
+            memories: The unslept memories
+
+        Returns:
+            The similar older memories, each once; they are added to the memory cache
+        """
+        if self.neighbourhood_size <= 0 or self.candidate_neighbours <= 0:
+            return []
+
+        known_ids = {memory.id for memory in memories}
+        neighbourhood: dict[UUID, Memory] = {}
+
+        for memory in memories:
+            if not memory.vectors:
+                continue
+            try:
+                similar_memories = self.memory_repository.search_multi(
+                    tenant, memory.vectors, self.neighbourhood_size
+                )
+            except ValueError as e:
+                logging.warning(
+                    "Could not load similar memories of memory %s: %s", memory.id, e
+                )
+                continue
+
+            for similar_memory in similar_memories:
+                if similar_memory.id and similar_memory.id not in known_ids:
+                    neighbourhood[similar_memory.id] = similar_memory
+
+        for memory_id, memory in neighbourhood.items():
+            self.memory_cache.setdefault(memory_id, memory)
+
+        logging.debug(
+            "Loaded %s older memories similar to %s unslept memories for tenant %s",
+            len(neighbourhood),
+            len(memories),
+            tenant,
+        )
+        return list(neighbourhood.values())
+
     @observe(name="memory-cleanup")
     def _general_cleanup(self, tenant: str, memories: List[Memory]) -> List[Memory]:
         """
@@ -357,11 +567,27 @@ class MemorySleeper:
             logging.warning("No deduplicated memories found after processing groups.")
             return []
 
-        saved_memories = self.memory_repository.save_all(tenant, deduplicated_memories)
+        try:
+            saved_memories = self.memory_repository.save_all(
+                tenant, deduplicated_memories
+            )
+        except BatchSaveError as e:
+            logging.error("Could not save deduplicated memories: %s", e)
+            saved_memories = e.saved
 
-        saved_connections = self.memory_connection_repository.save_all(
-            tenant, created_from_connections
-        )
+        saved_ids = {memory.id for memory in saved_memories}
+        created_from_connections = [
+            connection
+            for connection in created_from_connections
+            if all(memory_id in saved_ids for memory_id in connection.memories)
+        ]
+        try:
+            saved_connections = self.memory_connection_repository.save_all(
+                tenant, created_from_connections
+            )
+        except BatchSaveError as e:
+            logging.error("Could not save created from connections: %s", e)
+            saved_connections = e.saved
 
         for memory in saved_memories:
             if memory.deleted:
@@ -800,7 +1026,10 @@ class MemorySleeper:
 
     @observe(name="connect-memories")
     def _create_memory_connections(
-        self, memories: List[Memory], **kwargs
+        self,
+        memories: List[Memory],
+        neighbourhood: Optional[List[Memory]] = None,
+        **kwargs,
     ) -> List[MemoryConnectionDLO]:
         """
         Connect memories with each other using an LLM.
@@ -814,13 +1043,14 @@ class MemorySleeper:
 
         Args:
             memories: List of memories to analyze for connections
-            tenant: The tenant identifier
+            neighbourhood: Older memories to analyze for connections with the given memories only
             **kwargs: Additional arguments to pass to the LLM
 
         Returns:
             The original list of memories (connections are stored separately)
         """
-        if not memories or len(memories) < 2:
+        neighbourhood = neighbourhood or []
+        if not memories or len(memories) + len(neighbourhood) < 2:
             logging.warning("Not enough memories to connect. Returning original list.")
             return []
 
@@ -848,7 +1078,7 @@ class MemorySleeper:
             memory_input_dlos.append(memory_input_dlo)
 
         # If insufficient valid memories, return original list
-        if len(memory_input_dlos) < 2:
+        if not memory_input_dlos or len(memory_input_dlos) + len(neighbourhood) < 2:
             logging.warning(
                 "Not enough valid memories with IDs for connection analysis."
             )
@@ -860,9 +1090,11 @@ class MemorySleeper:
             len(memory_input_dlos),
         )
 
-        memory_groups = greedy_cover_max_groups(
-            memory_input_dlos, self.group_size, self.max_groups
+        started = time.perf_counter()
+        memory_groups, candidate_pairs = self._group_memories_for_connecting(
+            valid_memories, memory_input_dlos, neighbourhood
         )
+        grouping_ms = (time.perf_counter() - started) * 1000
 
         with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
             kwargs["langfuse_parent_observation_id"] = (
@@ -891,6 +1123,17 @@ class MemorySleeper:
                 except Exception as e:
                     print(f"Error processing memory group: {e}")
 
+        logging.info(
+            "Memory connection groups | memories=%d neighbourhood=%d candidate_pairs=%d "
+            "llm_calls=%d largest_group=%d grouping_ms=%.0f elapsed_ms=%.0f",
+            len(memory_input_dlos),
+            len(neighbourhood),
+            candidate_pairs,
+            len(memory_groups),
+            max((len(group) for group in memory_groups), default=0),
+            grouping_ms,
+            (time.perf_counter() - started) * 1000,
+        )
         logging.debug(
             "Processed all memory groups, resulting in %s total connections.",
             len(all_connections),
@@ -916,6 +1159,53 @@ class MemorySleeper:
 
         return all_connections
 
+    def _group_memories_for_connecting(
+        self,
+        memories: List[Memory],
+        memory_input_dlos: List[MemoryDeduplicationInputDLO],
+        neighbourhood: List[Memory],
+    ) -> Tuple[List[List[MemoryDeduplicationInputDLO]], int]:
+        """
+        Group memories so that every pair worth comparing shares a group, i.e. an LLM call.
+
+        Without candidate pruning all pairs of the given memories are covered. Otherwise only pairs of
+        similar memories are, and pairs with similar older memories from the neighbourhood are added.
+
+        Args:
+            memories: The memories to connect
+            memory_input_dlos: The input DLOs of the memories, in the same order
+            neighbourhood: Older memories to compare with the given memories only
+
+        Returns:
+            The memory groups and the number of memory pairs they cover
+        """
+        if self.candidate_neighbours <= 0:
+            groups = greedy_cover_max_groups(
+                memory_input_dlos, self.group_size, self.max_groups
+            )
+            return groups, len(memory_input_dlos) * (len(memory_input_dlos) - 1) // 2
+
+        neighbourhood = [memory for memory in neighbourhood if memory.id]
+        items = memory_input_dlos + [
+            MemoryDeduplicationInputDLO(
+                id=memory.id,  # type: ignore
+                title=memory.title,
+                content=memory.content,
+                learnings=[],
+            )
+            for memory in neighbourhood
+        ]
+        pairs = similarity_candidate_pairs(
+            [memory.vectors for memory in memories + neighbourhood],
+            self.candidate_neighbours,
+            self.candidate_threshold,
+            anchors=len(memories),
+        )
+        groups = greedy_pair_cover_max_groups(
+            items, pairs, max(2, self.group_size), self.max_groups
+        )
+        return groups, len(pairs)
+
     @observe(name="save-memory-connections")
     def _save_memory_connections(
         self, connection_dlos: List[MemoryConnectionDLO], tenant: str
@@ -960,9 +1250,13 @@ class MemorySleeper:
                     "Saving %s memories connections to the repository.",
                     len(connections),
                 )
-                connections = self.memory_connection_repository.save_all(
-                    tenant, connections
-                )
+                try:
+                    connections = self.memory_connection_repository.save_all(
+                        tenant, connections
+                    )
+                except BatchSaveError as e:
+                    logging.error("Could not save memory connections: %s", e)
+                    connections = e.saved
                 logging.debug(
                     "Saved %s memories connections to the repository.", len(connections)
                 )
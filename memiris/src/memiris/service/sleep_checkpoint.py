@@ -0,0 +1,85 @@
+import json
+import logging
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+
+class SleepCheckpointStore(ABC):
+    """
+    Stores how far the sleep of a tenant got, so an interrupted sleep resumes there instead of starting over.
+    The checkpoint is the paging cursor after the last completed window of unslept memories.
+    """
+
+    @abstractmethod
+    def load(self, tenant: str) -> Optional[UUID]:
+        """Return the cursor to resume the sleep of the tenant after, or None to start from the beginning."""
+        pass
+
+    @abstractmethod
+    def save(self, tenant: str, cursor: UUID) -> None:
+        """Record that the sleep of the tenant completed all windows up to the cursor."""
+        pass
+
+    @abstractmethod
+    def clear(self, tenant: str) -> None:
+        """Forget the checkpoint of the tenant after its sleep completed."""
+        pass
+
+
+class InMemorySleepCheckpointStore(SleepCheckpointStore):
+    """
+    Keeps checkpoints in memory. Resumes sleeps interrupted by errors, but not by process restarts.
+    """
+
+    def __init__(self) -> None:
+        self._cursors: dict[str, UUID] = {}
+
+    def load(self, tenant: str) -> Optional[UUID]:
+        return self._cursors.get(tenant)
+
+    def save(self, tenant: str, cursor: UUID) -> None:
+        self._cursors[tenant] = cursor
+
+    def clear(self, tenant: str) -> None:
+        self._cursors.pop(tenant, None)
+
+
+class FileSleepCheckpointStore(SleepCheckpointStore):
+    """
+    Keeps one small JSON file per tenant in a directory, so sleeps also resume after a process restart.
+    """
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, tenant: str) -> Path:
+        safe_tenant = re.sub(r"[^A-Za-z0-9_.-]", "_", tenant)
+        return self.directory / f"{safe_tenant}.json"
+
+    def load(self, tenant: str) -> Optional[UUID]:
+        path = self._path(tenant)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return UUID(data["cursor"]) if data.get("tenant") == tenant else None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning("Ignoring unreadable sleep checkpoint %s: %s", path, e)
+            return None
+
+    def save(self, tenant: str, cursor: UUID) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so an interruption never leaves a partial checkpoint
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as file:
+            json.dump({"tenant": tenant, "cursor": str(cursor)}, file)
+        os.replace(file.name, self._path(tenant))
+
+    def clear(self, tenant: str) -> None:
+        self._path(tenant).unlink(missing_ok=True)
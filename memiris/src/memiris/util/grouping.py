@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import heapq
 import itertools
+import logging
+import math
+import operator
 import random
-from typing import List, Sequence, Tuple, TypeVar
+from typing import Iterable, List, Mapping, Sequence, Tuple, TypeVar
 
 from langfuse import observe
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 
@@ -189,28 +195,255 @@ def greedy_cover(
     pruned.reverse()
 
     # --------------- iterative merge phase --------------------------------
+    pruned = _merge_blocks(pruned, k)
+
+    # convert indices → original items
+    result: List[List[T]] = [[ridx[p] for p in g] for g in pruned]
+
+    return result
+
+
+def _merge_blocks(blocks: list[list[int]], k: int) -> list[list[int]]:
+    """
+    Fuse blocks whose union has at most *k* members until no two blocks can be fused.
+    Args:
+        blocks: Blocks of item indices.
+        k: The maximum size of each block.
+
+    Returns:
+        The merged blocks.
+    """
     changed = True
     while changed:
         changed = False
         i = 0
-        while i < len(pruned):
+        while i < len(blocks):
             j = i + 1
-            while j < len(pruned):
-                gi, gj = pruned[i], pruned[j]
+            while j < len(blocks):
+                gi, gj = blocks[i], blocks[j]
                 union = sorted(set(gi).union(gj))
                 if len(union) <= k:
-                    pruned[i] = union
-                    pruned.pop(j)
+                    blocks[i] = union
+                    blocks.pop(j)
                     changed = True
-                    # do *not* increment j – new pruned[j] needs checking
+                    # do *not* increment j – new blocks[j] needs checking
                 else:
                     j += 1
             i += 1
+    return blocks
 
-    # convert indices → original items
-    result: List[List[T]] = [[ridx[p] for p in g] for g in pruned]
 
-    return result
+def _normalize(vectors: Mapping[str, Sequence[float]]) -> dict[str, list[float]]:
+    """
+    Scale every named vector to unit length, dropping empty and zero vectors.
+    Args:
+        vectors: The named vectors of one item.
+
+    Returns:
+        The unit-length vectors by name.
+    """
+    normalized = {}
+    for name, vector in vectors.items():
+        norm = math.sqrt(math.fsum(x * x for x in vector)) if vector else 0.0
+        if norm > 0:
+            normalized[name] = [x / norm for x in vector]
+    return normalized
+
+
+def _similarity(a: dict[str, list[float]], b: dict[str, list[float]]) -> float:
+    """Highest cosine similarity over the vector names both items share."""
+    best = -1.0
+    for name, vector in a.items():
+        other = b.get(name)
+        if other is not None and len(other) == len(vector):
+            best = max(best, sum(map(operator.mul, vector, other)))
+    return best
+
+
+@observe(name="grouping.similarity_candidate_pairs")
+def similarity_candidate_pairs(
+    vectors: Sequence[Mapping[str, Sequence[float]]],
+    neighbours: int,
+    threshold: float = 0.0,
+    anchors: int | None = None,
+) -> set[Tuple[int, int]]:
+    """
+    Select the pairs of items that are similar enough to be worth comparing.
+
+    A pair is a candidate if one item is among the *neighbours* most similar items of the other
+    (cosine similarity, highest over the shared vector names) and the similarity is at least *threshold*.
+    Only pairs with at least one of the first *anchors* items are considered; the remaining items are context
+    whose pairs among each other are already known. Items without vectors cannot be pruned and are paired
+    with every item they may be paired with.
+
+    Args:
+        vectors: The named vectors of each item.
+        neighbours: The number of nearest neighbours kept per item.
+        threshold: The minimum similarity of a candidate pair.
+        anchors: The number of leading items to find pairs for, all items if None.
+
+    Returns:
+        The candidate pairs as ``(i, j)`` index tuples with ``i < j``.
+    """
+    if neighbours < 1:
+        raise ValueError("neighbours must be at least 1")
+
+    v = len(vectors)
+    anchors = v if anchors is None else min(anchors, v)
+    normalized = [_normalize(vector) for vector in vectors]
+
+    pairs: set[Tuple[int, int]] = set()
+    nearest: list[list[Tuple[float, int]]] = [[] for _ in range(v)]
+
+    for i in range(anchors):
+        for j in range(i + 1, v):
+            if not normalized[i] or not normalized[j]:
+                pairs.add((i, j))
+                continue
+            similarity = _similarity(normalized[i], normalized[j])
+            if similarity < threshold:
+                continue
+            for a, b in ((i, j), (j, i)):
+                heap = nearest[a]
+                if len(heap) < neighbours:
+                    heapq.heappush(heap, (similarity, b))
+                elif similarity > heap[0][0]:
+                    heapq.heapreplace(heap, (similarity, b))
+
+    for i, heap in enumerate(nearest):
+        pairs.update((min(i, j), max(i, j)) for _, j in heap)
+
+    return pairs
+
+
+@observe(name="grouping.greedy_pair_cover_max_groups")
+def greedy_pair_cover_max_groups(
+    items: Sequence[T],
+    pairs: Iterable[Tuple[int, int]],
+    k: int,
+    max_groups: int,
+    rng: random.Random | None = None,
+) -> List[List[T]]:
+    """
+    Cover the given index *pairs* of *items* with blocks of size ≤ *k*.
+
+    If more than *max_groups* blocks are needed, *k* is doubled until the cover fits and then narrowed
+    down by binary search to the smallest block size that still fits.
+
+    Args:
+        items: A sequence of items to be grouped.
+        pairs: The pairs of item indices that must share a block.
+        k: The maximum size of each group (block).
+        max_groups: Optional maximum number of groups to return.
+        rng: An optional random number generator for tie-breaking.
+
+    Returns:
+        A list of groups (blocks) that together contain every given pair.
+    """
+    if max_groups is not None and max_groups < 1:
+        raise ValueError("max_groups must be at least 1")
+
+    pairs = list(pairs)
+    groups: List[List[T]] = greedy_pair_cover(items, pairs, k, rng=rng)
+    if max_groups is None or len(groups) <= max_groups:
+        return groups
+
+    # One block holding every paired item always fits, so k never has to grow past that.
+    limit = max(k, len({i for pair in pairs for i in pair}))
+    fitting_k, too_small_k = k, k
+    while len(groups) > max_groups and fitting_k < limit:
+        too_small_k, fitting_k = fitting_k, min(2 * fitting_k, limit)
+        groups = greedy_pair_cover(items, pairs, fitting_k, rng=rng)
+
+    # Doubling may overshoot; search for the smallest k in between that still fits.
+    while len(groups) <= max_groups and fitting_k - too_small_k > 1:
+        middle = (too_small_k + fitting_k) // 2
+        candidate = greedy_pair_cover(items, pairs, middle, rng=rng)
+        if len(candidate) <= max_groups:
+            fitting_k, groups = middle, candidate
+        else:
+            too_small_k = middle
+
+    logger.info(
+        "max_groups=%d forced groups to merge: raised k from %d to %d, %d groups",
+        max_groups,
+        k,
+        fitting_k,
+        len(groups),
+    )
+    return groups
+
+
+@observe(name="grouping.greedy_pair_cover")
+def greedy_pair_cover(
+    items: Sequence[T],
+    pairs: Iterable[Tuple[int, int]],
+    k: int,
+    rng: random.Random | None = None,
+) -> List[List[T]]:
+    """
+    Cover the given index *pairs* of *items* with blocks of size ≤ *k*.
+
+    Unlike ``greedy_cover`` only the given pairs need to share a block, so sparse candidate graphs need far
+    fewer and smaller blocks. Items that are not part of any pair are left out.
+
+    Heuristics:
+      1. greedy construction (anchor with most uncovered pairs, grow by most newly covered pairs)
+      2. iterative *merge* phase until no two blocks can be fused
+    Args:
+        items: A sequence of items to be grouped.
+        pairs: The pairs of item indices that must share a block.
+        k: The maximum size of each group (block).
+        rng: An optional random number generator for tie-breaking.
+
+    Returns:
+        A list of groups (blocks) that together contain every given pair.
+    """
+    if k < 2:
+        raise ValueError("need 2 ≤ k")
+    if rng is None:
+        rng = random.Random()
+
+    items = list(items)
+    uncovered: dict[int, set[int]] = {}
+    for i, j in pairs:
+        if i == j:
+            continue
+        uncovered.setdefault(i, set()).add(j)
+        uncovered.setdefault(j, set()).add(i)
+
+    blocks: list[list[int]] = []
+    while uncovered:
+        anchor = max(sorted(uncovered), key=lambda i: len(uncovered[i]))
+        group = [anchor]
+        members = {anchor}
+
+        while len(group) < k:
+            gains: dict[int, int] = {}
+            for member in group:
+                for cand in uncovered.get(member, ()):
+                    if cand not in members:
+                        gains[cand] = gains.get(cand, 0) + 1
+            if not gains:
+                break
+            best_gain = max(gains.values())
+            cand = rng.choice(sorted(c for c, g in gains.items() if g == best_gain))
+            group.append(cand)
+            members.add(cand)
+
+        for i, j in itertools.combinations(group, 2):
+            if j in uncovered.get(i, ()):
+                uncovered[i].discard(j)
+                uncovered[j].discard(i)
+        for i in group:
+            if i in uncovered and not uncovered[i]:
+                del uncovered[i]
+
+        blocks.append(sorted(group))
+
+    blocks = _merge_blocks(blocks, k)
+
+    return [[items[i] for i in g] for g in blocks]
 
 
 def check_groups(groups: list[list[T]]) -> bool:
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from memiris.api.memory_service import MemoryService
+from memiris.domain.memory import Memory
+from memiris.repository.memory_repository import MemoryRepository
+
+
+class TestMemoryService:
+    """Test suite for the existence and count checks of the MemoryService."""
+
+    @pytest.fixture
+    def memory_repository(self):
+        return MagicMock(spec=MemoryRepository)
+
+    def test_checks_do_not_load_memories(self, memory_repository):
+        memory_repository.has_any.return_value = True
+        memory_repository.count.return_value = 3
+        memory_repository.has_unslept_memories.return_value = False
+        memory_repository.count_unslept_memories.return_value = 0
+        service = MemoryService(memory_repository)
+
+        assert service.has_memories("tenant")
+        assert service.count_memories("tenant") == 3
+        assert not service.has_unslept_memories("tenant")
+        assert service.count_unslept_memories("tenant") == 0
+        memory_repository.all.assert_not_called()
+        memory_repository.find_unslept_memories.assert_not_called()
+
+    def test_default_checks_fall_back_to_loading(self, memory_repository):
+        memories = [Memory(title="a", content="a", learnings=[]) for _ in range(2)]
+        memory_repository.all.return_value = memories
+        memory_repository.find_unslept_memories.return_value = memories[:1]
+
+        assert MemoryRepository.count(memory_repository, "tenant") == 2
+        assert MemoryRepository.count_unslept_memories(memory_repository, "tenant") == 1
+
+        memory_repository.count_unslept_memories.return_value = 0
+        assert not MemoryRepository.has_unslept_memories(memory_repository, "tenant")
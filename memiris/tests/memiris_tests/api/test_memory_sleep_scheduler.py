@@ -0,0 +1,115 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from memiris.api.memory_service import MemoryService
+from memiris.api.memory_sleep_pipeline import MemorySleepPipeline
+from memiris.api.memory_sleep_scheduler import MemorySleepScheduler
+from memiris.service.memory_sleep import SleepStats
+
+
+class TestMemorySleepScheduler:
+    """Test suite for the MemorySleepScheduler class."""
+
+    @staticmethod
+    def _memory_service(unslept: dict[str, bool]) -> MemoryService:
+        memory_service = MagicMock(spec=MemoryService)
+        memory_service.find_all_tenants.return_value = list(unslept)
+        memory_service.has_unslept_memories.side_effect = unslept.get
+        return memory_service
+
+    @staticmethod
+    def _pipeline(windows: dict[str, int], turns: list[str]) -> MemorySleepPipeline:
+        """A pipeline processing one window per turn of each tenant's remaining windows."""
+        lock = threading.Lock()
+
+        def sleep(tenant: str, max_windows: int) -> SleepStats:
+            with lock:
+                turns.append(tenant)
+                done = min(max_windows, windows[tenant])
+                windows[tenant] -= done
+                return SleepStats(
+                    tenant=tenant,
+                    windows=done,
+                    memories=done * 10,
+                    completed=windows[tenant] == 0,
+                )
+
+        pipeline = MagicMock(spec=MemorySleepPipeline)
+        pipeline.sleep.side_effect = sleep
+        return pipeline
+
+    def test_only_matching_tenants_with_unslept_memories_are_discovered(self):
+        memory_service = self._memory_service(
+            {"artemis-user-1": True, "artemis-user-2": False, "other": True}
+        )
+        scheduler = MemorySleepScheduler(
+            create_pipeline=MagicMock(),
+            memory_service=memory_service,
+            tenant_filter=lambda tenant: tenant.startswith("artemis-user-"),
+        )
+
+        assert scheduler.discover_tenants() == ["artemis-user-1"]
+        memory_service.has_unslept_memories.assert_called_with("artemis-user-2")
+
+    def test_tenants_take_turns(self):
+        turns: list[str] = []
+        pipeline = self._pipeline({"large": 3, "small": 1, "medium": 2}, turns)
+        scheduler = MemorySleepScheduler(
+            create_pipeline=lambda: pipeline,
+            memory_service=self._memory_service({}),
+            max_parallel_tenants=1,
+        )
+
+        stats = scheduler.run(["large", "small", "medium"])
+
+        assert turns == ["large", "small", "medium", "large", "medium", "large"]
+        assert (stats.tenants, stats.completed, stats.turns) == (3, 3, 6)
+        assert stats.memories == 60
+
+    def test_failing_tenant_does_not_stop_the_others(self):
+        turns: list[str] = []
+        pipeline = self._pipeline({"a": 1, "c": 1}, turns)
+        scheduler = MemorySleepScheduler(
+            create_pipeline=lambda: pipeline,
+            memory_service=self._memory_service({}),
+            max_parallel_tenants=2,
+        )
+
+        stats = scheduler.run(["a", "b", "c"])
+
+        assert sorted(turns) == ["a", "b", "c"]
+        assert (stats.completed, stats.failed) == (2, 1)
+
+    def test_each_parallel_tenant_has_its_own_pipeline(self):
+        pipelines: list[MemorySleepPipeline] = []
+        in_use: set[int] = set()
+        overlap = threading.Event()
+
+        def create_pipeline() -> MemorySleepPipeline:
+            pipeline = MagicMock(spec=MemorySleepPipeline)
+
+            def sleep(tenant: str, max_windows: int) -> SleepStats:
+                assert max_windows == 1
+                if id(pipeline) in in_use:
+                    overlap.set()
+                in_use.add(id(pipeline))
+                time.sleep(0.01)
+                in_use.discard(id(pipeline))
+                return SleepStats(tenant=tenant, completed=True)
+
+            pipeline.sleep.side_effect = sleep
+            pipelines.append(pipeline)
+            return pipeline
+
+        scheduler = MemorySleepScheduler(
+            create_pipeline=create_pipeline,
+            memory_service=self._memory_service({}),
+            max_parallel_tenants=3,
+        )
+
+        stats = scheduler.run([f"tenant-{i}" for i in range(12)])
+
+        assert stats.completed == 12
+        assert len(pipelines) <= 3
+        assert not overlap.is_set()
@@ -0,0 +1,159 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from langchain_core.outputs import LLMResult
+
+from memiris.llm.abstract_language_model import (
+    AbstractLanguageModel,
+    WrappedChatMessage,
+    WrappedChatResponse,
+)
+from memiris.llm.llm_budget import BudgetedLanguageModel, LlmBudget
+
+
+def _response(total_tokens: int) -> WrappedChatResponse:
+    return WrappedChatResponse(
+        message=WrappedChatMessage(role="assistant", content="ok"),
+        model="test-model",
+        raw_response=SimpleNamespace(usage=SimpleNamespace(total_tokens=total_tokens)),
+    )
+
+
+class TestLlmBudget:
+    """Test suite for the global LLM budget."""
+
+    def test_concurrent_calls_are_limited(self):
+        budget = LlmBudget(max_concurrent_calls=2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def call():
+            nonlocal running, peak
+            with budget.reserve():
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.02)
+                with lock:
+                    running -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+        assert budget.stats().calls == 8
+        assert budget.stats().active == 0
+
+    def test_waiting_calls_are_admitted_in_arrival_order(self):
+        budget = LlmBudget(max_concurrent_calls=1)
+        admitted: list[int] = []
+        first = budget.acquire()
+
+        def call(i: int):
+            reservation = budget.acquire()
+            admitted.append(i)
+            budget.release(reservation)
+
+        threads = []
+        for i in range(5):
+            thread = threading.Thread(target=call, args=(i,))
+            thread.start()
+            threads.append(thread)
+            while budget.stats().waiting <= i:
+                time.sleep(0.001)
+
+        budget.release(first)
+        for thread in threads:
+            thread.join()
+
+        assert admitted == [0, 1, 2, 3, 4]
+
+    def test_reported_tokens_replace_the_estimate(self):
+        budget = LlmBudget(tokens_per_minute=1000)
+
+        with budget.reserve(100) as reservation:
+            assert budget.stats().tokens_last_minute == 100
+            reservation.used_tokens = 300
+
+        stats = budget.stats()
+        assert (stats.tokens, stats.tokens_last_minute) == (300, 300)
+
+    def test_calls_over_the_token_budget_wait(self):
+        budget = LlmBudget(tokens_per_minute=100)
+        budget.release(budget.acquire(80))
+        admitted = threading.Event()
+
+        thread = threading.Thread(
+            target=lambda: budget.release(budget.acquire(50)) or admitted.set(),
+            daemon=True,
+        )
+        thread.start()
+
+        assert not admitted.wait(0.1)
+        assert budget.stats().waiting == 1
+
+    def test_oversized_call_runs_on_an_idle_budget(self):
+        budget = LlmBudget(tokens_per_minute=100)
+
+        with budget.reserve(500):
+            pass
+
+        assert budget.stats().tokens == 500
+
+
+class TestBudgetedLanguageModel:
+    """Test suite for the language model running within a budget."""
+
+    def test_chat_records_the_reported_usage(self):
+        llm = MagicMock(spec=AbstractLanguageModel)
+        llm.chat.return_value = _response(42)
+        budget = LlmBudget(max_concurrent_calls=1)
+
+        response = BudgetedLanguageModel(llm, budget).chat(
+            [{"role": "user", "content": "Hello"}], options={"temperature": 0}
+        )
+
+        assert response.message.content == "ok"
+        llm.chat.assert_called_once_with(
+            [{"role": "user", "content": "Hello"}],
+            response_format=None,
+            keep_alive=None,
+            options={"temperature": 0},
+        )
+        assert budget.stats().tokens == 42
+
+    def test_failed_chat_releases_the_budget(self):
+        llm = MagicMock(spec=AbstractLanguageModel)
+        llm.chat.side_effect = RuntimeError("unavailable")
+        budget = LlmBudget(max_concurrent_calls=1)
+
+        with pytest.raises(RuntimeError):
+            BudgetedLanguageModel(llm, budget).chat([{"role": "user", "content": "a"}])
+
+        assert budget.stats().active == 0
+
+    def test_langchain_calls_are_budgeted(self):
+        llm = MagicMock(spec=AbstractLanguageModel)
+        llm.langchain_client.return_value = SimpleNamespace(callbacks=None)
+        budget = LlmBudget(max_concurrent_calls=1)
+
+        client = BudgetedLanguageModel(llm, budget).langchain_client()
+        (handler,) = client.callbacks
+        run_id = uuid4()
+        handler.on_chat_model_start({}, [[]], run_id=run_id)
+
+        assert budget.stats().active == 1
+
+        handler.on_llm_end(
+            LLMResult(generations=[], llm_output={"token_usage": {"total_tokens": 7}}),
+            run_id=run_id,
+        )
+        assert (budget.stats().active, budget.stats().tokens) == (0, 7)
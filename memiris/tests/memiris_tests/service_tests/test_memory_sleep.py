@@ -0,0 +1,247 @@
+import ast
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from memiris.domain.memory import Memory
+from memiris.llm.abstract_language_model import AbstractLanguageModel
+from memiris.repository.learning_repository import LearningRepository
+from memiris.repository.memory_connection_repository import MemoryConnectionRepository
+from memiris.repository.memory_repository import MemoryRepository
+from memiris.service.memory_sleep import MemorySleeper
+from memiris.service.sleep_checkpoint import (
+    FileSleepCheckpointStore,
+    InMemorySleepCheckpointStore,
+)
+from memiris.service.vectorizer import Vectorizer
+
+
+class TestMemorySleeperConnectionCandidates:
+    """Test suite for the similarity pruning before connecting memories."""
+
+    @pytest.fixture
+    def mock_llm(self):
+        """Create a mock AbstractLanguageModel that finds no connections."""
+        mock_model = MagicMock(spec=AbstractLanguageModel)
+        mock_model.chat.return_value.message.content = "[]"
+        return mock_model
+
+    @pytest.fixture
+    def memory_repository(self):
+        return MagicMock(spec=MemoryRepository)
+
+    def _sleeper(self, mock_llm, memory_repository, **kwargs) -> MemorySleeper:
+        return MemorySleeper(
+            tool_llm=mock_llm,
+            response_llm=mock_llm,
+            learning_repository=MagicMock(spec=LearningRepository),
+            memory_repository=memory_repository,
+            memory_connection_repository=MagicMock(spec=MemoryConnectionRepository),
+            vectorizer=MagicMock(spec=Vectorizer),
+            max_threads=1,
+            group_size=3,
+            max_groups=10,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _memory(title: str, vector: list[float]) -> Memory:
+        return Memory(
+            uid=uuid4(),
+            title=title,
+            content=title,
+            learnings=[uuid4()],
+            vectors={"vector_0": vector},
+        )
+
+    @staticmethod
+    def _sent_groups(mock_llm) -> list[set[str]]:
+        return [
+            {
+                memory["title"]
+                for memory in json.loads(
+                    ast.literal_eval(call.kwargs["messages"][1].content)
+                )
+            }
+            for call in mock_llm.chat.call_args_list
+        ]
+
+    def test_only_similar_memories_are_compared(self, mock_llm, memory_repository):
+        memories = [
+            self._memory("python", [1.0, 0.0]),
+            self._memory("python typing", [0.95, 0.05]),
+            self._memory("exams", [0.0, 1.0]),
+            self._memory("exam dates", [0.05, 0.95]),
+        ]
+        sleeper = self._sleeper(
+            mock_llm,
+            memory_repository,
+            candidate_neighbours=1,
+            candidate_threshold=0.8,
+        )
+
+        sleeper._create_memory_connections(memories)
+
+        groups = self._sent_groups(mock_llm)
+        assert sorted(groups, key=sorted) == [
+            {"exam dates", "exams"},
+            {"python", "python typing"},
+        ]
+
+    def test_all_pairs_are_compared_without_pruning(self, mock_llm, memory_repository):
+        memories = [
+            self._memory("python", [1.0, 0.0]),
+            self._memory("exams", [0.0, 1.0]),
+            self._memory("lunch", [-1.0, 0.0]),
+        ]
+        sleeper = self._sleeper(mock_llm, memory_repository, candidate_neighbours=0)
+
+        sleeper._create_memory_connections(memories)
+
+        assert self._sent_groups(mock_llm) == [{"python", "exams", "lunch"}]
+
+    def test_similar_older_memories_are_compared(self, mock_llm, memory_repository):
+        recent = self._memory("python", [1.0, 0.0])
+        older = self._memory("python basics", [0.9, 0.1])
+        memory_repository.search_multi.return_value = [recent, older]
+        sleeper = self._sleeper(
+            mock_llm, memory_repository, candidate_neighbours=2, neighbourhood_size=2
+        )
+
+        neighbourhood = sleeper._load_memory_neighbourhood("tenant", [recent])
+        sleeper._create_memory_connections([recent], neighbourhood=neighbourhood)
+
+        assert neighbourhood == [older]
+        assert sleeper.memory_cache[older.id] is older  # type: ignore
+        assert self._sent_groups(mock_llm) == [{"python", "python basics"}]
+
+
+class TestMemorySleeperWindows:
+    """Test suite for the paged sleep with checkpoints."""
+
+    @pytest.fixture
+    def memory_repository(self):
+        return MagicMock(spec=MemoryRepository)
+
+    @staticmethod
+    def _memories(count: int) -> list[Memory]:
+        return [
+            Memory(uid=uuid4(), title=f"m{i}", content=f"m{i}", learnings=[uuid4()])
+            for i in range(count)
+        ]
+
+    def _sleeper(self, memory_repository, checkpoint_store=None) -> MemorySleeper:
+        sleeper = MemorySleeper(
+            tool_llm=MagicMock(spec=AbstractLanguageModel),
+            response_llm=MagicMock(spec=AbstractLanguageModel),
+            learning_repository=MagicMock(spec=LearningRepository),
+            memory_repository=memory_repository,
+            memory_connection_repository=MagicMock(spec=MemoryConnectionRepository),
+            vectorizer=MagicMock(spec=Vectorizer),
+            window_size=2,
+            checkpoint_store=checkpoint_store,
+        )
+        sleeper._sleep_window = MagicMock()  # type: ignore[method-assign]
+        return sleeper
+
+    def test_memories_are_processed_in_windows(self, memory_repository):
+        first, second = self._memories(2), self._memories(1)
+        cursor = first[-1].id
+        memory_repository.find_unslept_memories_page.side_effect = [
+            (first, cursor),
+            (second, None),
+        ]
+        store = InMemorySleepCheckpointStore()
+        store.save = MagicMock(wraps=store.save)  # type: ignore[method-assign]
+        sleeper = self._sleeper(memory_repository, store)
+
+        stats = sleeper.run_sleep("tenant")
+
+        assert [call.args for call in sleeper._sleep_window.call_args_list] == [
+            ("tenant", first),
+            ("tenant", second),
+        ]
+        assert [
+            call.args
+            for call in memory_repository.find_unslept_memories_page.call_args_list
+        ] == [("tenant", 2, None), ("tenant", 2, cursor)]
+        store.save.assert_called_once_with("tenant", cursor)
+        assert store.load("tenant") is None
+        assert (stats.windows, stats.memories, stats.resumed) == (2, 3, False)
+        assert stats.completed
+
+    def test_interrupted_sleep_resumes_after_last_window(self, memory_repository):
+        first, second = self._memories(2), self._memories(2)
+        cursor = first[-1].id
+        memory_repository.find_unslept_memories_page.side_effect = [
+            (first, cursor),
+            (second, second[-1].id),
+        ]
+        store = InMemorySleepCheckpointStore()
+        sleeper = self._sleeper(memory_repository, store)
+        sleeper._sleep_window.side_effect = [None, RuntimeError("LLM unavailable")]
+
+        with pytest.raises(RuntimeError):
+            sleeper.run_sleep("tenant")
+
+        assert store.load("tenant") == cursor
+        assert not sleeper.memory_cache
+
+        memory_repository.find_unslept_memories_page.side_effect = [(second, None)]
+        sleeper._sleep_window.side_effect = None
+
+        stats = sleeper.run_sleep("tenant")
+
+        memory_repository.find_unslept_memories_page.assert_called_with(
+            "tenant", 2, cursor
+        )
+        assert stats.resumed
+        assert store.load("tenant") is None
+
+    def test_turn_stops_after_max_windows(self, memory_repository):
+        first = self._memories(2)
+        cursor = first[-1].id
+        memory_repository.find_unslept_memories_page.side_effect = [(first, cursor)]
+        store = InMemorySleepCheckpointStore()
+        sleeper = self._sleeper(memory_repository, store)
+
+        stats = sleeper.run_sleep("tenant", max_windows=1)
+
+        assert (stats.windows, stats.completed) == (1, False)
+        assert store.load("tenant") == cursor
+
+    def test_default_paging_orders_by_id(self, memory_repository):
+        memories = self._memories(5)
+        memory_repository.find_unslept_memories.return_value = memories
+        ordered = sorted(memories, key=lambda memory: str(memory.id))
+
+        first, cursor = MemoryRepository.find_unslept_memories_page(
+            memory_repository, "tenant", 3
+        )
+        rest, end = MemoryRepository.find_unslept_memories_page(
+            memory_repository, "tenant", 3, cursor
+        )
+
+        assert first == ordered[:3]
+        assert cursor == ordered[2].id
+        assert rest == ordered[3:]
+        assert end is None
+
+
+def test_file_checkpoint_store(tmp_path):
+    store = FileSleepCheckpointStore(tmp_path / "checkpoints")
+    cursor = uuid4()
+
+    assert store.load("artemis-user-1") is None
+    store.save("artemis-user-1", cursor)
+
+    assert (
+        FileSleepCheckpointStore(tmp_path / "checkpoints").load("artemis-user-1")
+        == cursor
+    )
+    assert store.load("artemis-user-2") is None
+
+    store.clear("artemis-user-1")
+    assert store.load("artemis-user-1") is None
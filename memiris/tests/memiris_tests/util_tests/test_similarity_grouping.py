@@ -0,0 +1,173 @@
+import itertools
+import random
+import time
+from typing import Any, List
+
+import pytest
+
+from memiris.util.grouping import (
+    greedy_cover,
+    greedy_pair_cover,
+    greedy_pair_cover_max_groups,
+    similarity_candidate_pairs,
+)
+
+
+def _covered(blocks: List[List[Any]]) -> set[tuple[Any, Any]]:
+    """Return the set of unordered pairs covered by *blocks*."""
+    pairs: set[tuple[Any, Any]] = set()
+    for g in blocks:
+        pairs.update(tuple(sorted(p)) for p in itertools.combinations(g, 2))
+    return pairs
+
+
+def _clustered_vectors(
+    size: int, cluster_size: int, dim: int = 32, seed: int = 7
+) -> list[dict[str, list[float]]]:
+    """Vectors of *size* items in clusters of *cluster_size* around random centers."""
+    rng = random.Random(seed)
+    vectors = []
+    for start in range(0, size, cluster_size):
+        center = [rng.uniform(-1, 1) for _ in range(dim)]
+        for _ in range(min(cluster_size, size - start)):
+            vectors.append({"vector_0": [x + rng.uniform(-0.05, 0.05) for x in center]})
+    return vectors
+
+
+def test_candidates_are_nearest_neighbours() -> None:
+    """Each item is paired with its most similar items only."""
+    vectors = [
+        {"vector_0": [1.0, 0.0]},
+        {"vector_0": [0.9, 0.1]},
+        {"vector_0": [0.0, 1.0]},
+        {"vector_0": [0.1, 0.9]},
+    ]
+
+    assert similarity_candidate_pairs(vectors, neighbours=1) == {(0, 1), (2, 3)}
+
+
+def test_threshold_drops_dissimilar_pairs() -> None:
+    vectors = [{"vector_0": [1.0, 0.0]}, {"vector_0": [0.0, 1.0]}]
+
+    assert similarity_candidate_pairs(vectors, neighbours=5) == {(0, 1)}
+    assert similarity_candidate_pairs(vectors, neighbours=5, threshold=0.5) == set()
+
+
+def test_best_vector_name_decides_similarity() -> None:
+    """Items are similar if any of their shared vectors is."""
+    vectors = [
+        {"vector_0": [1.0, 0.0], "vector_1": [1.0, 0.0]},
+        {"vector_0": [0.0, 1.0], "vector_1": [1.0, 0.1]},
+    ]
+
+    assert similarity_candidate_pairs(vectors, neighbours=1, threshold=0.9) == {(0, 1)}
+
+
+def test_items_without_vectors_are_paired_with_all() -> None:
+    vectors = [{"vector_0": [1.0, 0.0]}, {}, {"vector_0": [0.0, 1.0]}]
+
+    pairs = similarity_candidate_pairs(vectors, neighbours=1, threshold=0.9)
+
+    assert pairs == {(0, 1), (1, 2)}
+
+
+def test_context_items_are_not_paired_with_each_other() -> None:
+    """Items after the anchors are only paired with anchors."""
+    vectors = [
+        {"vector_0": [1.0, 0.0]},
+        {"vector_0": [0.0, 1.0]},
+        {"vector_0": [0.0, 1.0]},
+    ]
+
+    pairs = similarity_candidate_pairs(vectors, neighbours=2, anchors=1)
+
+    assert pairs == {(0, 1), (0, 2)}
+
+
+@pytest.mark.parametrize("v,k,edges", [(10, 3, 12), (50, 5, 120), (200, 8, 600)])
+def test_pair_cover_covers_given_pairs(v: int, k: int, edges: int) -> None:
+    rng = random.Random(v)
+    items = list(range(v))
+    pairs = {tuple(sorted(rng.sample(items, 2))) for _ in range(edges)}
+
+    blocks = greedy_pair_cover(items, pairs, k, rng=random.Random(1))
+
+    assert pairs <= _covered(blocks)
+    for g in blocks:
+        assert len(g) <= k
+        assert len(g) == len(set(g))
+
+
+def test_pair_cover_leaves_out_unpaired_items() -> None:
+    blocks = greedy_pair_cover(["a", "b", "c", "d"], [(0, 1)], 3)
+
+    assert blocks == [["a", "b"]]
+
+
+def test_pair_cover_max_groups_grows_blocks() -> None:
+    items = list(range(40))
+    pairs = [(i, i + 1) for i in range(39)]
+
+    blocks = greedy_pair_cover_max_groups(items, pairs, 4, max_groups=3)
+
+    assert len(blocks) <= 3
+    assert set(pairs) <= _covered(blocks)
+
+
+def test_pair_cover_max_groups_searches_k_instead_of_stepping(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    items = list(range(400))
+    pairs = [(i, i + 1) for i in range(399)]
+    calls: list[int] = []
+
+    def counting_cover(*args, **kwargs):
+        calls.append(args[2])
+        return greedy_pair_cover(*args, **kwargs)
+
+    monkeypatch.setattr("memiris.util.grouping.greedy_pair_cover", counting_cover)
+
+    with caplog.at_level("INFO", logger="memiris.util.grouping"):
+        blocks = greedy_pair_cover_max_groups(items, pairs, 4, max_groups=3)
+
+    assert len(blocks) <= 3
+    assert set(pairs) <= _covered(blocks)
+    assert len(calls) < 20
+    assert "forced groups to merge: raised k from 4" in caplog.text
+
+
+@pytest.mark.parametrize("backlog", [50, 100, 200])
+def test_benchmark_llm_calls_against_backlog_size(backlog: int) -> None:
+    """
+    Compare the LLM calls (groups) and memories sent when connecting all pairs with the calls
+    for similarity candidates only. Clusters stand in for memories about the same topic.
+    """
+    k = 20
+    vectors = _clustered_vectors(backlog, cluster_size=5)
+    items = list(range(backlog))
+
+    started = time.perf_counter()
+    all_pairs_groups = greedy_cover(items, k, rng=random.Random(0))
+    all_pairs_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    pairs = similarity_candidate_pairs(vectors, neighbours=4, threshold=0.5)
+    candidate_groups = greedy_pair_cover(items, pairs, k, rng=random.Random(0))
+    candidate_ms = (time.perf_counter() - started) * 1000
+
+    print(
+        f"backlog={backlog} "
+        f"all_pairs: calls={len(all_pairs_groups)} "
+        f"memories_sent={sum(map(len, all_pairs_groups))} ms={all_pairs_ms:.0f} | "
+        f"candidates: pairs={len(pairs)} calls={len(candidate_groups)} "
+        f"memories_sent={sum(map(len, candidate_groups))} ms={candidate_ms:.0f}"
+    )
+
+    # Every pair within a topic cluster is still compared by the LLM
+    covered = _covered(candidate_groups)
+    for start in range(0, backlog, 5):
+        assert set(itertools.combinations(range(start, start + 5), 2)) <= covered
+
+    # The calls grow linearly instead of quadratically with the backlog
+    assert len(candidate_groups) <= backlog // k + backlog // 10 + 1
+    assert len(candidate_groups) * 3 <= len(all_pairs_groups)
@@ -168,6 +168,24 @@ class TestWeaviateLearningRepository(WeaviateTest):
         assert search_results is not None
         assert len(search_results) == 0
 
+    def test_save_all(self, learning_repository):
+        existing = self._create_learning(learning_repository)
+        existing.title = "Updated Title"
+        new = Learning(
+            title="New Title",
+            content="New Content",
+            reference="New Reference",
+            vectors={"vector_0": mock_vector()},
+        )
+
+        saved = learning_repository.save_all("test", [existing, new])
+
+        assert [learning.id for learning in saved] == [existing.id, new.id]
+        assert learning_repository.find("test", existing.id).title == "Updated Title"
+        retrieved = learning_repository.find("test", new.id)
+        assert retrieved.title == "New Title"
+        compare_vectors(new.vectors, retrieved.vectors)
+
     def test_delete_all_for_tenant(self, learning_repository):
         """Test deleting all learnings for a tenant."""
         learning1 = self._create_learning(learning_repository)
@@ -265,6 +265,39 @@ class TestWeaviateMemoryConnectionRepository(WeaviateTest):
         retrieved_memory2 = memory_repository.find("test", memory2.id)
         assert len(retrieved_memory2.connections) == 0
 
+    def test_save_all(self, memory_repository, memory_connection_repository):
+        """Test saving connections in one batch, including the links of their memories."""
+        memory1 = self._create_test_memory(memory_repository)
+        memory2 = self._create_test_memory(memory_repository)
+        memory3 = self._create_test_memory(memory_repository)
+        existing = memory_connection_repository.save(
+            "test",
+            MemoryConnection(
+                connection_type=ConnectionType.RELATED,
+                memories=[memory1.id, memory2.id],
+            ),
+        )
+
+        existing.memories = [memory1.id, memory3.id]
+        new = MemoryConnection(
+            connection_type=ConnectionType.DUPLICATE,
+            memories=[memory2.id, memory3.id],
+        )
+
+        saved = memory_connection_repository.save_all("test", [existing, new])
+
+        assert [connection.id for connection in saved] == [existing.id, new.id]
+        retrieved = memory_connection_repository.find("test", new.id)
+        assert retrieved.connection_type == ConnectionType.DUPLICATE
+        assert set(retrieved.memories) == {memory2.id, memory3.id}
+
+        assert memory_repository.find("test", memory1.id).connections == [existing.id]
+        assert memory_repository.find("test", memory2.id).connections == [new.id]
+        assert set(memory_repository.find("test", memory3.id).connections) == {
+            existing.id,
+            new.id,
+        }
+
     def test_delete_all_for_tenant(
         self, memory_repository, memory_connection_repository
     ):
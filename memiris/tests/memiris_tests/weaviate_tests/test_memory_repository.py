@@ -267,6 +267,99 @@ class TestWeaviateMemoryRepository(WeaviateTest):
         assert learning2.id in learning_ids
         assert learning3.id in learning_ids
 
+    def test_save_all(self, memory_repository, learning_repository):
+        """Test inserting and updating memories in one batch, including learning links."""
+        learning1 = self._create_test_learning(learning_repository)
+        learning2 = self._create_test_learning(learning_repository)
+        existing = self._create_test_memory(memory_repository, learning_repository)
+        old_learning = existing.learnings[0]
+
+        existing.slept_on = True
+        existing.learnings = [learning1.id]
+        new = Memory(
+            title="New Memory Title",
+            content="New Memory Content",
+            learnings=[learning1.id, learning2.id],
+            vectors={"vector_0": mock_vector()},
+        )
+
+        saved = memory_repository.save_all("test", [existing, new])
+
+        assert [memory.id for memory in saved] == [existing.id, new.id]
+        assert new.id is not None
+
+        updated = memory_repository.find("test", existing.id)
+        assert updated.slept_on
+        assert updated.learnings == [learning1.id]
+        compare_vectors(existing.vectors, updated.vectors)
+
+        inserted = memory_repository.find("test", new.id)
+        assert set(inserted.learnings) == {learning1.id, learning2.id}
+
+        assert set(learning_repository.find("test", learning1.id).memories) == {
+            existing.id,
+            new.id,
+        }
+        assert learning_repository.find("test", old_learning).memories == []
+
+    def test_find_unslept_memories_page(self, memory_repository):
+        """Test paging through unslept memories with a small scan batch."""
+        memory_repository.delete_all_for_tenant("test_paging")
+        memories = [
+            Memory(
+                title=f"Memory {i}",
+                content=f"Content {i}",
+                learnings=[],
+                vectors={"vector_0": mock_vector()},
+                slept_on=i % 3 == 0,
+            )
+            for i in range(9)
+        ]
+        memory_repository.save_all("test_paging", memories)
+        memory_repository._batch_size = 2
+
+        found = []
+        cursor = None
+        while True:
+            page, cursor = memory_repository.find_unslept_memories_page(
+                "test_paging", 4, cursor
+            )
+            assert len(page) <= 4
+            found.extend(memory.id for memory in page)
+            if cursor is None:
+                break
+
+        assert sorted(found, key=str) == sorted(
+            (memory.id for memory in memories if not memory.slept_on), key=str
+        )
+
+    def test_count_and_existence(self, memory_repository):
+        """Test counting memories and checking for them without loading them."""
+        memory_repository.delete_all_for_tenant("test_counting")
+        assert memory_repository.count("test_counting") == 0
+        assert not memory_repository.has_any("test_counting")
+        assert not memory_repository.has_unslept_memories("test_unknown_tenant")
+
+        memory_repository.save_all(
+            "test_counting",
+            [
+                Memory(
+                    title=f"Memory {i}",
+                    content=f"Content {i}",
+                    learnings=[],
+                    vectors={"vector_0": mock_vector()},
+                    slept_on=i < 2,
+                    deleted=i == 4,
+                )
+                for i in range(5)
+            ],
+        )
+
+        assert memory_repository.count("test_counting") == 4
+        assert memory_repository.has_any("test_counting")
+        assert memory_repository.count_unslept_memories("test_counting") == 2
+        assert memory_repository.has_unslept_memories("test_counting")
+
     def test_memory_without_learnings(self, memory_repository):
         """Test creating a memory without any linked learnings."""
         vec = mock_vector()